@@ -0,0 +1,124 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the decoding of tabledata.list / getQueryResults pages.
+
+Decodes a fake page of JSON rows, with scalar, repeated and nested fields,
+into rows and into columns, once per row and cell as before the schema was
+compiled, and with a decoder compiled once per schema. No API is called.
+
+Usage: python decode_rows.py [rows_per_page] [number_of_pages]
+"""
+
+import sys
+import time
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.schema import _to_schema_fields
+from google.cloud.bigquery.table import Row
+
+
+SCHEMA = [
+    SchemaField("name", "STRING"),
+    SchemaField("age", "INTEGER"),
+    SchemaField("score", "FLOAT"),
+    SchemaField("alive", "BOOLEAN"),
+    SchemaField("born", "TIMESTAMP"),
+    SchemaField("tags", "STRING", mode="REPEATED"),
+    SchemaField(
+        "address",
+        "RECORD",
+        fields=[SchemaField("city", "STRING"), SchemaField("zip", "INTEGER")],
+    ),
+]
+
+
+def fake_page(rows_per_page):
+    return [
+        {
+            "f": [
+                {"v": "name-{}".format(i)},
+                {"v": str(i)},
+                {"v": None if i % 3 else "{}.5".format(i)},
+                {"v": "true" if i % 2 else "false"},
+                {"v": "1.5E9"},
+                {"v": [{"v": "a"}, {"v": "b"}]},
+                {"v": {"f": [{"v": "city"}, {"v": "12345"}]}},
+            ]
+        }
+        for i in range(rows_per_page)
+    ]
+
+
+def per_row_rows(schema, rows):
+    """Rows decoding before the schema was compiled (``_item_to_row``)."""
+    field_to_index = _helpers._field_to_index_mapping(schema)
+    result = []
+    for row in rows:
+        fields = _to_schema_fields(list(schema))
+        values = tuple(
+            _helpers._field_from_json(cell["v"], field)
+            for field, cell in zip(fields, row["f"])
+        )
+        result.append(Row(values, field_to_index))
+    return result
+
+
+def per_cell_columns(schema, rows):
+    """Columns decoding before the schema was compiled."""
+    return [
+        [_helpers._field_from_json(row["f"][index]["v"], field) for row in rows]
+        for index, field in enumerate(schema)
+    ]
+
+
+def compiled_rows(schema, rows):
+    return _helpers._RowsDecoder(schema).rows(rows)
+
+
+def compiled_columns(schema, rows):
+    return _helpers._RowsDecoder(schema).columns(rows)
+
+
+def run(decode, pages):
+    start = time.time()
+    for page in pages:
+        result = decode(SCHEMA, page)
+    return time.time() - start, result
+
+
+rows_per_page = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+number_of_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+pages = [fake_page(rows_per_page)] * number_of_pages
+total = rows_per_page * number_of_pages
+
+for name, before, after in (
+    ("rows", per_row_rows, compiled_rows),
+    ("columns", per_cell_columns, compiled_columns),
+):
+    before_time, before_result = run(before, pages)
+    after_time, after_result = run(after, pages)
+    assert before_result == after_result
+
+    print(
+        "{0} {1}: per cell {2:,.0f} rows/s, compiled {3:,.0f} rows/s, "
+        "speedup {4:.1f}x".format(
+            total,
+            name,
+            total / before_time,
+            total / after_time,
+            before_time / after_time,
+        )
+    )
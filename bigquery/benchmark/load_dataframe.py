@@ -0,0 +1,107 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the Parquet encoding of the dataframes to load.
+
+Encodes a fake dataframe and reads it in chunks of the size of the
+resumable upload, as ``load_table_from_dataframe`` sends it: through a
+temporary file, and streamed by row groups with ``stream_parquet=True``.
+Reports the throughput and the peak memory allocated by Arrow. No API is
+called.
+
+Usage: python load_dataframe.py [number_of_rows] [row_group_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas
+import pyarrow
+
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery.schema import SchemaField
+
+
+CHUNK_SIZE = 1024 * 1024  # The chunk size of the resumable uploads.
+
+SCHEMA = [
+    SchemaField("name", "STRING"),
+    SchemaField("age", "INTEGER"),
+    SchemaField("score", "FLOAT"),
+]
+
+
+def fake_dataframe(number_of_rows):
+    return pandas.DataFrame(
+        {
+            "name": ["name-{}".format(i) for i in range(number_of_rows)],
+            "age": range(number_of_rows),
+            "score": [i / 3.0 for i in range(number_of_rows)],
+        }
+    )
+
+
+def read_chunks(file_obj):
+    total = 0
+    chunk = file_obj.read(CHUNK_SIZE)
+    while chunk:
+        total += len(chunk)
+        chunk = file_obj.read(CHUNK_SIZE)
+    return total
+
+
+def temporary_file(dataframe, row_group_size):
+    tmpfd, tmppath = tempfile.mkstemp(suffix="_job_bench.parquet")
+    os.close(tmpfd)
+    try:
+        _pandas_helpers.dataframe_to_parquet(dataframe, SCHEMA, tmppath)
+        with open(tmppath, "rb") as parquet_file:
+            return read_chunks(parquet_file)
+    finally:
+        os.remove(tmppath)
+
+
+def streamed(dataframe, row_group_size):
+    stream = _pandas_helpers.ParquetStream(
+        dataframe, SCHEMA, row_group_size=row_group_size
+    )
+    try:
+        return read_chunks(stream)
+    finally:
+        stream.close()
+
+
+def run(encode, dataframe, row_group_size):
+    pool = pyarrow.default_memory_pool()
+    start_bytes = pool.max_memory() or 0
+    start = time.time()
+    size = encode(dataframe, row_group_size)
+    return time.time() - start, size, (pool.max_memory() or 0) - start_bytes
+
+
+number_of_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+row_group_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+dataframe = fake_dataframe(number_of_rows)
+
+# The streamed encoding runs first, as the peak of the memory pool only grows.
+for name, encode in (("streamed", streamed), ("temporary file", temporary_file)):
+    elapsed, size, peak = run(encode, dataframe, row_group_size)
+    print(
+        "{0}: {1:,} rows, {2:,} bytes in {3:.2f}s ({4:,.0f} rows/s), "
+        "peak Arrow memory {5:,} bytes".format(
+            name, number_of_rows, size, elapsed, number_of_rows / elapsed, peak
+        )
+    )
@@ -62,12 +62,17 @@ from google.cloud.bigquery.job import SchemaUpdateOption
 from google.cloud.bigquery.job import SourceFormat
 from google.cloud.bigquery.job import UnknownJob
 from google.cloud.bigquery.job import WriteDisposition
+from google.cloud.bigquery.job_poller import JobPoller
+from google.cloud.bigquery.job_poller import wait_for_jobs
 from google.cloud.bigquery.model import Model
 from google.cloud.bigquery.model import ModelReference
 from google.cloud.bigquery.query import ArrayQueryParameter
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
+from google.cloud.bigquery.query_cache import MemoryCacheBackend
+from google.cloud.bigquery.query_cache import ParquetCacheBackend
+from google.cloud.bigquery.query_cache import QueryCache
 from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.routine import Routine
 from google.cloud.bigquery.routine import RoutineArgument
@@ -91,6 +96,9 @@ __all__ = [
     "ArrayQueryParameter",
     "ScalarQueryParameter",
     "StructQueryParameter",
+    "QueryCache",
+    "MemoryCacheBackend",
+    "ParquetCacheBackend",
     # Datasets
     "Dataset",
     "DatasetReference",
@@ -111,6 +119,8 @@ __all__ = [
     "LoadJob",
     "LoadJobConfig",
     "UnknownJob",
+    "JobPoller",
+    "wait_for_jobs",
     # Models
     "Model",
     "ModelReference",
@@ -217,6 +217,170 @@ def _field_from_json(resource, field):
         return converter(resource, field)
 
 
+def _identity(value):
+    return value
+
+
+# Conversions of the (not null) JSON cell values which do not depend on the
+# field, applied without a lookup or a call of ``_not_null`` per cell.
+_SCALAR_FROM_JSON = {
+    "INTEGER": int,
+    "INT64": int,
+    "FLOAT": float,
+    "FLOAT64": float,
+    "NUMERIC": decimal.Decimal,
+    "STRING": _identity,
+    "GEOGRAPHY": _identity,
+}
+
+
+def _compile_value_converter(field, nullable):
+    """Compile the conversion of a single JSON value of ``field``.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField): The field.
+        nullable (bool): Whether the value can be null.
+
+    Returns:
+        Callable[[Any], Any]: The conversion of the JSON value.
+    """
+    if field.field_type == "RECORD":
+        subfields = [
+            (subfield.name, _compile_field_converter(subfield))
+            for subfield in field.fields
+        ]
+
+        def convert(value):
+            if value is None and nullable:
+                return None
+            return {
+                name: convert_subfield(cell["v"])
+                for (name, convert_subfield), cell in zip(subfields, value["f"])
+            }
+
+        return convert
+
+    scalar_converter = _SCALAR_FROM_JSON.get(field.field_type)
+    if scalar_converter is None:
+        converter = _CELLDATA_FROM_JSON.get(field.field_type, lambda value, _: value)
+        return lambda value: converter(value, field)
+    if not nullable or scalar_converter is _identity:
+        return scalar_converter
+
+    def convert(value):
+        if value is None:
+            return None
+        return scalar_converter(value)
+
+    return convert
+
+
+def _compile_field_converter(field):
+    """Compile the conversion of the JSON cell values of ``field``.
+
+    The result is equivalent to :func:`_field_from_json`, but the converters
+    of the field (and of its subfields) are looked up once.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField): The field.
+
+    Returns:
+        Callable[[Any], Any]:
+            The conversion of a JSON cell value (``cell["v"]``) of the field
+            to the native type.
+    """
+    if field.mode != "REPEATED":
+        return _compile_value_converter(field, field.mode == "NULLABLE")
+
+    convert_item = _compile_value_converter(field, False)
+
+    def convert(value):
+        return [convert_item(item["v"]) for item in value]
+
+    return convert
+
+
+class _RowsDecoder(object):
+    """Convert the JSON rows of a schema to rows or columns of native types.
+
+    The converters of the fields are compiled once, so that a decoder should
+    be reused for all the pages of rows with the same schema.
+
+    Args:
+        schema (Sequence[Union[ \
+                :class:`~google.cloud.bigquery.schema.SchemaField`, \
+                Mapping[str, Any] \
+        ]]): The schema of the rows.
+    """
+
+    def __init__(self, schema):
+        from google.cloud.bigquery.schema import _to_schema_fields
+
+        self.schema = _to_schema_fields(schema)
+        self.field_to_index = _field_to_index_mapping(self.schema)
+        self._converters = [_compile_field_converter(field) for field in self.schema]
+
+    def row_tuple(self, row):
+        """Convert a JSON row to a tuple of native values.
+
+        Args:
+            row (Dict): A JSON response row.
+
+        Returns:
+            Tuple: The values of the row.
+        """
+        return tuple(
+            [convert(cell["v"]) for convert, cell in zip(self._converters, row["f"])]
+        )
+
+    def rows(self, rows):
+        """Convert a page of JSON rows.
+
+        Args:
+            rows (Sequence[Dict]): The JSON response rows.
+
+        Returns:
+            List[:class:`~google.cloud.bigquery.Row`]
+        """
+        from google.cloud.bigquery import Row
+
+        converters = self._converters
+        field_to_index = self.field_to_index
+        return [
+            Row(
+                tuple(
+                    [convert(cell["v"]) for convert, cell in zip(converters, row["f"])]
+                ),
+                field_to_index,
+            )
+            for row in rows
+        ]
+
+    def column(self, rows, field_index):
+        """Convert the values of a field in a page of JSON rows.
+
+        Args:
+            rows (Sequence[Dict]): The JSON response rows.
+            field_index (int): The position of the field in the schema.
+
+        Returns:
+            List: The values of the field, one per row.
+        """
+        convert = self._converters[field_index]
+        return [convert(row["f"][field_index]["v"]) for row in rows]
+
+    def columns(self, rows):
+        """Convert a page of JSON rows to columns.
+
+        Args:
+            rows (Sequence[Dict]): The JSON response rows.
+
+        Returns:
+            List[List]: The values of each field of the schema.
+        """
+        return [self.column(rows, index) for index in range(len(self._converters))]
+
+
 def _row_tuple_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
@@ -232,14 +396,7 @@ def _row_tuple_from_json(row, schema):
     Returns:
         Tuple: A tuple of data converted to native types.
     """
-    from google.cloud.bigquery.schema import _to_schema_fields
-
-    schema = _to_schema_fields(schema)
-
-    row_data = []
-    for field, cell in zip(schema, row["f"]):
-        row_data.append(_field_from_json(cell["v"], field))
-    return tuple(row_data)
+    return _RowsDecoder(schema).row_tuple(row)
 
 
 def _rows_from_json(values, schema):
@@ -258,12 +415,7 @@ def _rows_from_json(values, schema):
     Returns:
         List[:class:`~google.cloud.bigquery.Row`]
     """
-    from google.cloud.bigquery import Row
-    from google.cloud.bigquery.schema import _to_schema_fields
-
-    schema = _to_schema_fields(schema)
-    field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index) for r in values]
+    return _RowsDecoder(schema).rows(values)
 
 
 def _int_to_json(value):
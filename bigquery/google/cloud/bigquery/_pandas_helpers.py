@@ -14,9 +14,11 @@
 
 """Shared helper functions for connecting BigQuery and pandas."""
 
+import collections
 import concurrent.futures
 import functools
 import logging
+import threading
 import warnings
 
 from six.moves import queue
@@ -49,6 +51,10 @@ _NO_BQSTORAGE_ERROR = (
 
 _PROGRESS_INTERVAL = 0.2  # Maximum time between download status checks, in seconds.
 
+_MAX_QUEUE_SIZE_DEFAULT = object()  # max queue size sentinel for BQ Storage downloads
+
+_PARQUET_ROW_GROUP_SIZE_DEFAULT = 100000  # rows encoded at once by ParquetStream
+
 _PANDAS_DTYPE_TO_BQ = {
     "bool": "BOOLEAN",
     "datetime64[ns, UTC]": "TIMESTAMP",
@@ -65,15 +71,67 @@ _PANDAS_DTYPE_TO_BQ = {
 }
 
 
+StreamProgress = collections.namedtuple("StreamProgress", ["pages", "rows", "bytes"])
+StreamProgress.__doc__ = """The progress of the download of a BQ Storage API stream.
+
+Attributes:
+    pages (int): The number of pages of the stream consumed so far.
+    rows (int): The number of rows of the stream consumed so far.
+    bytes (int): The in-memory size of the pages consumed so far.
+"""
+
+
 class _DownloadState(object):
-    """Flag to indicate that a thread should exit early."""
+    """Flag to indicate that a thread should exit early, and bookkeeping of
+    the pages downloaded but not yet consumed.
 
-    def __init__(self):
+    Args:
+        max_queue_bytes (Optional[int]):
+            The maximum total size of the downloaded pages that are not yet
+            consumed. A page is always admitted if no other page is waiting.
+    """
+
+    def __init__(self, max_queue_bytes=None):
         # No need for a lock because reading/replacing a variable is defined to
         # be an atomic operation in the Python language definition (enforced by
         # the global interpreter lock).
         self.done = False
 
+        self._max_queue_bytes = max_queue_bytes
+        self._queued_bytes = 0
+        self._bytes_released = threading.Condition()
+
+    def reserve_bytes(self, nbytes):
+        """Block until a page of ``nbytes`` bytes fits in the byte budget.
+
+        Args:
+            nbytes (int): The in-memory size of the page.
+
+        Returns:
+            bool: False if the download finished early while waiting.
+        """
+        with self._bytes_released:
+            while (
+                not self.done
+                and self._max_queue_bytes
+                and self._queued_bytes
+                and self._queued_bytes + nbytes > self._max_queue_bytes
+            ):
+                self._bytes_released.wait(_PROGRESS_INTERVAL)
+
+            self._queued_bytes += nbytes
+            return not self.done
+
+    def release_bytes(self, nbytes):
+        """Return the size of a consumed page to the byte budget.
+
+        Args:
+            nbytes (int): The in-memory size of the page.
+        """
+        with self._bytes_released:
+            self._queued_bytes -= nbytes
+            self._bytes_released.notify_all()
+
 
 def pyarrow_datetime():
     return pyarrow.timestamp("us", tz=None)
@@ -484,6 +542,159 @@ def dataframe_to_parquet(dataframe, bq_schema, filepath, parquet_compression="SN
     pyarrow.parquet.write_table(arrow_table, filepath, compression=parquet_compression)
 
 
+class ParquetStream(object):
+    """A dataframe encoded as a Parquet file, readable as a binary stream.
+
+    The dataframe is encoded one row group at a time, as the stream is read,
+    so that it never needs to be written to disk. Only the encoded bytes not
+    read yet, and the bytes of the last read (which a resumable upload may
+    send again), are kept in memory.
+
+    This requires the :mod:`pyarrow` package.
+
+    Args:
+        dataframe (pandas.DataFrame):
+            DataFrame to convert to Parquet.
+        bq_schema (Sequence[Union[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            Mapping[str, Any] \
+        ]]):
+            Desired BigQuery schema. Number of columns must match number of
+            columns in the DataFrame.
+        parquet_compression (str):
+            (optional) The compression codec of the Parquet file. Defaults to
+            "SNAPPY".
+        row_group_size (int):
+            (optional) The number of rows of each row group, encoded at
+            once.
+    """
+
+    def __init__(
+        self,
+        dataframe,
+        bq_schema,
+        parquet_compression="SNAPPY",
+        row_group_size=_PARQUET_ROW_GROUP_SIZE_DEFAULT,
+    ):
+        if pyarrow is None:
+            raise ValueError("pyarrow is required for BigQuery schema conversion.")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+
+        self._dataframe = dataframe
+        self._bq_schema = schema._to_schema_fields(bq_schema)
+        self._parquet_compression = parquet_compression
+
+        # An empty dataframe is still written as a row group, so that the
+        # file has a schema.
+        self._row_group_starts = iter(range(0, max(len(dataframe), 1), row_group_size))
+        self._row_group_size = row_group_size
+
+        self._sink = None
+        self._writer = None
+        self._finished = False
+
+        # The encoded bytes kept in memory start at ``_buffer_start``.
+        self._buffer = bytearray()
+        self._buffer_start = 0
+        self._position = 0
+
+    def _encode_next_row_group(self):
+        """Encode the next row group, or the footer after the last one."""
+        start = next(self._row_group_starts, None)
+        if start is None:
+            self.close()
+            return
+
+        arrow_table = dataframe_to_arrow(
+            self._dataframe.iloc[start : start + self._row_group_size], self._bq_schema
+        )
+        if self._writer is None:
+            self._sink = pyarrow.PythonFile(_ParquetStreamSink(self._buffer), mode="w")
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self._sink, arrow_table.schema, compression=self._parquet_compression
+            )
+        self._writer.write_table(arrow_table, row_group_size=len(arrow_table) or None)
+
+    def read(self, size=-1):
+        """Read at most ``size`` bytes, or all the remaining bytes."""
+        while not self._finished and (
+            size is None
+            or size < 0
+            or self._buffer_start + len(self._buffer) < self._position + size
+        ):
+            self._encode_next_row_group()
+
+        # The bytes before this read cannot be read again.
+        del self._buffer[: self._position - self._buffer_start]
+        self._buffer_start = self._position
+
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        self._position += len(data)
+        return data
+
+    def close(self):
+        """Stop encoding the dataframe."""
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = self._sink = None
+        self._finished = True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, position, whence=0):
+        """Move to ``position``, which must be in the bytes kept in memory.
+
+        Only :data:`os.SEEK_SET` (``0``) is supported.
+        """
+        if whence != 0:
+            raise ValueError("Only seeking from the start is supported.")
+        if not (
+            self._buffer_start <= position <= self._buffer_start + len(self._buffer)
+        ):
+            raise ValueError(
+                "Cannot seek to byte {}, only bytes {} to {} are kept.".format(
+                    position, self._buffer_start, self._buffer_start + len(self._buffer)
+                )
+            )
+        self._position = position
+        return position
+
+    def seekable(self):
+        return True
+
+
+class _ParquetStreamSink(object):
+    """The file-like object written to by the Parquet writer.
+
+    Args:
+        buffer (bytearray): Extended with the written bytes.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._written = 0
+        self.closed = False
+
+    def write(self, data):
+        self._buffer.extend(data)
+        self._written += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._written
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
 def _tabledata_list_page_to_arrow(page, column_names, arrow_types):
     # Iterate over the page to force the API request to get the page data.
     try:
@@ -572,6 +783,20 @@ def _bqstorage_page_to_dataframe(column_names, dtypes, page):
     return page.to_dataframe(dtypes=dtypes)[column_names]
 
 
+def _item_nbytes(item):
+    """Return the in-memory size of a downloaded page.
+
+    Args:
+        item (Union[pyarrow.RecordBatch, pandas.DataFrame]): The page.
+
+    Returns:
+        int: The size in bytes.
+    """
+    if hasattr(item, "nbytes"):
+        return item.nbytes
+    return int(item.memory_usage(index=False).sum())
+
+
 def _download_table_bqstorage_stream(
     download_state, bqstorage_client, session, stream, worker_queue, page_to_item
 ):
@@ -582,7 +807,22 @@ def _download_table_bqstorage_stream(
         if download_state.done:
             return
         item = page_to_item(page)
-        worker_queue.put(item)
+        nbytes = _item_nbytes(item)
+
+        if not download_state.reserve_bytes(nbytes):
+            return
+
+        # The queue may be bounded, put with a timeout to notice when the
+        # download has finished early and nobody consumes the queue anymore.
+        while True:
+            try:
+                worker_queue.put(
+                    (stream.name, item, nbytes), timeout=_PROGRESS_INTERVAL
+                )
+                break
+            except queue.Full:
+                if download_state.done:
+                    return
 
 
 def _nowait(futures):
@@ -606,8 +846,39 @@ def _download_table_bqstorage(
     preserve_order=False,
     selected_fields=None,
     page_to_item=None,
+    max_queue_size=_MAX_QUEUE_SIZE_DEFAULT,
+    max_queue_bytes=None,
+    max_stream_count=None,
+    max_workers=None,
+    progress_callback=None,
 ):
-    """Use (faster, but billable) BQ Storage API to construct DataFrame."""
+    """Use (faster, but billable) BQ Storage API to construct DataFrame.
+
+    The streams of the read session are downloaded in parallel by worker
+    threads, and the pages are yielded as they arrive. The downloaded pages
+    waiting to be consumed are buffered in a bounded queue, so that a slow
+    consumer makes the workers wait instead of growing the memory usage.
+
+    Args:
+        max_queue_size (Optional[int]):
+            The maximum number of downloaded pages waiting to be consumed.
+            By default, this is the number of workers. If ``None`` or ``0``,
+            the number of pages is not bounded.
+        max_queue_bytes (Optional[int]):
+            The maximum total in-memory size of the downloaded pages waiting
+            to be consumed. Not bounded by default.
+        max_stream_count (Optional[int]):
+            The maximum number of streams to request from the server. The
+            server decides by default. Ignored if ``preserve_order`` is set,
+            since a single stream is required then.
+        max_workers (Optional[int]):
+            The maximum number of streams downloaded concurrently. By
+            default, all the streams are downloaded concurrently. The other
+            streams are downloaded as soon as workers become available.
+        progress_callback (Optional[Callable[[str, StreamProgress], Any]]):
+            Called with the name of the stream and its progress each time a
+            page is consumed.
+    """
     if "$" in table.table_id:
         raise ValueError(
             "Reading from a specific partition is not currently supported."
@@ -623,6 +894,8 @@ def _download_table_bqstorage(
     requested_streams = 0
     if preserve_order:
         requested_streams = 1
+    elif max_stream_count:
+        requested_streams = max_stream_count
 
     session = bqstorage_client.create_read_session(
         table.to_bqstorage(),
@@ -642,15 +915,40 @@ def _download_table_bqstorage(
         return
 
     total_streams = len(session.streams)
+    total_workers = min(max_workers or total_streams, total_streams)
 
     # Use _DownloadState to notify worker threads when to quit.
     # See: https://stackoverflow.com/a/29237343/101923
-    download_state = _DownloadState()
+    download_state = _DownloadState(max_queue_bytes=max_queue_bytes)
 
     # Create a queue to collect frames as they are created in each thread.
-    worker_queue = queue.Queue()
+    # Bound the queue so that the downloaded pages do not pile up in memory
+    # when they are consumed slower than they are downloaded.
+    if max_queue_size is _MAX_QUEUE_SIZE_DEFAULT:
+        max_queue_size = total_workers
+    worker_queue = queue.Queue(maxsize=max_queue_size or 0)
+
+    stream_progress = {
+        stream.name: StreamProgress(pages=0, rows=0, bytes=0)
+        for stream in session.streams
+    }
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=total_streams) as pool:
+    def consume(queue_item):
+        stream_name, frame, nbytes = queue_item
+        download_state.release_bytes(nbytes)
+
+        progress = stream_progress[stream_name]
+        progress = StreamProgress(
+            pages=progress.pages + 1,
+            rows=progress.rows + len(frame),
+            bytes=progress.bytes + nbytes,
+        )
+        stream_progress[stream_name] = progress
+        if progress_callback is not None:
+            progress_callback(stream_name, progress)
+        return frame
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=total_workers) as pool:
         try:
             # Manually submit jobs and wait for download to complete rather
             # than using pool.map because pool.map continues running in the
@@ -683,10 +981,10 @@ def _download_table_bqstorage(
                     future.result()
 
                 try:
-                    frame = worker_queue.get(timeout=_PROGRESS_INTERVAL)
-                    yield frame
+                    queue_item = worker_queue.get(timeout=_PROGRESS_INTERVAL)
                 except queue.Empty:  # pragma: NO COVER
                     continue
+                yield consume(queue_item)
 
             # Return any remaining values after the workers finished.
             while not worker_queue.empty():  # pragma: NO COVER
@@ -694,10 +992,16 @@ def _download_table_bqstorage(
                     # Include a timeout because even though the queue is
                     # non-empty, it doesn't guarantee that a subsequent call to
                     # get() will not block.
-                    frame = worker_queue.get(timeout=_PROGRESS_INTERVAL)
-                    yield frame
+                    queue_item = worker_queue.get(timeout=_PROGRESS_INTERVAL)
                 except queue.Empty:  # pragma: NO COVER
                     continue
+                yield consume(queue_item)
+
+            _LOGGER.debug(
+                "Finished reading BQ Storage API session '{}': {}".format(
+                    session.name, stream_progress
+                )
+            )
         finally:
             # No need for a lock because reading/replacing a variable is
             # defined to be an atomic operation in the Python language
@@ -710,7 +1014,12 @@ def _download_table_bqstorage(
 
 
 def download_arrow_bqstorage(
-    project_id, table, bqstorage_client, preserve_order=False, selected_fields=None
+    project_id,
+    table,
+    bqstorage_client,
+    preserve_order=False,
+    selected_fields=None,
+    **download_options
 ):
     return _download_table_bqstorage(
         project_id,
@@ -719,6 +1028,7 @@ def download_arrow_bqstorage(
         preserve_order=preserve_order,
         selected_fields=selected_fields,
         page_to_item=_bqstorage_page_to_arrow,
+        **download_options
     )
 
 
@@ -730,6 +1040,7 @@ def download_dataframe_bqstorage(
     dtypes,
     preserve_order=False,
     selected_fields=None,
+    **download_options
 ):
     page_to_item = functools.partial(_bqstorage_page_to_dataframe, column_names, dtypes)
     return _download_table_bqstorage(
@@ -739,4 +1050,5 @@ def download_dataframe_bqstorage(
         preserve_order=preserve_order,
         selected_fields=selected_fields,
         page_to_item=page_to_item,
+        **download_options
     )
@@ -22,6 +22,8 @@ try:
 except ImportError:  # Python 2.7
     import collections as collections_abc
 
+import collections
+import concurrent.futures
 import copy
 import functools
 import gzip
@@ -88,6 +90,10 @@ _GENERIC_CONTENT_TYPE = u"*/*"
 _READ_LESS_THAN_SIZE = (
     "Size {:d} was specified but the file-like object only had " "{:d} bytes remaining."
 )
+# The insertAll error reasons of the rows which were not inserted because of
+# a transient failure, see
+# https://cloud.google.com/bigquery/troubleshooting-errors
+_RETRYABLE_INSERT_REASONS = frozenset(("backendError", "internalError", "timeout"))
 _NEED_TABLE_ARGUMENT = (
     "The table argument should be a table ID string, Table, or TableReference"
 )
@@ -1529,6 +1535,8 @@ class Client(ClientWithProject):
         project=None,
         job_config=None,
         parquet_compression="snappy",
+        stream_parquet=False,
+        parquet_row_group_size=_pandas_helpers._PARQUET_ROW_GROUP_SIZE_DEFAULT,
     ):
         """Upload the contents of a table from a pandas DataFrame.
 
@@ -1585,6 +1593,19 @@ class Client(ClientWithProject):
                  argument is directly passed as the ``compression`` argument
                  to the underlying ``DataFrame.to_parquet()`` method.
                  https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.to_parquet.html#pandas.DataFrame.to_parquet
+            stream_parquet (bool):
+                 [Beta] If ``True``, encode the dataframe to Parquet one row
+                 group at a time while it is uploaded, with a resumable
+                 upload, instead of writing it to a temporary file first.
+                 This needs no disk space, and the memory used is bounded by
+                 the size of a row group and of an upload chunk.
+
+                 Requires ``pyarrow`` and a job config schema, or a schema
+                 detected from the dataframe; otherwise a temporary file is
+                 used.
+            parquet_row_group_size (int):
+                 [Beta] The number of rows encoded at once if
+                 ``stream_parquet`` is ``True``.
 
         Returns:
             google.cloud.bigquery.job.LoadJob: A new load job.
@@ -1650,6 +1671,32 @@ class Client(ClientWithProject):
                 stacklevel=2,
             )
 
+        if pyarrow and job_config.schema and stream_parquet:
+            if parquet_compression == "snappy":  # adjust the default value
+                parquet_compression = parquet_compression.upper()
+
+            parquet_stream = _pandas_helpers.ParquetStream(
+                dataframe,
+                job_config.schema,
+                parquet_compression=parquet_compression,
+                row_group_size=parquet_row_group_size,
+            )
+            try:
+                # The size is unknown until the stream is read, which
+                # selects a resumable upload.
+                return self.load_table_from_file(
+                    parquet_stream,
+                    destination,
+                    num_retries=num_retries,
+                    job_id=job_id,
+                    job_id_prefix=job_id_prefix,
+                    location=location,
+                    project=project,
+                    job_config=job_config,
+                )
+            finally:
+                parquet_stream.close()
+
         tmpfd, tmppath = tempfile.mkstemp(suffix="_job_{}.parquet".format(job_id[:8]))
         os.close(tmpfd)
 
@@ -2253,31 +2300,56 @@ class Client(ClientWithProject):
                 The number of rows to stream in a single chunk. Must be positive.
             kwargs (Dict):
                 Keyword arguments to
-                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`,
+                applied to each chunk. With ``max_workers``, up to that many
+                chunks are inserted concurrently.
 
         Returns:
             Sequence[Sequence[Mappings]]:
                 A list with insert errors for each insert chunk. Each element
                 is a list containing one mapping per row with insert errors:
-                the "index" key identifies the row, and the "errors" key
-                contains a list of the mappings describing one or more problems
-                with the row.
+                the "index" key identifies the row in the chunk, and the
+                "errors" key contains a list of the mappings describing one or
+                more problems with the row.
 
         Raises:
-            ValueError: if table's schema is not set
+            ValueError: if table's schema is not set, or ``chunk_size`` is not
+                positive.
         """
-        insert_results = []
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
 
         chunk_count = int(math.ceil(len(dataframe) / chunk_size))
         rows_iter = (
             dict(six.moves.zip(dataframe.columns, row))
             for row in dataframe.itertuples(index=False, name=None)
         )
+        # Only build the rows of a chunk when it is inserted, so that the
+        # whole dataframe is never converted at once.
+        rows_chunks = (
+            list(itertools.islice(rows_iter, chunk_size)) for _ in range(chunk_count)
+        )
 
-        for _ in range(chunk_count):
-            rows_chunk = itertools.islice(rows_iter, chunk_size)
-            result = self.insert_rows(table, rows_chunk, selected_fields, **kwargs)
-            insert_results.append(result)
+        max_workers = kwargs.pop("max_workers", None)
+        insert_chunk = functools.partial(
+            self.insert_rows, table, selected_fields=selected_fields, **kwargs
+        )
+
+        if max_workers is None or max_workers <= 1 or chunk_count <= 1:
+            return [insert_chunk(rows_chunk) for rows_chunk in rows_chunks]
+
+        insert_results = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, chunk_count)
+        ) as pool:
+            # Bound the number of chunks in flight, so that at most
+            # ``max_workers`` chunks of rows are in memory.
+            futures = collections.deque()
+            for rows_chunk in rows_chunks:
+                if len(futures) >= max_workers:
+                    insert_results.append(futures.popleft().result())
+                futures.append(pool.submit(insert_chunk, rows_chunk))
+            insert_results.extend(future.result() for future in futures)
 
         return insert_results
 
@@ -2290,12 +2362,21 @@ class Client(ClientWithProject):
         ignore_unknown_values=None,
         template_suffix=None,
         retry=DEFAULT_RETRY,
+        chunk_size=None,
+        chunk_bytes=None,
+        max_workers=None,
+        max_row_retries=0,
     ):
         """Insert rows into a table without applying local type conversions.
 
         See
         https://cloud.google.com/bigquery/docs/reference/rest/v2/tabledata/insertAll
 
+        By default, all the rows are sent in a single request. To stay under
+        the request size limits of the streaming API, set ``chunk_size``
+        and/or ``chunk_bytes``: the rows are then split into several
+        requests, which are sent concurrently if ``max_workers`` is set.
+
         Args:
             table (Union[ \
                 google.cloud.bigquery.table.Table \
@@ -2326,19 +2407,38 @@ class Client(ClientWithProject):
                 https://cloud.google.com/bigquery/streaming-data-into-bigquery#template-tables
             retry (Optional[google.api_core.retry.Retry]):
                 How to retry the RPC.
+            chunk_size (Optional[int]):
+                The maximum number of rows sent in a single request. Must be
+                positive. By default, the number of rows is not limited.
+            chunk_bytes (Optional[int]):
+                The maximum total size, in bytes, of the JSON representation
+                of the rows sent in a single request. A row larger than this
+                is sent in a request of its own. By default, the size is not
+                limited.
+            max_workers (Optional[int]):
+                The maximum number of requests sent concurrently. By default,
+                the requests are sent one after another. If a request fails,
+                its exception is raised once the other requests are done, the
+                rows of the other requests may have been inserted.
+            max_row_retries (Optional[int]):
+                How many times to insert again the rows which were not
+                inserted because of a transient backend error, reported in
+                the ``insertErrors`` of the response. Only those rows are
+                sent again. Defaults to ``0``.
 
         Returns:
             Sequence[Mappings]:
                 One mapping per row with insert errors: the "index" key
                 identifies the row, and the "errors" key contains a list of
                 the mappings describing one or more problems with the row.
+                The mappings are sorted by index.
         """
         # Convert table to just a reference because unlike insert_rows,
         # insert_rows_json doesn't need the table schema. It's not doing any
         # type conversions.
         table = _table_arg_to_table_ref(table, default_project=self.project)
         rows_info = []
-        data = {"rows": rows_info}
+        data = {}
 
         for index, row in enumerate(json_rows):
             info = {"json": row}
@@ -2357,14 +2457,71 @@ class Client(ClientWithProject):
         if template_suffix is not None:
             data["templateSuffix"] = template_suffix
 
-        # We can always retry, because every row has an insert ID.
-        response = self._call_api(
-            retry, method="POST", path="%s/insertAll" % table.path, data=data
+        chunks = _insert_rows_chunks(rows_info, chunk_size, chunk_bytes)
+        insert_chunk = functools.partial(
+            self._insert_rows_chunk,
+            table.path,
+            data,
+            rows_info,
+            retry=retry,
+            max_row_retries=max_row_retries,
         )
+
+        if max_workers is None or max_workers <= 1 or len(chunks) <= 1:
+            chunk_errors = [insert_chunk(chunk) for chunk in chunks]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(chunks))
+            ) as pool:
+                futures = [pool.submit(insert_chunk, chunk) for chunk in chunks]
+            chunk_errors = [future.result() for future in futures]
+
+        errors = list(itertools.chain.from_iterable(chunk_errors))
+        if len(chunks) > 1:
+            errors.sort(key=lambda error: error["index"])
+        return errors
+
+    def _insert_rows_chunk(
+        self, table_path, data, rows_info, indexes, retry, max_row_retries
+    ):
+        """Insert a chunk of rows, then insert again the rows failing with a
+        transient error.
+
+        Args:
+            table_path (str): The path of the destination table.
+            data (Dict): The options of the request, without the rows.
+            rows_info (Sequence[Dict]): The rows of all the chunks.
+            indexes (Sequence[int]): The indexes of the rows of the chunk.
+            retry (google.api_core.retry.Retry): How to retry the RPC.
+            max_row_retries (int):
+                How many times to insert again the failing rows.
+
+        Returns:
+            List[Mapping]: The insert errors, indexed in ``rows_info``.
+        """
         errors = []
 
-        for error in response.get("insertErrors", ()):
-            errors.append({"index": int(error["index"]), "errors": error["errors"]})
+        for attempt in range(max_row_retries + 1):
+            chunk_data = dict(data)
+            chunk_data["rows"] = [rows_info[index] for index in indexes]
+
+            # We can always retry, because every row has an insert ID.
+            response = self._call_api(
+                retry, method="POST", path="%s/insertAll" % table_path, data=chunk_data
+            )
+
+            retry_indexes = []
+            for error in response.get("insertErrors", ()):
+                index = indexes[int(error["index"])]
+                reasons = set(item.get("reason") for item in error["errors"])
+                if attempt < max_row_retries and reasons <= _RETRYABLE_INSERT_REASONS:
+                    retry_indexes.append(index)
+                else:
+                    errors.append({"index": index, "errors": error["errors"]})
+
+            if not retry_indexes:
+                break
+            indexes = retry_indexes
 
         return errors
 
@@ -2546,6 +2703,49 @@ class Client(ClientWithProject):
             return self._schema_to_json_file_object(json_schema_list, file_obj)
 
 
+def _insert_rows_chunks(rows_info, chunk_size, chunk_bytes):
+    """Split the rows of an insertAll request into chunks.
+
+    Args:
+        rows_info (Sequence[Dict]): The rows to insert.
+        chunk_size (Optional[int]): The maximum number of rows of a chunk.
+        chunk_bytes (Optional[int]):
+            The maximum total size of the JSON representation of the rows of
+            a chunk.
+
+    Returns:
+        List[range]: The indexes of the rows of each chunk, in order.
+    """
+    if chunk_size is None and chunk_bytes is None:
+        return [six.moves.range(len(rows_info))]
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    chunks = []
+    start = 0
+    total_bytes = 0
+
+    for index, info in enumerate(rows_info):
+        row_bytes = 0
+        if chunk_bytes is not None:
+            # Add one byte for the separator of the rows.
+            row_bytes = len(json.dumps(info).encode("utf-8")) + 1
+
+        if index > start and (
+            index - start == chunk_size
+            or (chunk_bytes is not None and total_bytes + row_bytes > chunk_bytes)
+        ):
+            chunks.append(six.moves.range(start, index))
+            start = index
+            total_bytes = 0
+
+        total_bytes += row_bytes
+
+    if start < len(rows_info) or not chunks:
+        chunks.append(six.moves.range(start, len(rows_info)))
+    return chunks
+
+
 # pylint: disable=unused-argument
 def _item_to_project(iterator, resource):
     """Convert a JSON project to the native object.
@@ -24,6 +24,7 @@ import numbers
 import six
 
 from google.cloud import bigquery
+from google.cloud.bigquery import table
 from google.cloud.bigquery.dbapi import exceptions
 
 
@@ -218,3 +219,22 @@ def array_like(value):
     return isinstance(value, collections_abc.Sequence) and not isinstance(
         value, (six.text_type, six.binary_type, bytearray)
     )
+
+
+def to_bq_table_rows(record_batches):
+    """Convert Arrow record batches to BigQuery table rows.
+
+    Args:
+        record_batches (Iterable[pyarrow.RecordBatch]): The record batches.
+
+    Returns:
+        Iterator[google.cloud.bigquery.table.Row]:
+            The rows, converted a record batch at a time.
+    """
+    for record_batch in record_batches:
+        field_to_index = {
+            name: index for index, name in enumerate(record_batch.schema.names)
+        }
+        columns = [column.to_pylist() for column in record_batch.columns]
+        for values in six.moves.zip(*columns):
+            yield table.Row(values, field_to_index)
@@ -21,6 +21,10 @@ try:
 except ImportError:  # Python 2.7
     import collections as collections_abc
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 import six
 
 from google.cloud.bigquery import job
@@ -155,6 +159,19 @@ class Cursor(object):
         """
         self._query_data = None
         self._query_job = None
+        query_job = self._start_query(
+            operation, parameters, job_id=job_id, job_config=job_config
+        )
+        self._finish_query(query_job)
+
+    def _start_query(self, operation, parameters, job_id=None, job_config=None):
+        """Start the query job of a database operation.
+
+        See ``execute`` for argument descriptions.
+
+        Returns:
+            google.cloud.bigquery.job.QueryJob: The running query job.
+        """
         client = self.connection._client
 
         # The DB-API uses the pyformat formatting, since the way BigQuery does
@@ -166,9 +183,18 @@ class Cursor(object):
 
         config = job_config or job.QueryJobConfig(use_legacy_sql=False)
         config.query_parameters = query_parameters
-        self._query_job = client.query(
-            formatted_operation, job_config=config, job_id=job_id
-        )
+        return client.query(formatted_operation, job_config=config, job_id=job_id)
+
+    def _finish_query(self, query_job):
+        """Wait for a query job, and make its results the current results.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob): The query job.
+
+        Raises:
+            google.cloud.bigquery.dbapi.DatabaseError: if the query failed.
+        """
+        self._query_job = query_job
 
         # Wait for the query to finish.
         try:
@@ -180,17 +206,51 @@ class Cursor(object):
         self._set_rowcount(query_results)
         self._set_description(query_results.schema)
 
-    def executemany(self, operation, seq_of_parameters):
+    def executemany(self, operation, seq_of_parameters, max_concurrent_jobs=1):
         """Prepare and execute a database operation multiple times.
 
+        The ``rowcount`` is the total over all the sets of parameter values,
+        ``0`` if there are none, the ``description`` and the results are
+        those of the last set.
+
         Args:
             operation (str): A Google BigQuery query string.
 
             seq_of_parameters (Union[Sequence[Mapping[str, Any], Sequence[Any]]]):
                 Sequence of many sets of parameter values.
+
+            max_concurrent_jobs (int):
+                (Optional) The maximum number of query jobs running at the
+                same time. Defaults to ``1``, the sets of parameter values are
+                then executed one after another. The order in which concurrent
+                jobs modify a table is not defined.
+
+        Raises:
+            google.cloud.bigquery.dbapi.DatabaseError:
+                if a query failed. The query jobs already started keep
+                running.
         """
+        if max_concurrent_jobs < 1:
+            raise exceptions.ProgrammingError("max_concurrent_jobs must be positive")
+
+        self._query_data = None
+        self._query_job = None
+        rowcount = 0
+        running_jobs = collections.deque()
+
+        def finish_oldest_query():
+            self._finish_query(running_jobs.popleft())
+            return rowcount + self.rowcount
+
         for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+            if len(running_jobs) >= max_concurrent_jobs:
+                rowcount = finish_oldest_query()
+            running_jobs.append(self._start_query(operation, parameters))
+
+        while running_jobs:
+            rowcount = finish_oldest_query()
+
+        self.rowcount = rowcount
 
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
@@ -212,11 +272,26 @@ class Cursor(object):
 
         if self._query_data is None:
             client = self.connection._client
+            bqstorage_client = self.connection._bqstorage_client
             rows_iter = client.list_rows(
                 self._query_job.destination,
                 selected_fields=self._query_job._query_results.schema,
                 page_size=self.arraysize,
             )
+
+            if bqstorage_client is not None and pyarrow is not None:
+                # Stream the rows through a BQ Storage API read session. The
+                # iterable falls back to tabledata.list when the read session
+                # cannot be created, e.g. for small anonymous query results.
+                rows_iter._preserve_order = job._contains_order_by(
+                    self._query_job.query
+                )
+                record_batches = rows_iter.to_arrow_iterable(
+                    bqstorage_client=bqstorage_client
+                )
+                self._query_data = _helpers.to_bq_table_rows(record_batches)
+                return
+
             self._query_data = iter(rows_iter)
 
     def fetchone(self):
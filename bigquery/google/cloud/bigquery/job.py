@@ -3193,6 +3193,7 @@ class QueryJob(_AsyncJob):
         progress_bar_type=None,
         bqstorage_client=None,
         create_bqstorage_client=False,
+        max_workers=None,
     ):
         """[Beta] Create a class:`pyarrow.Table` by loading all pages of a
         table or query.
@@ -3235,6 +3236,15 @@ class QueryJob(_AsyncJob):
 
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
+                ..versionadded:: 1.24.0
+            max_workers (Optional[int]):
+                The maximum number of streams downloaded concurrently from
+                the BigQuery Storage API. By default, all the streams are
+                downloaded concurrently.
+
+                This argument does nothing if the BigQuery Storage API is not
+                used.
+
                 ..versionadded:: 1.24.0
 
         Returns:
@@ -3253,6 +3263,7 @@ class QueryJob(_AsyncJob):
             progress_bar_type=progress_bar_type,
             bqstorage_client=bqstorage_client,
             create_bqstorage_client=create_bqstorage_client,
+            max_workers=max_workers,
         )
 
     # If changing the signature of this method, make sure to apply the same
@@ -3263,6 +3274,7 @@ class QueryJob(_AsyncJob):
         dtypes=None,
         progress_bar_type=None,
         create_bqstorage_client=False,
+        max_workers=None,
     ):
         """Return a pandas DataFrame from a QueryJob
 
@@ -3305,6 +3317,15 @@ class QueryJob(_AsyncJob):
 
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
+                ..versionadded:: 1.24.0
+            max_workers (Optional[int]):
+                The maximum number of streams downloaded concurrently from
+                the BigQuery Storage API. By default, all the streams are
+                downloaded concurrently.
+
+                This argument does nothing if the BigQuery Storage API is not
+                used.
+
                 ..versionadded:: 1.24.0
 
         Returns:
@@ -3320,6 +3341,7 @@ class QueryJob(_AsyncJob):
             dtypes=dtypes,
             progress_bar_type=progress_bar_type,
             create_bqstorage_client=create_bqstorage_client,
+            max_workers=max_workers,
         )
 
     def __iter__(self):
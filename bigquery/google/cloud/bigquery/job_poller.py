@@ -0,0 +1,420 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wait for many jobs at once.
+
+Waiting on each job with :meth:`~google.cloud.bigquery.job.QueryJob.result`
+polls every job separately, from a thread per job. A :class:`JobPoller`
+instead polls all the pending jobs of a project with a single
+``jobs.list`` request, filtered on the jobs which are done, and backs off
+while no job completes:
+
+.. code-block:: python
+
+    from google.cloud import bigquery
+
+    client = bigquery.Client()
+    jobs = [client.query(query) for query in queries]
+
+    done, not_done = bigquery.wait_for_jobs(jobs, timeout=600)
+"""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+
+import google.auth.exceptions
+from google.api_core import exceptions
+import requests
+
+from google.cloud.bigquery import job as job_module
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+
+_LOGGER = logging.getLogger(__name__)
+_POLLER_WORKER_NAME = "Thread-JobPoller"
+
+# The errors of a round of polling after which the next round is attempted.
+# ``RetryError`` (a ``GoogleAPIError``) is raised once the retry deadline of
+# the requests expires.
+_RETRYABLE_POLL_ERRORS = (
+    exceptions.GoogleAPIError,
+    google.auth.exceptions.TransportError,
+    requests.exceptions.RequestException,
+)
+
+FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
+FIRST_EXCEPTION = concurrent.futures.FIRST_EXCEPTION
+ALL_COMPLETED = concurrent.futures.ALL_COMPLETED
+
+DoneAndNotDoneJobs = collections.namedtuple("DoneAndNotDoneJobs", ["done", "not_done"])
+DoneAndNotDoneJobs.__doc__ = "The jobs returned by :func:`wait_for_jobs`."
+DoneAndNotDoneJobs.done.__doc__ = (
+    "Set[google.cloud.bigquery.job._AsyncJob]: The jobs which are done."
+)
+DoneAndNotDoneJobs.not_done.__doc__ = (
+    "Set[google.cloud.bigquery.job._AsyncJob]: The jobs which are not done."
+)
+
+
+def _job_key(job):
+    return (job.project, job.job_id)
+
+
+class JobPoller(object):
+    """Poll many jobs together, and call back when they are done.
+
+    Each round of polling sends one ``jobs.list`` request per project, for
+    the jobs done since the oldest pending job was created. The interval
+    between the rounds grows from ``min_interval`` to ``max_interval`` while
+    no job completes, and is reset when a job completes.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to list the jobs.
+        min_interval (Optional[float]):
+            The minimum interval between two rounds, in seconds.
+            Defaults to ``0.5``.
+        max_interval (Optional[float]):
+            The maximum interval between two rounds, in seconds.
+            Defaults to ``10``.
+        multiplier (Optional[float]):
+            How much the interval grows after a round with no job done.
+            Defaults to ``1.5``.
+        all_users (Optional[bool]):
+            Whether to list the jobs of all the users of the projects. It is
+            needed to poll the jobs created with other credentials than the
+            client's. Defaults to :data:`False`.
+        retry (Optional[google.api_core.retry.Retry]):
+            How to retry the RPCs.
+    """
+
+    def __init__(
+        self,
+        client,
+        min_interval=0.5,
+        max_interval=10.0,
+        multiplier=1.5,
+        all_users=False,
+        retry=DEFAULT_RETRY,
+    ):
+        self._client = client
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._multiplier = multiplier
+        self._all_users = all_users
+        self._retry = retry
+
+        self._interval = min_interval
+        self._thread = None
+        self._operational_lock = threading.Lock()
+
+        # Protects the pending jobs, and signals the polling thread when jobs
+        # are added or when the poller is stopped.
+        self._pending_changed = threading.Condition()
+        self._pending = collections.OrderedDict()
+        self._stopped = False
+        self._exception = None
+
+    @property
+    def exception(self):
+        """Optional[Exception]: The error which stopped the polling thread.
+
+        The jobs which were pending are then not polled anymore.
+        """
+        with self._pending_changed:
+            return self._exception
+
+    @property
+    def pending_count(self):
+        """int: The number of jobs which are not done yet."""
+        with self._pending_changed:
+            return len(self._pending)
+
+    def add(self, job, callback=None, error_callback=None):
+        """Poll a job until it is done.
+
+        The job must have been started. If it is already done, the callback
+        is called at once.
+
+        Args:
+            job (google.cloud.bigquery.job._AsyncJob): The job.
+            callback (Optional[Callable[[google.cloud.bigquery.job._AsyncJob], Any]]):
+                Called with the job once it is done, from the polling thread.
+            error_callback (Optional[Callable[[google.cloud.bigquery.job._AsyncJob, Exception], Any]]):
+                Called with the job and the error if the polling thread stops
+                on an unexpected error before the job is done. Called at once
+                if the polling thread has already stopped on an error.
+        """
+        if job.state == job_module._DONE_STATE:
+            if callback is not None:
+                callback(job)
+            return
+
+        if job.created is None:
+            # The creation time bounds the listed jobs.
+            job.reload(retry=self._retry)
+
+        with self._pending_changed:
+            exception = self._exception
+            if exception is None:
+                key = _job_key(job)
+                _, callbacks, error_callbacks = self._pending.setdefault(
+                    key, (job, [], [])
+                )
+                if callback is not None:
+                    callbacks.append(callback)
+                if error_callback is not None:
+                    error_callbacks.append(error_callback)
+                self._pending_changed.notify()
+
+        if exception is not None and error_callback is not None:
+            error_callback(job, exception)
+
+    def poll(self):
+        """Run a round of polling, then call back for the jobs which are done.
+
+        Returns:
+            int: The number of jobs which are done.
+        """
+        with self._pending_changed:
+            pending = list(self._pending.values())
+
+        jobs_by_project = collections.defaultdict(list)
+        for job, _, _ in pending:
+            jobs_by_project[job.project].append(job)
+
+        done_jobs = []
+        for project, jobs in jobs_by_project.items():
+            done_jobs.extend(self._poll_project(project, jobs))
+
+        for job in done_jobs:
+            with self._pending_changed:
+                _, callbacks, _ = self._pending.pop(_job_key(job), (job, (), ()))
+
+            for callback in callbacks:
+                try:
+                    callback(job)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in a callback of job %s.", job.job_id)
+
+        return len(done_jobs)
+
+    def _poll_project(self, project, jobs):
+        """List the jobs of a project which are done.
+
+        Args:
+            project (str): The project of the jobs.
+            jobs (Sequence[google.cloud.bigquery.job._AsyncJob]):
+                The pending jobs of the project.
+
+        Returns:
+            List[google.cloud.bigquery.job._AsyncJob]:
+                The jobs which are done, updated from their listing.
+        """
+        jobs_by_id = {job.job_id: job for job in jobs}
+        creation_times = [job.created for job in jobs]
+
+        listed_jobs = self._client.list_jobs(
+            project=project,
+            all_users=self._all_users,
+            state_filter="done",
+            min_creation_time=min(creation_times),
+            max_creation_time=max(creation_times),
+            retry=self._retry,
+        )
+
+        done_jobs = []
+        for listed_job in listed_jobs:
+            job = jobs_by_id.pop(listed_job.job_id, None)
+            if job is None:
+                continue
+
+            # Also completes the future of the job.
+            job._set_properties(listed_job._properties)
+            done_jobs.append(job)
+            if not jobs_by_id:
+                break
+
+        return done_jobs
+
+    def _next_interval(self, done_count):
+        if done_count:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._interval * self._multiplier, self._max_interval)
+        return self._interval
+
+    def poll_until_stopped(self):
+        """Poll the jobs until the poller is stopped.
+
+        If an unexpected error stops the polling, it is reported to the error
+        callbacks of the pending jobs.
+
+        .. note::
+            This blocks; it is run in the polling thread.
+        """
+        try:
+            self._poll_until_stopped()
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.exception("%s stopped on an error.", _POLLER_WORKER_NAME)
+            self._fail_pending(exc)
+        else:
+            _LOGGER.info("%s exiting.", _POLLER_WORKER_NAME)
+
+    def _poll_until_stopped(self):
+        while True:
+            with self._pending_changed:
+                while not self._pending and not self._stopped:
+                    self._interval = self._min_interval
+                    self._pending_changed.wait()
+                if self._stopped:
+                    break
+
+            try:
+                done_count = self.poll()
+            except _RETRYABLE_POLL_ERRORS:
+                _LOGGER.exception("Error while listing the jobs, retrying.")
+                done_count = 0
+
+            with self._pending_changed:
+                if not self._stopped:
+                    # Wake up early when the poller is stopped.
+                    self._pending_changed.wait(self._next_interval(done_count))
+
+    def _fail_pending(self, exception):
+        """Stop polling the pending jobs, and call their error callbacks."""
+        with self._pending_changed:
+            self._exception = exception
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for job, _, error_callbacks in pending:
+            for error_callback in error_callbacks:
+                try:
+                    error_callback(job, exception)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error in an error callback of job %s.", job.job_id
+                    )
+
+    def start(self):
+        """Start polling the jobs from a helper thread."""
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError("Job poller is already running.")
+
+            with self._pending_changed:
+                self._stopped = False
+
+            thread = threading.Thread(
+                name=_POLLER_WORKER_NAME, target=self.poll_until_stopped
+            )
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug("Started helper thread %s", thread.name)
+            self._thread = thread
+
+    def stop(self):
+        """Stop the helper thread. The pending jobs are not polled anymore."""
+        with self._operational_lock:
+            with self._pending_changed:
+                self._stopped = True
+                self._pending_changed.notify()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
+
+
+def wait_for_jobs(jobs, timeout=None, return_when=ALL_COMPLETED, poller=None):
+    """Wait for jobs to be done, as :func:`concurrent.futures.wait` does.
+
+    Args:
+        jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+            The started jobs.
+        timeout (Optional[float]):
+            The maximum number of seconds to wait. By default, there is no
+            limit.
+        return_when (Optional[str]):
+            When to return, one of :data:`FIRST_COMPLETED`,
+            :data:`FIRST_EXCEPTION` (a job failed) or :data:`ALL_COMPLETED`.
+            Defaults to :data:`ALL_COMPLETED`.
+        poller (Optional[JobPoller]):
+            A running poller, used to poll the jobs. By default, a poller is
+            started with the client of the first job, and stopped before
+            returning.
+
+    Returns:
+        DoneAndNotDoneJobs: The jobs which are done, and those which are not.
+
+    Raises:
+        Exception: The error which stopped the polling thread, if any.
+    """
+    jobs = list(jobs)
+    done = set()
+    errors = []
+    job_done = threading.Condition()
+
+    def should_return():
+        if errors or len(done) == len(jobs):
+            return True
+        if return_when == FIRST_COMPLETED:
+            return bool(done)
+        if return_when == FIRST_EXCEPTION:
+            return any(job.error_result is not None for job in done)
+        return False
+
+    def on_done(job):
+        with job_done:
+            done.add(job)
+            job_done.notify()
+
+    def on_error(job, exception):
+        with job_done:
+            errors.append(exception)
+            job_done.notify()
+
+    owns_poller = poller is None and bool(jobs)
+    if owns_poller:
+        poller = JobPoller(jobs[0]._client)
+
+    for job in jobs:
+        poller.add(job, callback=on_done, error_callback=on_error)
+
+    if owns_poller:
+        poller.start()
+
+    deadline = None if timeout is None else time.time() + timeout
+    try:
+        with job_done:
+            while not should_return():
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    break
+                job_done.wait(remaining)
+            done_jobs = set(done)
+    finally:
+        if owns_poller:
+            poller.stop()
+
+    if errors:
+        raise errors[0]
+
+    return DoneAndNotDoneJobs(done_jobs, set(jobs) - done_jobs)
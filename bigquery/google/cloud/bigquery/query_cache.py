@@ -0,0 +1,587 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of query results.
+
+A :class:`QueryCache` runs the queries of a client, and keeps their results as
+Arrow tables. A query is answered from the cache if the same query, with the
+same configuration and parameters, ran before and none of the tables it reads
+was modified since:
+
+.. code-block:: python
+
+    from google.cloud import bigquery
+
+    client = bigquery.Client()
+    cache = bigquery.QueryCache(client, ttl=600)
+
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("id", "INT64", 42)]
+    )
+    result = cache.query(
+        "SELECT name FROM `dataset.users` WHERE id = @id", job_config=job_config
+    )
+    dataframe = result.to_dataframe()
+
+To detect the referenced tables and their modification, each query is first
+run as a (free) dry run. Results are cached only for ``SELECT`` statements
+reading tables with no streaming buffer, without a destination table, and not
+calling the functions whose result changes with each call, such as
+``CURRENT_TIMESTAMP()`` or ``RAND()``.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud.bigquery import job
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import Row
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the query cache."
+)
+_NO_PANDAS_ERROR = (
+    "The pandas library is not installed, please install "
+    "pandas to use the to_dataframe() function."
+)
+
+# Quoted strings and identifiers are kept verbatim, runs of whitespace and
+# comments are replaced by a single space.
+_SQL_TOKENS = re.compile(
+    r"""
+    (?P<quoted>
+        '''.*?(?<!\\)'''
+        | \"\"\".*?(?<!\\)\"\"\"
+        | '(?:\\.|[^'\\])*'
+        | "(?:\\.|[^"\\])*"
+        | `(?:\\.|[^`\\])*`
+    )
+    | (?P<space>(?:\s|--[^\n]*|\#[^\n]*|/\*.*?\*/)+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_NON_DETERMINISTIC_FUNCTIONS = re.compile(
+    r"\b(?:CURRENT_DATE|CURRENT_DATETIME|CURRENT_TIME|CURRENT_TIMESTAMP"
+    r"|GENERATE_UUID|NOW|RAND|SESSION_USER)\b",
+    re.IGNORECASE,
+)
+# Options of the query jobs that do not change their results.
+_IGNORED_CONFIGURATION_KEYS = ("dryRun", "jobTimeoutMs", "labels")
+
+_SCHEMA_METADATA_KEY = b"google.cloud.bigquery.schema"
+_CREATED_METADATA_KEY = b"google.cloud.bigquery.created"
+
+
+CacheEntry = collections.namedtuple("CacheEntry", ["table", "schema", "created"])
+CacheEntry.__doc__ = "The cached results of a query."
+CacheEntry.table.__doc__ = "pyarrow.Table: The rows of the results."
+CacheEntry.schema.__doc__ = (
+    "List[google.cloud.bigquery.schema.SchemaField]: The schema of the results."
+)
+CacheEntry.created.__doc__ = "float: When the query ran, in seconds since the epoch."
+
+
+def _normalize_query(query):
+    """Normalize the whitespace and the comments of a SQL query.
+
+    Args:
+        query (str): A SQL query.
+
+    Returns:
+        str: The query, with the same meaning.
+    """
+
+    def replace(match):
+        quoted = match.group("quoted")
+        return quoted if quoted is not None else " "
+
+    return _SQL_TOKENS.sub(replace, query).strip().rstrip(";").rstrip()
+
+
+class MemoryCacheBackend(object):
+    """Keep the cached results in memory.
+
+    The least recently used results are evicted first.
+
+    Args:
+        max_entries (Optional[int]):
+            The maximum number of query results to keep. Defaults to ``128``.
+        max_bytes (Optional[int]):
+            The maximum total size of the kept Arrow tables. Results larger
+            than this are not cached. By default, the size is not limited.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached results of a query.
+
+        Args:
+            key (str): The key of the query.
+
+        Returns:
+            Optional[CacheEntry]: The results, if cached.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                # Mark the entry as the most recently used.
+                self._entries[key] = entry
+            return entry
+
+    def set(self, key, entry):
+        """Cache the results of a query.
+
+        Args:
+            key (str): The key of the query.
+            entry (CacheEntry): The results.
+        """
+        nbytes = entry.table.nbytes
+        if self._max_bytes is not None and nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            self._delete(key)
+            self._entries[key] = entry
+            self._total_bytes += nbytes
+
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._total_bytes > self._max_bytes
+            ):
+                self._delete(next(iter(self._entries)))
+
+    def delete(self, key):
+        """Remove the results of a query from the cache.
+
+        Args:
+            key (str): The key of the query.
+        """
+        with self._lock:
+            self._delete(key)
+
+    def _delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.table.nbytes
+
+
+class ParquetCacheBackend(object):
+    """Keep the cached results in Parquet files.
+
+    The files can be shared by several processes. The least recently used
+    results are evicted first.
+
+    Args:
+        directory (str): The directory of the Parquet files, created if needed.
+        max_entries (Optional[int]):
+            The maximum number of query results to keep. Defaults to ``128``.
+    """
+
+    _SUFFIX = ".parquet"
+
+    def __init__(self, directory, max_entries=128):
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        self._directory = directory
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + self._SUFFIX)
+
+    def get(self, key):
+        """Return the cached results of a query.
+
+        Args:
+            key (str): The key of the query.
+
+        Returns:
+            Optional[CacheEntry]: The results, if cached.
+        """
+        path = self._path(key)
+        try:
+            table = pyarrow.parquet.read_table(path)
+            # Mark the entry as the most recently used.
+            os.utime(path, None)
+        except (IOError, OSError):
+            return None
+
+        metadata = table.schema.metadata or {}
+        if _SCHEMA_METADATA_KEY not in metadata:
+            return None
+
+        schema = [
+            SchemaField.from_api_repr(field)
+            for field in json.loads(metadata[_SCHEMA_METADATA_KEY].decode("utf-8"))
+        ]
+        created = float(metadata[_CREATED_METADATA_KEY])
+        return CacheEntry(table.replace_schema_metadata(None), schema, created)
+
+    def set(self, key, entry):
+        """Cache the results of a query.
+
+        Args:
+            key (str): The key of the query.
+            entry (CacheEntry): The results.
+        """
+        schema = json.dumps([field.to_api_repr() for field in entry.schema])
+        table = entry.table.replace_schema_metadata(
+            {
+                _SCHEMA_METADATA_KEY: schema.encode("utf-8"),
+                _CREATED_METADATA_KEY: repr(entry.created).encode("ascii"),
+            }
+        )
+
+        path = self._path(key)
+        # Write to a temporary file first, so that readers never see a
+        # partially written file.
+        temp_path = "{}.{}-{}.tmp".format(
+            path, os.getpid(), threading.current_thread().ident
+        )
+        pyarrow.parquet.write_table(table, temp_path)
+
+        with self._lock:
+            os.rename(temp_path, path)
+            self._evict()
+
+    def delete(self, key):
+        """Remove the results of a query from the cache.
+
+        Args:
+            key (str): The key of the query.
+        """
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        paths = [
+            os.path.join(self._directory, name)
+            for name in os.listdir(self._directory)
+            if name.endswith(self._SUFFIX)
+        ]
+        if len(paths) <= self._max_entries:
+            return
+
+        paths.sort(key=os.path.getmtime)
+        for path in paths[: len(paths) - self._max_entries]:
+            try:
+                os.remove(path)
+            except OSError:  # pragma: NO COVER
+                pass
+
+
+class CachedRowIterator(object):
+    """The rows of cached query results.
+
+    Args:
+        entry (CacheEntry): The cached results.
+    """
+
+    def __init__(self, entry):
+        self._table = entry.table
+        self._schema = entry.schema
+        self._field_to_index = {
+            field.name: index for index, field in enumerate(entry.schema)
+        }
+
+    @property
+    def schema(self):
+        """List[google.cloud.bigquery.schema.SchemaField]: The schema of the rows."""
+        return list(self._schema)
+
+    @property
+    def total_rows(self):
+        """int: The number of rows."""
+        return self._table.num_rows
+
+    def __iter__(self):
+        for record_batch in self._table.to_batches():
+            columns = [column.to_pylist() for column in record_batch.columns]
+            for values in zip(*columns):
+                yield Row(values, self._field_to_index)
+
+    def to_arrow(self):
+        """Return the rows as a :class:`pyarrow.Table`.
+
+        Returns:
+            pyarrow.Table: The cached table.
+        """
+        return self._table
+
+    def to_dataframe(self, dtypes=None):
+        """Return the rows as a :class:`pandas.DataFrame`.
+
+        Args:
+            dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+                Optional. A dictionary of column names pandas ``dtype``s.
+
+        Returns:
+            pandas.DataFrame: The rows.
+
+        Raises:
+            ValueError: If the :mod:`pandas` library cannot be imported.
+        """
+        try:
+            dataframe = self._table.to_pandas()
+        except ImportError:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        for column, dtype in (dtypes or {}).items():
+            dataframe[column] = dataframe[column].astype(dtype)
+        return dataframe
+
+
+class QueryCacheResult(object):
+    """The results of a query run through a :class:`QueryCache`.
+
+    Args:
+        query_job (Optional[google.cloud.bigquery.job.QueryJob]):
+            The job which ran the query, ``None`` if the results were cached.
+        entry (Optional[CacheEntry]):
+            The cached results, ``None`` if the results cannot be cached.
+    """
+
+    def __init__(self, query_job, entry):
+        self._query_job = query_job
+        self._entry = entry
+
+    @property
+    def job(self):
+        """Optional[google.cloud.bigquery.job.QueryJob]: The job which ran the
+        query, ``None`` if the results were read from the cache."""
+        return self._query_job
+
+    @property
+    def from_cache(self):
+        """bool: Whether the results were read from the cache."""
+        return self._query_job is None
+
+    def result(self):
+        """Return the rows of the results.
+
+        Returns:
+            Union[ \
+                CachedRowIterator, \
+                google.cloud.bigquery.table.RowIterator, \
+            ]: The rows.
+        """
+        if self._entry is None:
+            return self._query_job.result()
+        return CachedRowIterator(self._entry)
+
+    def to_arrow(self):
+        """Return the results as a :class:`pyarrow.Table`.
+
+        Returns:
+            pyarrow.Table: The rows.
+        """
+        if self._entry is None:
+            return self._query_job.to_arrow()
+        return self._entry.table
+
+    def to_dataframe(self, dtypes=None):
+        """Return the results as a :class:`pandas.DataFrame`.
+
+        Args:
+            dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+                Optional. A dictionary of column names pandas ``dtype``s.
+
+        Returns:
+            pandas.DataFrame: The rows.
+        """
+        if self._entry is None:
+            return self._query_job.to_dataframe(dtypes=dtypes)
+        return CachedRowIterator(self._entry).to_dataframe(dtypes=dtypes)
+
+
+class QueryCache(object):
+    """Run queries, and cache their results on the client side.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to run the queries.
+        backend (Optional[Union[MemoryCacheBackend, ParquetCacheBackend]]):
+            Where the results are kept. Defaults to a
+            :class:`MemoryCacheBackend`.
+        ttl (Optional[float]):
+            The maximum age of the cached results, in seconds. By default,
+            results are kept until one of the tables they were read from is
+            modified, or until they are evicted.
+        bqstorage_client (google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient):
+            **Beta Feature** Optional. A BigQuery Storage API client, used to
+            download the results to cache.
+
+    Raises:
+        ValueError: If the :mod:`pyarrow` library cannot be imported.
+    """
+
+    def __init__(self, client, backend=None, ttl=None, bqstorage_client=None):
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        if backend is None:
+            backend = MemoryCacheBackend()
+
+        self._client = client
+        self._backend = backend
+        self._ttl = ttl
+        self._bqstorage_client = bqstorage_client
+
+    def _job_config(self, job_config):
+        """Merge the query configuration with the defaults of the client."""
+        job_config = copy.deepcopy(job_config) or job.QueryJobConfig()
+        default_job_config = self._client._default_query_job_config
+        if default_job_config:
+            job_config = job_config._fill_from_default(default_job_config)
+        return job_config
+
+    def _cache_key(self, query, job_config, location, project, retry):
+        """Compute the cache key of a query.
+
+        Returns:
+            Optional[str]: The key, ``None`` if the results cannot be cached.
+        """
+        if job_config.dry_run or job_config.destination is not None:
+            return None
+        if _NON_DETERMINISTIC_FUNCTIONS.search(query):
+            return None
+
+        dry_run_config = copy.deepcopy(job_config)
+        dry_run_config.dry_run = True
+        dry_run_job = self._client.query(
+            query,
+            job_config=dry_run_config,
+            location=location,
+            project=project,
+            retry=retry,
+        )
+        if (dry_run_job.statement_type or "SELECT").upper() != "SELECT":
+            return None
+
+        tables = []
+        for table_ref in dry_run_job.referenced_tables:
+            table = self._client.get_table(table_ref, retry=retry)
+            if table.streaming_buffer is not None or table.table_type == "EXTERNAL":
+                # Their modification time does not change with their rows.
+                return None
+            modified = table.modified
+            tables.append(
+                (
+                    "{}.{}.{}".format(table.project, table.dataset_id, table.table_id),
+                    modified.isoformat() if modified is not None else None,
+                )
+            )
+
+        configuration = job_config.to_api_repr()
+        for key in _IGNORED_CONFIGURATION_KEYS:
+            configuration.pop(key, None)
+
+        key = json.dumps(
+            {
+                "query": _normalize_query(query),
+                "configuration": configuration,
+                "location": location or self._client.location,
+                "project": project or self._client.project,
+                "tables": sorted(tables),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def query(
+        self, query, job_config=None, location=None, project=None, retry=DEFAULT_RETRY
+    ):
+        """Run a SQL query, or read its results from the cache.
+
+        Args:
+            query (str): SQL query to be executed.
+
+        Keyword Arguments:
+            job_config (google.cloud.bigquery.job.QueryJobConfig):
+                (Optional) Extra configuration options for the job.
+            location (str):
+                (Optional) Location where to run the job. Must match the
+                location of the any table used in the query as well as the
+                destination table.
+            project (str):
+                (Optional) Project ID of the project of where to run the job.
+                Defaults to the client's project.
+            retry (google.api_core.retry.Retry):
+                (Optional) How to retry the RPCs.
+
+        Returns:
+            QueryCacheResult:
+                The results. If they were not cached, the query job is done
+                and, if they can be cached, they were downloaded.
+        """
+        job_config = self._job_config(job_config)
+        key = self._cache_key(query, job_config, location, project, retry)
+
+        if key is not None:
+            entry = self._backend.get(key)
+            if entry is not None and (
+                self._ttl is None or time.time() - entry.created <= self._ttl
+            ):
+                _LOGGER.debug("Query results read from the cache: %s", key)
+                return QueryCacheResult(None, entry)
+            if entry is not None:
+                self._backend.delete(key)
+
+        created = time.time()
+        query_job = self._client.query(
+            query,
+            job_config=job_config,
+            location=location,
+            project=project,
+            retry=retry,
+        )
+        if key is None:
+            return QueryCacheResult(query_job, None)
+
+        rows = query_job.result(retry=retry)
+        table = rows.to_arrow(bqstorage_client=self._bqstorage_client)
+        entry = CacheEntry(table, rows.schema, created)
+        self._backend.set(key, entry)
+        return QueryCacheResult(query_job, entry)
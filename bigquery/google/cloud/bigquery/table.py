@@ -1344,7 +1344,8 @@ class RowIterator(HTTPIterator):
             next_token="pageToken",
         )
         schema = _to_schema_fields(schema)
-        self._field_to_index = _helpers._field_to_index_mapping(schema)
+        self._decoder = _helpers._RowsDecoder(schema)
+        self._field_to_index = self._decoder.field_to_index
         self._page_size = page_size
         self._preserve_order = False
         self._project = client.project
@@ -1408,10 +1409,12 @@ class RowIterator(HTTPIterator):
         self, bqstorage_download, tabledata_list_download, bqstorage_client=None
     ):
         if bqstorage_client is not None:
+            items_yielded = False
             try:
                 # Iterate over the stream so that read errors are raised (and
                 # the method can then fallback to tabledata.list).
                 for item in bqstorage_download():
+                    items_yielded = True
                     yield item
                 return
             except google.api_core.exceptions.Forbidden:
@@ -1425,7 +1428,11 @@ class RowIterator(HTTPIterator):
                 # query results tables, so some errors are expected. Rather
                 # than throw those errors, try reading the DataFrame again, but
                 # with the tabledata.list API.
-                pass
+                #
+                # The pages already yielded cannot be taken back, falling back
+                # would yield their rows twice.
+                if items_yielded:
+                    raise
 
         _LOGGER.debug(
             "Started reading table '{}.{}.{}' with tabledata.list.".format(
@@ -1435,8 +1442,11 @@ class RowIterator(HTTPIterator):
         for item in tabledata_list_download():
             yield item
 
-    def _to_arrow_iterable(self, bqstorage_client=None):
-        """Create an iterable of arrow RecordBatches, to process the table as a stream."""
+    def _to_arrow_iterable(self, bqstorage_client=None, **download_options):
+        """Create an iterable of arrow RecordBatches, to process the table as a stream.
+
+        The ``download_options`` are passed to the BQ Storage API download.
+        """
         bqstorage_download = functools.partial(
             _pandas_helpers.download_arrow_bqstorage,
             self._project,
@@ -1444,6 +1454,7 @@ class RowIterator(HTTPIterator):
             bqstorage_client,
             preserve_order=self._preserve_order,
             selected_fields=self._selected_fields,
+            **download_options
         )
         tabledata_list_download = functools.partial(
             _pandas_helpers.download_arrow_tabledata_list, iter(self.pages), self.schema
@@ -1454,6 +1465,101 @@ class RowIterator(HTTPIterator):
             bqstorage_client=bqstorage_client,
         )
 
+    def _validate_bqstorage_client(self, bqstorage_client):
+        """Return the BQ Storage API client to use to read the rows, if any."""
+        if bqstorage_client is not None and self.max_results is not None:
+            warnings.warn(
+                "Cannot use bqstorage_client if max_results is set, "
+                "reverting to fetching data with the tabledata.list endpoint.",
+                stacklevel=3,
+            )
+            return None
+        return bqstorage_client
+
+    def to_arrow_iterable(
+        self,
+        bqstorage_client=None,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_queue_bytes=None,
+        max_stream_count=None,
+        max_workers=None,
+        progress_callback=None,
+    ):
+        """[Beta] Create an iterable of :class:`pyarrow.RecordBatch`, to
+        process the table as a stream.
+
+        Unlike :meth:`to_arrow`, the rows are not all kept in memory: the
+        record batches are yielded as they are downloaded, so that results
+        larger than the available memory can be processed.
+
+        Args:
+            bqstorage_client (google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient):
+                **Beta Feature** Optional. A BigQuery Storage API client. If
+                supplied, use the faster BigQuery Storage API to fetch rows
+                from BigQuery. This API is a billable API.
+
+                This method requires the ``pyarrow`` and
+                ``google-cloud-bigquery-storage`` libraries.
+
+                Reading from a specific partition or snapshot is not
+                currently supported by this method.
+            max_queue_size (Optional[int]):
+                The maximum number of record batches downloaded from the
+                BigQuery Storage API, but not yet consumed. By default, this
+                is the number of parallel downloads. If ``None`` or ``0``,
+                the number of record batches is not bounded.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            max_queue_bytes (Optional[int]):
+                The maximum total size of the record batches downloaded from
+                the BigQuery Storage API, but not yet consumed.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            max_stream_count (Optional[int]):
+                The maximum number of streams to read in parallel from the
+                BigQuery Storage API. The server decides by default.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            max_workers (Optional[int]):
+                The maximum number of streams downloaded concurrently from
+                the BigQuery Storage API. By default, all the streams are
+                downloaded concurrently.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            progress_callback (Optional[Callable[[str, StreamProgress], Any]]):
+                Called each time a page downloaded from the BigQuery Storage
+                API is consumed, with the name of its stream and the progress
+                of that stream so far: a ``StreamProgress`` named tuple with
+                the number of ``pages``, ``rows`` and ``bytes`` consumed.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]:
+                The record batches of the table, one per page of rows.
+
+        Raises:
+            ValueError: If the :mod:`pyarrow` library cannot be imported.
+
+        ..versionadded:: 1.24.0
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        return self._to_arrow_iterable(
+            bqstorage_client=self._validate_bqstorage_client(bqstorage_client),
+            max_queue_size=max_queue_size,
+            max_queue_bytes=max_queue_bytes,
+            max_stream_count=max_stream_count,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+
     # If changing the signature of this method, make sure to apply the same
     # changes to job.QueryJob.to_arrow()
     def to_arrow(
@@ -1461,6 +1567,7 @@ class RowIterator(HTTPIterator):
         progress_bar_type=None,
         bqstorage_client=None,
         create_bqstorage_client=False,
+        max_workers=None,
     ):
         """[Beta] Create a class:`pyarrow.Table` by loading all pages of a
         table or query.
@@ -1503,6 +1610,15 @@ class RowIterator(HTTPIterator):
 
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
+                ..versionadded:: 1.24.0
+            max_workers (Optional[int]):
+                The maximum number of streams downloaded concurrently from
+                the BigQuery Storage API. By default, all the streams are
+                downloaded concurrently.
+
+                This argument does nothing if the BigQuery Storage API is not
+                used.
+
                 ..versionadded:: 1.24.0
 
         Returns:
@@ -1529,7 +1645,7 @@ class RowIterator(HTTPIterator):
 
             record_batches = []
             for record_batch in self._to_arrow_iterable(
-                bqstorage_client=bqstorage_client
+                bqstorage_client=bqstorage_client, max_workers=max_workers
             ):
                 record_batches.append(record_batch)
 
@@ -1554,10 +1670,13 @@ class RowIterator(HTTPIterator):
             arrow_schema = _pandas_helpers.bq_to_arrow_schema(self._schema)
             return pyarrow.Table.from_batches(record_batches, schema=arrow_schema)
 
-    def _to_dataframe_iterable(self, bqstorage_client=None, dtypes=None):
+    def _to_dataframe_iterable(
+        self, bqstorage_client=None, dtypes=None, **download_options
+    ):
         """Create an iterable of pandas DataFrames, to process the table as a stream.
 
-        See ``to_dataframe`` for argument descriptions.
+        See ``to_dataframe`` for argument descriptions. The
+        ``download_options`` are passed to the BQ Storage API download.
         """
         column_names = [field.name for field in self._schema]
         bqstorage_download = functools.partial(
@@ -1569,6 +1688,7 @@ class RowIterator(HTTPIterator):
             dtypes,
             preserve_order=self._preserve_order,
             selected_fields=self._selected_fields,
+            **download_options
         )
         tabledata_list_download = functools.partial(
             _pandas_helpers.download_dataframe_tabledata_list,
@@ -1582,6 +1702,101 @@ class RowIterator(HTTPIterator):
             bqstorage_client=bqstorage_client,
         )
 
+    def to_dataframe_iterable(
+        self,
+        bqstorage_client=None,
+        dtypes=None,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_queue_bytes=None,
+        max_stream_count=None,
+        max_workers=None,
+        progress_callback=None,
+    ):
+        """[Beta] Create an iterable of pandas DataFrames, to process the
+        table as a stream.
+
+        Unlike :meth:`to_dataframe`, the rows are not all kept in memory: the
+        DataFrames are yielded as they are downloaded, so that results larger
+        than the available memory can be processed.
+
+        Args:
+            bqstorage_client (google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient):
+                **Beta Feature** Optional. A BigQuery Storage API client. If
+                supplied, use the faster BigQuery Storage API to fetch rows
+                from BigQuery.
+
+                This method requires the ``pyarrow`` and
+                ``google-cloud-bigquery-storage`` libraries.
+
+                Reading from a specific partition or snapshot is not
+                currently supported by this method.
+            dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+                Optional. A dictionary of column names pandas ``dtype``s. The
+                provided ``dtype`` is used when constructing the series for
+                the column specified. Otherwise, the default pandas behavior
+                is used.
+            max_queue_size (Optional[int]):
+                The maximum number of DataFrames downloaded from the BigQuery
+                Storage API, but not yet consumed. By default, this is the
+                number of parallel downloads. If ``None`` or ``0``, the number
+                of DataFrames is not bounded.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            max_queue_bytes (Optional[int]):
+                The maximum total size of the DataFrames downloaded from the
+                BigQuery Storage API, but not yet consumed.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            max_stream_count (Optional[int]):
+                The maximum number of streams to read in parallel from the
+                BigQuery Storage API. The server decides by default.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            max_workers (Optional[int]):
+                The maximum number of streams downloaded concurrently from
+                the BigQuery Storage API. By default, all the streams are
+                downloaded concurrently.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+            progress_callback (Optional[Callable[[str, StreamProgress], Any]]):
+                Called each time a page downloaded from the BigQuery Storage
+                API is consumed, with the name of its stream and the progress
+                of that stream so far: a ``StreamProgress`` named tuple with
+                the number of ``pages``, ``rows`` and ``bytes`` consumed.
+
+                This argument does nothing if ``bqstorage_client`` is not
+                supplied.
+
+        Returns:
+            Iterator[pandas.DataFrame]:
+                The DataFrames of the table, one per page of rows. The column
+                headers are derived from the destination table's schema.
+
+        Raises:
+            ValueError:
+                If the :mod:`pandas` library cannot be imported.
+
+        ..versionadded:: 1.24.0
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        if dtypes is None:
+            dtypes = {}
+
+        return self._to_dataframe_iterable(
+            bqstorage_client=self._validate_bqstorage_client(bqstorage_client),
+            dtypes=dtypes,
+            max_queue_size=max_queue_size,
+            max_queue_bytes=max_queue_bytes,
+            max_stream_count=max_stream_count,
+            max_workers=max_workers,
+            progress_callback=progress_callback,
+        )
+
     # If changing the signature of this method, make sure to apply the same
     # changes to job.QueryJob.to_dataframe()
     def to_dataframe(
@@ -1590,6 +1805,7 @@ class RowIterator(HTTPIterator):
         dtypes=None,
         progress_bar_type=None,
         create_bqstorage_client=False,
+        max_workers=None,
     ):
         """Create a pandas DataFrame by loading all pages of a query.
 
@@ -1643,6 +1859,15 @@ class RowIterator(HTTPIterator):
 
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
+                ..versionadded:: 1.24.0
+            max_workers (Optional[int]):
+                The maximum number of streams downloaded concurrently from
+                the BigQuery Storage API. By default, all the streams are
+                downloaded concurrently.
+
+                This argument does nothing if the BigQuery Storage API is not
+                used.
+
                 ..versionadded:: 1.24.0
 
         Returns:
@@ -1684,7 +1909,9 @@ class RowIterator(HTTPIterator):
 
             frames = []
             for frame in self._to_dataframe_iterable(
-                bqstorage_client=bqstorage_client, dtypes=dtypes
+                bqstorage_client=bqstorage_client,
+                dtypes=dtypes,
+                max_workers=max_workers,
             ):
                 frames.append(frame)
 
@@ -1726,6 +1953,7 @@ class _EmptyRowIterator(object):
         progress_bar_type=None,
         bqstorage_client=None,
         create_bqstorage_client=False,
+        max_workers=None,
     ):
         """[Beta] Create an empty class:`pyarrow.Table`.
 
@@ -1733,6 +1961,7 @@ class _EmptyRowIterator(object):
             progress_bar_type (Optional[str]): Ignored. Added for compatibility with RowIterator.
             bqstorage_client (Any): Ignored. Added for compatibility with RowIterator.
             create_bqstorage_client (bool): Ignored. Added for compatibility with RowIterator.
+            max_workers (Any): Ignored. Added for compatibility with RowIterator.
 
         Returns:
             pyarrow.Table: An empty :class:`pyarrow.Table`.
@@ -1747,6 +1976,7 @@ class _EmptyRowIterator(object):
         dtypes=None,
         progress_bar_type=None,
         create_bqstorage_client=False,
+        max_workers=None,
     ):
         """Create an empty dataframe.
 
@@ -1755,6 +1985,7 @@ class _EmptyRowIterator(object):
             dtypes (Any): Ignored. Added for compatibility with RowIterator.
             progress_bar_type (Any): Ignored. Added for compatibility with RowIterator.
             create_bqstorage_client (bool): Ignored. Added for compatibility with RowIterator.
+            max_workers (Any): Ignored. Added for compatibility with RowIterator.
 
         Returns:
             pandas.DataFrame: An empty :class:`~pandas.DataFrame`.
@@ -1763,6 +1994,37 @@ class _EmptyRowIterator(object):
             raise ValueError(_NO_PANDAS_ERROR)
         return pandas.DataFrame()
 
+    def to_arrow_iterable(self, bqstorage_client=None, **download_options):
+        """[Beta] Create an empty iterable of :class:`pyarrow.RecordBatch`.
+
+        Args:
+            bqstorage_client (Any): Ignored. Added for compatibility with RowIterator.
+            download_options (Any): Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: An empty iterator.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+        return iter(())
+
+    def to_dataframe_iterable(
+        self, bqstorage_client=None, dtypes=None, **download_options
+    ):
+        """[Beta] Create an empty iterable of pandas DataFrames.
+
+        Args:
+            bqstorage_client (Any): Ignored. Added for compatibility with RowIterator.
+            dtypes (Any): Ignored. Added for compatibility with RowIterator.
+            download_options (Any): Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            Iterator[pandas.DataFrame]: An empty iterator.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        return iter(())
+
     def __iter__(self):
         return iter(())
 
@@ -2095,29 +2357,24 @@ def _item_to_row(iterator, resource):
     Returns:
         google.cloud.bigquery.table.Row: The next row in the page.
     """
-    return Row(
-        _helpers._row_tuple_from_json(resource, iterator.schema),
-        iterator._field_to_index,
-    )
+    return Row(iterator._decoder.row_tuple(resource), iterator._field_to_index)
 
 
-def _tabledata_list_page_columns(schema, response):
+def _tabledata_list_page_columns(decoder, response):
     """Make a generator of all the columns in a page from tabledata.list.
 
     This enables creating a :class:`pandas.DataFrame` and other
     column-oriented data structures such as :class:`pyarrow.RecordBatch`
+
+    Each column is converted at once, when it is first read.
     """
-    columns = []
     rows = response.get("rows", [])
 
-    def get_column_data(field_index, field):
-        for row in rows:
-            yield _helpers._field_from_json(row["f"][field_index]["v"], field)
-
-    for field_index, field in enumerate(schema):
-        columns.append(get_column_data(field_index, field))
+    def get_column_data(field_index):
+        for value in decoder.column(rows, field_index):
+            yield value
 
-    return columns
+    return [get_column_data(field_index) for field_index in range(len(decoder.schema))]
 
 
 # pylint: disable=unused-argument
@@ -2131,7 +2388,7 @@ def _rows_page_start(iterator, page, response):
     """
     # Make a (lazy) copy of the page in column-oriented format for use in data
     # science packages.
-    page._columns = _tabledata_list_page_columns(iterator._schema, response)
+    page._columns = _tabledata_list_page_columns(iterator._decoder, response)
 
     total_rows = response.get("totalRows")
     if total_rows is not None:
@@ -606,6 +606,148 @@ class Test_rows_from_json(unittest.TestCase):
         self.assertEqual(coerced, expected)
 
 
+class Test_RowsDecoder(unittest.TestCase):
+    def _make_one(self, schema):
+        from google.cloud.bigquery._helpers import _RowsDecoder
+
+        with _field_isinstance_patcher():
+            return _RowsDecoder(schema)
+
+    def _make_schema(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        return [
+            SchemaField("name", "STRING"),
+            SchemaField("age", "INTEGER"),
+            SchemaField("score", "FLOAT", mode="REQUIRED"),
+            SchemaField("balance", "NUMERIC"),
+            SchemaField("alive", "BOOLEAN"),
+            SchemaField("born", "TIMESTAMP"),
+            SchemaField("tags", "STRING", mode="REPEATED"),
+            SchemaField(
+                "address",
+                "RECORD",
+                fields=[
+                    SchemaField("city", "STRING"),
+                    SchemaField("zip", "INTEGER"),
+                    SchemaField("lines", "STRING", mode="REPEATED"),
+                ],
+            ),
+            SchemaField(
+                "phones",
+                "RECORD",
+                mode="REPEATED",
+                fields=[SchemaField("number", "STRING", mode="REQUIRED")],
+            ),
+        ]
+
+    def _make_rows(self):
+        return [
+            {
+                "f": [
+                    {"v": "Phred Phlyntstone"},
+                    {"v": "32"},
+                    {"v": "1.5"},
+                    {"v": "12.25"},
+                    {"v": "true"},
+                    {"v": "1.5E9"},
+                    {"v": [{"v": "a"}, {"v": "b"}]},
+                    {
+                        "v": {
+                            "f": [
+                                {"v": "Bedrock"},
+                                {"v": "12345"},
+                                {"v": [{"v": "301 Cobblestone Way"}]},
+                            ]
+                        }
+                    },
+                    {"v": [{"v": {"f": [{"v": "555-1212"}]}}]},
+                ]
+            },
+            {
+                "f": [
+                    {"v": None},
+                    {"v": None},
+                    {"v": "-2"},
+                    {"v": None},
+                    {"v": None},
+                    {"v": None},
+                    {"v": []},
+                    {"v": None},
+                    {"v": []},
+                ]
+            },
+        ]
+
+    def test_row_tuple_matches_field_from_json(self):
+        from google.cloud.bigquery._helpers import _field_from_json
+
+        schema = self._make_schema()
+        decoder = self._make_one(schema)
+
+        for row in self._make_rows():
+            expected = tuple(
+                _field_from_json(cell["v"], field)
+                for field, cell in zip(schema, row["f"])
+            )
+            self.assertEqual(decoder.row_tuple(row), expected)
+
+    def test_row_tuple_w_nulls(self):
+        decoder = self._make_one(self._make_schema())
+
+        row = decoder.row_tuple(self._make_rows()[1])
+
+        self.assertEqual(row, (None, None, -2.0, None, None, None, [], None, []))
+
+    def test_row_tuple_w_required_null(self):
+        decoder = self._make_one([_Field("REQUIRED", "col", "INTEGER")])
+
+        with self.assertRaises(TypeError):
+            decoder.row_tuple({"f": [{"v": None}]})
+
+    def test_row_tuple_w_unknown_type(self):
+        decoder = self._make_one(
+            [_Field("NULLABLE", "col", "UNKNOWN"), _Field("REPEATED", "rep", "UNKNOWN")]
+        )
+
+        row = decoder.row_tuple({"f": [{"v": "x"}, {"v": [{"v": "y"}]}]})
+
+        self.assertEqual(row, ("x", ["y"]))
+
+    def test_rows(self):
+        from google.cloud.bigquery.table import Row
+
+        decoder = self._make_one(self._make_schema())
+
+        rows = decoder.rows(self._make_rows())
+
+        self.assertEqual(len(rows), 2)
+        self.assertIsInstance(rows[0], Row)
+        self.assertEqual(rows[0]["age"], 32)
+        self.assertEqual(rows[0]["address"]["lines"], ["301 Cobblestone Way"])
+        self.assertEqual(rows[0]["phones"], [{"number": "555-1212"}])
+        self.assertIsNone(rows[1]["name"])
+
+    def test_columns(self):
+        import decimal
+
+        decoder = self._make_one(self._make_schema())
+
+        columns = decoder.columns(self._make_rows())
+
+        self.assertEqual(len(columns), 9)
+        self.assertEqual(columns[0], ["Phred Phlyntstone", None])
+        self.assertEqual(columns[1], [32, None])
+        self.assertEqual(columns[3], [decimal.Decimal("12.25"), None])
+        self.assertEqual(columns[4], [True, None])
+        self.assertEqual(columns[6], [["a", "b"], []])
+
+    def test_columns_wo_rows(self):
+        decoder = self._make_one(self._make_schema())
+
+        self.assertEqual(decoder.columns([]), [[]] * 9)
+
+
 class Test_int_to_json(unittest.TestCase):
     def _call_fut(self, value):
         from google.cloud.bigquery._helpers import _int_to_json
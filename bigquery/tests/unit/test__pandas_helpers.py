@@ -16,7 +16,9 @@ import collections
 import datetime
 import decimal
 import functools
+import io
 import operator
+import threading
 import warnings
 
 import mock
@@ -37,6 +39,11 @@ except ImportError:  # pragma: NO COVER
 import pytest
 import pytz
 
+try:
+    from google.cloud import bigquery_storage_v1beta1
+except ImportError:  # pragma: NO COVER
+    bigquery_storage_v1beta1 = None
+
 from google import api_core
 from google.cloud.bigquery import schema
 
@@ -959,6 +966,88 @@ def test_dataframe_to_parquet_compression_method(module_under_test):
     assert call_args.kwargs.get("compression") == "ZSTD"
 
 
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_parquet_stream_without_pyarrow(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "pyarrow", None)
+    with pytest.raises(ValueError) as exc_context:
+        module_under_test.ParquetStream(pandas.DataFrame(), ())
+    assert "pyarrow is required" in str(exc_context.value)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_w_invalid_row_group_size(module_under_test):
+    with pytest.raises(ValueError):
+        module_under_test.ParquetStream(pandas.DataFrame(), (), row_group_size=0)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_read_in_chunks(module_under_test):
+    import pyarrow.parquet
+
+    bq_schema = (
+        schema.SchemaField("id", "INTEGER"),
+        schema.SchemaField("name", "STRING"),
+    )
+    dataframe = pandas.DataFrame(
+        {"id": range(10), "name": ["name-{}".format(i) for i in range(10)]}
+    )
+    stream = module_under_test.ParquetStream(dataframe, bq_schema, row_group_size=3)
+
+    chunks = []
+    chunk = stream.read(64)
+    while chunk:
+        chunks.append(chunk)
+        assert stream.tell() == sum(len(chunk) for chunk in chunks)
+        chunk = stream.read(64)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) == 64 for chunk in chunks[:-1])
+    parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.num_row_groups == 4
+    assert parquet_file.read().to_pydict() == {
+        "id": list(range(10)),
+        "name": ["name-{}".format(i) for i in range(10)],
+    }
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_seek_within_last_read(module_under_test):
+    bq_schema = (schema.SchemaField("id", "INTEGER"),)
+    dataframe = pandas.DataFrame({"id": range(100)})
+    stream = module_under_test.ParquetStream(dataframe, bq_schema, row_group_size=10)
+
+    stream.read(100)
+    chunk = stream.read(100)
+    assert stream.seek(150) == 150
+    assert stream.read(50) == chunk[50:]
+
+    # The first read is discarded by the second one.
+    with pytest.raises(ValueError):
+        stream.seek(50)
+    with pytest.raises(ValueError):
+        stream.seek(0, 2)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_empty_dataframe(module_under_test):
+    import pyarrow.parquet
+
+    bq_schema = (schema.SchemaField("id", "INTEGER"),)
+    dataframe = pandas.DataFrame({"id": pandas.Series([], dtype="int64")})
+    stream = module_under_test.ParquetStream(dataframe, bq_schema)
+
+    table = pyarrow.parquet.read_table(io.BytesIO(stream.read()))
+
+    assert stream.read() == b""
+    assert table.num_rows == 0
+    assert table.schema.names == ["id"]
+    assert pyarrow.types.is_int64(table.schema.field("id").type)
+
+
 @pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
 def test_dataframe_to_bq_schema_fallback_needed_wo_pyarrow(module_under_test):
     dataframe = pandas.DataFrame(
@@ -1296,3 +1385,180 @@ def test_download_dataframe_tabledata_list_dict_sequence_schema(module_under_tes
         )
     )
     assert result.equals(expected_result)
+
+
+def _make_bqstorage_client(stream_count, pages_per_stream, page_rows=2):
+    """Create a mock BQ Storage client reading Arrow pages from the streams."""
+    from google.cloud.bigquery_storage_v1beta1 import reader
+
+    streams = [
+        {"name": "/projects/proj/dataset/dset/tables/tbl/streams/{}".format(i)}
+        for i in range(stream_count)
+    ]
+    session = bigquery_storage_v1beta1.types.ReadSession(streams=streams)
+
+    bqstorage_client = mock.create_autospec(
+        bigquery_storage_v1beta1.BigQueryStorageClient
+    )
+    bqstorage_client.create_read_session.return_value = session
+
+    record_batch = pyarrow.RecordBatch.from_arrays(
+        [pyarrow.array(range(page_rows))], names=["colA"]
+    )
+
+    def read_rows(position):
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_arrow.return_value = record_batch
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        mock_rows = mock_rowstream.rows.return_value
+        type(mock_rows).pages = mock.PropertyMock(
+            return_value=(mock_page,) * pages_per_stream
+        )
+        return mock_rowstream
+
+    bqstorage_client.read_rows.side_effect = read_rows
+    return bqstorage_client, record_batch
+
+
+def _make_table():
+    from google.cloud.bigquery import table
+
+    return table.TableReference.from_string("proj.dset.tbl")
+
+
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_download_arrow_bqstorage_bounded_queue(module_under_test):
+    bqstorage_client, record_batch = _make_bqstorage_client(
+        stream_count=3, pages_per_stream=4
+    )
+    progress_callback = mock.Mock()
+
+    with mock.patch.object(
+        module_under_test.queue, "Queue", wraps=module_under_test.queue.Queue
+    ) as queue_class:
+        pages = list(
+            module_under_test.download_arrow_bqstorage(
+                "proj",
+                _make_table(),
+                bqstorage_client,
+                max_stream_count=5,
+                max_workers=2,
+                progress_callback=progress_callback,
+            )
+        )
+
+    assert len(pages) == 12
+    # The queue holds at most one page per worker.
+    queue_class.assert_called_once_with(maxsize=2)
+    _, kwargs = bqstorage_client.create_read_session.call_args
+    assert kwargs["requested_streams"] == 5
+
+    # The progress of each stream is reported as its pages are consumed.
+    assert progress_callback.call_count == 12
+    final_progress = {}
+    for call in progress_callback.call_args_list:
+        stream_name, progress = call[0]
+        final_progress[stream_name] = progress
+    assert len(final_progress) == 3
+    for progress in final_progress.values():
+        assert progress == module_under_test.StreamProgress(
+            pages=4, rows=8, bytes=4 * record_batch.nbytes
+        )
+
+
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_download_arrow_bqstorage_unbounded_queue(module_under_test):
+    bqstorage_client, _ = _make_bqstorage_client(stream_count=2, pages_per_stream=3)
+
+    with mock.patch.object(
+        module_under_test.queue, "Queue", wraps=module_under_test.queue.Queue
+    ) as queue_class:
+        pages = list(
+            module_under_test.download_arrow_bqstorage(
+                "proj", _make_table(), bqstorage_client, max_queue_size=None
+            )
+        )
+
+    assert len(pages) == 6
+    queue_class.assert_called_once_with(maxsize=0)
+
+
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_download_arrow_bqstorage_preserve_order_ignores_max_stream_count(
+    module_under_test,
+):
+    bqstorage_client, _ = _make_bqstorage_client(stream_count=1, pages_per_stream=1)
+
+    list(
+        module_under_test.download_arrow_bqstorage(
+            "proj",
+            _make_table(),
+            bqstorage_client,
+            preserve_order=True,
+            max_stream_count=5,
+        )
+    )
+
+    _, kwargs = bqstorage_client.create_read_session.call_args
+    assert kwargs["requested_streams"] == 1
+
+
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_download_arrow_bqstorage_stops_workers_on_early_exit(module_under_test):
+    bqstorage_client, _ = _make_bqstorage_client(stream_count=2, pages_per_stream=50)
+
+    pages = module_under_test.download_arrow_bqstorage(
+        "proj", _make_table(), bqstorage_client, max_queue_size=1
+    )
+    next(pages)
+
+    # The workers are blocked on the full queue, they must notice that the
+    # consumer is gone instead of hanging.
+    closer = threading.Thread(target=pages.close)
+    closer.start()
+    closer.join(timeout=5.0)
+    assert not closer.is_alive()
+
+
+def test_download_state_byte_budget(module_under_test):
+    download_state = module_under_test._DownloadState(max_queue_bytes=100)
+
+    # A page larger than the budget is admitted when nothing is queued.
+    assert download_state.reserve_bytes(150)
+    download_state.release_bytes(150)
+
+    assert download_state.reserve_bytes(60)
+    reserved = threading.Event()
+
+    def reserve():
+        download_state.reserve_bytes(60)
+        reserved.set()
+
+    thread = threading.Thread(target=reserve)
+    thread.start()
+    assert not reserved.wait(timeout=0.05)
+
+    download_state.release_bytes(60)
+    assert reserved.wait(timeout=1.0)
+    thread.join()
+
+
+def test_download_state_byte_budget_early_exit(module_under_test):
+    download_state = module_under_test._DownloadState(max_queue_bytes=100)
+    assert download_state.reserve_bytes(100)
+
+    download_state.done = True
+
+    assert not download_state.reserve_bytes(100)
@@ -4913,6 +4913,130 @@ class TestClient(unittest.TestCase):
             expected_call = mock.call(method="POST", path=API_PATH, data=expected_data)
             assert call == expected_call
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_w_errors(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataframe = pandas.DataFrame({"age": [10, 20, 30, 40, 50]})
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        invalid = [{"reason": "invalid"}]
+        client._connection = make_connection(
+            {"insertErrors": [{"index": 1, "errors": invalid}]},
+            {"insertErrors": [{"index": 0, "errors": invalid}]},
+        )
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        error_info = client.insert_rows_from_dataframe(table, dataframe, chunk_size=3)
+
+        # The errors are indexed in their chunk.
+        self.assertEqual(
+            error_info,
+            [[{"index": 1, "errors": invalid}], [{"index": 0, "errors": invalid}]],
+        )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_w_chunk_bytes(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataframe = pandas.DataFrame({"age": [10, 20, 30, 40, 50]})
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        invalid = [{"reason": "invalid"}]
+
+        def api_request(method, path, data):
+            # Reject the rows aged 30 and 50.
+            return {
+                "insertErrors": [
+                    {"index": index, "errors": invalid}
+                    for index, info in enumerate(data["rows"])
+                    if info["json"]["age"] in ("30", "50")
+                ]
+            }
+
+        conn = client._connection = make_connection()
+        conn.api_request.side_effect = api_request
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        # Each chunk of 3 rows is split in requests of a single row.
+        error_info = client.insert_rows_from_dataframe(
+            table, dataframe, chunk_size=3, chunk_bytes=1
+        )
+
+        self.assertEqual(conn.api_request.call_count, 5)
+        self.assertEqual(
+            error_info,
+            [[{"index": 2, "errors": invalid}], [{"index": 1, "errors": invalid}]],
+        )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_w_max_workers(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataframe = pandas.DataFrame({"age": list(range(10))})
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        invalid = [{"reason": "invalid"}]
+
+        def api_request(method, path, data):
+            # The first row of each chunk is invalid.
+            return {"insertErrors": [{"index": 0, "errors": invalid}]}
+
+        conn = client._connection = make_connection()
+        conn.api_request.side_effect = api_request
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        error_info = client.insert_rows_from_dataframe(
+            table, dataframe, chunk_size=3, max_workers=2
+        )
+
+        self.assertEqual(error_info, [[{"index": 0, "errors": invalid}]] * 4)
+        sent = sorted(
+            int(info["json"]["age"])
+            for call in conn.api_request.call_args_list
+            for info in call[1]["data"]["rows"]
+        )
+        self.assertEqual(sent, list(range(10)))
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_w_invalid_chunk_size(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        with self.assertRaises(ValueError):
+            client.insert_rows_from_dataframe(
+                table, pandas.DataFrame({"age": [1]}), chunk_size=0
+            )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_wo_rows(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        conn = client._connection = make_connection()
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        error_info = client.insert_rows_from_dataframe(
+            table, pandas.DataFrame({"age": []})
+        )
+
+        self.assertEqual(error_info, [])
+        conn.api_request.assert_not_called()
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     def test_insert_rows_from_dataframe_many_columns(self):
         from google.cloud.bigquery.schema import SchemaField
@@ -5100,6 +5224,149 @@ class TestClient(unittest.TestCase):
             data=expected,
         )
 
+    def test_insert_rows_json_w_chunk_size(self):
+        rows = [{"col": i} for i in range(5)]
+        row_ids = [str(i) for i in range(5)]
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(
+            project="default-project", credentials=creds, _http=http
+        )
+        invalid = [{"reason": "invalid", "message": "bad row"}]
+        conn = client._connection = make_connection(
+            {"insertErrors": [{"index": 1, "errors": invalid}]},
+            {},
+            {"insertErrors": [{"index": 0, "errors": invalid}]},
+        )
+
+        errors = client.insert_rows_json(
+            "proj.dset.tbl", rows, row_ids=row_ids, skip_invalid_rows=True, chunk_size=2
+        )
+
+        self.assertEqual(
+            errors, [{"index": 1, "errors": invalid}, {"index": 4, "errors": invalid}]
+        )
+        path = "/projects/proj/datasets/dset/tables/tbl/insertAll"
+        conn.api_request.assert_has_calls(
+            [
+                mock.call(
+                    method="POST",
+                    path=path,
+                    data={
+                        "skipInvalidRows": True,
+                        "rows": [
+                            {"json": row, "insertId": row_id}
+                            for row, row_id in zip(
+                                rows[start : start + 2], row_ids[start : start + 2]
+                            )
+                        ],
+                    },
+                )
+                for start in (0, 2, 4)
+            ]
+        )
+
+    def test_insert_rows_json_w_chunk_bytes(self):
+        rows = [{"col": "x" * 10}, {"col": "x" * 100}, {"col": "y"}, {"col": "z"}]
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(
+            project="default-project", credentials=creds, _http=http
+        )
+        conn = client._connection = make_connection({}, {}, {})
+
+        errors = client.insert_rows_json(
+            "proj.dset.tbl", rows, row_ids=[None] * len(rows), chunk_bytes=100
+        )
+
+        self.assertEqual(errors, [])
+        sent = [
+            [info["json"] for info in call[1]["data"]["rows"]]
+            for call in conn.api_request.call_args_list
+        ]
+        # The large row is sent alone, the small rows together.
+        self.assertEqual(sent, [rows[:1], rows[1:2], rows[2:]])
+
+    def test_insert_rows_json_w_invalid_chunk_size(self):
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(
+            project="default-project", credentials=creds, _http=http
+        )
+
+        with self.assertRaises(ValueError):
+            client.insert_rows_json("proj.dset.tbl", [{"col": 1}], chunk_size=0)
+
+    def test_insert_rows_json_w_max_workers(self):
+        rows = [{"col": i} for i in range(10)]
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(
+            project="default-project", credentials=creds, _http=http
+        )
+        invalid = [{"reason": "invalid"}]
+
+        def api_request(method, path, data):
+            # The last row of each chunk is invalid.
+            return {
+                "insertErrors": [{"index": len(data["rows"]) - 1, "errors": invalid}]
+            }
+
+        conn = client._connection = make_connection()
+        conn.api_request.side_effect = api_request
+
+        errors = client.insert_rows_json(
+            "proj.dset.tbl", rows, chunk_size=3, max_workers=4
+        )
+
+        self.assertEqual(conn.api_request.call_count, 4)
+        self.assertEqual(
+            errors, [{"index": index, "errors": invalid} for index in (2, 5, 8, 9)]
+        )
+        sent = sorted(
+            info["json"]["col"]
+            for call in conn.api_request.call_args_list
+            for info in call[1]["data"]["rows"]
+        )
+        self.assertEqual(sent, list(range(10)))
+
+    def test_insert_rows_json_w_max_row_retries(self):
+        rows = [{"col": i} for i in range(4)]
+        row_ids = [str(i) for i in range(4)]
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(
+            project="default-project", credentials=creds, _http=http
+        )
+        backend_error = [{"reason": "backendError"}]
+        invalid = [{"reason": "invalid"}]
+        conn = client._connection = make_connection(
+            {
+                "insertErrors": [
+                    {"index": 1, "errors": backend_error},
+                    {"index": 2, "errors": invalid},
+                    {"index": 3, "errors": backend_error},
+                ]
+            },
+            {"insertErrors": [{"index": 1, "errors": backend_error}]},
+            {"insertErrors": [{"index": 0, "errors": backend_error}]},
+        )
+
+        errors = client.insert_rows_json(
+            "proj.dset.tbl", rows, row_ids=row_ids, max_row_retries=2
+        )
+
+        self.assertEqual(
+            errors,
+            [{"index": 2, "errors": invalid}, {"index": 3, "errors": backend_error}],
+        )
+        sent = [
+            [info["insertId"] for info in call[1]["data"]["rows"]]
+            for call in conn.api_request.call_args_list
+        ]
+        # Only the rows with a transient error are sent again.
+        self.assertEqual(sent, [row_ids, ["1", "3"], ["3"]])
+
     def test_list_partitions(self):
         from google.cloud.bigquery.table import Table
 
@@ -5894,6 +6161,61 @@ class TestClientUpload(object):
         sent_config = load_table_from_file.mock_calls[0][2]["job_config"]
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_stream_parquet(self):
+        import pyarrow.parquet
+        from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"id": range(10), "age": range(10, 20)})
+        job_config = job.LoadJobConfig(
+            schema=[SchemaField("id", "INTEGER"), SchemaField("age", "INTEGER")]
+        )
+        uploaded = []
+
+        def load_table_from_file(client, file_obj, *args, **kwargs):
+            uploaded.append(file_obj.read())
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            side_effect=load_table_from_file,
+        )
+        mkstemp_patch = mock.patch("tempfile.mkstemp", autospec=True)
+        with load_patch as load_table_from_file, mkstemp_patch as mkstemp:
+            client.load_table_from_dataframe(
+                dataframe,
+                self.TABLE_REF,
+                job_config=job_config,
+                stream_parquet=True,
+                parquet_row_group_size=4,
+            )
+
+        mkstemp.assert_not_called()
+        load_table_from_file.assert_called_once_with(
+            client,
+            mock.ANY,
+            self.TABLE_REF,
+            num_retries=_DEFAULT_NUM_RETRIES,
+            job_id=mock.ANY,
+            job_id_prefix=None,
+            location=None,
+            project=None,
+            job_config=mock.ANY,
+        )
+        sent_config = load_table_from_file.mock_calls[0][2]["job_config"]
+        assert sent_config.source_format == job.SourceFormat.PARQUET
+
+        parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(uploaded[0]))
+        assert parquet_file.num_row_groups == 3
+        assert parquet_file.read().to_pydict() == {
+            "id": list(range(10)),
+            "age": list(range(10, 20)),
+        }
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
     def test_load_table_from_dataframe_w_client_location(self):
@@ -6747,6 +7069,69 @@ class TestClientUpload(object):
             timeout=mock.ANY,
         )
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test__do_resumable_upload_w_parquet_stream(self):
+        import random
+        import pyarrow.parquet
+        from google.cloud.bigquery import _pandas_helpers
+        from google.cloud.bigquery.schema import SchemaField
+
+        rand = random.Random(0)
+        dataframe = pandas.DataFrame(
+            {"text": ["%040x" % rand.getrandbits(160) for _ in range(20000)]}
+        )
+        stream = _pandas_helpers.ParquetStream(
+            dataframe,
+            [SchemaField("text", "STRING")],
+            parquet_compression="NONE",
+            row_group_size=5000,
+        )
+        received = bytearray()
+        put_count = [0]
+        # The chunks are read from the stream, without a temporary file.
+        tempfile_patch = mock.patch("tempfile.mkstemp", autospec=True)
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            if method == "POST":
+                return self._make_response(
+                    http_client.OK, "", {"location": "http://test.invalid?upload_id=1"}
+                )
+
+            put_count[0] += 1
+            start = int(headers["content-range"].split(" ")[1].split("-")[0])
+            assert start == len(received)
+            received.extend(data)
+            if headers["content-range"].endswith("/*"):
+                return self._make_response(
+                    resumable_media.PERMANENT_REDIRECT,
+                    "",
+                    {"range": "bytes=0-{:d}".format(len(received) - 1)},
+                )
+            return self._make_response(
+                http_client.OK,
+                json.dumps({"size": len(received)}),
+                {"Content-Type": "application/json"},
+            )
+
+        from google import resumable_media
+
+        transport = self._make_transport()
+        transport.request.side_effect = request
+        client = self._make_client(transport)
+
+        chunk_patch = mock.patch(
+            "google.cloud.bigquery.client._DEFAULT_CHUNKSIZE", 256 * 1024
+        )
+        with chunk_patch, tempfile_patch as mkstemp:
+            client._do_resumable_upload(stream, self.EXPECTED_CONFIGURATION, None)
+
+        mkstemp.assert_not_called()
+        assert put_count[0] > 3
+        parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(bytes(received)))
+        assert parquet_file.num_row_groups == 4
+        assert parquet_file.read().column("text").to_pylist() == list(dataframe["text"])
+
     def test__do_multipart_upload(self):
         transport = self._make_transport([self._make_response(http_client.OK)])
         client = self._make_client(transport)
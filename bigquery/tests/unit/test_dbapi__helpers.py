@@ -17,6 +17,11 @@ import decimal
 import math
 import unittest
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 import google.cloud._helpers
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.dbapi import exceptions
@@ -185,3 +190,36 @@ class TestQueryParameters(unittest.TestCase):
     def test_to_query_parameters_none_argument(self):
         query_parameters = _helpers.to_query_parameters(None)
         self.assertEqual(query_parameters, [])
+
+
+@unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+class TestToBqTableRows(unittest.TestCase):
+    def test_empty_iterable(self):
+        rows_iterable = iter([])
+        result = _helpers.to_bq_table_rows(rows_iterable)
+        self.assertEqual(list(result), [])
+
+    def test_non_empty_iterable(self):
+        from google.cloud.bigquery.table import Row
+
+        record_batches = [
+            pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array([1, 2]), pyarrow.array(["a", None])],
+                names=["foo", "bar"],
+            ),
+            pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array([3]), pyarrow.array(["c"])], names=["foo", "bar"]
+            ),
+        ]
+
+        result = list(_helpers.to_bq_table_rows(record_batches))
+
+        field_to_index = {"foo": 0, "bar": 1}
+        self.assertEqual(
+            result,
+            [
+                Row((1, "a"), field_to_index),
+                Row((2, None), field_to_index),
+                Row((3, "c"), field_to_index),
+            ],
+        )
@@ -41,6 +41,15 @@ class TestConnection(unittest.TestCase):
         self.assertIsInstance(connection, Connection)
         self.assertIs(connection._client, mock_client)
 
+    def test_ctor_w_bqstorage_client(self):
+        mock_client = self._mock_client()
+        mock_bqstorage_client = mock.sentinel.bqstorage_client
+        connection = self._make_one(
+            client=mock_client, bqstorage_client=mock_bqstorage_client
+        )
+        self.assertIs(connection._client, mock_client)
+        self.assertIs(connection._bqstorage_client, mock_bqstorage_client)
+
     @mock.patch("google.cloud.bigquery.Client", autospec=True)
     def test_connect_wo_client(self, mock_client):
         from google.cloud.bigquery.dbapi import connect
@@ -58,6 +67,17 @@ class TestConnection(unittest.TestCase):
         connection = connect(client=mock_client)
         self.assertIsInstance(connection, Connection)
         self.assertIs(connection._client, mock_client)
+        self.assertIsNone(connection._bqstorage_client)
+
+    def test_connect_w_bqstorage_client(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_client()
+        connection = connect(
+            client=mock_client, bqstorage_client=mock.sentinel.bqstorage_client
+        )
+        self.assertIs(connection._client, mock_client)
+        self.assertIs(connection._bqstorage_client, mock.sentinel.bqstorage_client)
 
     def test_close(self):
         connection = self._make_one(client=self._mock_client())
@@ -16,6 +16,11 @@ import unittest
 
 import mock
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class TestCursor(unittest.TestCase):
     @staticmethod
@@ -180,6 +185,73 @@ class TestCursor(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0], (1,))
 
+    def _mock_bqstorage_client(self, rows):
+        from google.cloud.bigquery import table
+
+        mock_rows_iter = mock.create_autospec(table.RowIterator, instance=True)
+        mock_rows_iter.to_arrow_iterable.return_value = iter(
+            [
+                pyarrow.RecordBatch.from_arrays(
+                    [pyarrow.array([row[0] for row in rows])], names=["foo"]
+                )
+            ]
+        )
+        return mock.sentinel.bqstorage_client, mock_rows_iter
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetchall_w_bqstorage_client(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[(1,), (2,), (3,)])
+        (
+            bqstorage_client,
+            mock_client.list_rows.return_value,
+        ) = self._mock_bqstorage_client([(1,), (2,), (3,)])
+        query = "SELECT foo FROM some_table ORDER BY foo;"
+        mock_client.query.return_value.query = query
+        connection = dbapi.connect(mock_client, bqstorage_client)
+        cursor = connection.cursor()
+        cursor.execute(query)
+
+        rows = cursor.fetchmany(size=2)
+        self.assertEqual([row.values() for row in rows], [(1,), (2,)])
+        self.assertEqual(rows[0]["foo"], 1)
+        rows = cursor.fetchall()
+        self.assertEqual([row.values() for row in rows], [(3,)])
+        rows_iter = mock_client.list_rows.return_value
+        rows_iter.to_arrow_iterable.assert_called_once_with(
+            bqstorage_client=bqstorage_client
+        )
+        self.assertTrue(rows_iter._preserve_order)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetchall_w_bqstorage_client_w_dml(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[], num_dml_affected_rows=12)
+        (
+            bqstorage_client,
+            mock_client.list_rows.return_value,
+        ) = self._mock_bqstorage_client([])
+        connection = dbapi.connect(mock_client, bqstorage_client)
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM UserSessions WHERE user_id = 'test';")
+
+        self.assertEqual(cursor.fetchall(), [])
+        mock_client.list_rows.assert_not_called()
+
+    @mock.patch("google.cloud.bigquery.dbapi.cursor.pyarrow", new=None)
+    def test_fetchall_w_bqstorage_client_wo_pyarrow(self):
+        from google.cloud.bigquery import dbapi
+
+        mock_client = self._mock_client(rows=[(1,)])
+        connection = dbapi.connect(mock_client, mock.sentinel.bqstorage_client)
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+
+        # The rows are fetched with tabledata.list.
+        self.assertEqual(cursor.fetchall(), [(1,)])
+
     def test_execute_custom_job_id(self):
         from google.cloud.bigquery.dbapi import connect
 
@@ -288,7 +360,82 @@ class TestCursor(unittest.TestCase):
             (("test",), ("anothertest",)),
         )
         self.assertIsNone(cursor.description)
+        # The rows affected by all the statements.
+        self.assertEqual(cursor.rowcount, 24)
+
+    def test_executemany_w_max_concurrent_jobs(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=3)
+        events = []
+
+        def query(*args, **kwargs):
+            events.append("start")
+            return client.query.return_value
+
+        client.query.side_effect = query
+        client.query.return_value.result.side_effect = lambda: events.append("wait")
+        connection = connect(client)
+        cursor = connection.cursor()
+
+        cursor.executemany(
+            "UPDATE t SET x = %s WHERE y = %s;",
+            [(i, i) for i in range(5)],
+            max_concurrent_jobs=2,
+        )
+
+        self.assertEqual(cursor.rowcount, 15)
+        self.assertEqual(
+            events,
+            ["start", "start", "wait", "start", "wait", "start", "wait", "start"]
+            + ["wait", "wait"],
+        )
+
+    def test_executemany_w_error(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery import job
+        from google.api_core import exceptions
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=3)
+        failing_job = self._mock_job(num_dml_affected_rows=3)
+        failing_job.result.side_effect = exceptions.BadRequest("invalid")
+        client.query.side_effect = [
+            self._mock_job(num_dml_affected_rows=3),
+            failing_job,
+            self._mock_job(num_dml_affected_rows=3),
+        ]
+        cursor = dbapi.connect(client).cursor()
+
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.executemany(
+                "DELETE FROM t WHERE x = %s;", [(1,), (2,), (3,)], max_concurrent_jobs=3
+            )
+
+        self.assertEqual(client.query.call_count, 3)
+        self.assertIsInstance(cursor._query_job, job.QueryJob)
+
+    def test_executemany_w_invalid_max_concurrent_jobs(self):
+        from google.cloud.bigquery import dbapi
+
+        cursor = dbapi.connect(self._mock_client()).cursor()
+
+        with self.assertRaises(dbapi.ProgrammingError):
+            cursor.executemany("SELECT %s;", [(1,)], max_concurrent_jobs=0)
+
+    def test_executemany_wo_parameters(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=12)
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute("DELETE FROM UserSessions WHERE user_id = 'test';")
         self.assertEqual(cursor.rowcount, 12)
+        client.query.reset_mock()
+
+        cursor.executemany("SELECT %s;", [])
+
+        self.assertEqual(cursor.rowcount, 0)
+        self.assertIsNone(cursor.description)
+        client.query.assert_not_called()
 
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
@@ -0,0 +1,348 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+
+PROJECT = "project"
+OTHER_PROJECT = "other-project"
+
+
+def _make_client():
+    from google.cloud.bigquery.client import Client
+
+    client = mock.create_autospec(Client, instance=True)
+    client.project = PROJECT
+    return client
+
+
+def _make_resource(job_id, project=PROJECT, created=1000.0, state="RUNNING"):
+    resource = {
+        "jobReference": {"projectId": project, "jobId": job_id},
+        "configuration": {"query": {"query": "SELECT 1"}},
+        "statistics": {"creationTime": created},
+        "status": {"state": state},
+    }
+    return resource
+
+
+def _make_job(client, job_id, project=PROJECT, created=1000.0, state="RUNNING"):
+    from google.cloud.bigquery.job import QueryJob
+
+    return QueryJob.from_api_repr(
+        _make_resource(job_id, project=project, created=created, state=state), client
+    )
+
+
+def _make_done_job(client, job_id, project=PROJECT, error_result=None):
+    job = _make_job(client, job_id, project=project, state="DONE")
+    if error_result is not None:
+        job._properties["status"]["errorResult"] = error_result
+    return job
+
+
+class TestJobPoller(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.job_poller import JobPoller
+
+        return JobPoller
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_add_done_job_calls_back_at_once(self):
+        client = _make_client()
+        poller = self._make_one(client)
+        job = _make_done_job(client, "job-1")
+        callback = mock.Mock()
+
+        poller.add(job, callback=callback)
+
+        callback.assert_called_once_with(job)
+        self.assertEqual(poller.pending_count, 0)
+
+    def test_add_reloads_job_without_creation_time(self):
+        client = _make_client()
+        poller = self._make_one(client)
+        job = _make_job(client, "job-1")
+        del job._properties["statistics"]
+
+        with mock.patch.object(job, "reload") as reload_:
+            poller.add(job)
+
+        reload_.assert_called_once_with(retry=poller._retry)
+        self.assertEqual(poller.pending_count, 1)
+
+    def test_poll_lists_done_jobs_per_project(self):
+        from google.cloud.bigquery import _helpers
+
+        client = _make_client()
+        job_1 = _make_job(client, "job-1", created=1000.0)
+        job_2 = _make_job(client, "job-2", created=3000.0)
+        job_3 = _make_job(client, "job-3", project=OTHER_PROJECT, created=2000.0)
+        listed = {
+            PROJECT: [
+                _make_done_job(client, "unrelated"),
+                _make_done_job(client, "job-2"),
+            ],
+            OTHER_PROJECT: [_make_done_job(client, "job-3", project=OTHER_PROJECT)],
+        }
+        client.list_jobs.side_effect = lambda project, **kwargs: iter(listed[project])
+
+        poller = self._make_one(client, all_users=True)
+        callback = mock.Mock()
+        for job in (job_1, job_2, job_3):
+            poller.add(job, callback=callback)
+
+        self.assertEqual(poller.poll(), 2)
+
+        self.assertEqual(client.list_jobs.call_count, 2)
+        client.list_jobs.assert_any_call(
+            project=PROJECT,
+            all_users=True,
+            state_filter="done",
+            min_creation_time=_helpers._datetime_from_microseconds(1000.0 * 1000),
+            max_creation_time=_helpers._datetime_from_microseconds(3000.0 * 1000),
+            retry=poller._retry,
+        )
+        self.assertEqual(
+            sorted(call[0][0].job_id for call in callback.call_args_list),
+            ["job-2", "job-3"],
+        )
+        self.assertEqual(job_1.state, "RUNNING")
+        self.assertTrue(job_2.done())
+        self.assertTrue(job_3.done())
+        self.assertEqual(poller.pending_count, 1)
+
+    def test_poll_stops_listing_once_all_jobs_found(self):
+        client = _make_client()
+        job = _make_job(client, "job-1")
+        consumed = []
+
+        def list_jobs(**kwargs):
+            for listed_job in [
+                _make_done_job(client, "job-1"),
+                _make_done_job(client, "other"),
+            ]:
+                consumed.append(listed_job.job_id)
+                yield listed_job
+
+        client.list_jobs.side_effect = list_jobs
+        poller = self._make_one(client)
+        poller.add(job)
+
+        self.assertEqual(poller.poll(), 1)
+        self.assertEqual(consumed, ["job-1"])
+
+    def test_poll_callback_error_is_logged(self):
+        client = _make_client()
+        job = _make_job(client, "job-1")
+        client.list_jobs.return_value = iter([_make_done_job(client, "job-1")])
+        poller = self._make_one(client)
+        other_callback = mock.Mock()
+        poller.add(job, callback=mock.Mock(side_effect=ValueError("boom")))
+        poller.add(job, callback=other_callback)
+
+        with mock.patch("google.cloud.bigquery.job_poller._LOGGER") as logger:
+            self.assertEqual(poller.poll(), 1)
+
+        logger.exception.assert_called_once()
+        other_callback.assert_called_once_with(job)
+
+    def test_next_interval(self):
+        poller = self._make_one(
+            _make_client(), min_interval=1.0, max_interval=3.0, multiplier=2.0
+        )
+
+        self.assertEqual(poller._next_interval(0), 2.0)
+        self.assertEqual(poller._next_interval(0), 3.0)
+        self.assertEqual(poller._next_interval(0), 3.0)
+        self.assertEqual(poller._next_interval(1), 1.0)
+
+    def test_start_twice(self):
+        poller = self._make_one(_make_client())
+        poller.start()
+        try:
+            with self.assertRaises(ValueError):
+                poller.start()
+        finally:
+            poller.stop()
+
+        self.assertIsNone(poller._thread)
+
+    def test_thread_polls_until_jobs_done(self):
+        from google.api_core import exceptions
+        import requests
+
+        client = _make_client()
+        job = _make_job(client, "job-1")
+        client.list_jobs.side_effect = [
+            exceptions.InternalServerError("boom"),
+            exceptions.RetryError("Deadline exceeded", None),
+            requests.exceptions.ConnectionError("connection reset"),
+            iter([]),
+            iter([_make_done_job(client, "job-1")]),
+        ]
+        poller = self._make_one(client, min_interval=0.001, max_interval=0.01)
+        done = threading.Event()
+        poller.add(job, callback=lambda _: done.set())
+
+        poller.start()
+        try:
+            self.assertTrue(done.wait(10))
+        finally:
+            poller.stop()
+
+        self.assertEqual(client.list_jobs.call_count, 5)
+        self.assertTrue(job.done())
+
+    def test_thread_error_calls_error_callbacks(self):
+        client = _make_client()
+        job_1 = _make_job(client, "job-1")
+        job_2 = _make_job(client, "job-2")
+        error = ValueError("unexpected")
+        client.list_jobs.side_effect = error
+        poller = self._make_one(client)
+        error_callback = mock.Mock()
+        callback = mock.Mock()
+        poller.add(job_1, callback=callback, error_callback=error_callback)
+        poller.add(job_2, callback=callback, error_callback=error_callback)
+
+        poller.start()
+        poller._thread.join(10)
+
+        self.assertFalse(poller._thread.is_alive())
+        self.assertIs(poller.exception, error)
+        self.assertEqual(poller.pending_count, 0)
+        error_callback.assert_has_calls(
+            [mock.call(job_1, error), mock.call(job_2, error)]
+        )
+        callback.assert_not_called()
+
+        # Jobs added after the failure are not polled.
+        job_3 = _make_job(client, "job-3")
+        poller.add(job_3, error_callback=error_callback)
+        error_callback.assert_called_with(job_3, error)
+        self.assertEqual(poller.pending_count, 0)
+        poller.stop()
+
+
+class Test_wait_for_jobs(unittest.TestCase):
+    def _call_fut(self, *args, **kwargs):
+        from google.cloud.bigquery.job_poller import wait_for_jobs
+
+        return wait_for_jobs(*args, **kwargs)
+
+    def test_empty(self):
+        done, not_done = self._call_fut([])
+
+        self.assertEqual(done, set())
+        self.assertEqual(not_done, set())
+
+    def test_all_completed(self):
+        client = _make_client()
+        job_1 = _make_job(client, "job-1")
+        job_2 = _make_done_job(client, "job-2")
+        client.list_jobs.return_value = iter([_make_done_job(client, "job-1")])
+
+        done, not_done = self._call_fut([job_1, job_2])
+
+        self.assertEqual(done, {job_1, job_2})
+        self.assertEqual(not_done, set())
+        self.assertTrue(job_1.done())
+
+    def test_first_completed_with_poller(self):
+        from google.cloud.bigquery.job_poller import FIRST_COMPLETED
+
+        client = _make_client()
+        job_1 = _make_job(client, "job-1")
+        job_2 = _make_job(client, "job-2")
+        poller = mock.Mock(spec=["add"])
+        poller.add.side_effect = lambda job, callback, error_callback: (
+            callback(job) if job is job_2 else None
+        )
+
+        done, not_done = self._call_fut(
+            [job_1, job_2], return_when=FIRST_COMPLETED, poller=poller
+        )
+
+        self.assertEqual(done, {job_2})
+        self.assertEqual(not_done, {job_1})
+
+    def test_first_exception(self):
+        from google.cloud.bigquery.job_poller import FIRST_EXCEPTION
+
+        client = _make_client()
+        job_1 = _make_job(client, "job-1")
+        job_2 = _make_done_job(client, "job-2")
+        job_3 = _make_done_job(client, "job-3", error_result={"reason": "invalid"})
+        poller = mock.Mock(spec=["add"])
+        poller.add.side_effect = lambda job, callback, error_callback: (
+            callback(job) if job.state == "DONE" else None
+        )
+
+        done, not_done = self._call_fut(
+            [job_1, job_2], return_when=FIRST_EXCEPTION, poller=poller, timeout=0.01
+        )
+        self.assertEqual(done, {job_2})
+        self.assertEqual(not_done, {job_1})
+
+        done, not_done = self._call_fut(
+            [job_1, job_3], return_when=FIRST_EXCEPTION, poller=poller
+        )
+        self.assertEqual(done, {job_3})
+        self.assertEqual(not_done, {job_1})
+
+    def test_retry_error_does_not_block_waiters(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery.job_poller import JobPoller
+
+        client = _make_client()
+        job = _make_job(client, "job-1")
+        client.list_jobs.side_effect = [
+            exceptions.RetryError("Deadline exceeded", None),
+            iter([_make_done_job(client, "job-1")]),
+        ]
+        poller = JobPoller(client, min_interval=0.001, max_interval=0.01)
+        poller.start()
+
+        try:
+            done, not_done = self._call_fut([job], poller=poller)
+        finally:
+            poller.stop()
+
+        self.assertEqual(done, {job})
+        self.assertEqual(not_done, set())
+
+    def test_poller_error_releases_waiters(self):
+        client = _make_client()
+        job = _make_job(client, "job-1")
+        client.list_jobs.side_effect = ValueError("unexpected")
+
+        with self.assertRaises(ValueError):
+            self._call_fut([job])
+
+    def test_timeout(self):
+        client = _make_client()
+        job = _make_job(client, "job-1")
+        client.list_jobs.side_effect = lambda **kwargs: iter([])
+
+        done, not_done = self._call_fut([job], timeout=0.01)
+
+        self.assertEqual(done, set())
+        self.assertEqual(not_done, {job})
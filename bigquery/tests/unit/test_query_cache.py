@@ -0,0 +1,371 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+from google.cloud.bigquery.schema import SchemaField
+
+
+SCHEMA = [SchemaField("name", "STRING"), SchemaField("age", "INTEGER")]
+
+
+def _make_arrow_table(names=("Phred", "Bharney"), ages=(32, 33)):
+    return pyarrow.Table.from_arrays(
+        [pyarrow.array(list(names)), pyarrow.array(list(ages))], names=["name", "age"]
+    )
+
+
+def _make_entry(table=None, created=1000.0):
+    from google.cloud.bigquery.query_cache import CacheEntry
+
+    if table is None:
+        table = _make_arrow_table()
+    return CacheEntry(table, SCHEMA, created)
+
+
+class Test_normalize_query(unittest.TestCase):
+    def _call_fut(self, query):
+        from google.cloud.bigquery.query_cache import _normalize_query
+
+        return _normalize_query(query)
+
+    def test_whitespace_and_comments(self):
+        query = """
+            SELECT name  -- The name.
+            FROM   `dataset.users`   /* All
+            the users. */ WHERE id = @id ;
+        """
+        self.assertEqual(
+            self._call_fut(query), "SELECT name FROM `dataset.users` WHERE id = @id"
+        )
+
+    def test_keeps_quoted_strings(self):
+        query = "SELECT 'a  -- b', \"c\\\"  d\", '''e\n  f''' FROM  t"
+        self.assertEqual(
+            self._call_fut(query), "SELECT 'a  -- b', \"c\\\"  d\", '''e\n  f''' FROM t"
+        )
+
+
+@unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+class TestMemoryCacheBackend(unittest.TestCase):
+    def _make_one(self, *args, **kwargs):
+        from google.cloud.bigquery.query_cache import MemoryCacheBackend
+
+        return MemoryCacheBackend(*args, **kwargs)
+
+    def test_get_miss(self):
+        self.assertIsNone(self._make_one().get("key"))
+
+    def test_set_get_delete(self):
+        backend = self._make_one()
+        entry = _make_entry()
+
+        backend.set("key", entry)
+        self.assertIs(backend.get("key"), entry)
+
+        backend.delete("key")
+        self.assertIsNone(backend.get("key"))
+
+    def test_evicts_least_recently_used(self):
+        backend = self._make_one(max_entries=2)
+        backend.set("a", _make_entry())
+        backend.set("b", _make_entry())
+        backend.get("a")
+
+        backend.set("c", _make_entry())
+
+        self.assertIsNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("a"))
+        self.assertIsNotNone(backend.get("c"))
+
+    def test_max_bytes(self):
+        small = _make_entry(_make_arrow_table(names=["a"], ages=[1]))
+        nbytes = small.table.nbytes
+        backend = self._make_one(max_bytes=2 * nbytes)
+        backend.set("a", small)
+        backend.set("b", small)
+        backend.set("c", small)
+
+        self.assertIsNone(backend.get("a"))
+        self.assertIsNotNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("c"))
+
+        # Too large to be cached at all.
+        backend.set(
+            "large", _make_entry(_make_arrow_table(names=["a"] * 10, ages=[1] * 10))
+        )
+        self.assertIsNone(backend.get("large"))
+        self.assertIsNotNone(backend.get("c"))
+
+
+@unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+class TestParquetCacheBackend(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _make_one(self, *args, **kwargs):
+        from google.cloud.bigquery.query_cache import ParquetCacheBackend
+
+        return ParquetCacheBackend(self.directory, *args, **kwargs)
+
+    def test_set_get_delete(self):
+        backend = self._make_one()
+        entry = _make_entry(created=1234.5)
+
+        backend.set("key", entry)
+        got = backend.get("key")
+
+        self.assertTrue(got.table.equals(entry.table))
+        self.assertEqual(got.schema, SCHEMA)
+        self.assertEqual(got.created, 1234.5)
+
+        backend.delete("key")
+        self.assertIsNone(backend.get("key"))
+        # Deleting a missing entry does nothing.
+        backend.delete("key")
+
+    def test_shared_directory(self):
+        self._make_one().set("key", _make_entry())
+
+        self.assertIsNotNone(self._make_one().get("key"))
+
+    def test_evicts_least_recently_used(self):
+        import os
+
+        backend = self._make_one(max_entries=2)
+        backend.set("a", _make_entry())
+        backend.set("b", _make_entry())
+        # Make "b" the least recently used.
+        os.utime(os.path.join(self.directory, "b.parquet"), (1, 1))
+
+        backend.set("c", _make_entry())
+
+        self.assertIsNone(backend.get("b"))
+        self.assertIsNotNone(backend.get("a"))
+        self.assertIsNotNone(backend.get("c"))
+
+    @mock.patch("google.cloud.bigquery.query_cache.pyarrow", new=None)
+    def test_ctor_wo_pyarrow(self):
+        with self.assertRaises(ValueError):
+            self._make_one()
+
+
+@unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+class TestQueryCache(unittest.TestCase):
+    QUERY = "SELECT name, age FROM `proj.dset.users` WHERE age > @age"
+
+    def _make_one(self, client, **kwargs):
+        from google.cloud.bigquery.query_cache import QueryCache
+
+        return QueryCache(client, **kwargs)
+
+    def _make_table(self, modified_ms="1000", streaming_buffer=None):
+        from google.cloud.bigquery.table import Table
+
+        table = Table("proj.dset.users")
+        table._properties["lastModifiedTime"] = modified_ms
+        if streaming_buffer is not None:
+            table._properties["streamingBuffer"] = streaming_buffer
+        return table
+
+    def _make_client(self, statement_type="SELECT", table=None):
+        from google.cloud.bigquery import client
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery import table as table_module
+
+        mock_client = mock.create_autospec(client.Client, instance=True)
+        mock_client.project = "proj"
+        mock_client.location = None
+        mock_client._default_query_job_config = None
+
+        dry_run_job = mock.create_autospec(job.QueryJob, instance=True)
+        dry_run_job.statement_type = statement_type
+        dry_run_job.referenced_tables = [
+            table_module.TableReference.from_string("proj.dset.users")
+        ]
+
+        rows = mock.create_autospec(table_module.RowIterator, instance=True)
+        rows.schema = SCHEMA
+        rows.to_arrow.return_value = _make_arrow_table()
+        query_job = mock.create_autospec(job.QueryJob, instance=True)
+        query_job.result.return_value = rows
+
+        def query(sql, job_config=None, **kwargs):
+            if job_config.dry_run:
+                return dry_run_job
+            return query_job
+
+        mock_client.query.side_effect = query
+        mock_client.get_table.return_value = table or self._make_table()
+        return mock_client
+
+    def _job_config(self, age=30):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery import query
+
+        return job.QueryJobConfig(
+            query_parameters=[query.ScalarQueryParameter("age", "INT64", age)]
+        )
+
+    def _query_jobs(self, client):
+        return [
+            call
+            for call in client.query.call_args_list
+            if not call[1]["job_config"].dry_run
+        ]
+
+    @mock.patch("google.cloud.bigquery.query_cache.pyarrow", new=None)
+    def test_ctor_wo_pyarrow(self):
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client)
+
+    def test_query_miss_then_hit(self):
+        client = self._make_client()
+        cache = self._make_one(client)
+
+        first = cache.query(self.QUERY, job_config=self._job_config())
+        second = cache.query(
+            "  SELECT name, age\nFROM `proj.dset.users` WHERE age > @age;",
+            job_config=self._job_config(),
+        )
+
+        self.assertFalse(first.from_cache)
+        self.assertIsNotNone(first.job)
+        self.assertTrue(second.from_cache)
+        self.assertIsNone(second.job)
+        self.assertEqual(len(self._query_jobs(client)), 1)
+        self.assertTrue(second.to_arrow().equals(_make_arrow_table()))
+        rows = list(second.result())
+        self.assertEqual(rows[0]["name"], "Phred")
+        self.assertEqual(rows[1].values(), ("Bharney", 33))
+        self.assertEqual(second.result().total_rows, 2)
+        self.assertEqual(second.result().schema, SCHEMA)
+
+    def test_query_w_other_parameters(self):
+        client = self._make_client()
+        cache = self._make_one(client)
+
+        cache.query(self.QUERY, job_config=self._job_config(age=30))
+        result = cache.query(self.QUERY, job_config=self._job_config(age=40))
+
+        self.assertFalse(result.from_cache)
+        self.assertEqual(len(self._query_jobs(client)), 2)
+
+    def test_query_w_modified_table(self):
+        client = self._make_client()
+        cache = self._make_one(client)
+
+        cache.query(self.QUERY, job_config=self._job_config())
+        client.get_table.return_value = self._make_table(modified_ms="2000")
+        result = cache.query(self.QUERY, job_config=self._job_config())
+
+        self.assertFalse(result.from_cache)
+        self.assertEqual(len(self._query_jobs(client)), 2)
+
+    def test_query_w_expired_entry(self):
+        client = self._make_client()
+        cache = self._make_one(client, ttl=60)
+
+        with mock.patch("time.time", return_value=1000.0):
+            cache.query(self.QUERY, job_config=self._job_config())
+        with mock.patch("time.time", return_value=1030.0):
+            fresh = cache.query(self.QUERY, job_config=self._job_config())
+        with mock.patch("time.time", return_value=1061.0):
+            expired = cache.query(self.QUERY, job_config=self._job_config())
+
+        self.assertTrue(fresh.from_cache)
+        self.assertFalse(expired.from_cache)
+        self.assertEqual(len(self._query_jobs(client)), 2)
+
+    def test_query_w_dml(self):
+        client = self._make_client(statement_type="DELETE")
+        cache = self._make_one(client)
+
+        first = cache.query("DELETE FROM `proj.dset.users` WHERE true")
+        second = cache.query("DELETE FROM `proj.dset.users` WHERE true")
+
+        self.assertFalse(second.from_cache)
+        self.assertEqual(len(self._query_jobs(client)), 2)
+        # The results are not downloaded.
+        first.job.result.assert_not_called()
+
+    def test_query_w_streaming_buffer(self):
+        table = self._make_table(
+            streaming_buffer={
+                "estimatedRows": "10",
+                "estimatedBytes": "100",
+                "oldestEntryTime": "1000",
+            }
+        )
+        client = self._make_client(table=table)
+        cache = self._make_one(client)
+
+        cache.query(self.QUERY, job_config=self._job_config())
+        result = cache.query(self.QUERY, job_config=self._job_config())
+
+        self.assertFalse(result.from_cache)
+
+    def test_query_w_non_deterministic_function(self):
+        client = self._make_client()
+        cache = self._make_one(client)
+
+        cache.query("SELECT CURRENT_TIMESTAMP()")
+        result = cache.query("SELECT CURRENT_TIMESTAMP()")
+
+        self.assertFalse(result.from_cache)
+        # Not even a dry run is needed.
+        self.assertEqual(len(client.query.call_args_list), 2)
+
+    def test_query_w_destination(self):
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        cache = self._make_one(client)
+        job_config = job.QueryJobConfig(destination="proj.dset.dest")
+
+        result = cache.query(self.QUERY, job_config=job_config)
+
+        self.assertFalse(result.from_cache)
+        self.assertEqual(len(client.query.call_args_list), 1)
+        result.to_arrow()
+        result.job.to_arrow.assert_called_once_with()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_from_cache(self):
+        client = self._make_client()
+        cache = self._make_one(client)
+
+        cache.query(self.QUERY, job_config=self._job_config())
+        dataframe = cache.query(self.QUERY, job_config=self._job_config()).to_dataframe(
+            dtypes={"age": "int32"}
+        )
+
+        self.assertEqual(list(dataframe["name"]), ["Phred", "Bharney"])
+        self.assertEqual(dataframe["age"].dtype.name, "int32")
@@ -1473,6 +1473,22 @@ class Test_EmptyRowIterator(unittest.TestCase):
         self.assertIsInstance(df, pandas.DataFrame)
         self.assertEqual(len(df), 0)  # verify the number of rows
 
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_iterable(self):
+        row_iterator = self._make_one()
+        self.assertEqual(list(row_iterator.to_arrow_iterable()), [])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable(self):
+        row_iterator = self._make_one()
+        self.assertEqual(list(row_iterator.to_dataframe_iterable()), [])
+
+    @mock.patch("google.cloud.bigquery.table.pandas", new=None)
+    def test_to_dataframe_iterable_error_if_pandas_is_none(self):
+        row_iterator = self._make_one()
+        with self.assertRaises(ValueError):
+            row_iterator.to_dataframe_iterable()
+
 
 class TestRowIterator(unittest.TestCase):
     def _class_under_test(self):
@@ -2299,6 +2315,301 @@ class TestRowIterator(unittest.TestCase):
         with self.assertRaises(ValueError):
             row_iterator.to_dataframe()
 
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_iterable(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        rows = [
+            {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+        ]
+        path = "/foo"
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": rows[:1], "pageToken": "NEXTPAGE"},
+                {"rows": rows[1:]},
+            ]
+        )
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        record_batches = row_iterator.to_arrow_iterable()
+
+        # Nothing is downloaded until the iterable is consumed.
+        api_request.assert_not_called()
+        record_batches = list(record_batches)
+        self.assertEqual(len(record_batches), 2)
+        self.assertIsInstance(record_batches[0], pyarrow.RecordBatch)
+        self.assertEqual(record_batches[0].to_pydict()["name"], ["Phred Phlyntstone"])
+        self.assertEqual(record_batches[1].to_pydict()["age"], [33])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_iterable_w_bqstorage_download_options(self):
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.Mock()
+        row_iterator = self._make_one(
+            table=mut.TableReference.from_string("proj.dset.tbl")
+        )
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_bqstorage",
+            return_value=iter(()),
+        ) as download:
+            list(
+                row_iterator.to_arrow_iterable(
+                    bqstorage_client=bqstorage_client,
+                    max_stream_count=4,
+                    max_workers=2,
+                    progress_callback=mock.sentinel.progress_callback,
+                )
+            )
+
+        download_kwargs = download.call_args[1]
+        self.assertEqual(download_kwargs["max_stream_count"], 4)
+        self.assertEqual(download_kwargs["max_workers"], 2)
+        self.assertIs(
+            download_kwargs["progress_callback"], mock.sentinel.progress_callback
+        )
+
+    @mock.patch("google.cloud.bigquery.table.pyarrow", new=None)
+    def test_to_arrow_iterable_error_if_pyarrow_is_none(self):
+        row_iterator = self._make_one()
+        with self.assertRaises(ValueError):
+            row_iterator.to_arrow_iterable()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        rows = [
+            {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+            {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+            {"f": [{"v": "Wylma Phlyntstone"}, {"v": "29"}]},
+        ]
+        path = "/foo"
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": rows[:2], "pageToken": "NEXTPAGE"},
+                {"rows": rows[2:]},
+            ]
+        )
+        row_iterator = self._make_one(_mock_client(), api_request, path, schema)
+
+        dfs = row_iterator.to_dataframe_iterable(dtypes={"age": "int32"})
+
+        api_request.assert_not_called()
+        dfs = list(dfs)
+        self.assertEqual(len(dfs), 2)
+        self.assertEqual(list(dfs[0].columns), ["name", "age"])
+        self.assertEqual(list(dfs[0]["name"]), ["Phred Phlyntstone", "Bharney Rhubble"])
+        self.assertEqual(list(dfs[1]["age"]), [29])
+        self.assertEqual(dfs[1]["age"].dtype.name, "int32")
+
+    @mock.patch("google.cloud.bigquery.table.pandas", new=None)
+    def test_to_dataframe_iterable_error_if_pandas_is_none(self):
+        row_iterator = self._make_one()
+        with self.assertRaises(ValueError):
+            row_iterator.to_dataframe_iterable()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable_max_results_w_bqstorage_warning(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        rows = [{"f": [{"v": "Phred Phlyntstone"}]}]
+        api_request = mock.Mock(return_value={"rows": rows})
+        bqstorage_client = mock.Mock()
+        row_iterator = self._make_one(
+            client=_mock_client(),
+            api_request=api_request,
+            path="/foo",
+            schema=schema,
+            max_results=42,
+        )
+
+        with warnings.catch_warnings(record=True) as warned:
+            dfs = list(
+                row_iterator.to_dataframe_iterable(bqstorage_client=bqstorage_client)
+            )
+
+        matches = [
+            warning
+            for warning in warned
+            if warning.category is UserWarning
+            and "cannot use bqstorage_client" in str(warning).lower()
+        ]
+        self.assertEqual(len(matches), 1, msg="User warning was not emitted.")
+        self.assertEqual(len(dfs), 1)
+        bqstorage_client.create_read_session.assert_not_called()
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_dataframe_iterable_w_bqstorage(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        arrow_schema = pyarrow.schema([pyarrow.field("colA", pyarrow.int64())])
+        streams = [
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"},
+            {"name": "/projects/proj/dataset/dset/tables/tbl/streams/5678"},
+        ]
+        session = bigquery_storage_v1beta1.types.ReadSession(
+            streams=streams,
+            arrow_schema={"serialized_schema": arrow_schema.serialize().to_pybytes()},
+        )
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        page_data_frame = pandas.DataFrame(
+            [{"colA": 1}, {"colA": -1}], columns=["colA"]
+        )
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_dataframe.return_value = page_data_frame
+        mock_pages = (mock_page, mock_page, mock_page)
+        type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
+
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "IGNORED")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+        progress_callback = mock.Mock()
+        dfs = list(
+            row_iterator.to_dataframe_iterable(
+                bqstorage_client=bqstorage_client,
+                max_queue_size=1,
+                max_stream_count=2,
+                progress_callback=progress_callback,
+            )
+        )
+
+        self.assertEqual(len(dfs), len(streams) * len(mock_pages))
+        for df in dfs:
+            self.assertEqual(list(df["colA"]), [1, -1])
+        session_kwargs = bqstorage_client.create_read_session.call_args[1]
+        self.assertEqual(session_kwargs["requested_streams"], 2)
+
+        self.assertEqual(progress_callback.call_count, len(dfs))
+        last_progress = {}
+        for call in progress_callback.call_args_list:
+            stream_name, progress = call[0]
+            last_progress[stream_name] = progress
+        self.assertEqual(sorted(last_progress), sorted(s["name"] for s in streams))
+        for progress in last_progress.values():
+            self.assertEqual(progress.pages, 3)
+            self.assertEqual(progress.rows, 6)
+            self.assertGreater(progress.bytes, 0)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable_w_bqstorage_download_options(self):
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.Mock()
+        row_iterator = self._make_one(
+            table=mut.TableReference.from_string("proj.dset.tbl")
+        )
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_dataframe_bqstorage",
+            return_value=iter(()),
+        ) as download:
+            list(
+                row_iterator.to_dataframe_iterable(
+                    bqstorage_client=bqstorage_client,
+                    max_queue_bytes=100,
+                    max_workers=2,
+                )
+            )
+
+        download_kwargs = download.call_args[1]
+        self.assertEqual(download_kwargs["max_queue_bytes"], 100)
+        self.assertEqual(download_kwargs["max_workers"], 2)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_bqstorage_max_workers(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.Mock()
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "INTEGER")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_dataframe_bqstorage",
+            return_value=iter([pandas.DataFrame({"colA": [1, 2]})]),
+        ) as download:
+            df = row_iterator.to_dataframe(
+                bqstorage_client=bqstorage_client, max_workers=3
+            )
+
+        self.assertEqual(list(df["colA"]), [1, 2])
+        self.assertEqual(download.call_args[1]["max_workers"], 3)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_dataframe_iterable_w_bqstorage_error_after_first_page(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        arrow_schema = pyarrow.schema([pyarrow.field("colA", pyarrow.int64())])
+        session = bigquery_storage_v1beta1.types.ReadSession(
+            streams=[{"name": "/projects/proj/dataset/dset/tables/tbl/streams/1234"}],
+            arrow_schema={"serialized_schema": arrow_schema.serialize().to_pybytes()},
+        )
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        mock_rowstream = mock.create_autospec(reader.ReadRowsStream)
+        bqstorage_client.read_rows.return_value = mock_rowstream
+        mock_rows = mock.create_autospec(reader.ReadRowsIterable)
+        mock_rowstream.rows.return_value = mock_rows
+        mock_page = mock.create_autospec(reader.ReadRowsPage)
+        mock_page.to_dataframe.side_effect = [
+            pandas.DataFrame([{"colA": 1}], columns=["colA"]),
+            exceptions.InternalServerError("stream broken"),
+        ]
+        type(mock_rows).pages = mock.PropertyMock(return_value=(mock_page, mock_page))
+
+        api_request = mock.Mock(return_value={"rows": []})
+        row_iterator = self._make_one(
+            api_request=api_request,
+            schema=[schema.SchemaField("colA", "IGNORED")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+        dfs = row_iterator.to_dataframe_iterable(bqstorage_client=bqstorage_client)
+
+        self.assertEqual(list(next(dfs)["colA"]), [1])
+        # The rows already yielded would be yielded again by tabledata.list.
+        with pytest.raises(exceptions.InternalServerError):
+            next(dfs)
+        api_request.assert_not_called()
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     def test_to_dataframe_max_results_w_bqstorage_warning(self):
         from google.cloud.bigquery.schema import SchemaField
@@ -0,0 +1,92 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the writes of many documents.
+
+Writes documents through a fake API whose commits take a fixed latency,
+with sequential :class:`~google.cloud.firestore_v1.batch.WriteBatch`
+commits of 500 writes, and with a
+:class:`~google.cloud.firestore_v1.bulk_writer.BulkWriter`. The 500/50/5
+ramp-up of the bulk writer is lifted, as the benchmark lasts seconds rather
+than minutes. No API is called.
+
+Usage: python bulk_writer.py [number_of_documents] [commit_latency]
+"""
+
+import sys
+import time
+
+import google.auth.credentials
+import mock
+
+from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1.proto import firestore_pb2
+from google.cloud.firestore_v1.proto import write_pb2
+
+
+def make_client(commit_latency):
+    def commit(database_string, write_pbs, **kwargs):
+        time.sleep(commit_latency)
+        return firestore_pb2.CommitResponse(
+            write_results=[write_pb2.WriteResult() for _ in write_pbs]
+        )
+
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    client = Client(project="benchmark", credentials=credentials)
+    client._firestore_api_internal = mock.Mock(spec=["commit"])
+    client._firestore_api_internal.commit.side_effect = commit
+    return client
+
+
+def sequential_batches(client, number_of_documents):
+    collection = client.collection("docs")
+    batch = client.batch()
+    for index in range(number_of_documents):
+        batch.set(collection.document(str(index)), {"index": index})
+        if len(batch._write_pbs) == 500:
+            batch.commit()
+    if batch._write_pbs:
+        batch.commit()
+
+
+def bulk_writer(client, number_of_documents):
+    collection = client.collection("docs")
+    with client.bulk_writer(initial_ops_per_second=10 ** 6) as writer:
+        for index in range(number_of_documents):
+            writer.set(collection.document(str(index)), {"index": index})
+
+
+def run(write, number_of_documents, commit_latency):
+    client = make_client(commit_latency)
+    start = time.time()
+    write(client, number_of_documents)
+    return time.time() - start
+
+
+number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+commit_latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+before_time = run(sequential_batches, number_of_documents, commit_latency)
+after_time = run(bulk_writer, number_of_documents, commit_latency)
+
+print(
+    "{0} documents, {1}s per commit: sequential batches {2:,.0f} writes/s, "
+    "bulk writer {3:,.0f} writes/s, speedup {4:.1f}x".format(
+        number_of_documents,
+        commit_latency,
+        number_of_documents / before_time,
+        number_of_documents / after_time,
+        before_time / after_time,
+    )
+)
@@ -0,0 +1,117 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark of the encoding of the documents written.
+
+Encodes flat, nested and transform-heavy documents into ``Write``
+protobufs, as ``create``, ``set``, ``set`` with ``merge=True`` and
+``update`` do. No API is called.
+
+Usage: python encode_documents.py [number_of_documents]
+"""
+
+import datetime
+import sys
+import time
+
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1 import transforms
+
+
+DOCUMENT_PATH = "projects/benchmark/databases/(default)/documents/docs/doc"
+NOW = datetime.datetime(2019, 10, 1, 12, 30, 15)
+
+
+def flat_document(index):
+    document = {"field{}".format(column): column * index for column in range(10)}
+    document.update(
+        {
+            "name": u"name-{}".format(index),
+            "score": index / 3.0,
+            "alive": index % 2 == 0,
+            "created": NOW,
+            "payload": b"\x00\x01\x02",
+            "missing": None,
+        }
+    )
+    return document
+
+
+def nested_document(index):
+    return {
+        "name": u"name-{}".format(index),
+        "address": {
+            "street": u"{} Main Street".format(index),
+            "city": {"name": u"Springfield", "zip": u"12345", "geo": [1.5, 2.5]},
+        },
+        "tags": [u"a", u"b", u"c"],
+        "history": [{"at": NOW, "value": value} for value in range(5)],
+        "stats": {"counts": {"views": index, "likes": index // 2}, "ratio": 0.5},
+    }
+
+
+def transform_document(index):
+    return {
+        "name": u"name-{}".format(index),
+        "updated": transforms.SERVER_TIMESTAMP,
+        "views": transforms.Increment(1),
+        "best": transforms.Maximum(index),
+        "worst": transforms.Minimum(index),
+        "tags": transforms.ArrayUnion([u"new"]),
+        "old_tags": transforms.ArrayRemove([u"old"]),
+        "stats": {"updated": transforms.SERVER_TIMESTAMP, "count": index},
+    }
+
+
+def update_document(index):
+    return {
+        "name": u"name-{}".format(index),
+        "address.street": u"{} Main Street".format(index),
+        "address.city": {"name": u"Springfield", "zip": u"12345"},
+        "stats.views": transforms.Increment(1),
+        "updated": transforms.SERVER_TIMESTAMP,
+    }
+
+
+WRITES = [
+    ("create flat", flat_document, _helpers.pbs_for_create),
+    ("set flat", flat_document, _helpers.pbs_for_set_no_merge),
+    ("set nested", nested_document, _helpers.pbs_for_set_no_merge),
+    (
+        "set merge nested",
+        nested_document,
+        lambda path, data: _helpers.pbs_for_set_with_merge(path, data, True),
+    ),
+    ("set transforms", transform_document, _helpers.pbs_for_set_no_merge),
+    (
+        "update",
+        update_document,
+        lambda path, data: _helpers.pbs_for_update(path, data, None),
+    ),
+]
+
+
+def run(make_document, encode, number_of_documents):
+    documents = [make_document(index) for index in range(number_of_documents)]
+    start = time.time()
+    for document in documents:
+        encode(DOCUMENT_PATH, document)
+    return time.time() - start
+
+
+number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+for name, make_document, encode in WRITES:
+    elapsed = run(make_document, encode, number_of_documents)
+    print("{0}: {1:,.0f} documents/s".format(name, number_of_documents / elapsed))
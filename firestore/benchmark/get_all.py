@@ -0,0 +1,86 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the retrieval of many documents by reference.
+
+Retrieves documents from a fake API whose streams send a document every
+``document_latency`` seconds, with one ``BatchGetDocuments`` stream as
+before the references were split in chunks, and with chunks retrieved over
+concurrent streams, in any order and in the order of the references. No
+API is called.
+
+Usage: python get_all.py [number_of_documents] [chunk_size] [document_latency]
+"""
+
+import sys
+import time
+
+import google.auth.credentials
+import mock
+
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1.proto import document_pb2
+from google.cloud.firestore_v1.proto import firestore_pb2
+
+
+def make_client(document_latency):
+    fields = _helpers.encode_dict({"name": u"lamp", "count": 10, "price": 2.5})
+
+    def batch_get_documents(database_string, document_paths, mask, **kwargs):
+        for document_path in document_paths:
+            time.sleep(document_latency)
+            yield firestore_pb2.BatchGetDocumentsResponse(
+                found=document_pb2.Document(name=document_path, fields=fields)
+            )
+
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    client = Client(project="benchmark", credentials=credentials)
+    client._firestore_api_internal = mock.Mock(spec=["batch_get_documents"])
+    client._firestore_api_internal.batch_get_documents.side_effect = batch_get_documents
+    return client
+
+
+def run(number_of_documents, document_latency, **kwargs):
+    client = make_client(document_latency)
+    collection = client.collection("lamps")
+    references = [
+        collection.document(str(index)) for index in range(number_of_documents)
+    ]
+    start = time.time()
+    count = sum(1 for _ in client.get_all(references, **kwargs))
+    assert count == number_of_documents
+    return time.time() - start
+
+
+number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+document_latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0002
+
+before_time = run(number_of_documents, document_latency)
+for ordered in (False, True):
+    after_time = run(
+        number_of_documents, document_latency, chunk_size=chunk_size, ordered=ordered
+    )
+    print(
+        "{0} documents: one stream {1:.2f}s, chunks of {2} (ordered={3}) "
+        "{4:.2f}s, speedup {5:.1f}x".format(
+            number_of_documents,
+            before_time,
+            chunk_size,
+            ordered,
+            after_time,
+            before_time / after_time,
+        )
+    )
@@ -0,0 +1,106 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the reads of a large query over an unreliable stream.
+
+Reads every document of a query from a fake API whose ``RunQuery`` streams
+send a document every ``document_latency`` seconds and are dropped after
+``documents_per_stream`` documents. Compares restarting the whole query on
+each dropped stream, resuming the stream after the last document received,
+and reading pages of ``page_size`` documents. No API is called.
+
+Usage: python paginate_query.py [number_of_documents] [documents_per_stream]
+    [page_size] [document_latency]
+"""
+
+import sys
+import time
+
+import google.auth.credentials
+import mock
+from google.api_core import exceptions
+
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1 import Client
+from google.cloud.firestore_v1.proto import document_pb2
+from google.cloud.firestore_v1.proto import firestore_pb2
+
+
+def make_client(number_of_documents, documents_per_stream, document_latency):
+    collection_path = "projects/benchmark/databases/(default)/documents/lamps"
+
+    def run_query(parent, query_pb, **kwargs):
+        start = 0
+        if query_pb.HasField("start_at"):
+            start = query_pb.start_at.values[0].integer_value + 1
+        stop = number_of_documents
+        if query_pb.HasField("limit"):
+            stop = min(stop, start + query_pb.limit.value)
+        for sent, index in enumerate(range(start, stop)):
+            if sent == documents_per_stream:
+                raise exceptions.ServiceUnavailable("Stream dropped.")
+            time.sleep(document_latency)
+            document_pb = document_pb2.Document(
+                name="{}/{:08d}".format(collection_path, index),
+                fields=_helpers.encode_dict({"index": index, "name": u"lamp"}),
+            )
+            yield firestore_pb2.RunQueryResponse(document=document_pb)
+
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    client = Client(project="benchmark", credentials=credentials)
+    client._firestore_api_internal = mock.Mock(spec=["run_query"])
+    client._firestore_api_internal.run_query.side_effect = run_query
+    return client
+
+
+def restart(query, page_size):
+    # Bounded, so that the benchmark ends when a stream never completes.
+    for _ in range(5):
+        try:
+            return sum(1 for _ in query.stream())
+        except exceptions.ServiceUnavailable:
+            pass
+    return 0
+
+
+def resume(query, page_size):
+    return sum(1 for _ in query.stream(resume=True))
+
+
+def paginate(query, page_size):
+    return sum(len(page) for page in query.paginate(page_size))
+
+
+def run(read, number_of_documents, documents_per_stream, page_size, latency):
+    client = make_client(number_of_documents, documents_per_stream, latency)
+    query = client.collection("lamps").order_by("index")
+    start = time.time()
+    count = read(query, page_size)
+    return count, time.time() - start
+
+
+number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+documents_per_stream = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+page_size = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+document_latency = float(sys.argv[4]) if len(sys.argv) > 4 else 0.0001
+
+for name, read in (("restart", restart), ("resume", resume), ("paginate", paginate)):
+    count, elapsed = run(
+        read, number_of_documents, documents_per_stream, page_size, document_latency
+    )
+    print(
+        "{0}: {1} of {2} documents in {3:.2f}s".format(
+            name, count, number_of_documents, elapsed
+        )
+    )
@@ -0,0 +1,145 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the snapshots computed by the Watch of large result sets.
+
+Computes the snapshot of a change to a listener of many documents, with the
+copy-on-write dict used before the documents were kept in a persistent
+tree, and with :class:`~google.cloud.firestore_v1.watch.WatchDocTree`. The
+documents are ordered by their path. No API is called.
+
+Usage: python watch_snapshot.py [number_of_documents] [number_of_changes]
+"""
+
+import functools
+import sys
+import time
+
+import mock
+
+from google.cloud.firestore_v1 import watch
+
+
+DocTreeEntry = watch.DocTreeEntry
+
+
+class CopyOnWriteDocTree(object):
+    """The document tree before the persistent tree."""
+
+    def __init__(self, comparator=None):
+        self._dict = {}
+        self._index = 0
+
+    def keys(self):
+        return list(self._dict.keys())
+
+    def _copy(self):
+        wdt = CopyOnWriteDocTree()
+        wdt._dict = self._dict.copy()
+        wdt._index = self._index
+        return wdt
+
+    def insert(self, key, value):
+        self = self._copy()
+        self._dict[key] = DocTreeEntry(value, self._index)
+        self._index += 1
+        return self
+
+    def find(self, key):
+        return self._dict[key]
+
+    def remove(self, key):
+        self = self._copy()
+        del self._dict[key]
+        return self
+
+    def __iter__(self):
+        return iter(self._dict)
+
+    def __len__(self):
+        return len(self._dict)
+
+
+class Reference(object):
+    def __init__(self, document_path):
+        self._document_path = document_path
+
+
+class Snapshot(object):
+    def __init__(self, index, update_time=1):
+        self.reference = Reference("/docs/{:08d}".format(index))
+        self.update_time = update_time
+
+
+def compare(doc1, doc2):
+    path1 = doc1.reference._document_path
+    path2 = doc2.reference._document_path
+    return (path1 > path2) - (path1 < path2)
+
+
+def make_watch():
+    inst = watch.Watch.__new__(watch.Watch)
+    inst._comparator = compare
+    return inst
+
+
+def run(tree_class, number_of_documents, number_of_changes, sort_keys):
+    inst = make_watch()
+    doc_tree = tree_class(compare)
+    doc_map = {}
+    for index in range(0, 2 * number_of_documents, 2):
+        doc = Snapshot(index)
+        doc_tree = doc_tree.insert(doc, None)
+        doc_map[doc.reference._document_path] = doc
+
+    step = max(1, number_of_documents // number_of_changes)
+    changed = range(0, 2 * number_of_documents, 2 * step)[:number_of_changes]
+    deletes = [Snapshot(index).reference._document_path for index in changed[::3]]
+    adds = [Snapshot(index + 1) for index in changed[1::3]]
+    updates = [Snapshot(index, update_time=2) for index in changed[2::3]]
+
+    start = time.time()
+    updated_tree, _, changes = inst._compute_snapshot(
+        doc_tree, dict(doc_map), deletes, adds, updates
+    )
+    # The documents handed to the snapshot callback, in order. The keys of
+    # the copy-on-write dict had to be sorted by ``push``.
+    keys = updated_tree.keys()
+    if sort_keys:
+        keys = sorted(keys, key=functools.cmp_to_key(compare))
+    return time.time() - start, len(changes), len(keys)
+
+
+number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+number_of_changes = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+with mock.patch.object(watch, "_LOGGER"):
+    before_time, before_changes, before_size = run(
+        CopyOnWriteDocTree, number_of_documents, number_of_changes, True
+    )
+    after_time, after_changes, after_size = run(
+        watch.WatchDocTree, number_of_documents, number_of_changes, False
+    )
+assert (before_changes, before_size) == (after_changes, after_size)
+
+print(
+    "{0} documents, {1} changes: copy-on-write dict {2:.3f}s, "
+    "persistent tree {3:.3f}s, speedup {4:.1f}x".format(
+        number_of_documents,
+        after_changes,
+        before_time,
+        after_time,
+        before_time / after_time,
+    )
+)
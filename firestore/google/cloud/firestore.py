@@ -18,6 +18,7 @@
 from google.cloud.firestore_v1 import __version__
 from google.cloud.firestore_v1 import ArrayRemove
 from google.cloud.firestore_v1 import ArrayUnion
+from google.cloud.firestore_v1 import BulkWriter
 from google.cloud.firestore_v1 import Client
 from google.cloud.firestore_v1 import CollectionReference
 from google.cloud.firestore_v1 import DELETE_FIELD
@@ -45,6 +46,7 @@ __all__ = [
     "__version__",
     "ArrayRemove",
     "ArrayUnion",
+    "BulkWriter",
     "Client",
     "CollectionReference",
     "DELETE_FIELD",
@@ -152,67 +152,176 @@ def encode_value(value):
     Raises:
         TypeError: If the ``value`` is not one of the accepted types.
     """
-    if value is None:
-        return document_pb2.Value(null_value=struct_pb2.NULL_VALUE)
+    value_pb = document_pb2.Value()
+    _encode_value_into(value, value_pb)
+    return value_pb
 
-    # Must come before six.integer_types since ``bool`` is an integer subtype.
-    if isinstance(value, bool):
-        return document_pb2.Value(boolean_value=value)
 
-    if isinstance(value, six.integer_types):
-        return document_pb2.Value(integer_value=value)
+def encode_dict(values_dict):
+    """Encode a dictionary into protobuf ``Value``-s.
 
-    if isinstance(value, float):
-        return document_pb2.Value(double_value=value)
+    Args:
+        values_dict (dict): The dictionary to encode as protobuf fields.
 
-    if isinstance(value, DatetimeWithNanoseconds):
-        return document_pb2.Value(timestamp_value=value.timestamp_pb())
+    Returns:
+        Dict[str, ~google.cloud.firestore_v1.types.Value]: A
+        dictionary of string keys and ``Value`` protobufs as dictionary
+        values.
+    """
+    return {key: encode_value(value) for key, value in six.iteritems(values_dict)}
 
-    if isinstance(value, datetime.datetime):
-        return document_pb2.Value(timestamp_value=_datetime_to_pb_timestamp(value))
 
-    if isinstance(value, six.text_type):
-        return document_pb2.Value(string_value=value)
+def _encode_value_into(value, value_pb):
+    """Encode a native Python value into an empty protobuf ``Value``.
 
-    if isinstance(value, six.binary_type):
-        return document_pb2.Value(bytes_value=value)
+    The nested lists and dictionaries are encoded into the sub-messages of
+    ``value_pb`` in place, rather than copied into it.
 
-    # NOTE: We avoid doing an isinstance() check for a Document
-    #       here to avoid import cycles.
-    document_path = getattr(value, "_document_path", None)
-    if document_path is not None:
-        return document_pb2.Value(reference_value=document_path)
+    Args:
+        value (Any): A native Python value, see :func:`encode_value`.
+        value_pb (~google.cloud.firestore_v1.types.Value): The protobuf
+            to encode the value into.
 
-    if isinstance(value, GeoPoint):
-        return document_pb2.Value(geo_point_value=value.to_protobuf())
+    Raises:
+        TypeError: If the ``value`` is not one of the accepted types.
+    """
+    encoder = _VALUE_ENCODERS.get(type(value))
+    if encoder is None:
+        encoder = _resolve_value_encoder(value)
+    encoder(value, value_pb)
 
-    if isinstance(value, list):
-        value_list = [encode_value(element) for element in value]
-        value_pb = document_pb2.ArrayValue(values=value_list)
-        return document_pb2.Value(array_value=value_pb)
 
-    if isinstance(value, dict):
-        value_dict = encode_dict(value)
-        value_pb = document_pb2.MapValue(fields=value_dict)
-        return document_pb2.Value(map_value=value_pb)
+def _encode_dict_into(values_dict, fields_pb):
+    """Encode a dictionary into the ``fields`` of a protobuf, in place.
 
-    raise TypeError(
-        "Cannot convert to a Firestore Value", value, "Invalid type", type(value)
-    )
+    Args:
+        values_dict (dict): The dictionary to encode as protobuf fields.
+        fields_pb (MutableMapping[str, ~google.cloud.firestore_v1.types.Value]):
+            The map field of a ``Document`` or ``MapValue`` to encode the
+            dictionary into.
+    """
+    for key, value in six.iteritems(values_dict):
+        _encode_value_into(value, fields_pb[key])
 
 
-def encode_dict(values_dict):
-    """Encode a dictionary into protobuf ``Value``-s.
+def _encode_null(value, value_pb):
+    value_pb.null_value = struct_pb2.NULL_VALUE
 
-    Args:
-        values_dict (dict): The dictionary to encode as protobuf fields.
 
-    Returns:
-        Dict[str, ~google.cloud.firestore_v1.types.Value]: A
-        dictionary of string keys and ``Value`` protobufs as dictionary
-        values.
+def _encode_boolean(value, value_pb):
+    value_pb.boolean_value = value
+
+
+def _encode_integer(value, value_pb):
+    value_pb.integer_value = value
+
+
+def _encode_double(value, value_pb):
+    value_pb.double_value = value
+
+
+def _encode_datetime_with_nanoseconds(value, value_pb):
+    value_pb.timestamp_value.CopyFrom(value.timestamp_pb())
+
+
+def _encode_datetime(value, value_pb):
+    value_pb.timestamp_value.CopyFrom(_datetime_to_pb_timestamp(value))
+
+
+def _encode_string(value, value_pb):
+    value_pb.string_value = value
+
+
+def _encode_bytes(value, value_pb):
+    value_pb.bytes_value = value
+
+
+def _encode_reference(value, value_pb):
+    value_pb.reference_value = value._document_path
+
+
+def _encode_geo_point(value, value_pb):
+    value_pb.geo_point_value.latitude = value.latitude
+    value_pb.geo_point_value.longitude = value.longitude
+
+
+def _encode_array(value, value_pb):
+    _encode_array_value_into(value, value_pb.array_value)
+
+
+def _encode_array_value_into(values, array_value_pb):
+    """Encode a list into an empty protobuf ``ArrayValue``, in place."""
+    array_value_pb.SetInParent()
+    values_pb = array_value_pb.values
+    for element in values:
+        _encode_value_into(element, values_pb.add())
+
+
+def _encode_map(value, value_pb):
+    value_pb.map_value.SetInParent()
+    _encode_dict_into(value, value_pb.map_value.fields)
+
+
+# The encoders by the exact type of the values, see ``_resolve_value_encoder``.
+_VALUE_ENCODERS = {
+    type(None): _encode_null,
+    bool: _encode_boolean,
+    float: _encode_double,
+    DatetimeWithNanoseconds: _encode_datetime_with_nanoseconds,
+    datetime.datetime: _encode_datetime,
+    six.text_type: _encode_string,
+    six.binary_type: _encode_bytes,
+    GeoPoint: _encode_geo_point,
+    list: _encode_array,
+    dict: _encode_map,
+}
+_VALUE_ENCODERS.update(
+    (integer_type, _encode_integer) for integer_type in six.integer_types
+)
+
+
+def _resolve_value_encoder(value):
+    """Find the encoder of a value of a type not yet encoded.
+
+    The encoder is cached for the type of the value. The checks follow the
+    order of the types in :func:`encode_value`.
+
+    Raises:
+        TypeError: If the ``value`` is not one of the accepted types.
     """
-    return {key: encode_value(value) for key, value in six.iteritems(values_dict)}
+    # Must come before six.integer_types since ``bool`` is an integer subtype.
+    if isinstance(value, bool):
+        encoder = _encode_boolean
+    elif isinstance(value, six.integer_types):
+        encoder = _encode_integer
+    elif isinstance(value, float):
+        encoder = _encode_double
+    elif isinstance(value, DatetimeWithNanoseconds):
+        encoder = _encode_datetime_with_nanoseconds
+    elif isinstance(value, datetime.datetime):
+        encoder = _encode_datetime
+    elif isinstance(value, six.text_type):
+        encoder = _encode_string
+    elif isinstance(value, six.binary_type):
+        encoder = _encode_bytes
+    # NOTE: We avoid doing an isinstance() check for a Document
+    #       here to avoid import cycles. The encoder of a reference is not
+    #       cached, as the check depends on the value.
+    elif getattr(value, "_document_path", None) is not None:
+        return _encode_reference
+    elif isinstance(value, GeoPoint):
+        encoder = _encode_geo_point
+    elif isinstance(value, list):
+        encoder = _encode_array
+    elif isinstance(value, dict):
+        encoder = _encode_map
+    else:
+        raise TypeError(
+            "Cannot convert to a Firestore Value", value, "Invalid type", type(value)
+        )
+
+    _VALUE_ENCODERS[type(value)] = encoder
+    return encoder
 
 
 def reference_value_to_document(reference_value, client):
@@ -473,97 +582,66 @@ class DocumentExtractor(object):
 
     def get_update_pb(self, document_path, exists=None, allow_empty_mask=False):
 
+        # The document is encoded into the write in place.
+        update_pb = write_pb2.Write()
+        update_pb.update.name = document_path
+        _encode_dict_into(self.set_fields, update_pb.update.fields)
+
+        update_mask = self._get_update_mask(allow_empty_mask)
+        if update_mask is not None:
+            update_pb.update_mask.CopyFrom(update_mask)
+
         if exists is not None:
-            current_document = common_pb2.Precondition(exists=exists)
-        else:
-            current_document = None
-
-        update_pb = write_pb2.Write(
-            update=document_pb2.Document(
-                name=document_path, fields=encode_dict(self.set_fields)
-            ),
-            update_mask=self._get_update_mask(allow_empty_mask),
-            current_document=current_document,
-        )
+            update_pb.current_document.exists = exists
 
         return update_pb
 
     def get_transform_pb(self, document_path, exists=None):
-        def make_array_value(values):
-            value_list = [encode_value(element) for element in values]
-            return document_pb2.ArrayValue(values=value_list)
+        def set_to_server_value(field_transform, unused_value):
+            field_transform.set_to_server_value = REQUEST_TIME_ENUM
+
+        def remove_all_from_array(field_transform, values):
+            _encode_array_value_into(values, field_transform.remove_all_from_array)
+
+        def append_missing_elements(field_transform, values):
+            _encode_array_value_into(values, field_transform.append_missing_elements)
+
+        def increment(field_transform, value):
+            _encode_value_into(value, field_transform.increment)
+
+        def maximum(field_transform, value):
+            _encode_value_into(value, field_transform.maximum)
+
+        def minimum(field_transform, value):
+            _encode_value_into(value, field_transform.minimum)
 
         path_field_transforms = (
-            [
-                (
-                    path,
-                    write_pb2.DocumentTransform.FieldTransform(
-                        field_path=path.to_api_repr(),
-                        set_to_server_value=REQUEST_TIME_ENUM,
-                    ),
-                )
-                for path in self.server_timestamps
-            ]
+            [(path, set_to_server_value, None) for path in self.server_timestamps]
             + [
-                (
-                    path,
-                    write_pb2.DocumentTransform.FieldTransform(
-                        field_path=path.to_api_repr(),
-                        remove_all_from_array=make_array_value(values),
-                    ),
-                )
+                (path, remove_all_from_array, values)
                 for path, values in self.array_removes.items()
             ]
             + [
-                (
-                    path,
-                    write_pb2.DocumentTransform.FieldTransform(
-                        field_path=path.to_api_repr(),
-                        append_missing_elements=make_array_value(values),
-                    ),
-                )
+                (path, append_missing_elements, values)
                 for path, values in self.array_unions.items()
             ]
-            + [
-                (
-                    path,
-                    write_pb2.DocumentTransform.FieldTransform(
-                        field_path=path.to_api_repr(), increment=encode_value(value)
-                    ),
-                )
-                for path, value in self.increments.items()
-            ]
-            + [
-                (
-                    path,
-                    write_pb2.DocumentTransform.FieldTransform(
-                        field_path=path.to_api_repr(), maximum=encode_value(value)
-                    ),
-                )
-                for path, value in self.maximums.items()
-            ]
-            + [
-                (
-                    path,
-                    write_pb2.DocumentTransform.FieldTransform(
-                        field_path=path.to_api_repr(), minimum=encode_value(value)
-                    ),
-                )
-                for path, value in self.minimums.items()
-            ]
-        )
-        field_transforms = [
-            transform for path, transform in sorted(path_field_transforms)
-        ]
-        transform_pb = write_pb2.Write(
-            transform=write_pb2.DocumentTransform(
-                document=document_path, field_transforms=field_transforms
-            )
+            + [(path, increment, value) for path, value in self.increments.items()]
+            + [(path, maximum, value) for path, value in self.maximums.items()]
+            + [(path, minimum, value) for path, value in self.minimums.items()]
         )
+        # The transforms of a document are ordered by field path.
+        path_field_transforms.sort(key=lambda item: item[0])
+
+        transform_pb = write_pb2.Write()
+        transform_pb.transform.document = document_path
+        field_transforms = transform_pb.transform.field_transforms
+        for path, encode_transform, value in path_field_transforms:
+            field_transform = field_transforms.add()
+            field_transform.field_path = path.to_api_repr()
+            encode_transform(field_transform, value)
+
         if exists is not None:
-            transform_pb.current_document.CopyFrom(
-                common_pb2.Precondition(exists=exists)
-            )
+            transform_pb.current_document.exists = exists
 
         return transform_pb
 
@@ -694,6 +772,8 @@ class DocumentExtractorForMerge(DocumentExtractor):
             raise ValueError("Cannot merge specific fields with empty document.")
 
         merge_paths = self._normalize_merge_paths(merge)
+        # Sorted once, rather than for each merge path.
+        transform_paths = self.transform_paths
 
         del self.data_merge[:]
         del self.transform_merge[:]
@@ -701,7 +781,7 @@ class DocumentExtractorForMerge(DocumentExtractor):
 
         for merge_path in merge_paths:
 
-            if merge_path in self.transform_paths:
+            if merge_path in transform_paths:
                 self.transform_merge.append(merge_path)
 
             for field_path in self.field_paths:
@@ -731,7 +811,7 @@ class DocumentExtractorForMerge(DocumentExtractor):
         for merge_path in self.merge:
             tranform_merge_paths = [
                 transform_path
-                for transform_path in self.transform_paths
+                for transform_path in transform_paths
                 if merge_path.eq_or_parent(transform_path)
             ]
             merged_transform_paths.update(tranform_merge_paths)
@@ -832,9 +912,10 @@ class DocumentExtractorForUpdate(DocumentExtractor):
         return extract_fields(self.document_data, prefix_path, expand_dots=True)
 
     def _get_update_mask(self, allow_empty_mask=False):
+        transform_paths = self.transform_paths
         mask_paths = []
         for field_path in self.top_level_paths:
-            if field_path not in self.transform_paths:
+            if field_path not in transform_paths:
                 mask_paths.append(field_path.to_api_repr())
 
         return common_pb2.DocumentMask(field_paths=mask_paths)
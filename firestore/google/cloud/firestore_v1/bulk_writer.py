@@ -0,0 +1,498 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for writing many documents to the Google Cloud Firestore API."""
+
+import collections
+import concurrent.futures
+import threading
+import time
+
+from google.api_core import exceptions
+from google.cloud.firestore_v1 import transaction
+from google.cloud.firestore_v1.batch import WriteBatch
+
+
+MAX_BATCH_SIZE = 500
+"""int: The maximum number of writes of a commit accepted by the server."""
+_DEFAULT_MAX_WORKERS = 10
+_DEFAULT_MAX_ATTEMPTS = 5
+_INITIAL_OPS_PER_SECOND = 500
+"""int: The initial number of writes per second, as in the 500/50/5 rule."""
+_RAMP_UP_MULTIPLIER = 1.5
+"""float: The growth of the number of writes per second at each ramp-up."""
+_RAMP_UP_PERIOD = 5 * 60
+"""float: The number of seconds between two ramp-ups of the throughput."""
+_DEFAULT_MAX_OPS_PER_SECOND = 10000
+_RETRYABLE_ERRORS = (
+    exceptions.Aborted,
+    exceptions.InternalServerError,
+    exceptions.ResourceExhausted,
+    exceptions.ServiceUnavailable,
+)
+_CLOSED = "The BulkWriter is closed."
+
+BulkWriterStats = collections.namedtuple(
+    "BulkWriterStats",
+    [
+        "writes",
+        "succeeded",
+        "failed",
+        "batches",
+        "retries",
+        "elapsed",
+        "writes_per_second",
+    ],
+)
+BulkWriterStats.__doc__ = "The throughput of a :class:`BulkWriter`."
+BulkWriterStats.writes.__doc__ = "int: The number of writes enqueued."
+BulkWriterStats.succeeded.__doc__ = "int: The number of writes committed."
+BulkWriterStats.failed.__doc__ = "int: The number of writes which failed."
+BulkWriterStats.batches.__doc__ = "int: The number of commits sent."
+BulkWriterStats.retries.__doc__ = "int: The number of commits retried."
+BulkWriterStats.elapsed.__doc__ = (
+    "float: The number of seconds since the first write was enqueued."
+)
+BulkWriterStats.writes_per_second.__doc__ = (
+    "float: The number of writes committed per second."
+)
+
+
+class _RateLimiter(object):
+    """Limit the number of writes per second, ramping up over time.
+
+    Follows the 500/50/5 rule: start with ``initial_ops_per_second`` writes
+    per second, then increase the traffic by 50% every 5 minutes. The
+    tokens of a second which are not used can be used in the next one, up
+    to a second of tokens.
+
+    Args:
+        initial_ops_per_second (int): The initial number of writes per second.
+        max_ops_per_second (int): The maximum number of writes per second.
+        multiplier (float): The growth of the limit at each ramp-up.
+        period (float): The number of seconds between two ramp-ups.
+    """
+
+    def __init__(
+        self,
+        initial_ops_per_second=_INITIAL_OPS_PER_SECOND,
+        max_ops_per_second=_DEFAULT_MAX_OPS_PER_SECOND,
+        multiplier=_RAMP_UP_MULTIPLIER,
+        period=_RAMP_UP_PERIOD,
+    ):
+        self._initial_ops_per_second = min(initial_ops_per_second, max_ops_per_second)
+        self._max_ops_per_second = max_ops_per_second
+        self._multiplier = multiplier
+        self._period = period
+        self._start_time = None
+        self._last_refill = None
+        self._available = 0.0
+
+    def ops_per_second(self, now):
+        """The limit of the number of writes per second at a given time."""
+        if self._start_time is None:
+            return self._initial_ops_per_second
+        ramp_ups = int((now - self._start_time) // self._period)
+        ops_per_second = self._initial_ops_per_second * self._multiplier ** ramp_ups
+        return min(int(ops_per_second), self._max_ops_per_second)
+
+    def _refill(self, now):
+        capacity = self.ops_per_second(now)
+        if self._start_time is None:
+            self._start_time = self._last_refill = now
+            self._available = float(capacity)
+        else:
+            elapsed = max(0.0, now - self._last_refill)
+            self._available = min(capacity, self._available + elapsed * capacity)
+            self._last_refill = now
+        return capacity
+
+    def try_acquire(self, tokens):
+        """Take tokens if they are available.
+
+        Args:
+            tokens (int): The number of writes to send.
+
+        Returns:
+            float: ``0`` if the tokens were taken, else the number of seconds
+            to wait before they are available.
+        """
+        now = time.time()
+        capacity = self._refill(now)
+        # A batch larger than a second of tokens waits for a full second.
+        tokens = min(tokens, capacity)
+        if self._available >= tokens:
+            self._available -= tokens
+            return 0
+        return (tokens - self._available) / capacity
+
+    def acquire(self, tokens):
+        """Wait until tokens are available, then take them.
+
+        Args:
+            tokens (int): The number of writes to send.
+        """
+        delay = self.try_acquire(tokens)
+        while delay:
+            time.sleep(delay)
+            delay = self.try_acquire(tokens)
+
+
+class _Operation(object):
+    """A write enqueued in a :class:`BulkWriter`.
+
+    Args:
+        document_path (str): The path of the written document.
+        write_pbs (List[google.cloud.proto.firestore.v1.write_pb2.Write]):
+            The writes of the operation, committed together.
+    """
+
+    __slots__ = ("document_path", "write_pbs", "future")
+
+    def __init__(self, document_path, write_pbs):
+        self.document_path = document_path
+        self.write_pbs = write_pbs
+        self.future = concurrent.futures.Future()
+        # The writes cannot be cancelled once enqueued.
+        self.future.set_running_or_notify_cancel()
+
+
+class BulkWriter(object):
+    """Write many documents, with batches committed in parallel.
+
+    This has the same set of methods for write operations that
+    :class:`~google.cloud.firestore_v1.batch.WriteBatch` does, which return
+    a future of the
+    :class:`~google.cloud.firestore_v1.types.WriteResult` of each write.
+
+    The writes are grouped into batches of up to ``max_batch_size`` writes,
+    committed from a pool of threads as the batches fill up. The traffic
+    is throttled following the 500/50/5 rule, starting with
+    ``initial_ops_per_second`` writes per second. The writes to a document
+    are committed in the order they are enqueued.
+
+    Unlike a :class:`~google.cloud.firestore_v1.batch.WriteBatch`, the
+    writes are not atomic: each batch is committed separately. The commits
+    which fail with a retryable error (``ABORTED``, ``INTERNAL``,
+    ``RESOURCE_EXHAUSTED`` or ``UNAVAILABLE``) are retried with exponential
+    backoff. The futures of the writes of a batch which fails get its
+    error.
+
+    .. note::
+        A retried commit may have been applied by the server before the
+        error, in which case a retried ``create`` fails with
+        :class:`~google.api_core.exceptions.AlreadyExists`.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client that created this bulk writer.
+        max_batch_size (Optional[int]): The maximum number of writes of a
+            commit. Defaults to :data:`MAX_BATCH_SIZE`.
+        max_workers (Optional[int]): The maximum number of commits sent in
+            parallel. Defaults to ``10``.
+        max_attempts (Optional[int]): The maximum number of attempts to
+            commit a batch. Defaults to ``5``.
+        initial_ops_per_second (Optional[int]): The initial number of writes
+            per second. Defaults to ``500``.
+        max_ops_per_second (Optional[int]): The maximum number of writes per
+            second, reached while ramping up. Defaults to ``10000``.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch_size=MAX_BATCH_SIZE,
+        max_workers=_DEFAULT_MAX_WORKERS,
+        max_attempts=_DEFAULT_MAX_ATTEMPTS,
+        initial_ops_per_second=_INITIAL_OPS_PER_SECOND,
+        max_ops_per_second=_DEFAULT_MAX_OPS_PER_SECOND,
+    ):
+        if not 0 < max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                "max_batch_size must be between 1 and {:d}.".format(MAX_BATCH_SIZE)
+            )
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_attempts = max_attempts
+        self._rate_limiter = _RateLimiter(initial_ops_per_second, max_ops_per_second)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+
+        # Protects the enqueued writes, the in-flight batches and the stats.
+        self._lock = threading.RLock()
+        self._operations = []
+        self._batch_size = 0
+        # The batches are numbered when taken out of the queue, and sent in
+        # that order: waiting for the rate limiter holds ``_send_turn`` only.
+        self._send_turn = threading.Condition()
+        self._next_ticket = 0
+        self._sending_ticket = 0
+        self._batch_futures = set()
+        # The last batch sent with a write to each document.
+        self._document_batches = {}
+        self._closed = False
+
+        self._start_time = None
+        self._writes = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._batches = 0
+        self._retries = 0
+
+    @property
+    def stats(self):
+        """BulkWriterStats: The throughput of the writer so far."""
+        with self._lock:
+            if self._start_time is None:
+                elapsed = 0.0
+            else:
+                elapsed = time.time() - self._start_time
+            writes_per_second = self._succeeded / elapsed if elapsed else 0.0
+            return BulkWriterStats(
+                self._writes,
+                self._succeeded,
+                self._failed,
+                self._batches,
+                self._retries,
+                elapsed,
+                writes_per_second,
+            )
+
+    def create(self, reference, document_data):
+        """Enqueue a write to create a document.
+
+        See :meth:`google.cloud.firestore_v1.batch.WriteBatch.create`.
+
+        Returns:
+            concurrent.futures.Future: The future of the
+            :class:`~google.cloud.firestore_v1.types.WriteResult`.
+        """
+        return self._enqueue(
+            reference, lambda batch: batch.create(reference, document_data)
+        )
+
+    def set(self, reference, document_data, merge=False):
+        """Enqueue a write to replace a document.
+
+        See :meth:`google.cloud.firestore_v1.batch.WriteBatch.set`.
+
+        Returns:
+            concurrent.futures.Future: The future of the
+            :class:`~google.cloud.firestore_v1.types.WriteResult`.
+        """
+        return self._enqueue(
+            reference, lambda batch: batch.set(reference, document_data, merge=merge)
+        )
+
+    def update(self, reference, field_updates, option=None):
+        """Enqueue a write to update a document.
+
+        See :meth:`google.cloud.firestore_v1.batch.WriteBatch.update`.
+
+        Returns:
+            concurrent.futures.Future: The future of the
+            :class:`~google.cloud.firestore_v1.types.WriteResult`.
+        """
+        return self._enqueue(
+            reference, lambda batch: batch.update(reference, field_updates, option)
+        )
+
+    def delete(self, reference, option=None):
+        """Enqueue a write to delete a document.
+
+        See :meth:`google.cloud.firestore_v1.batch.WriteBatch.delete`.
+
+        Returns:
+            concurrent.futures.Future: The future of the
+            :class:`~google.cloud.firestore_v1.types.WriteResult`.
+        """
+        return self._enqueue(reference, lambda batch: batch.delete(reference, option))
+
+    def _enqueue(self, reference, add_write):
+        """Enqueue the writes added to a batch by ``add_write``."""
+        batch = WriteBatch(self._client)
+        add_write(batch)
+        operation = _Operation(reference._document_path, batch._write_pbs)
+
+        taken = []
+        with self._lock:
+            if self._closed:
+                raise ValueError(_CLOSED)
+            if self._start_time is None:
+                self._start_time = time.time()
+
+            if self._batch_size + len(operation.write_pbs) > self._max_batch_size:
+                taken.append(self._take_batch())
+            self._operations.append(operation)
+            self._batch_size += len(operation.write_pbs)
+            self._writes += 1
+
+            if self._batch_size >= self._max_batch_size:
+                taken.append(self._take_batch())
+
+        for operations, batch_size, ticket in taken:
+            self._send_batch(operations, batch_size, ticket)
+
+        return operation.future
+
+    def _take_batch(self):
+        """Take the enqueued writes out of the queue, and number them.
+
+        Must be called with the lock held.
+
+        Returns:
+            Tuple[List[_Operation], int, int]: The operations, their number
+            of writes, and the ticket to pass to :meth:`_send_batch`.
+        """
+        operations, self._operations = self._operations, []
+        batch_size, self._batch_size = self._batch_size, 0
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        return operations, batch_size, ticket
+
+    def _send_batch(self, operations, batch_size, ticket):
+        """Send a batch in a commit, once the rate allows it.
+
+        Must be called without the lock held. The batches are sent in the
+        order they were taken, so that the writes to a document are
+        committed in order. The callers wait for the rate limiter, which
+        throttles the writes.
+        """
+        with self._send_turn:
+            while self._sending_ticket != ticket:
+                self._send_turn.wait()
+
+            try:
+                if operations:
+                    self._rate_limiter.acquire(batch_size)
+                    with self._lock:
+                        self._submit_batch(operations)
+            finally:
+                self._sending_ticket += 1
+                self._send_turn.notify_all()
+
+    def _submit_batch(self, operations):
+        """Submit the commit of a batch to the thread pool.
+
+        Must be called with the lock held.
+        """
+        # The earlier batches writing to the same documents are committed
+        # first, so that the writes to a document are applied in order.
+        dependencies = set()
+        for operation in operations:
+            previous = self._document_batches.get(operation.document_path)
+            if previous is not None:
+                dependencies.add(previous)
+
+        batch_future = self._executor.submit(
+            self._commit_batch, operations, dependencies
+        )
+        self._batches += 1
+        self._batch_futures.add(batch_future)
+        for operation in operations:
+            self._document_batches[operation.document_path] = batch_future
+        batch_future.add_done_callback(
+            lambda future: self._batch_done(future, operations)
+        )
+
+    def _commit_batch(self, operations, dependencies):
+        """Commit a batch, retrying on retryable errors.
+
+        Run from the thread pool. The futures of the writes are resolved
+        with their results, or the error of the commit.
+        """
+        concurrent.futures.wait(dependencies)
+
+        write_pbs = [
+            write_pb for operation in operations for write_pb in operation.write_pbs
+        ]
+        current_sleep = transaction._INITIAL_SLEEP
+        attempt = 1
+        while True:
+            try:
+                commit_response = self._client._firestore_api.commit(
+                    self._client._database_string,
+                    write_pbs,
+                    transaction=None,
+                    metadata=self._client._rpc_metadata,
+                )
+                break
+            except _RETRYABLE_ERRORS as exc:
+                if attempt >= self._max_attempts:
+                    self._fail_operations(operations, exc)
+                    return
+            except Exception as exc:  # pylint: disable=broad-except
+                self._fail_operations(operations, exc)
+                return
+
+            with self._lock:
+                self._retries += 1
+            attempt += 1
+            current_sleep = transaction._sleep(current_sleep)
+
+        write_results = iter(commit_response.write_results)
+        for operation in operations:
+            # As for DocumentReference, the result of the first write of the
+            # operation, if it was split into an update and a transform.
+            results = [next(write_results) for _ in operation.write_pbs]
+            operation.future.set_result(results[0])
+
+        with self._lock:
+            self._succeeded += len(operations)
+
+    def _fail_operations(self, operations, exception):
+        for operation in operations:
+            operation.future.set_exception(exception)
+
+        with self._lock:
+            self._failed += len(operations)
+
+    def _batch_done(self, batch_future, operations):
+        with self._lock:
+            self._batch_futures.discard(batch_future)
+            for operation in operations:
+                path = operation.document_path
+                if self._document_batches.get(path) is batch_future:
+                    del self._document_batches[path]
+
+    def flush(self):
+        """Send the enqueued writes, and wait until they are all done.
+
+        The errors of the writes are set on their futures, not raised.
+        """
+        with self._lock:
+            operations, batch_size, ticket = self._take_batch()
+        # Also waits for the batches taken earlier by other threads.
+        self._send_batch(operations, batch_size, ticket)
+
+        with self._lock:
+            batch_futures = list(self._batch_futures)
+        concurrent.futures.wait(batch_futures)
+
+    def close(self):
+        """Flush the enqueued writes, and stop the threads of the writer.
+
+        No writes can be enqueued once the writer is closed.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
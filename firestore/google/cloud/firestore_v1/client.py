@@ -23,7 +23,12 @@ In the hierarchy of API concepts
 * a :class:`~google.cloud.firestore_v1.client.Client` owns a
   :class:`~google.cloud.firestore_v1.document.DocumentReference`
 """
+import collections
+import concurrent.futures
 import os
+import threading
+
+import six
 
 import google.api_core.client_options
 from google.api_core.gapic_v1 import client_info
@@ -34,6 +39,7 @@ from google.cloud.firestore_v1 import __version__
 from google.cloud.firestore_v1 import query
 from google.cloud.firestore_v1 import types
 from google.cloud.firestore_v1.batch import WriteBatch
+from google.cloud.firestore_v1.bulk_writer import BulkWriter
 from google.cloud.firestore_v1.collection import CollectionReference
 from google.cloud.firestore_v1.document import DocumentReference
 from google.cloud.firestore_v1.document import DocumentSnapshot
@@ -53,8 +59,11 @@ _BAD_DOC_TEMPLATE = (
 )
 _ACTIVE_TXN = "There is already an active transaction."
 _INACTIVE_TXN = "There is no active transaction."
+_BAD_GET_ALL_ARG = "{} must be a positive integer, got {!r}."
 _CLIENT_INFO = client_info.ClientInfo(client_library_version=__version__)
 _FIRESTORE_EMULATOR_HOST = "FIRESTORE_EMULATOR_HOST"
+_DEFAULT_GET_ALL_WORKERS = 10
+_GET_ALL_PUT_TIMEOUT = 0.1
 
 
 class Client(ClientWithProject):
@@ -396,18 +405,27 @@ class Client(ClientWithProject):
             extra = "{!r} was provided".format(name)
             raise TypeError(_BAD_OPTION_ERR, extra)
 
-    def get_all(self, references, field_paths=None, transaction=None):
+    def get_all(
+        self,
+        references,
+        field_paths=None,
+        transaction=None,
+        chunk_size=None,
+        max_workers=None,
+        ordered=False,
+    ):
         """Retrieve a batch of documents.
 
         .. note::
 
-           Documents returned by this method are not guaranteed to be
-           returned in the same order that they are given in ``references``.
+           Unless ``ordered`` is set, documents returned by this method are
+           not guaranteed to be returned in the same order that they are
+           given in ``references``.
 
         .. note::
 
-           If multiple ``references`` refer to the same document, the server
-           will only return one result.
+           If multiple ``references`` refer to the same document, it is
+           only requested and returned once.
 
         See :meth:`~google.cloud.firestore_v1.client.Client.field_path` for
         more information on **field paths**.
@@ -426,24 +444,111 @@ class Client(ClientWithProject):
             transaction (Optional[:class:`~google.cloud.firestore_v1.transaction.Transaction`]):
                 An existing transaction that these ``references`` will be
                 retrieved in.
+            chunk_size (Optional[int]): The maximum number of documents
+                retrieved by each ``BatchGetDocuments`` stream. The chunks
+                of documents are retrieved over concurrent streams. By
+                default, all the documents are retrieved by one stream.
+            max_workers (Optional[int]): The maximum number of concurrent
+                streams, when the documents are split in chunks. Defaults
+                to ``10``.
+            ordered (Optional[bool]): Whether to return the documents in the
+                order of ``references``. The documents received ahead of
+                their turn are held until the documents before them are
+                returned. Defaults to :data:`False`.
 
         Yields:
             .DocumentSnapshot: The next document snapshot that fulfills the
             query, or :data:`None` if the document does not exist.
+
+        Raises:
+            ValueError: If ``chunk_size`` or ``max_workers`` is not positive.
         """
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(_BAD_GET_ALL_ARG.format("chunk_size", chunk_size))
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(_BAD_GET_ALL_ARG.format("max_workers", max_workers))
+
         document_paths, reference_map = _reference_info(references)
+        # The unique paths, in the order of the references.
+        document_paths = list(collections.OrderedDict.fromkeys(document_paths))
         mask = _get_doc_mask(field_paths)
+        transaction_id = _helpers.get_transaction_id(transaction)
+
+        if chunk_size is None or len(document_paths) <= chunk_size:
+            snapshots = self._get_all_chunk(
+                document_paths, mask, transaction_id, reference_map
+            )
+        else:
+            chunks = [
+                document_paths[start : start + chunk_size]
+                for start in six.moves.range(0, len(document_paths), chunk_size)
+            ]
+            if max_workers is None:
+                max_workers = _DEFAULT_GET_ALL_WORKERS
+            snapshots = self._get_all_chunks(
+                chunks, mask, transaction_id, reference_map, max_workers, chunk_size
+            )
+
+        if ordered:
+            snapshots = _in_order(snapshots, document_paths)
+
+        for snapshot in snapshots:
+            yield snapshot
+
+    def _get_all_chunk(self, document_paths, mask, transaction_id, reference_map):
+        """Retrieve documents with one ``BatchGetDocuments`` stream."""
         response_iterator = self._firestore_api.batch_get_documents(
             self._database_string,
             document_paths,
             mask,
-            transaction=_helpers.get_transaction_id(transaction),
+            transaction=transaction_id,
             metadata=self._rpc_metadata,
         )
 
         for get_doc_response in response_iterator:
             yield _parse_batch_get(get_doc_response, reference_map, self)
 
+    def _get_all_chunks(
+        self, chunks, mask, transaction_id, reference_map, max_workers, queue_size
+    ):
+        """Retrieve chunks of documents over concurrent streams.
+
+        The snapshots are yielded as they are received from any stream.
+        """
+        results = six.moves.queue.Queue(queue_size)
+        stopped = threading.Event()
+
+        def retrieve_chunk(document_paths):
+            try:
+                for snapshot in self._get_all_chunk(
+                    document_paths, mask, transaction_id, reference_map
+                ):
+                    if not _put_until_stopped(results, stopped, snapshot):
+                        return
+            except Exception as exc:  # pylint: disable=broad-except
+                _put_until_stopped(results, stopped, exc)
+            else:
+                _put_until_stopped(results, stopped, None)
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        futures = []
+        try:
+            futures = [pool.submit(retrieve_chunk, chunk) for chunk in chunks]
+            remaining = len(futures)
+            while remaining:
+                item = results.get()
+                if item is None:  # a chunk is done
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=True)
+
     def collections(self):
         """List top-level collections of the client's database.
 
@@ -468,6 +573,25 @@ class Client(ClientWithProject):
         """
         return WriteBatch(self)
 
+    def bulk_writer(self, **kwargs):
+        """Get a bulk writer, to write many documents in parallel batches.
+
+        See :class:`~google.cloud.firestore_v1.bulk_writer.BulkWriter` for
+        more information on the bulk writers and the constructor arguments.
+
+        Args:
+            kwargs (Dict[str, Any]): The keyword arguments (other than
+                ``client``) to pass along to the
+                :class:`~google.cloud.firestore_v1.bulk_writer.BulkWriter`
+                constructor.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.bulk_writer.BulkWriter`:
+            A bulk writer attached to this client, to be closed once all the
+            writes are enqueued.
+        """
+        return BulkWriter(self, **kwargs)
+
     def transaction(self, **kwargs):
         """Get a transaction that uses this client.
 
@@ -514,6 +638,47 @@ def _reference_info(references):
     return document_paths, reference_map
 
 
+def _put_until_stopped(results, stopped, item):
+    """Put an item in a queue, unless stopped while the queue is full.
+
+    Helper for :meth:`~google.cloud.firestore_v1.client.Client.get_all`.
+
+    Returns:
+        bool: Whether the item was put.
+    """
+    while not stopped.is_set():
+        try:
+            results.put(item, timeout=_GET_ALL_PUT_TIMEOUT)
+        except six.moves.queue.Full:
+            continue
+        return True
+    return False
+
+
+def _in_order(snapshots, document_paths):
+    """Yield snapshots in the order of their document paths.
+
+    Helper for :meth:`~google.cloud.firestore_v1.client.Client.get_all`.
+
+    Args:
+        snapshots (Iterable[.DocumentSnapshot]): The snapshots, in any
+            order.
+        document_paths (List[str]): The unique paths of the documents, in
+            the order to yield them.
+
+    Yields:
+        .DocumentSnapshot: The snapshots, in the order of ``document_paths``.
+    """
+    pending = {}
+    paths = iter(document_paths)
+    next_path = next(paths, None)
+    for snapshot in snapshots:
+        pending[snapshot.reference._document_path] = snapshot
+        while next_path in pending:
+            yield pending.pop(next_path)
+            next_path = next(paths, None)
+
+
 def _get_reference(document_path, reference_map):
     """Get a document reference from a dictionary.
 
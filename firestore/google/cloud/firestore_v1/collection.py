@@ -383,7 +383,7 @@ class CollectionReference(object):
         )
         return self.stream(transaction=transaction)
 
-    def stream(self, transaction=None):
+    def stream(self, transaction=None, resume=False):
         """Read the documents in this collection.
 
         This sends a ``RunQuery`` RPC and then returns an iterator which
@@ -395,7 +395,8 @@ class CollectionReference(object):
            The underlying stream of responses will time out after
            the ``max_rpc_timeout_millis`` value set in the GAPIC
            client configuration for the ``RunQuery`` API.  Snapshots
-           not consumed from the iterator before that point will be lost.
+           not consumed from the iterator before that point will be lost,
+           unless ``resume`` is set.
 
         If a ``transaction`` is used and it already has write operations
         added, this method cannot be used (i.e. read-after-write is not
@@ -405,13 +406,36 @@ class CollectionReference(object):
             transaction (Optional[:class:`~google.cloud.firestore_v1.transaction.\
                 Transaction`]):
                 An existing transaction that the query will run in.
+            resume (Optional[bool]): Whether to resume the query after the
+                last document received when the stream fails with a
+                transient error. See
+                :meth:`~google.cloud.firestore_v1.query.Query.stream`.
 
         Yields:
             :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
             The next document that fulfills the query.
         """
         query = query_mod.Query(self)
-        return query.stream(transaction=transaction)
+        return query.stream(transaction=transaction, resume=resume)
+
+    def paginate(self, page_size, transaction=None):
+        """Read the documents in this collection, by pages.
+
+        See :meth:`~google.cloud.firestore_v1.query.Query.paginate` for
+        more information on this method.
+
+        Args:
+            page_size (int): The maximum number of documents of a page.
+            transaction (Optional[:class:`~google.cloud.firestore_v1.transaction.\
+                Transaction`]):
+                An existing transaction that the query will run in.
+
+        Yields:
+            List[:class:`~google.cloud.firestore_v1.document.DocumentSnapshot`]:
+            The documents of the next page.
+        """
+        query = query_mod.Query(self)
+        return query.paginate(page_size, transaction=transaction)
 
     def on_snapshot(self, callback):
         """Monitor the documents in this collection.
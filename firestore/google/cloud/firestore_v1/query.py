@@ -22,6 +22,7 @@ import copy
 import math
 import warnings
 
+from google.api_core import exceptions
 from google.protobuf import wrappers_pb2
 import six
 
@@ -64,6 +65,14 @@ _NO_ORDERS_FOR_CURSOR = (
     "come from fields set in ``order_by()``."
 )
 _MISMATCH_CURSOR_W_ORDER_BY = "The cursor {!r} does not match the order fields {!r}."
+_BAD_PAGE_SIZE = "Page size must be positive, got {!r}."
+_RESUMABLE_STREAM_ERRORS = (
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ServiceUnavailable,
+)
+_MAX_RESUME_ATTEMPTS = 5
+"""int: The number of times a stream is resumed without receiving a document."""
 
 
 class Query(object):
@@ -737,7 +746,7 @@ class Query(object):
         )
         return self.stream(transaction=transaction)
 
-    def stream(self, transaction=None):
+    def stream(self, transaction=None, resume=False):
         """Read the documents in the collection that match this query.
 
         This sends a ``RunQuery`` RPC and then returns an iterator which
@@ -749,7 +758,8 @@ class Query(object):
            The underlying stream of responses will time out after
            the ``max_rpc_timeout_millis`` value set in the GAPIC
            client configuration for the ``RunQuery`` API.  Snapshots
-           not consumed from the iterator before that point will be lost.
+           not consumed from the iterator before that point will be lost,
+           unless ``resume`` is set.
 
         If a ``transaction`` is used and it already has write operations
         added, this method cannot be used (i.e. read-after-write is not
@@ -759,11 +769,45 @@ class Query(object):
             transaction
                 (Optional[:class:`~google.cloud.firestore_v1.transaction.Transaction`]):
                 An existing transaction that this query will run in.
+            resume (Optional[bool]): Whether to resume the query when the
+                stream fails with a transient error (``DEADLINE_EXCEEDED``,
+                ``INTERNAL`` or ``UNAVAILABLE``), with a new stream starting
+                after the last document received. The documents must have
+                the fields of the ``order_by()`` clauses, see
+                :meth:`start_after`. Defaults to :data:`False`.
 
         Yields:
             :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
             The next document that fulfills the query.
         """
+        if not resume:
+            for snapshot in self._stream(transaction):
+                yield snapshot
+            return
+
+        query = self
+        count = 0
+        attempts = 0
+        while True:
+            try:
+                for snapshot in query._stream(transaction):
+                    yield snapshot
+                    last_snapshot = snapshot
+                    count += 1
+                    attempts = 0
+                return
+            except _RESUMABLE_STREAM_ERRORS:
+                attempts += 1
+                if attempts >= _MAX_RESUME_ATTEMPTS:
+                    raise
+
+            if count:
+                query = self._resume_after(last_snapshot, count)
+                if query is None:  # the limit was reached
+                    return
+
+    def _stream(self, transaction):
+        """Read the documents matching this query with one ``RunQuery``."""
         parent_path, expected_prefix = self._parent._parent_info()
         response_iterator = self._client._firestore_api.run_query(
             parent_path,
@@ -784,6 +828,75 @@ class Query(object):
             if snapshot is not None:
                 yield snapshot
 
+    def _resume_after(self, snapshot, count):
+        """Make the query of the documents after those already received.
+
+        Args:
+            snapshot (:class:`~google.cloud.firestore_v1.document.DocumentSnapshot`):
+                The last document received.
+            count (int): The number of documents received.
+
+        Returns:
+            Optional[:class:`~google.cloud.firestore_v1.query.Query`]:
+            The query starting after ``snapshot``, without the documents
+            already skipped by the offset or counted against the limit,
+            or :data:`None` if the limit is reached.
+        """
+        query = self.start_after(snapshot).offset(None)
+        if self._limit is not None:
+            if count >= self._limit:
+                return None
+            query = query.limit(self._limit - count)
+        return query
+
+    def paginate(self, page_size, transaction=None):
+        """Read the documents matching this query, by pages.
+
+        Each page is read with a query limited to ``page_size`` documents,
+        starting after the last document of the previous page, so that
+        large result sets are read with bounded memory. The streams of the
+        pages are resumed on transient errors, as with
+        ``stream(resume=True)``.
+
+        The documents must have the fields of the ``order_by()`` clauses,
+        see :meth:`start_after`.
+
+        Args:
+            page_size (int): The maximum number of documents of a page.
+            transaction
+                (Optional[:class:`~google.cloud.firestore_v1.transaction.Transaction`]):
+                An existing transaction that this query will run in.
+
+        Yields:
+            List[:class:`~google.cloud.firestore_v1.document.DocumentSnapshot`]:
+            The documents of the next page.
+
+        Raises:
+            ValueError: If ``page_size`` is not positive.
+        """
+        if page_size <= 0:
+            raise ValueError(_BAD_PAGE_SIZE.format(page_size))
+
+        query = self
+        count = 0
+        while query is not None:
+            page_limit = page_size
+            if self._limit is not None:
+                page_limit = min(page_size, self._limit - count)
+                if page_limit <= 0:
+                    return
+
+            page = list(
+                query.limit(page_limit).stream(transaction=transaction, resume=True)
+            )
+            if page:
+                yield page
+            if len(page) < page_limit:
+                return
+
+            count += len(page)
+            query = self._resume_after(page[-1], count)
+
     def on_snapshot(self, callback):
         """Monitor the documents in this collection that match this query.
 
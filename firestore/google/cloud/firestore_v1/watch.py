@@ -63,47 +63,174 @@ _TERMINATING_STREAM_EXCEPTIONS = (exceptions.Cancelled,)
 DocTreeEntry = collections.namedtuple("DocTreeEntry", ["value", "index"])
 
 
+def _natural_comparator(key1, key2):
+    return (key1 > key2) - (key1 < key2)
+
+
+class _DocTreeNode(object):
+    """An immutable node of a :class:`WatchDocTree`.
+
+    Args:
+        key: The key of the node.
+        value: The value of the node.
+        left (Optional[_DocTreeNode]): The subtree of the lesser keys.
+        right (Optional[_DocTreeNode]): The subtree of the greater keys.
+    """
+
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
+    def __init__(self, key, value, left, right):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+        self.size = 1 + _size(left) + _size(right)
+
+
+def _height(node):
+    return 0 if node is None else node.height
+
+
+def _size(node):
+    return 0 if node is None else node.size
+
+
+def _balance(key, value, left, right):
+    """Build a node, rotating it if its subtrees are unbalanced (AVL)."""
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) < _height(left.right):
+            left = _rotate_left(left)
+        return _rotate_right(_DocTreeNode(key, value, left, right))
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) < _height(right.left):
+            right = _rotate_right(right)
+        return _rotate_left(_DocTreeNode(key, value, left, right))
+    return _DocTreeNode(key, value, left, right)
+
+
+def _rotate_left(node):
+    right = node.right
+    left = _DocTreeNode(node.key, node.value, node.left, right.left)
+    return _DocTreeNode(right.key, right.value, left, right.right)
+
+
+def _rotate_right(node):
+    left = node.left
+    right = _DocTreeNode(node.key, node.value, left.right, node.right)
+    return _DocTreeNode(left.key, left.value, left.left, right)
+
+
+def _insert(node, key, value, comparator):
+    if node is None:
+        return _DocTreeNode(key, value, None, None)
+    order = comparator(key, node.key)
+    if order < 0:
+        left = _insert(node.left, key, value, comparator)
+        return _balance(node.key, node.value, left, node.right)
+    if order > 0:
+        right = _insert(node.right, key, value, comparator)
+        return _balance(node.key, node.value, node.left, right)
+    return _DocTreeNode(key, value, node.left, node.right)
+
+
+def _remove_min(node):
+    """Return the node of the least key, and the tree without it."""
+    if node.left is None:
+        return node, node.right
+    minimum, left = _remove_min(node.left)
+    return minimum, _balance(node.key, node.value, left, node.right)
+
+
+def _remove(node, key, comparator):
+    if node is None:
+        raise KeyError(key)
+    order = comparator(key, node.key)
+    if order < 0:
+        left = _remove(node.left, key, comparator)
+        return _balance(node.key, node.value, left, node.right)
+    if order > 0:
+        right = _remove(node.right, key, comparator)
+        return _balance(node.key, node.value, node.left, right)
+    if node.right is None:
+        return node.left
+    minimum, right = _remove_min(node.right)
+    return _balance(minimum.key, minimum.value, node.left, right)
+
+
 class WatchDocTree(object):
-    # TODO: Currently this uses a dict. Other implementations us an rbtree.
-    # The performance of this implementation should be investigated and may
-    # require modifying the underlying datastructure to a rbtree.
-    def __init__(self):
-        self._dict = {}
-        self._index = 0
+    """A persistent sorted map of the documents of a watch.
 
-    def keys(self):
-        return list(self._dict.keys())
+    The keys are ordered by ``comparator``, in a balanced (AVL) tree.
+    :meth:`insert` and :meth:`remove` return a new tree in O(log n), which
+    shares its unchanged nodes with this one:  this tree is not modified.
+
+    Args:
+        comparator (Optional[Callable[[Any, Any], int]]): Compares two keys,
+            as ``cmp`` does. Defaults to the natural order of the keys.
+    """
+
+    def __init__(self, comparator=None):
+        if comparator is None:
+            comparator = _natural_comparator
+        self._comparator = comparator
+        self._root = None
 
-    def _copy(self):
-        wdt = WatchDocTree()
-        wdt._dict = self._dict.copy()
-        wdt._index = self._index
-        self = wdt
-        return self
+    def _with_root(self, root):
+        wdt = WatchDocTree(self._comparator)
+        wdt._root = root
+        return wdt
+
+    def keys(self):
+        return list(self)
 
     def insert(self, key, value):
-        self = self._copy()
-        self._dict[key] = DocTreeEntry(value, self._index)
-        self._index += 1
-        return self
+        return self._with_root(_insert(self._root, key, value, self._comparator))
 
     def find(self, key):
-        return self._dict[key]
+        """Find the value of a key, and the index of the key in the tree.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        comparator = self._comparator
+        node = self._root
+        index = 0
+        while node is not None:
+            order = comparator(key, node.key)
+            if order < 0:
+                node = node.left
+            elif order > 0:
+                index += _size(node.left) + 1
+                node = node.right
+            else:
+                return DocTreeEntry(node.value, index + _size(node.left))
+        raise KeyError(key)
 
     def remove(self, key):
-        self = self._copy()
-        del self._dict[key]
-        return self
+        return self._with_root(_remove(self._root, key, self._comparator))
 
     def __iter__(self):
-        for k in self._dict:
-            yield k
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.key
+                node = node.right
 
     def __len__(self):
-        return len(self._dict)
+        return _size(self._root)
 
     def __contains__(self, k):
-        return k in self._dict
+        try:
+            self.find(k)
+        except KeyError:
+            return False
+        return True
 
 
 class ChangeType(Enum):
@@ -224,7 +351,7 @@ class Watch(object):
         # Initialize state for on_snapshot
         # The sorted tree of QueryDocumentSnapshots as sent in the last
         # snapshot. We only look at the keys.
-        self.doc_tree = WatchDocTree()
+        self.doc_tree = WatchDocTree(comparator)
 
         # A map of document names to QueryDocumentSnapshots for the last sent
         # snapshot.
@@ -546,13 +673,8 @@ class Watch(object):
         )
 
         if not self.has_pushed or len(appliedChanges):
-            # TODO: It is possible in the future we will have the tree order
-            # on insert. For now, we sort here.
-            key = functools.cmp_to_key(self._comparator)
-            keys = sorted(updated_tree.keys(), key=key)
-
             self._snapshot_callback(
-                keys,
+                updated_tree.keys(),
                 appliedChanges,
                 datetime.datetime.fromtimestamp(read_time.seconds, pytz.utc),
             )
@@ -667,7 +789,9 @@ class Watch(object):
         key = functools.cmp_to_key(self._comparator)
 
         # Deletes are sorted based on the order of the existing document.
-        delete_changes = sorted(delete_changes)
+        delete_changes = sorted(
+            delete_changes, key=lambda name: doc_tree.find(doc_map[name]).index
+        )
         for name in delete_changes:
             change, updated_tree, updated_map = delete_doc(
                 name, updated_tree, updated_map
@@ -247,6 +247,69 @@ class Test_encode_value(unittest.TestCase):
         expected = _value_pb(map_value=map_pb)
         self.assertEqual(result, expected)
 
+    def test_empty_array(self):
+        result = self._call_fut([])
+        self.assertTrue(result.HasField("array_value"))
+        self.assertEqual(list(result.array_value.values), [])
+
+    def test_empty_map(self):
+        result = self._call_fut({})
+        self.assertTrue(result.HasField("map_value"))
+        self.assertEqual(dict(result.map_value.fields), {})
+
+    def test_nested(self):
+        from google.cloud.firestore_v1.proto.document_pb2 import ArrayValue
+        from google.cloud.firestore_v1.proto.document_pb2 import MapValue
+
+        result = self._call_fut({"a": [{"b": 1}], "c": {"d": u"e"}})
+
+        inner_pb = _value_pb(
+            map_value=MapValue(fields={"b": _value_pb(integer_value=1)})
+        )
+        map_pb = MapValue(
+            fields={
+                "a": _value_pb(array_value=ArrayValue(values=[inner_pb])),
+                "c": _value_pb(
+                    map_value=MapValue(fields={"d": _value_pb(string_value=u"e")})
+                ),
+            }
+        )
+        self.assertEqual(result, _value_pb(map_value=map_pb))
+
+    def test_subclasses(self):
+        import collections
+        from google.cloud.firestore_v1 import _helpers
+
+        class Integer(int):
+            pass
+
+        value = collections.OrderedDict([("b", Integer(2)), ("a", True)])
+        result = self._call_fut(value)
+
+        expected = self._call_fut({"b": 2, "a": True})
+        self.assertEqual(result, expected)
+        # The encoders of the subclasses are cached.
+        self.assertIs(_helpers._VALUE_ENCODERS[Integer], _helpers._encode_integer)
+        self.assertIs(
+            _helpers._VALUE_ENCODERS[collections.OrderedDict], _helpers._encode_map
+        )
+        del _helpers._VALUE_ENCODERS[Integer]
+
+    def test_reference_value_not_cached(self):
+        from google.cloud.firestore_v1 import _helpers
+
+        class Reference(object):
+            def __init__(self, document_path):
+                self._document_path = document_path
+
+        result = self._call_fut(Reference(u"projects/p/databases/d/documents/a/b"))
+        expected = _value_pb(reference_value=u"projects/p/databases/d/documents/a/b")
+        self.assertEqual(result, expected)
+        self.assertNotIn(Reference, _helpers._VALUE_ENCODERS)
+
+        with self.assertRaises(TypeError):
+            self._call_fut(Reference(None))
+
     def test_bad_type(self):
         value = object()
         with self.assertRaises(TypeError):
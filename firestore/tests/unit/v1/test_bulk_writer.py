@@ -0,0 +1,422 @@
+# Copyright 2019 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+
+class Test_RateLimiter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.bulk_writer import _RateLimiter
+
+        return _RateLimiter
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_ops_per_second_ramp_up(self):
+        limiter = self._make_one(500, 1000, multiplier=1.5, period=300)
+        self.assertEqual(limiter.ops_per_second(0), 500)
+
+        with mock.patch("time.time", return_value=100.0):
+            self.assertEqual(limiter.try_acquire(1), 0)
+
+        self.assertEqual(limiter.ops_per_second(399.0), 500)
+        self.assertEqual(limiter.ops_per_second(400.0), 750)
+        self.assertEqual(limiter.ops_per_second(700.0), 1000)
+
+    def test_initial_ops_per_second_over_max(self):
+        limiter = self._make_one(500, 200)
+        self.assertEqual(limiter.ops_per_second(0), 200)
+
+    def test_try_acquire(self):
+        limiter = self._make_one(100, 1000)
+
+        with mock.patch("time.time", return_value=10.0):
+            self.assertEqual(limiter.try_acquire(60), 0)
+            self.assertEqual(limiter.try_acquire(40), 0)
+            self.assertEqual(limiter.try_acquire(50), 0.5)
+
+        # The tokens refill at the rate of the limit.
+        with mock.patch("time.time", return_value=10.25):
+            self.assertEqual(limiter.try_acquire(50), 0.25)
+
+        with mock.patch("time.time", return_value=10.5):
+            self.assertEqual(limiter.try_acquire(50), 0)
+
+        # Up to a second of tokens.
+        with mock.patch("time.time", return_value=100.0):
+            self.assertEqual(limiter.try_acquire(100), 0)
+            self.assertEqual(limiter.try_acquire(1), 0.01)
+
+    def test_try_acquire_more_than_capacity(self):
+        limiter = self._make_one(100, 1000)
+
+        with mock.patch("time.time", return_value=10.0):
+            self.assertEqual(limiter.try_acquire(500), 0)
+            self.assertEqual(limiter.try_acquire(500), 1.0)
+
+    def test_acquire(self):
+        limiter = self._make_one(100, 1000)
+        limiter.try_acquire = mock.Mock(side_effect=[0.5, 0.25, 0])
+
+        with mock.patch("time.sleep") as sleep:
+            limiter.acquire(10)
+
+        self.assertEqual(sleep.mock_calls, [mock.call(0.5), mock.call(0.25)])
+        limiter.try_acquire.assert_called_with(10)
+
+
+class TestBulkWriter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        from google.cloud.firestore_v1.bulk_writer import MAX_BATCH_SIZE
+
+        client = mock.sentinel.client
+        writer = self._make_one(client)
+        self.assertIs(writer._client, client)
+        self.assertEqual(writer._max_batch_size, MAX_BATCH_SIZE)
+        self.assertEqual(writer._max_attempts, 5)
+        self.assertEqual(writer._rate_limiter.ops_per_second(0), 500)
+        self.assertEqual(writer._executor._max_workers, 10)
+        self.assertEqual(writer._operations, [])
+        writer.close()
+
+    def test_constructor_explicit(self):
+        writer = self._make_one(
+            mock.sentinel.client,
+            max_batch_size=20,
+            max_workers=2,
+            max_attempts=3,
+            initial_ops_per_second=50,
+        )
+        self.assertEqual(writer._max_batch_size, 20)
+        self.assertEqual(writer._max_attempts, 3)
+        self.assertEqual(writer._rate_limiter.ops_per_second(0), 50)
+        self.assertEqual(writer._executor._max_workers, 2)
+        writer.close()
+
+    def test_constructor_w_invalid_max_batch_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_batch_size=0)
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_batch_size=501)
+
+    def test_writes(self):
+        from google.cloud.firestore_v1.batch import WriteBatch
+
+        client = _make_client()
+        firestore_api = _make_firestore_api()
+        client._firestore_api_internal = firestore_api
+        document1 = client.document("a", "b")
+        document2 = client.document("c", "d")
+        document3 = client.document("e", "f")
+        document4 = client.document("g", "h")
+
+        batch = WriteBatch(client)
+        batch.create(document1, {"ten": 10})
+        batch.set(document2, {"buck": u"ets"}, merge=True)
+        batch.update(document3, {"ten": 11})
+        batch.delete(document4)
+
+        with self._make_one(client) as writer:
+            futures = [
+                writer.create(document1, {"ten": 10}),
+                writer.set(document2, {"buck": u"ets"}, merge=True),
+                writer.update(document3, {"ten": 11}),
+                writer.delete(document4),
+            ]
+            self.assertEqual(len(writer._operations), 4)
+
+        firestore_api.commit.assert_called_once_with(
+            client._database_string,
+            batch._write_pbs,
+            transaction=None,
+            metadata=client._rpc_metadata,
+        )
+        self.assertEqual([future.result() for future in futures], _write_results(4))
+        self.assertEqual(writer._operations, [])
+        self.assertEqual(writer._batch_futures, set())
+        self.assertEqual(writer._document_batches, {})
+
+        stats = writer.stats
+        self.assertEqual(stats.writes, 4)
+        self.assertEqual(stats.succeeded, 4)
+        self.assertEqual(stats.failed, 0)
+        self.assertEqual(stats.batches, 1)
+        self.assertEqual(stats.retries, 0)
+        self.assertGreater(stats.elapsed, 0)
+        self.assertGreater(stats.writes_per_second, 0)
+
+    def test_write_w_transform(self):
+        from google.cloud.firestore_v1.transforms import SERVER_TIMESTAMP
+
+        client = _make_client()
+        firestore_api = _make_firestore_api()
+        client._firestore_api_internal = firestore_api
+        document1 = client.document("a", "b")
+        document2 = client.document("c", "d")
+
+        with self._make_one(client) as writer:
+            future1 = writer.set(document1, {"when": SERVER_TIMESTAMP, "ten": 10})
+            future2 = writer.delete(document2)
+
+        (call,) = firestore_api.commit.mock_calls
+        self.assertEqual(len(call[1][1]), 3)
+        # The first write result of each write.
+        results = _write_results(3)
+        self.assertEqual(future1.result(), results[0])
+        self.assertEqual(future2.result(), results[2])
+
+    def test_writes_split_in_batches(self):
+        client = _make_client()
+        firestore_api = _make_firestore_api()
+        client._firestore_api_internal = firestore_api
+
+        with self._make_one(client, max_batch_size=2) as writer:
+            futures = [
+                writer.delete(client.document("a", str(index))) for index in range(5)
+            ]
+
+        self.assertEqual(firestore_api.commit.call_count, 3)
+        batch_sizes = sorted(
+            len(call[1][1]) for call in firestore_api.commit.mock_calls
+        )
+        self.assertEqual(batch_sizes, [1, 2, 2])
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(writer.stats.batches, 3)
+        self.assertEqual(writer.stats.succeeded, 5)
+
+    def test_writes_throttled(self):
+        client = _make_client()
+        client._firestore_api_internal = _make_firestore_api()
+
+        writer = self._make_one(client, max_batch_size=2)
+        writer._rate_limiter = mock.Mock(spec=["acquire"])
+        for index in range(5):
+            writer.delete(client.document("a", str(index)))
+        writer.close()
+
+        self.assertEqual(
+            writer._rate_limiter.acquire.mock_calls,
+            [mock.call(2), mock.call(2), mock.call(1)],
+        )
+
+    def test_writes_throttled_without_lock(self):
+        client = _make_client()
+        client._firestore_api_internal = _make_firestore_api()
+        throttled = threading.Event()
+        release = threading.Event()
+
+        def acquire(tokens):
+            throttled.set()
+            release.wait()
+
+        writer = self._make_one(client, max_batch_size=1)
+        writer._rate_limiter = mock.Mock(spec=["acquire"])
+        writer._rate_limiter.acquire.side_effect = acquire
+        thread = threading.Thread(
+            target=writer.delete, args=(client.document("a", "b"),)
+        )
+        thread.start()
+        self.assertTrue(throttled.wait(timeout=1.0))
+
+        # Neither the stats nor the commit workers wait for the throttling.
+        self.assertTrue(writer._lock.acquire(timeout=1.0))
+        writer._lock.release()
+        self.assertEqual(writer.stats.writes, 1)
+
+        release.set()
+        thread.join(timeout=1.0)
+        writer.close()
+        self.assertEqual(writer.stats.succeeded, 1)
+
+    def test_writes_to_same_document_in_order(self):
+        client = _make_client()
+        document = client.document("a", "b")
+        first_started = threading.Event()
+        release_first = threading.Event()
+        committed = []
+
+        def commit(database_string, write_pbs, **kwargs):
+            if not committed and not first_started.is_set():
+                first_started.set()
+                release_first.wait()
+            committed.append(write_pbs[0].update.fields["n"].integer_value)
+            return _commit_response(len(write_pbs))
+
+        firestore_api = mock.Mock(spec=["commit"])
+        firestore_api.commit.side_effect = commit
+        client._firestore_api_internal = firestore_api
+
+        writer = self._make_one(client, max_batch_size=1, max_workers=2)
+        writer.set(document, {"n": 1})
+        first_started.wait()
+        writer.set(document, {"n": 2})
+        # The second batch waits for the first one, to the same document.
+        self.assertEqual(committed, [])
+        release_first.set()
+        writer.close()
+
+        self.assertEqual(committed, [1, 2])
+
+    def test_commit_retried(self):
+        from google.api_core import exceptions
+
+        client = _make_client()
+        firestore_api = mock.Mock(spec=["commit"])
+        firestore_api.commit.side_effect = [
+            exceptions.ServiceUnavailable("Try again."),
+            exceptions.Aborted("Contention."),
+            _commit_response(1),
+        ]
+        client._firestore_api_internal = firestore_api
+
+        with mock.patch(
+            "google.cloud.firestore_v1.transaction._sleep", return_value=1.0
+        ) as sleep:
+            with self._make_one(client) as writer:
+                future = writer.delete(client.document("a", "b"))
+
+        self.assertEqual(future.result(), _write_results(1)[0])
+        self.assertEqual(firestore_api.commit.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(writer.stats.retries, 2)
+        self.assertEqual(writer.stats.succeeded, 1)
+
+    def test_commit_retried_until_max_attempts(self):
+        from google.api_core import exceptions
+
+        client = _make_client()
+        firestore_api = mock.Mock(spec=["commit"])
+        exc = exceptions.ResourceExhausted("Slow down.")
+        firestore_api.commit.side_effect = exc
+        client._firestore_api_internal = firestore_api
+
+        with mock.patch(
+            "google.cloud.firestore_v1.transaction._sleep", return_value=1.0
+        ):
+            with self._make_one(client, max_attempts=3) as writer:
+                future1 = writer.delete(client.document("a", "b"))
+                future2 = writer.delete(client.document("c", "d"))
+
+        self.assertEqual(firestore_api.commit.call_count, 3)
+        self.assertIs(future1.exception(), exc)
+        self.assertIs(future2.exception(), exc)
+        self.assertEqual(writer.stats.retries, 2)
+        self.assertEqual(writer.stats.failed, 2)
+        self.assertEqual(writer.stats.succeeded, 0)
+
+    def test_commit_not_retried(self):
+        from google.api_core import exceptions
+
+        client = _make_client()
+        firestore_api = mock.Mock(spec=["commit"])
+        exc = exceptions.AlreadyExists("Already there.")
+        firestore_api.commit.side_effect = exc
+        client._firestore_api_internal = firestore_api
+
+        with self._make_one(client) as writer:
+            future = writer.create(client.document("a", "b"), {"ten": 10})
+
+        firestore_api.commit.assert_called_once()
+        with self.assertRaises(exceptions.AlreadyExists):
+            future.result()
+        self.assertEqual(writer.stats.failed, 1)
+
+    def test_flush(self):
+        client = _make_client()
+        firestore_api = _make_firestore_api()
+        client._firestore_api_internal = firestore_api
+
+        writer = self._make_one(client)
+        future = writer.delete(client.document("a", "b"))
+        self.assertFalse(future.done())
+
+        writer.flush()
+
+        self.assertTrue(future.done())
+        firestore_api.commit.assert_called_once()
+        # Flushing again sends nothing.
+        writer.flush()
+        firestore_api.commit.assert_called_once()
+        writer.close()
+
+    def test_write_after_close(self):
+        client = _make_client()
+        writer = self._make_one(client)
+        writer.close()
+        # Closing twice is fine.
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.delete(client.document("a", "b"))
+
+    def test_stats_before_writes(self):
+        writer = self._make_one(mock.sentinel.client)
+        stats = writer.stats
+        self.assertEqual(stats.writes, 0)
+        self.assertEqual(stats.elapsed, 0.0)
+        self.assertEqual(stats.writes_per_second, 0.0)
+        writer.close()
+
+
+def _write_results(count):
+    from google.cloud.firestore_v1.proto import write_pb2
+    from google.protobuf import timestamp_pb2
+
+    return [
+        write_pb2.WriteResult(update_time=timestamp_pb2.Timestamp(seconds=index))
+        for index in range(1, count + 1)
+    ]
+
+
+def _commit_response(count):
+    from google.cloud.firestore_v1.proto import firestore_pb2
+
+    return firestore_pb2.CommitResponse(write_results=_write_results(count))
+
+
+def _make_firestore_api():
+    firestore_api = mock.Mock(spec=["commit"])
+    firestore_api.commit.side_effect = lambda database_string, write_pbs, **kwargs: (
+        _commit_response(len(write_pbs))
+    )
+    return firestore_api
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_client(project="seventy-nine"):
+    from google.cloud.firestore_v1.client import Client
+
+    credentials = _make_credentials()
+    return Client(project=project, credentials=credentials)
@@ -534,6 +534,149 @@ class TestClient(unittest.TestCase):
             metadata=client._rpc_metadata,
         )
 
+    def test_get_all_w_duplicates(self):
+        data1 = {"up": 10}
+        data2 = {"down": -10}
+        info = self._info_for_get_all(data1, data2)
+        client, document1, document2, response1, response2 = info
+        document3 = client.document("pineapple", "lamp1")
+
+        snapshots = self._get_all_helper(
+            client, [document1, document2, document3], [response1, response2]
+        )
+
+        self.assertEqual(len(snapshots), 2)
+        self.assertIs(snapshots[0]._reference, document3)
+        self.assertIs(snapshots[1]._reference, document2)
+
+        # Each document is requested once.
+        doc_paths = [document1._document_path, document2._document_path]
+        client._firestore_api.batch_get_documents.assert_called_once_with(
+            client._database_string,
+            doc_paths,
+            None,
+            transaction=None,
+            metadata=client._rpc_metadata,
+        )
+
+    def test_get_all_ordered(self):
+        info = self._info_for_get_all({"up": 10}, {"down": -10})
+        client, document1, document2, response1, response2 = info
+        document3 = client.document("pineapple", "lamp3")
+        response3 = _make_batch_response(missing=document3._document_path)
+
+        snapshots = self._get_all_helper(
+            client,
+            [document1, document2, document3],
+            [response3, response2, response1],
+            ordered=True,
+        )
+
+        self.assertEqual(
+            [snapshot._reference for snapshot in snapshots],
+            [document1, document2, document3],
+        )
+        self.assertFalse(snapshots[2].exists)
+
+    def _get_all_chunks_helper(self, count, chunk_size, transaction=False, **kwargs):
+        client = self._make_default_one()
+        if transaction:
+            kwargs["transaction"] = client.transaction()
+            kwargs["transaction"]._id = b"txn-id"
+        references = [client.document("lamps", str(index)) for index in range(count)]
+
+        def batch_get_documents(database_string, document_paths, mask, **kwargs):
+            # The documents of a chunk are received in reverse order.
+            for document_path in reversed(document_paths):
+                yield _make_batch_response(missing=document_path)
+
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = batch_get_documents
+        client._firestore_api_internal = firestore_api
+
+        snapshots = client.get_all(references, chunk_size=chunk_size, **kwargs)
+        self.assertIsInstance(snapshots, types.GeneratorType)
+        return client, references, list(snapshots)
+
+    def test_get_all_w_chunks(self):
+        client, references, snapshots = self._get_all_chunks_helper(
+            7, 3, transaction=True, max_workers=2
+        )
+
+        self.assertEqual(len(snapshots), 7)
+        self.assertEqual(
+            set(snapshot._reference for snapshot in snapshots), set(references)
+        )
+
+        paths = [reference._document_path for reference in references]
+        calls = client._firestore_api.batch_get_documents.mock_calls
+        self.assertEqual(
+            sorted(calls),
+            [
+                mock.call(
+                    client._database_string,
+                    paths[start : start + 3],
+                    None,
+                    transaction=b"txn-id",
+                    metadata=client._rpc_metadata,
+                )
+                for start in (0, 3, 6)
+            ],
+        )
+
+    def test_get_all_w_chunks_ordered(self):
+        _, references, snapshots = self._get_all_chunks_helper(7, 3, ordered=True)
+
+        self.assertEqual([snapshot._reference for snapshot in snapshots], references)
+
+    def test_get_all_w_chunks_error(self):
+        from google.api_core import exceptions
+
+        client = self._make_default_one()
+        references = [client.document("lamps", str(index)) for index in range(4)]
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = [
+            iter([]),
+            exceptions.ServiceUnavailable("Try again."),
+        ]
+        client._firestore_api_internal = firestore_api
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            list(client.get_all(references, chunk_size=2))
+
+    def test_get_all_w_chunks_closed_early(self):
+        client = self._make_default_one()
+        references = [client.document("lamps", str(index)) for index in range(100)]
+
+        def batch_get_documents(database_string, document_paths, mask, **kwargs):
+            for document_path in document_paths:
+                yield _make_batch_response(missing=document_path)
+
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = batch_get_documents
+        client._firestore_api_internal = firestore_api
+
+        # The streams blocked on the full queue stop with the generator.
+        snapshots = client.get_all(references, chunk_size=10, max_workers=4)
+        next(snapshots)
+        snapshots.close()
+
+    def test_get_all_w_invalid_chunks(self):
+        client = self._make_default_one()
+        references = [client.document("lamps", str(index)) for index in range(4)]
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        client._firestore_api_internal = firestore_api
+
+        for kwargs in (
+            {"chunk_size": 0},
+            {"chunk_size": -1},
+            {"chunk_size": 2, "max_workers": 0},
+        ):
+            with self.assertRaises(ValueError):
+                list(client.get_all(references, **kwargs))
+
+        firestore_api.batch_get_documents.assert_not_called()
+
     def test_batch(self):
         from google.cloud.firestore_v1.batch import WriteBatch
 
@@ -543,6 +686,16 @@ class TestClient(unittest.TestCase):
         self.assertIs(batch._client, client)
         self.assertEqual(batch._write_pbs, [])
 
+    def test_bulk_writer(self):
+        from google.cloud.firestore_v1.bulk_writer import BulkWriter
+
+        client = self._make_default_one()
+        bulk_writer = client.bulk_writer(max_batch_size=20)
+        self.assertIsInstance(bulk_writer, BulkWriter)
+        self.assertIs(bulk_writer._client, client)
+        self.assertEqual(bulk_writer._max_batch_size, 20)
+        bulk_writer.close()
+
     def test_transaction(self):
         from google.cloud.firestore_v1.transaction import Transaction
 
@@ -592,6 +745,63 @@ class Test__reference_info(unittest.TestCase):
         self.assertEqual(reference_map, expected_map)
 
 
+class Test__put_until_stopped(unittest.TestCase):
+    @staticmethod
+    def _call_fut(results, stopped, item):
+        from google.cloud.firestore_v1.client import _put_until_stopped
+
+        return _put_until_stopped(results, stopped, item)
+
+    def test_put(self):
+        import threading
+        from six.moves import queue
+
+        results = queue.Queue(1)
+        self.assertTrue(self._call_fut(results, threading.Event(), "item"))
+        self.assertEqual(results.get_nowait(), "item")
+
+    def test_stopped_while_full(self):
+        import threading
+        from six.moves import queue
+
+        stopped = threading.Event()
+
+        def put(item, timeout):
+            stopped.set()
+            raise queue.Full
+
+        results = mock.Mock(spec=["put"])
+        results.put.side_effect = put
+        self.assertFalse(self._call_fut(results, stopped, "item"))
+        results.put.assert_called_once_with("item", timeout=0.1)
+
+
+class Test__in_order(unittest.TestCase):
+    @staticmethod
+    def _call_fut(snapshots, document_paths):
+        from google.cloud.firestore_v1.client import _in_order
+
+        return _in_order(snapshots, document_paths)
+
+    def test_it(self):
+        from google.cloud.firestore_v1.client import Client
+        from google.cloud.firestore_v1.document import DocumentSnapshot
+
+        client = Client(project="hi-projject", credentials=_make_credentials())
+        references = [client.document("a", str(index)) for index in range(4)]
+        snapshots = [
+            DocumentSnapshot(reference, None, False, None, None, None)
+            for reference in references
+        ]
+        paths = [reference._document_path for reference in references]
+
+        received = [snapshots[2], snapshots[0], snapshots[3], snapshots[1]]
+        self.assertEqual(list(self._call_fut(received, paths)), snapshots)
+
+    def test_empty(self):
+        self.assertEqual(list(self._call_fut([], [])), [])
+
+
 class Test__get_reference(unittest.TestCase):
     @staticmethod
     def _call_fut(document_path, reference_map):
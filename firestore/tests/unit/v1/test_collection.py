@@ -493,7 +493,7 @@ class TestCollectionReference(unittest.TestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         self.assertIs(get_response, query_instance.stream.return_value)
-        query_instance.stream.assert_called_once_with(transaction=None)
+        query_instance.stream.assert_called_once_with(transaction=None, resume=False)
 
         # Verify the deprecation
         self.assertEqual(len(warned), 1)
@@ -511,7 +511,9 @@ class TestCollectionReference(unittest.TestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         self.assertIs(get_response, query_instance.stream.return_value)
-        query_instance.stream.assert_called_once_with(transaction=transaction)
+        query_instance.stream.assert_called_once_with(
+            transaction=transaction, resume=False
+        )
 
         # Verify the deprecation
         self.assertEqual(len(warned), 1)
@@ -525,7 +527,7 @@ class TestCollectionReference(unittest.TestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         self.assertIs(stream_response, query_instance.stream.return_value)
-        query_instance.stream.assert_called_once_with(transaction=None)
+        query_instance.stream.assert_called_once_with(transaction=None, resume=False)
 
     @mock.patch("google.cloud.firestore_v1.query.Query", autospec=True)
     def test_stream_with_transaction(self, query_class):
@@ -536,7 +538,29 @@ class TestCollectionReference(unittest.TestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         self.assertIs(stream_response, query_instance.stream.return_value)
-        query_instance.stream.assert_called_once_with(transaction=transaction)
+        query_instance.stream.assert_called_once_with(
+            transaction=transaction, resume=False
+        )
+
+    @mock.patch("google.cloud.firestore_v1.query.Query", autospec=True)
+    def test_stream_with_resume(self, query_class):
+        collection = self._make_one("collection")
+        stream_response = collection.stream(resume=True)
+
+        query_instance = query_class.return_value
+        self.assertIs(stream_response, query_instance.stream.return_value)
+        query_instance.stream.assert_called_once_with(transaction=None, resume=True)
+
+    @mock.patch("google.cloud.firestore_v1.query.Query", autospec=True)
+    def test_paginate(self, query_class):
+        collection = self._make_one("collection")
+        transaction = mock.sentinel.txn
+        pages = collection.paginate(10, transaction=transaction)
+
+        query_class.assert_called_once_with(collection)
+        query_instance = query_class.return_value
+        self.assertIs(pages, query_instance.paginate.return_value)
+        query_instance.paginate.assert_called_once_with(10, transaction=transaction)
 
     @mock.patch("google.cloud.firestore_v1.collection.Watch", autospec=True)
     def test_on_snapshot(self, watch):
@@ -398,7 +398,13 @@ class DummyCollection(object):
 class DummyQuery(object):  # pragma: NO COVER
     def __init__(self, parent):
         self._parent = parent
-        self._comparator = lambda x, y: 1
+
+    @staticmethod
+    def _comparator(doc1, doc2):
+        # The implicit ordering of the queries, by document name.
+        path1 = doc1.reference._path
+        path2 = doc2.reference._path
+        return (path1 > path2) - (path1 < path2)
 
     @property
     def _client(self):
@@ -1145,6 +1145,189 @@ class TestQuery(unittest.TestCase):
             metadata=client._rpc_metadata,
         )
 
+    def _make_paging_query(self, count, failures=()):
+        from google.api_core import exceptions
+
+        # A fake GAPIC over the documents "doc-00", "doc-01", ... with a
+        # field "n" of 0, 1, ..., which fails after the number of documents
+        # given in ``failures``, one failure per call.
+        client = _make_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        failures = list(failures)
+
+        def run_query(parent_path, query_pb, **kwargs):
+            start = 0
+            if query_pb.HasField("start_at"):
+                self.assertFalse(query_pb.start_at.before)
+                start = query_pb.start_at.values[0].integer_value + 1
+            start += query_pb.offset
+            stop = count
+            if query_pb.HasField("limit"):
+                stop = min(stop, start + query_pb.limit.value)
+            fail_after = failures.pop(0) if failures else None
+            for received, n in enumerate(range(start, stop)):
+                if received == fail_after:
+                    raise exceptions.ServiceUnavailable("Stream dropped.")
+                name = "{}/doc-{:02d}".format(expected_prefix, n)
+                yield _make_query_response(name=name, data={"n": n})
+
+        firestore_api = mock.Mock(spec=["run_query"])
+        firestore_api.run_query.side_effect = run_query
+        client._firestore_api_internal = firestore_api
+        return self._make_one(parent).order_by("n")
+
+    @staticmethod
+    def _run_query_pbs(query):
+        return [
+            call[1][1] for call in query._client._firestore_api.run_query.mock_calls
+        ]
+
+    def test_stream_w_resume(self):
+        query = self._make_paging_query(10, failures=[3])
+
+        returned = list(query.stream(resume=True))
+
+        self.assertEqual([snapshot.get("n") for snapshot in returned], list(range(10)))
+        first_pb, second_pb = self._run_query_pbs(query)
+        self.assertEqual(first_pb, query._to_protobuf())
+        self.assertEqual(second_pb, query.start_after(returned[2])._to_protobuf())
+
+    def test_stream_w_resume_w_limit_and_offset(self):
+        query = self._make_paging_query(10, failures=[2]).offset(2).limit(5)
+
+        returned = list(query.stream(resume=True))
+
+        self.assertEqual([snapshot.get("n") for snapshot in returned], [2, 3, 4, 5, 6])
+        _, second_pb = self._run_query_pbs(query)
+        self.assertEqual(second_pb.offset, 0)
+        self.assertEqual(second_pb.limit.value, 3)
+
+    def test_stream_w_resume_at_limit(self):
+        from google.api_core import exceptions
+
+        query = self._make_paging_query(10).limit(2)
+        response_pbs = [
+            _make_query_response(name=name, data={"n": n})
+            for n, name in (
+                (0, "projects/project-project/databases/(default)/documents/dee/a"),
+                (1, "projects/project-project/databases/(default)/documents/dee/b"),
+            )
+        ]
+
+        def run_query(parent_path, query_pb, **kwargs):
+            for response_pb in response_pbs:
+                yield response_pb
+            raise exceptions.DeadlineExceeded("Stream timed out.")
+
+        query._client._firestore_api.run_query.side_effect = run_query
+
+        returned = list(query.stream(resume=True))
+
+        self.assertEqual(len(returned), 2)
+        query._client._firestore_api.run_query.assert_called_once()
+
+    def test_stream_w_resume_before_first_document(self):
+        query = self._make_paging_query(3, failures=[0])
+
+        returned = list(query.stream(resume=True))
+
+        self.assertEqual(len(returned), 3)
+        first_pb, second_pb = self._run_query_pbs(query)
+        self.assertEqual(first_pb, second_pb)
+
+    def test_stream_w_resume_too_many_attempts(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.query import _MAX_RESUME_ATTEMPTS
+
+        query = self._make_paging_query(3, failures=[0] * _MAX_RESUME_ATTEMPTS)
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            list(query.stream(resume=True))
+
+        self.assertEqual(len(self._run_query_pbs(query)), _MAX_RESUME_ATTEMPTS)
+
+    def test_stream_w_resume_non_resumable_error(self):
+        from google.api_core import exceptions
+
+        query = self._make_paging_query(3)
+        exc = exceptions.PermissionDenied("Nope.")
+        query._client._firestore_api.run_query.side_effect = exc
+
+        with self.assertRaises(exceptions.PermissionDenied):
+            list(query.stream(resume=True))
+
+        query._client._firestore_api.run_query.assert_called_once()
+
+    def test_stream_wo_resume(self):
+        from google.api_core import exceptions
+
+        query = self._make_paging_query(10, failures=[3])
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            list(query.stream())
+
+    def test_paginate(self):
+        query = self._make_paging_query(10)
+
+        pages = list(query.paginate(4))
+
+        self.assertEqual(
+            [[snapshot.get("n") for snapshot in page] for page in pages],
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+        )
+        first_pb, second_pb, third_pb = self._run_query_pbs(query)
+        self.assertEqual(first_pb, query.limit(4)._to_protobuf())
+        self.assertEqual(
+            second_pb, query.start_after(pages[0][-1]).limit(4)._to_protobuf()
+        )
+        self.assertEqual(
+            third_pb, query.start_after(pages[1][-1]).limit(4)._to_protobuf()
+        )
+
+    def test_paginate_last_page_full(self):
+        query = self._make_paging_query(8)
+
+        pages = list(query.paginate(4))
+
+        self.assertEqual([len(page) for page in pages], [4, 4])
+        # The end is known from an empty page.
+        self.assertEqual(len(self._run_query_pbs(query)), 3)
+
+    def test_paginate_w_limit(self):
+        query = self._make_paging_query(10).limit(6)
+
+        pages = list(query.paginate(4))
+
+        self.assertEqual([len(page) for page in pages], [4, 2])
+        _, second_pb = self._run_query_pbs(query)
+        self.assertEqual(second_pb.limit.value, 2)
+
+    def test_paginate_w_zero_limit(self):
+        query = self._make_paging_query(10).limit(0)
+
+        pages = list(query.paginate(4))
+
+        self.assertEqual(pages, [])
+        query._client._firestore_api.run_query.assert_not_called()
+
+    def test_paginate_w_resume(self):
+        query = self._make_paging_query(6, failures=[2])
+
+        pages = list(query.paginate(4))
+
+        self.assertEqual(
+            [[snapshot.get("n") for snapshot in page] for page in pages],
+            [[0, 1, 2, 3], [4, 5]],
+        )
+        self.assertEqual(len(self._run_query_pbs(query)), 3)
+
+    def test_paginate_bad_page_size(self):
+        query = self._make_paging_query(6)
+
+        with self.assertRaises(ValueError):
+            next(query.paginate(0))
+
     def test_stream_with_transaction(self):
         # Create a minimal fake GAPIC.
         firestore_api = mock.Mock(spec=["run_query"])
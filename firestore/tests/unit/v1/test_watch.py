@@ -48,6 +48,78 @@ class TestWatchDocTree(unittest.TestCase):
         self.assertTrue("b" in inst)
         self.assertFalse("a" in inst)
 
+    def test_keys_ordered(self):
+        inst = self._makeOne()
+        for key in "dbeac":
+            inst = inst.insert(key, None)
+        self.assertEqual(inst.keys(), ["a", "b", "c", "d", "e"])
+
+    def test_keys_ordered_by_comparator(self):
+        from google.cloud.firestore_v1.watch import WatchDocTree
+
+        def reverse(key1, key2):
+            return (key2 > key1) - (key2 < key1)
+
+        inst = WatchDocTree(reverse)
+        for key in "dbeac":
+            inst = inst.insert(key, None)
+        self.assertEqual(inst.keys(), ["e", "d", "c", "b", "a"])
+        self.assertEqual(inst.find("d").index, 1)
+
+    def test_insert_and_remove_persistent(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        inserted = inst.insert("a", 2)
+        removed = inserted.remove("b")
+        self.assertEqual(inst.keys(), ["b"])
+        self.assertEqual(inserted.keys(), ["a", "b"])
+        self.assertEqual(removed.keys(), ["a"])
+
+    def test_insert_existing_replaces_value(self):
+        inst = self._makeOne()
+        inst = inst.insert("a", 1)
+        inst = inst.insert("a", 2)
+        self.assertEqual(len(inst), 1)
+        self.assertEqual(inst.find("a").value, 2)
+
+    def test_find_index(self):
+        inst = self._makeOne()
+        for key in "dbeac":
+            inst = inst.insert(key, key.upper())
+        for index, key in enumerate("abcde"):
+            self.assertEqual(inst.find(key), (key.upper(), index))
+
+    def test_find_missing(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        with self.assertRaises(KeyError):
+            inst.find("a")
+
+    def test_remove_missing(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        with self.assertRaises(KeyError):
+            inst.remove("a")
+
+    def test_balanced_w_many_changes(self):
+        import math
+        import random
+
+        rand = random.Random(0)
+        keys = list(range(1000))
+        rand.shuffle(keys)
+        inst = self._makeOne()
+        for key in keys:
+            inst = inst.insert(key, None)
+        for key in keys[::2]:
+            inst = inst.remove(key)
+
+        remaining = sorted(keys[1::2])
+        self.assertEqual(inst.keys(), remaining)
+        for index, key in enumerate(remaining):
+            self.assertEqual(inst.find(key).index, index)
+        self.assertLessEqual(inst._root.height, 1.45 * math.log(len(inst) + 2, 2))
+
 
 class TestDocumentChange(unittest.TestCase):
     def _makeOne(self, type, document, old_index, new_index):
@@ -677,12 +749,13 @@ class TestWatch(unittest.TestCase):
     def test__compute_snapshot_operation_relative_ordering(self):
         from google.cloud.firestore_v1.watch import WatchDocTree
 
-        doc_tree = WatchDocTree()
+        doc_tree = WatchDocTree(_compare_document_paths)
 
         class DummyDoc(object):
             update_time = mock.sentinel
 
         deleted_doc = DummyDoc()
+        deleted_doc._document_path = "/deleted"
         added_doc = DummyDoc()
         added_doc._document_path = "/added"
         updated_doc = DummyDoc()
@@ -739,13 +812,15 @@ class TestWatch(unittest.TestCase):
     def test__compute_snapshot_deletes_w_real_comparator(self):
         from google.cloud.firestore_v1.watch import WatchDocTree
 
-        doc_tree = WatchDocTree()
+        doc_tree = WatchDocTree(_compare_document_paths)
 
         class DummyDoc(object):
             update_time = mock.sentinel
 
         deleted_doc_1 = DummyDoc()
+        deleted_doc_1._document_path = "/deleted_1"
         deleted_doc_2 = DummyDoc()
+        deleted_doc_2._document_path = "/deleted_2"
         doc_tree = doc_tree.insert(deleted_doc_1, None)
         doc_tree = doc_tree.insert(deleted_doc_2, None)
         doc_map = {"/deleted_1": deleted_doc_1, "/deleted_2": deleted_doc_2}
@@ -758,6 +833,53 @@ class TestWatch(unittest.TestCase):
         )
         self.assertEqual(updated_map, {})
 
+    def test__compute_snapshot_indexes_w_comparator(self):
+        from google.cloud.firestore_v1.watch import ChangeType
+        from google.cloud.firestore_v1.watch import WatchDocTree
+
+        def snapshot(name, update_time=1):
+            reference = DummyDocumentReference(name)
+            snapshot = DummyDocumentSnapshot(reference, None, True, None, None, None)
+            snapshot.reference = reference
+            snapshot.update_time = update_time
+            return snapshot
+
+        doc_tree = WatchDocTree(_compare_document_paths)
+        doc_map = {}
+        for name in "acegi":
+            doc = snapshot(name)
+            doc_tree = doc_tree.insert(doc, None)
+            doc_map["/" + name] = doc
+        inst = self._makeOne(comparator=_compare_document_paths)
+
+        updated_tree, updated_map, applied_changes = inst._compute_snapshot(
+            doc_tree,
+            doc_map,
+            ["/g", "/c"],
+            [snapshot("f"), snapshot("b")],
+            [snapshot("i", update_time=2), snapshot("a")],
+        )
+
+        self.assertEqual(
+            [
+                (change.type, change.document.reference._document_path)
+                + (change.old_index, change.new_index)
+                for change in applied_changes
+            ],
+            [
+                (ChangeType.REMOVED, "/c", 1, -1),
+                (ChangeType.REMOVED, "/g", 2, -1),
+                (ChangeType.ADDED, "/b", -1, 1),
+                (ChangeType.ADDED, "/f", -1, 3),
+                (ChangeType.MODIFIED, "/i", 4, 4),
+            ],
+        )
+        self.assertEqual(
+            [doc.reference._document_path for doc in updated_tree],
+            ["/a", "/b", "/e", "/f", "/i"],
+        )
+        self.assertEqual(len(updated_map), 5)
+
     def test__reset_docs(self):
         from google.cloud.firestore_v1.watch import ChangeType
 
@@ -777,6 +899,12 @@ class TestWatch(unittest.TestCase):
         self.assertFalse(inst.current)
 
 
+def _compare_document_paths(doc1, doc2):
+    path1 = getattr(doc1, "reference", doc1)._document_path
+    path2 = getattr(doc2, "reference", doc2)._document_path
+    return (path1 > path2) - (path1 < path2)
+
+
 class DummyFirestoreStub(object):
     def Listen(self):  # pragma: NO COVER
         pass
@@ -0,0 +1,58 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmark of the message size accounting in the publisher batch.
+
+Compares the size computed by serializing a throwaway ``PublishRequest`` per
+message with the incremental size computed from the message fields.
+
+Usage: python batch_size.py [number_of_messages]
+"""
+
+import sys
+import timeit
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+def request_size(message):
+    return types.PublishRequest(messages=[message]).ByteSize()
+
+
+MESSAGES = {
+    "small": types.PubsubMessage(data=b"x" * 20),
+    "attributes": types.PubsubMessage(
+        data=b"x" * 200, attributes={"key{}".format(i): "value" for i in range(5)}
+    ),
+    "large": types.PubsubMessage(
+        data=b"x" * 100000, attributes={"foo": "bar"}, ordering_key="key"
+    ),
+}
+
+number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+for name, message in sorted(MESSAGES.items()):
+    assert request_size(message) == thread._publish_request_size_increase(message)
+
+    serialized = timeit.timeit(lambda: request_size(message), number=number)
+    incremental = timeit.timeit(
+        lambda: thread._publish_request_size_increase(message), number=number
+    )
+    print(
+        "{0}: PublishRequest.ByteSize {1:.3f} sec, incremental {2:.3f} sec, "
+        "speedup {3:.1f}x".format(
+            name, serialized, incremental, serialized / incremental
+        )
+    )
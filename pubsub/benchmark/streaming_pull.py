@@ -0,0 +1,128 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the processing of streaming pull responses.
+
+Feeds a fake stream of large responses to ``StreamingPullManager`` and
+compares admitting each message separately (one lock acquisition, leaser
+update and load check per message) with admitting the whole response at once.
+The leaser is real, the server, the dispatcher and the user callbacks are not.
+
+Usage: python streaming_pull.py [messages_per_response] [number_of_responses]
+"""
+
+import sys
+import time
+
+import mock
+
+from google.api_core import bidi
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import client
+from google.cloud.pubsub_v1.subscriber import message
+from google.cloud.pubsub_v1.subscriber import scheduler
+from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
+from google.cloud.pubsub_v1.subscriber._protocol import leaser
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+
+def per_message_on_response(manager, response):
+    """The response processing before the messages were admitted at once."""
+    items = [
+        requests.ModAckRequest(received.ack_id, manager._ack_histogram.percentile(99))
+        for received in response.received_messages
+    ]
+    manager._dispatcher.modify_ack_deadline(items)
+
+    invoke_callbacks_for = []
+    for received_message in response.received_messages:
+        msg = message.Message(
+            received_message.message, received_message.ack_id, manager._scheduler.queue
+        )
+        with manager._pause_resume_lock:
+            if manager.load < streaming_pull_manager._MAX_LOAD:
+                invoke_callbacks_for.append(msg)
+            else:
+                manager._messages_on_hold.put(msg)
+                manager._on_hold_bytes += msg.size
+
+        req = requests.LeaseRequest(ack_id=msg.ack_id, byte_size=msg.size)
+        manager.leaser.add([req])
+        manager.maybe_pause_consumer()
+
+    for msg in invoke_callbacks_for:
+        manager._scheduler.schedule(manager._callback, msg)
+
+
+def make_manager(max_messages):
+    manager = streaming_pull_manager.StreamingPullManager(
+        mock.create_autospec(client.Client, instance=True),
+        "subscription-name",
+        flow_control=types.FlowControl(max_messages=max_messages),
+        scheduler=mock.create_autospec(scheduler.Scheduler, instance=True),
+    )
+    manager._callback = mock.sentinel.callback
+    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumer.is_paused = False
+    manager._dispatcher = mock.create_autospec(dispatcher.Dispatcher, instance=True)
+    manager._leaser = leaser.Leaser(manager)
+    return manager
+
+
+def fake_stream(messages_per_response, number_of_responses):
+    responses = []
+    for i in range(number_of_responses):
+        received_messages = [
+            types.ReceivedMessage(
+                ack_id="ack-{}-{}".format(i, j),
+                message=types.PubsubMessage(data=b"x" * 1000, message_id=str(j)),
+            )
+            for j in range(messages_per_response)
+        ]
+        responses.append(
+            types.StreamingPullResponse(received_messages=received_messages)
+        )
+    return responses
+
+
+def run(on_response, responses, max_messages):
+    manager = make_manager(max_messages)
+    start = time.time()
+    for response in responses:
+        on_response(manager, response)
+    return time.time() - start, manager._messages_on_hold.qsize()
+
+
+messages_per_response = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+number_of_responses = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+responses = fake_stream(messages_per_response, number_of_responses)
+total = messages_per_response * number_of_responses
+
+# Once with all the messages delivered, once with half of them put on hold.
+for max_messages in (total, total // 2):
+    per_message, held = run(per_message_on_response, responses, max_messages)
+    batched, batched_held = run(
+        streaming_pull_manager.StreamingPullManager._on_response,
+        responses,
+        max_messages,
+    )
+    assert held == batched_held
+
+    print(
+        "{0} messages, {1} on hold: per message {2:.3f} sec, "
+        "whole response {3:.3f} sec, speedup {4:.1f}x".format(
+            total, held, per_message, batched, per_message / batched
+        )
+    )
@@ -49,6 +49,7 @@ class Future(google.api_core.future.Future):
         self._result = self._SENTINEL
         self._exception = self._SENTINEL
         self._callbacks = []
+        self._callbacks_lock = threading.Lock()
         if completed is None:
             completed = threading.Event()
         self._completed = completed
@@ -140,9 +141,11 @@ class Future(google.api_core.future.Future):
         Returns:
             None
         """
-        if self.done():
-            return callback(self)
-        self._callbacks.append(callback)
+        with self._callbacks_lock:
+            if not self.done():
+                self._callbacks.append(callback)
+                return
+        callback(self)
 
     def set_result(self, result):
         """Set the result of the future to the provided result.
@@ -181,6 +184,11 @@ class Future(google.api_core.future.Future):
         Args:
             message_id (str): The message ID, as a string.
         """
-        self._completed.set()
-        for callback in self._callbacks:
+        # Registering a callback concurrently with completing the future must
+        # result in exactly one invocation of that callback.
+        with self._callbacks_lock:
+            self._completed.set()
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
             callback(self)
@@ -39,8 +39,8 @@ class Batch(object):
     is sent to that batch. If there is not, then a new batch is created
     and the message put there.
 
-    When a new batch is created, it automatically starts a timer counting
-    down to the maximum latency before the batch should commit.
+    When a new batch is created, it automatically schedules a deadline at the
+    maximum latency before the batch should commit.
     Essentially, if enough time passes, the batch automatically commits
     regardless of how much is in it. However, if either the message count or
     size thresholds are encountered first, then the batch will commit early.
@@ -134,6 +134,21 @@ class Batch(object):
         # Okay, everything is good.
         return True
 
+    @abc.abstractmethod
+    def cancel(self, cancellation_reason):
+        """Complete pending futures with an exception.
+
+        This method must be called before committing the batch, and the batch
+        does not accept any messages afterwards. It is used when publishing
+        with ordering keys, to fail the batches queued behind a failed batch.
+
+        Args:
+            cancellation_reason (str): The reason why this batch has been
+                cancelled. One of the constants on
+                :class:`BatchCancellationReason`.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def publish(self, message):
         """Publish a single message.
@@ -167,3 +182,12 @@ class BatchStatus(object):
     IN_PROGRESS = "in progress"
     ERROR = "error"
     SUCCESS = "success"
+
+
+class BatchCancellationReason(object):
+    """An enum-like class representing reasons why a batch was cancelled."""
+
+    PRIOR_ORDERED_MESSAGE_FAILED = (
+        "Batch cancelled because prior ordered message for the same key has "
+        "failed. This batch has been cancelled to preserve ordering."
+    )
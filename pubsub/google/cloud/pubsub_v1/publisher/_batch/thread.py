@@ -32,6 +32,63 @@ _CAN_COMMIT = (base.BatchStatus.ACCEPTING_MESSAGES, base.BatchStatus.STARTING)
 _SERVER_PUBLISH_MAX_BYTES = 10 * 1000 * 1000  # max accepted size of PublishRequest
 
 
+def _varint_size(value):
+    """Return the number of bytes needed to encode a non-negative varint."""
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _length_delimited_size(length):
+    """Return the wire size of a length-delimited field with a one-byte tag.
+
+    All the fields of ``PubsubMessage`` and the ``messages`` field of
+    ``PublishRequest`` have field numbers below 16, thus one-byte tags.
+    """
+    return 1 + _varint_size(length) + length
+
+
+def _publish_request_size_increase(message):
+    """Return the number of bytes a message adds to a ``PublishRequest``.
+
+    This is the same as ``PublishRequest(messages=[message]).ByteSize()``,
+    but computed from the field lengths without building and serializing
+    another request.
+
+    Args:
+        message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+    Returns:
+        int: The size of the message in the request, in bytes.
+    """
+    # Messages being published normally do not have these server-assigned
+    # fields, do not bother with their encoding.
+    if message.message_id or message.HasField("publish_time"):
+        return _length_delimited_size(message.ByteSize())
+
+    message_size = 0
+
+    data_length = len(message.data)
+    if data_length:
+        message_size += _length_delimited_size(data_length)
+
+    # Each map entry is a nested message, which always contains both the key
+    # and the value fields, even if they are empty.
+    for key, value in six.iteritems(message.attributes):
+        key_size = _length_delimited_size(len(key.encode("utf-8")))
+        value_size = _length_delimited_size(len(value.encode("utf-8")))
+        entry_size = key_size + value_size
+        message_size += _length_delimited_size(entry_size)
+
+    ordering_key = message.ordering_key
+    if ordering_key:
+        message_size += _length_delimited_size(len(ordering_key.encode("utf-8")))
+
+    return _length_delimited_size(message_size)
+
+
 class Batch(base.Batch):
     """A batch of messages.
 
@@ -65,12 +122,29 @@ class Batch(base.Batch):
         autocommit (bool): Whether to autocommit the batch when the time
             has elapsed. Defaults to True unless ``settings.max_latency`` is
             inf.
+        commit_when_full (bool): Whether to commit the batch when it cannot
+            accept any more messages. Defaults to True. Ordered publishing
+            disables this, since only one batch per ordering key may be in
+            flight at any time.
+        batch_done_callback (Optional[Callable[[bool], Any]]): A callable
+            invoked with the success status (``True`` or ``False``) once the
+            batch commit has completed.
     """
 
-    def __init__(self, client, topic, settings, autocommit=True):
+    def __init__(
+        self,
+        client,
+        topic,
+        settings,
+        autocommit=True,
+        commit_when_full=True,
+        batch_done_callback=None,
+    ):
         self._client = client
         self._topic = topic
         self._settings = settings
+        self._commit_when_full = commit_when_full
+        self._batch_done_callback = batch_done_callback
 
         self._state_lock = threading.Lock()
         # These members are all communicated between threads; ensure that
@@ -87,14 +161,12 @@ class Batch(base.Batch):
         self._base_request_size = types.PublishRequest(topic=topic).ByteSize()
         self._size = self._base_request_size
 
-        # If max latency is specified, start a thread to monitor the batch and
-        # commit when the max latency is reached.
-        self._thread = None
+        # If max latency is specified, ask the client's commit scheduler to
+        # commit the batch when the max latency is reached.
         if autocommit and self.settings.max_latency < float("inf"):
-            self._thread = threading.Thread(
-                name="Thread-MonitorBatchPublisher", target=self.monitor
+            self._client.commit_scheduler.schedule_deadline(
+                self.settings.max_latency, self.commit
             )
-            self._thread.start()
 
     @staticmethod
     def make_lock():
@@ -153,11 +225,12 @@ class Batch(base.Batch):
 
         .. note::
 
-            This method is non-blocking. It opens a new thread, which calls
-            :meth:`_commit`, which does block.
+            This method is non-blocking. It schedules :meth:`_commit`, which
+            does block, on the client's commit scheduler.
 
-        This synchronously sets the batch status to "starting", and then opens
-        a new thread, which handles actually sending the messages to Pub/Sub.
+        This synchronously sets the batch status to "starting", and then hands
+        the batch to the commit scheduler, which handles actually sending the
+        messages to Pub/Sub.
 
         If the current batch is **not** accepting messages, this method
         does nothing.
@@ -170,11 +243,29 @@ class Batch(base.Batch):
             else:
                 return
 
-        # Start a new thread to actually handle the commit.
-        commit_thread = threading.Thread(
-            name="Thread-CommitBatchPublisher", target=self._commit
-        )
-        commit_thread.start()
+        # Let the shared commit scheduler actually handle the commit.
+        self._client.commit_scheduler.schedule_commit(self._commit)
+
+    def cancel(self, cancellation_reason):
+        """Complete pending futures with an exception.
+
+        This method must be called before committing the batch, and the batch
+        does not accept any messages afterwards.
+
+        Args:
+            cancellation_reason (str): The reason why this batch has been
+                cancelled. One of the constants on
+                :class:`~.pubsub_v1.publisher._batch.base.BatchCancellationReason`.
+        """
+        with self._state_lock:
+            if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+                raise RuntimeError("Only batches not yet committed can be cancelled.")
+
+            self._status = base.BatchStatus.ERROR
+
+        exc = RuntimeError(cancellation_reason)
+        for future in self._futures:
+            future.set_exception(exc)
 
     def _commit(self):
         """Actually publish all of the messages on the active batch.
@@ -198,6 +289,17 @@ class Batch(base.Batch):
                 _LOGGER.debug("Batch is already in progress, exiting commit")
                 return
 
+        success = self._send()
+
+        if self._batch_done_callback is not None:
+            self._batch_done_callback(success)
+
+    def _send(self):
+        """Send the messages of an in progress batch to the backend.
+
+        Returns:
+            bool: Whether the messages were successfully published.
+        """
         # Once in the IN_PROGRESS state, no other thread can publish additional
         # messages or initiate a commit (those operations become a no-op), thus
         # it is safe to release the state lock here. Releasing the lock avoids
@@ -209,7 +311,7 @@ class Batch(base.Batch):
         if not self._messages:
             _LOGGER.debug("No messages to publish, exiting commit")
             self._status = base.BatchStatus.SUCCESS
-            return
+            return True
 
         # Begin the request to publish these messages.
         # Log how long the underlying request takes.
@@ -226,7 +328,7 @@ class Batch(base.Batch):
                 future.set_exception(exc)
 
             _LOGGER.exception("Failed to publish %s messages.", len(self._futures))
-            return
+            return False
 
         end = time.time()
         _LOGGER.debug("gRPC Publish took %s seconds.", end - start)
@@ -239,6 +341,7 @@ class Batch(base.Batch):
             zip_iter = six.moves.zip(response.message_ids, self._futures)
             for message_id, future in zip_iter:
                 future.set_result(message_id)
+            return True
         else:
             # Sanity check: If the number of message IDs is not equal to
             # the number of futures I have, then something went wrong.
@@ -255,21 +358,7 @@ class Batch(base.Batch):
                 len(response.message_ids),
                 len(self._futures),
             )
-
-    def monitor(self):
-        """Commit this batch after sufficient time has elapsed.
-
-        This simply sleeps for ``self.settings.max_latency`` seconds,
-        and then calls commit unless the batch has already been committed.
-        """
-        # NOTE: This blocks; it is up to the calling code to call it
-        #       in a separate thread.
-
-        # Sleep for however long we should be waiting.
-        time.sleep(self.settings.max_latency)
-
-        _LOGGER.debug("Monitor is waking up")
-        return self._commit()
+            return False
 
     def publish(self, message):
         """Publish a single message.
@@ -300,12 +389,14 @@ class Batch(base.Batch):
 
         future = None
 
+        # The message size does not depend on the batch state, compute it
+        # before taking the lock.
+        size_increase = _publish_request_size_increase(message)
+
         with self._state_lock:
             if not self.will_accept(message):
                 return future
 
-            size_increase = types.PublishRequest(messages=[message]).ByteSize()
-
             if (self._base_request_size + size_increase) > _SERVER_PUBLISH_MAX_BYTES:
                 err_msg = (
                     "The message being published would produce too large a publish "
@@ -333,7 +424,7 @@ class Batch(base.Batch):
 
         # Try to commit, but it must be **without** the lock held, since
         # ``commit()`` will try to obtain the lock.
-        if overflow:
+        if overflow and self._commit_when_full:
             self.commit()
 
         return future
@@ -0,0 +1,242 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch import base
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _OrderedSequencerStatus(object):
+    """An enum-like class representing valid statuses for an OrderedSequencer.
+
+    Starting state: ACCEPTING_MESSAGES
+
+    Transitions:
+      ACCEPTING_MESSAGES -> PAUSED (on permanent error)
+      ACCEPTING_MESSAGES -> STOPPED  (when user calls stop() explicitly)
+      PAUSED -> ACCEPTING_MESSAGES  (when user unpauses)
+    """
+
+    ACCEPTING_MESSAGES = "accepting messages"
+    PAUSED = "paused"
+    STOPPED = "stopped"
+
+
+class OrderedSequencer(object):
+    """Sequences messages into batches ordered by an ordering key for one topic.
+
+    Messages published with the same ordering key are put into a queue of
+    batches, and at most one batch of the queue is committed at any time.
+    Once the batch at the head of the queue is published, the next batch is
+    committed. Sequencers for different ordering keys are independent, so
+    their batches are committed concurrently through the client's commit
+    scheduler.
+
+    If a batch fails to publish, all the batches queued behind it are
+    cancelled and the sequencer pauses, rejecting new messages until
+    :meth:`unpause` is called.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create the batches.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        ordering_key (str): The ordering key for this sequencer.
+        idle_callback (Optional[Callable[[OrderedSequencer], Any]]): A
+            callable invoked without any locks held when the sequencer runs
+            out of batches, so that the client may discard it.
+    """
+
+    def __init__(self, client, topic, ordering_key, idle_callback=None):
+        self._client = client
+        self._topic = topic
+        self._ordering_key = ordering_key
+        self._idle_callback = idle_callback
+
+        # Guards the batch queue and the status. The lock must never be held
+        # while acquiring the client's batch lock.
+        self._state_lock = threading.Lock()
+        # The head of the queue is the only batch that may be in flight,
+        # the tail is the only batch that may accept messages.
+        self._ordered_batches = collections.deque()
+        self._status = _OrderedSequencerStatus.ACCEPTING_MESSAGES
+
+    @property
+    def ordering_key(self):
+        """str: The ordering key of the messages in this sequencer."""
+        return self._ordering_key
+
+    def is_finished(self):
+        """Whether the sequencer holds no batches and can be discarded.
+
+        A paused sequencer is never finished, since it has to remember that
+        its ordering key is paused.
+
+        Returns:
+            bool: Whether the sequencer is finished.
+        """
+        with self._state_lock:
+            return (
+                not self._ordered_batches
+                and self._status != _OrderedSequencerStatus.PAUSED
+            )
+
+    def stop(self):
+        """Permanently stop this sequencer.
+
+        The batches are committed one after the other, but the sequencer
+        does not accept new messages afterwards.
+
+        Raises:
+            RuntimeError:
+                If called after stop() has already been called.
+        """
+        with self._state_lock:
+            if self._status == _OrderedSequencerStatus.STOPPED:
+                raise RuntimeError("Ordered sequencer already stopped.")
+
+            self._status = _OrderedSequencerStatus.STOPPED
+            if self._ordered_batches:
+                self._ordered_batches[0].commit()
+
+    def unpause(self):
+        """Resume accepting messages after a publish failure.
+
+        Raises:
+            RuntimeError:
+                If the sequencer is not paused.
+        """
+        with self._state_lock:
+            if self._status != _OrderedSequencerStatus.PAUSED:
+                raise RuntimeError("Ordering key is not paused.")
+            self._status = _OrderedSequencerStatus.ACCEPTING_MESSAGES
+
+    def publish(self, message):
+        """Publish a message for this ordering key.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            A class instance that conforms to Python Standard library's
+            :class:`~concurrent.futures.Future` interface (but not an
+            instance of that class).
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyException:
+                If the ordering key is paused due to an earlier error.
+            RuntimeError:
+                If called after the sequencer has been stopped.
+        """
+        with self._state_lock:
+            if self._status == _OrderedSequencerStatus.PAUSED:
+                raise exceptions.PublishToPausedOrderingKeyException(self._ordering_key)
+            if self._status == _OrderedSequencerStatus.STOPPED:
+                raise RuntimeError("Cannot publish on a stopped sequencer.")
+
+            if not self._ordered_batches:
+                self._ordered_batches.append(self._create_batch())
+
+            batch = self._ordered_batches[-1]
+            future = batch.publish(message)
+            while future is None:
+                batch = self._create_batch()
+                self._ordered_batches.append(batch)
+                future = batch.publish(message)
+
+            # A full batch is waiting at the head of the queue, it does not
+            # have to wait for its latency deadline anymore.
+            if len(self._ordered_batches) > 1:
+                self._ordered_batches[0].commit()
+
+            return future
+
+    def _create_batch(self):
+        """Create a batch that is committed only by this sequencer.
+
+        .. note::
+            The caller must hold the ``_state_lock``.
+        """
+        batch = self._client._batch_class(
+            client=self._client,
+            topic=self._topic,
+            settings=self._client.batch_settings,
+            autocommit=False,
+            commit_when_full=False,
+            batch_done_callback=self._batch_done_callback,
+        )
+
+        max_latency = self._client.batch_settings.max_latency
+        if max_latency < float("inf"):
+            self._client.commit_scheduler.schedule_deadline(
+                max_latency, lambda: self._on_batch_deadline(batch)
+            )
+
+        return batch
+
+    def _on_batch_deadline(self, batch):
+        """Commit the batch once its latency elapses, if it is the first one.
+
+        A batch further down the queue is committed by the batch done callback
+        of its predecessor instead.
+        """
+        with self._state_lock:
+            if self._ordered_batches and self._ordered_batches[0] is batch:
+                batch.commit()
+
+    def _batch_done_callback(self, success):
+        """Deal with the completion of the batch at the head of the queue.
+
+        On success the next batch is committed. On failure, the queued
+        batches are cancelled and the sequencer is paused.
+
+        Args:
+            success (bool): Whether the batch was successfully published.
+        """
+        cancelled_batches = ()
+        with self._state_lock:
+            self._ordered_batches.popleft()
+
+            if success:
+                if self._ordered_batches:
+                    self._ordered_batches[0].commit()
+            else:
+                _LOGGER.debug(
+                    "Pausing ordering key %s after a publish failure.",
+                    self._ordering_key,
+                )
+                if self._status == _OrderedSequencerStatus.ACCEPTING_MESSAGES:
+                    self._status = _OrderedSequencerStatus.PAUSED
+
+                cancelled_batches = self._ordered_batches
+                self._ordered_batches = collections.deque()
+
+            idle = not self._ordered_batches
+
+        # Cancelling a batch runs the done callbacks of its futures, which
+        # may resume the ordering key or publish on it, so the state lock
+        # must not be held.
+        for batch in cancelled_batches:
+            batch.cancel(base.BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED)
+
+        if idle and self._idle_callback is not None:
+            self._idle_callback(self)
@@ -15,6 +15,7 @@
 from __future__ import absolute_import
 
 import copy
+import logging
 import os
 import pkg_resources
 
@@ -28,11 +29,16 @@ from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1.gapic.transports import publisher_grpc_transport
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher import scheduler
+from google.cloud.pubsub_v1.publisher._sequencer import OrderedSequencer
 from google.cloud.pubsub_v1.publisher._batch import thread
 
 
 __version__ = pkg_resources.get_distribution("google-cloud-pubsub").version
 
+_LOGGER = logging.getLogger(__name__)
+
 _BLACKLISTED_METHODS = (
     "publish",
     "from_service_account_file",
@@ -51,6 +57,16 @@ class Client(object):
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
             settings for batch publishing.
+        publisher_options (~google.cloud.pubsub_v1.types.PublisherOptions): The
+            options for the publisher client. Note that enabling flow control
+            with ``max_latency`` set to infinity can block forever, since
+            pending batches are then never committed automatically.
+        commit_scheduler (~google.cloud.pubsub_v1.publisher.scheduler.CommitScheduler):
+            An optional scheduler used to send the batches and to commit them
+            when their ``max_latency`` elapses. If not specified, a
+            :class:`~google.cloud.pubsub_v1.publisher.scheduler.ThreadPoolCommitScheduler`
+            with default settings is created, and shut down by :meth:`stop`.
+            A scheduler passed in by the caller is not shut down by the client.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~google.cloud.pubsub_v1.gapic.publisher_client.PublisherClient`.
@@ -74,6 +90,14 @@ class Client(object):
                 max_latency=1,   # One second
             ),
 
+            # Optional
+            publisher_options = pubsub_v1.types.PublisherOptions(
+                flow_control=pubsub_v1.types.PublishFlowControl(
+                    message_limit=2000,
+                    limit_exceeded_behavior=pubsub_v1.types.LimitExceededBehavior.BLOCK,
+                ),
+            ),
+
             # Optional
             client_config = {
                 "interfaces": {
@@ -96,7 +120,9 @@ class Client(object):
 
     _batch_class = thread.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(
+        self, batch_settings=(), publisher_options=(), commit_scheduler=None, **kwargs
+    ):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -129,6 +155,20 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self.publisher_options = types.PublisherOptions(*publisher_options)
+
+        # The flow controller bounds the number and total size of messages
+        # that have been handed to ``publish()`` but not yet sent.
+        self._flow_controller = flow_controller.FlowController(
+            self.publisher_options.flow_control
+        )
+
+        # All batches share the same scheduler, which bounds the number of
+        # concurrent Publish RPCs and handles all batch latency deadlines.
+        self._owns_commit_scheduler = commit_scheduler is None
+        if commit_scheduler is None:
+            commit_scheduler = scheduler.ThreadPoolCommitScheduler()
+        self._commit_scheduler = commit_scheduler
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
@@ -136,8 +176,15 @@ class Client(object):
         self._batches = {}
         self._is_stopped = False
 
+        # Messages with an ordering key go through a sequencer instead, one
+        # exists for each (topic, ordering_key) pair with pending batches.
+        # Sequencers for different keys commit their batches concurrently.
+        self._sequencers = {}
+
     @classmethod
-    def from_service_account_file(cls, filename, batch_settings=(), **kwargs):
+    def from_service_account_file(
+        cls, filename, batch_settings=(), publisher_options=(), **kwargs
+    ):
         """Creates an instance of this client using the provided credentials
         file.
 
@@ -146,6 +193,8 @@ class Client(object):
                 file.
             batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
                 settings for batch publishing.
+            publisher_options (~google.cloud.pubsub_v1.types.PublisherOptions):
+                The options for the publisher client.
             kwargs: Additional arguments to pass to the constructor.
 
         Returns:
@@ -154,7 +203,7 @@ class Client(object):
         """
         credentials = service_account.Credentials.from_service_account_file(filename)
         kwargs["credentials"] = credentials
-        return cls(batch_settings, **kwargs)
+        return cls(batch_settings, publisher_options, **kwargs)
 
     from_service_account_json = from_service_account_file
 
@@ -167,6 +216,16 @@ class Client(object):
         """
         return publisher_client.PublisherClient.SERVICE_ADDRESS
 
+    @property
+    def commit_scheduler(self):
+        """Return the scheduler used to commit the batches.
+
+        Returns:
+            ~google.cloud.pubsub_v1.publisher.scheduler.CommitScheduler: The
+            commit scheduler shared by all batches of this client.
+        """
+        return self._commit_scheduler
+
     def _batch(self, topic, create=False, autocommit=True):
         """Return the current batch for the provided topic.
 
@@ -204,7 +263,77 @@ class Client(object):
 
         return batch
 
-    def publish(self, topic, data, **attrs):
+    def _sequencer(self, topic, ordering_key):
+        """Return the ordered sequencer for the provided topic and ordering key.
+
+        This will create a new sequencer if none currently exists.
+
+        .. note::
+            The caller must hold the ``_batch_lock``.
+
+        Args:
+            topic (str): A string representing the topic.
+            ordering_key (str): A string representing the ordering key.
+
+        Returns:
+            ~.pubsub_v1.publisher._sequencer.OrderedSequencer: The sequencer.
+        """
+        sequencer_key = (topic, ordering_key)
+        sequencer = self._sequencers.get(sequencer_key)
+        if sequencer is None:
+            sequencer = OrderedSequencer(
+                self, topic, ordering_key, idle_callback=self._on_sequencer_idle
+            )
+            self._sequencers[sequencer_key] = sequencer
+
+        return sequencer
+
+    def _on_sequencer_idle(self, sequencer):
+        """Discard a sequencer that has no more batches to publish."""
+        with self._batch_lock:
+            sequencer_key = (sequencer._topic, sequencer.ordering_key)
+            if (
+                self._sequencers.get(sequencer_key) is sequencer
+                and sequencer.is_finished()
+            ):
+                del self._sequencers[sequencer_key]
+
+    def resume_publish(self, topic, ordering_key):
+        """Resume publish on an ordering key that has had unrecoverable errors.
+
+        Sequencers are discarded once they are idle, so resuming an ordering
+        key which has no sequencer (it was never used, or it has no pending
+        messages) does nothing.
+
+        Args:
+            topic (str): The topic to publish messages to.
+            ordering_key: A string that identifies related messages for which
+                publish order should be respected.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped by a `stop()` method
+                call, or if publishing on the ordering key is not paused.
+            ValueError:
+                If message ordering is not enabled.
+        """
+        with self._batch_lock:
+            if self._is_stopped:
+                raise RuntimeError("Cannot resume publish on a stopped publisher.")
+
+            if not self.publisher_options.enable_message_ordering:
+                raise ValueError("Message ordering is not enabled.")
+
+            sequencer = self._sequencers.get((topic, ordering_key))
+            if sequencer is None:
+                _LOGGER.debug(
+                    "No sequencer for the topic/ordering key combination, "
+                    "nothing to resume."
+                )
+            else:
+                sequencer.unpause()
+
+    def publish(self, topic, data, ordering_key="", **attrs):
         """Publish a single message.
 
         .. note::
@@ -234,6 +363,11 @@ class Client(object):
             topic (str): The topic to publish messages to.
             data (bytes): A bytestring representing the message body. This
                 must be a bytestring.
+            ordering_key: A string that identifies related messages for which
+                publish order should be respected. Message ordering must be
+                enabled for this client to use this feature.
+                EXPERIMENTAL: This feature is currently available in a closed
+                alpha. Please contact the Cloud Pub/Sub team to use it.
             attrs (Mapping[str, str]): A dictionary of attributes to be
                 sent as metadata. (These may be text strings or byte strings.)
 
@@ -247,6 +381,15 @@ class Client(object):
             RuntimeError:
                 If called after publisher has been stopped
                 by a `stop()` method call.
+            ValueError:
+                If an ordering key is given but message ordering is not
+                enabled.
+            ~google.cloud.pubsub_v1.publisher.exceptions.PublishToPausedOrderingKeyException:
+                If the ordering key is paused after an unrecoverable error,
+                see :meth:`resume_publish`.
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If publishing the message would exceed the flow control limits
+                and the ``limit_exceeded_behavior`` is ``ERROR``.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -255,6 +398,12 @@ class Client(object):
                 "Data being published to Pub/Sub must be sent as a bytestring."
             )
 
+        if not self.publisher_options.enable_message_ordering and ordering_key != "":
+            raise ValueError(
+                "Cannot publish a message with an ordering key when message "
+                "ordering is not enabled."
+            )
+
         # Coerce all attributes to text strings.
         for k, v in copy.copy(attrs).items():
             if isinstance(v, six.text_type):
@@ -268,19 +417,47 @@ class Client(object):
             )
 
         # Create the Pub/Sub message object.
-        message = types.PubsubMessage(data=data, attributes=attrs)
-
-        # Delegate the publishing to the batch.
-        with self._batch_lock:
-            if self._is_stopped:
-                raise RuntimeError("Cannot publish on a stopped publisher.")
+        message = types.PubsubMessage(
+            data=data, ordering_key=ordering_key, attributes=attrs
+        )
 
-            batch = self._batch(topic)
-            future = None
-            while future is None:
-                future = batch.publish(message)
-                if future is None:
-                    batch = self._batch(topic, create=True)
+        # Fail fast on a stopped publisher, rather than waiting for capacity.
+        if self._is_stopped:
+            raise RuntimeError("Cannot publish on a stopped publisher.")
+
+        # Messages should go through flow control before they are batched, and
+        # this must happen without the batch lock held, as it might block.
+        self._flow_controller.add(message)
+
+        try:
+            # Delegate the publishing to the batch.
+            with self._batch_lock:
+                if self._is_stopped:
+                    raise RuntimeError("Cannot publish on a stopped publisher.")
+
+                if ordering_key:
+                    sequencer = self._sequencer(topic, ordering_key)
+                    future = sequencer.publish(message)
+                else:
+                    batch = self._batch(topic)
+                    future = None
+                    while future is None:
+                        future = batch.publish(message)
+                        if future is None:
+                            batch = self._batch(topic, create=True)
+        except Exception:
+            self._flow_controller.release(message)
+            raise
+
+        if (
+            self.publisher_options.flow_control.limit_exceeded_behavior
+            != types.LimitExceededBehavior.IGNORE
+        ):
+
+            def on_publish_done(future):
+                self._flow_controller.release(message)
+
+            future.add_done_callback(on_publish_done)
 
         return future
 
@@ -306,3 +483,11 @@ class Client(object):
 
             for batch in self._batches.values():
                 batch.commit()
+
+            # Ordered batches are committed one after the other.
+            for sequencer in self._sequencers.values():
+                sequencer.stop()
+
+        # The already scheduled commits still run after the shutdown.
+        if self._owns_commit_scheduler:
+            self._commit_scheduler.shutdown()
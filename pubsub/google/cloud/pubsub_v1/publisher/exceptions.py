@@ -26,4 +26,32 @@ class MessageTooLargeError(ValueError):
     """Attempt to publish a message that would exceed the server max size limit."""
 
 
-__all__ = ("MessageTooLargeError", "PublishError", "TimeoutError")
+class FlowControlLimitError(Exception):
+    """An action resulted in exceeding the flow control limits."""
+
+
+class PublishToPausedOrderingKeyException(Exception):
+    """Publish attempted to paused ordering key. To resume publishing, call
+    the resume_publish() method on the publisher Client object with this
+    ordering key. Ordering keys are paused if an unrecoverable error
+    occurred during publish of a batch for that key.
+    """
+
+    def __init__(self, ordering_key):
+        self.ordering_key = ordering_key
+        super(PublishToPausedOrderingKeyException, self).__init__()
+
+    def __str__(self):
+        return (
+            "Can not publish messages to paused ordering key {}. Call "
+            "resume_publish() to resume publishing.".format(self.ordering_key)
+        )
+
+
+__all__ = (
+    "FlowControlLimitError",
+    "MessageTooLargeError",
+    "PublishError",
+    "PublishToPausedOrderingKeyException",
+    "TimeoutError",
+)
@@ -0,0 +1,180 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlowController(object):
+    """A class used to control the flow of messages passing through it.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.PublishFlowControl):
+            Desired flow control configuration.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+
+        self._message_count = 0
+        self._total_bytes = 0
+
+        # The threads blocked in :meth:`add`, in arrival order. Only the
+        # thread at the head of the queue may reserve capacity, which ensures
+        # that large messages are not starved by a stream of small ones.
+        self._waiting = collections.deque()
+
+        # The lock guards the counters and the waiting queue, and is shared
+        # with the condition used to wake up the blocked threads.
+        self._operational_lock = threading.Lock()
+        self._has_capacity = threading.Condition(lock=self._operational_lock)
+
+    @property
+    def message_count(self):
+        """int: The number of messages currently tracked by the controller."""
+        return self._message_count
+
+    @property
+    def total_bytes(self):
+        """int: The total size of messages currently tracked, in bytes."""
+        return self._total_bytes
+
+    def add(self, message):
+        """Add a message to flow control.
+
+        Adding a message updates the internal load statistics, and an action is
+        taken if these limits are exceeded (depending on the flow control settings).
+
+        Args:
+            message (~google.cloud.pubsub_v1.types.PubsubMessage):
+                The message entering the flow control.
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If adding a message would exceed flow control limits and the
+                desired action is ``LimitExceededBehavior.ERROR``.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        message_size = message.ByteSize()
+
+        with self._operational_lock:
+            if not self._waiting and not self._would_overflow(message_size):
+                self._reserve(message_size)
+                return
+
+            if behavior == types.LimitExceededBehavior.ERROR:
+                msg = (
+                    "Flow control limits would be exceeded - "
+                    "{} messages ({} bytes) already in flight, limits are "
+                    "{} messages and {} bytes.".format(
+                        self._message_count,
+                        self._total_bytes,
+                        self._settings.message_limit,
+                        self._settings.byte_limit,
+                    )
+                )
+                raise exceptions.FlowControlLimitError(msg)
+
+            assert behavior == types.LimitExceededBehavior.BLOCK
+
+            _LOGGER.debug(
+                "Blocking until there is enough free capacity in the flow - "
+                "%s messages (%s bytes) in flight.",
+                self._message_count,
+                self._total_bytes,
+            )
+
+            token = object()
+            self._waiting.append(token)
+            try:
+                while self._waiting[0] is not token or self._would_overflow(
+                    message_size
+                ):
+                    self._has_capacity.wait()
+            finally:
+                self._waiting.remove(token)
+                # The next thread in line might be able to proceed now.
+                self._has_capacity.notify_all()
+
+            self._reserve(message_size)
+
+            _LOGGER.debug("Woke up from waiting on free capacity in the flow.")
+
+    def release(self, message):
+        """Release a message from flow control.
+
+        Args:
+            message (~google.cloud.pubsub_v1.types.PubsubMessage):
+                The message leaving the flow control.
+        """
+        if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        message_size = message.ByteSize()
+
+        with self._operational_lock:
+            self._message_count -= 1
+            self._total_bytes -= message_size
+
+            if self._message_count < 0 or self._total_bytes < 0:
+                _LOGGER.warning(
+                    "Releasing a message that was never added or already released."
+                )
+                self._message_count = max(0, self._message_count)
+                self._total_bytes = max(0, self._total_bytes)
+
+            self._has_capacity.notify_all()
+
+    def _reserve(self, message_size):
+        """Account for a message entering the flow.
+
+        .. note::
+            The caller must hold the ``_operational_lock``.
+        """
+        self._message_count += 1
+        self._total_bytes += message_size
+
+    def _would_overflow(self, message_size):
+        """Determine if accepting a message would exceed flow control limits.
+
+        A message larger than the byte limit on its own is admitted when
+        nothing else is in flight, otherwise it could never be published.
+
+        .. note::
+            The caller must hold the ``_operational_lock``.
+
+        Args:
+            message_size (int): The size of the message, in bytes.
+
+        Returns:
+            bool: Whether accepting the message would exceed the limits.
+        """
+        if self._message_count == 0:
+            return False
+
+        messages_overflow = self._message_count + 1 > self._settings.message_limit
+        bytes_overflow = self._total_bytes + message_size > self._settings.byte_limit
+        return messages_overflow or bytes_overflow
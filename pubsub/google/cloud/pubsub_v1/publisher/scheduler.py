@@ -0,0 +1,307 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Commit schedulers run batch commits and batch latency deadlines.
+
+These are used by the publisher to send the ``Publish`` RPCs of committed
+batches, and to commit batches once their ``max_latency`` has elapsed.
+"""
+
+from __future__ import absolute_import
+
+import abc
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+import six
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+CommitStats = collections.namedtuple(
+    "CommitStats",
+    [
+        "queue_depth",
+        "in_flight",
+        "committed",
+        "mean_commit_latency",
+        "max_commit_latency",
+    ],
+)
+CommitStats.__doc__ = """A snapshot of the commit scheduler statistics.
+
+Attributes:
+    queue_depth (int): The number of commits waiting for a free worker.
+    in_flight (int): The number of commits currently running.
+    committed (int): The number of commits that have finished running.
+    mean_commit_latency (float): The average duration of a finished commit,
+        in seconds. This is dominated by the latency of the ``Publish`` RPC.
+    max_commit_latency (float): The longest duration of a finished commit,
+        in seconds.
+"""
+
+
+@six.add_metaclass(abc.ABCMeta)
+class CommitScheduler(object):
+    """Abstract base class for commit schedulers.
+
+    A commit scheduler is shared by all the batches of a publisher client.
+    It runs the (blocking) batch commits asynchronously, and calls back when
+    the batches' latency deadlines expire.
+    """
+
+    @abc.abstractmethod
+    def schedule_commit(self, commit):
+        """Schedule a batch commit to be run asynchronously.
+
+        Args:
+            commit (Callable[[], None]): The blocking function that sends the
+                batch to the backend.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def schedule_deadline(self, delay, callback):
+        """Schedule a callback to be called after the given delay.
+
+        The callback should not block, since it can delay other deadlines.
+
+        Args:
+            delay (float): The number of seconds to wait before calling
+                the callback.
+            callback (Callable[[], None]): The function to call.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self):
+        """Shut down the scheduler.
+
+        Pending deadlines are dropped, but commits still run to completion,
+        including the ones scheduled after the shutdown: ordered batches are
+        only committed once the previous batch for the same key is done.
+        """
+        raise NotImplementedError
+
+
+def _make_default_thread_pool_executor(max_workers):
+    # Python 2.7 and 3.6+ have the thread_name_prefix argument, which is useful
+    # for debugging.
+    executor_kwargs = {}
+    if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+        executor_kwargs["thread_name_prefix"] = "ThreadPoolExecutor-CommitScheduler"
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, **executor_kwargs
+    )
+
+
+class ThreadPoolCommitScheduler(CommitScheduler):
+    """A commit scheduler backed by a bounded thread pool and a timer thread.
+
+    At most ``max_concurrent_commits`` ``Publish`` RPCs are in flight at any
+    time, the rest of the committed batches wait in the executor's queue. All
+    batch deadlines are handled by a single timer thread, which is started
+    on demand and exits once no deadlines are pending. The timer thread is
+    not a daemon, so batches waiting for their deadline are still committed
+    when the interpreter exits.
+
+    Args:
+        max_concurrent_commits (int): The maximum number of batch commits to
+            run concurrently. Ignored if ``executor`` is given.
+        executor (concurrent.futures.ThreadPoolExecutor): An optional executor
+            to run the commits in. If not specified, a default one will be
+            created. An executor passed in is never shut down by the
+            scheduler.
+    """
+
+    def __init__(self, max_concurrent_commits=10, executor=None):
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = _make_default_thread_pool_executor(max_concurrent_commits)
+        self._executor = executor
+
+        self._stats_lock = threading.Lock()
+        self._queue_depth = 0
+        self._in_flight = 0
+        self._committed = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+        # A heap of (deadline, sequence number, callback) tuples. The sequence
+        # number keeps the ordering stable and avoids comparing callbacks.
+        self._deadlines = []
+        self._deadline_counter = itertools.count()
+        self._deadlines_changed = threading.Condition()
+        self._timer_thread = None
+        self._timer_running = False
+        self._is_shutdown = False
+
+    @property
+    def stats(self):
+        """~.pubsub_v1.publisher.scheduler.CommitStats: The current
+        commit statistics."""
+        with self._stats_lock:
+            mean_latency = (
+                self._total_latency / self._committed if self._committed else 0.0
+            )
+            return CommitStats(
+                queue_depth=self._queue_depth,
+                in_flight=self._in_flight,
+                committed=self._committed,
+                mean_commit_latency=mean_latency,
+                max_commit_latency=self._max_latency,
+            )
+
+    def schedule_commit(self, commit):
+        """Schedule a batch commit to be run in the thread pool.
+
+        Args:
+            commit (Callable[[], None]): The blocking function that sends the
+                batch to the backend.
+
+        Returns:
+            None
+        """
+        with self._stats_lock:
+            self._queue_depth += 1
+            try:
+                self._executor.submit(self._run_commit, commit)
+                return
+            except RuntimeError:
+                # The executor no longer accepts work, as happens once the
+                # interpreter starts exiting. Commit in the calling thread
+                # rather than dropping the batch.
+                _LOGGER.debug("Executor is shut down, committing in place.")
+
+        self._run_commit(commit)
+
+    def _run_commit(self, commit):
+        with self._stats_lock:
+            self._queue_depth -= 1
+            self._in_flight += 1
+
+        start = time.time()
+        try:
+            commit()
+        except Exception:
+            _LOGGER.exception("Unexpected error while committing a batch.")
+        finally:
+            latency = time.time() - start
+            with self._stats_lock:
+                self._in_flight -= 1
+                self._committed += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+                self._maybe_shutdown_executor()
+
+    def _maybe_shutdown_executor(self):
+        """Shut down the executor once the scheduler is shut down and idle.
+
+        Executors passed in by the caller are left running.
+
+        .. note::
+            The caller must hold the ``_stats_lock``.
+        """
+        if not self._owns_executor:
+            return
+        if self._is_shutdown and not self._queue_depth and not self._in_flight:
+            self._executor.shutdown(wait=False)
+
+    def schedule_deadline(self, delay, callback):
+        """Schedule a callback to be called by the timer thread after a delay.
+
+        Args:
+            delay (float): The number of seconds to wait before calling
+                the callback.
+            callback (Callable[[], None]): The function to call.
+
+        Returns:
+            None
+        """
+        deadline = time.time() + delay
+        with self._deadlines_changed:
+            if self._is_shutdown:
+                _LOGGER.debug("Scheduler is shut down, dropping the deadline.")
+                return
+
+            heapq.heappush(
+                self._deadlines, (deadline, next(self._deadline_counter), callback)
+            )
+
+            if not self._timer_running:
+                self._timer_thread = threading.Thread(
+                    name="Thread-CommitSchedulerTimer", target=self._run_timer
+                )
+                self._timer_running = True
+                self._timer_thread.start()
+
+            self._deadlines_changed.notify()
+
+    def _run_timer(self):
+        """Call the deadline callbacks as their deadlines expire.
+
+        The thread exits once no deadlines are pending, so that it does not
+        keep the interpreter from exiting.
+
+        .. note::
+            This blocks; it is run in the timer thread.
+        """
+        while True:
+            with self._deadlines_changed:
+                while not self._is_shutdown and self._deadlines:
+                    timeout = self._deadlines[0][0] - time.time()
+                    if timeout <= 0:
+                        break
+                    self._deadlines_changed.wait(timeout)
+
+                if self._is_shutdown or not self._deadlines:
+                    _LOGGER.debug("Exiting the commit scheduler timer thread.")
+                    self._timer_running = False
+                    return
+
+                _, _, callback = heapq.heappop(self._deadlines)
+
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Unexpected error in a batch deadline callback.")
+
+    def shutdown(self):
+        """Shut down the scheduler.
+
+        Pending deadlines are dropped and the timer thread exits. Commits
+        still run to completion, including the ones scheduled after the
+        shutdown, and the executor is shut down once no commits remain.
+        This method does not block.
+        """
+        with self._deadlines_changed:
+            self._is_shutdown = True
+            self._deadlines = []
+            self._deadlines_changed.notify()
+
+        with self._stats_lock:
+            self._maybe_shutdown_executor()
@@ -105,7 +105,12 @@ class Dispatcher(object):
         batched_commands = collections.defaultdict(list)
 
         for item in items:
-            batched_commands[item.__class__].append(item)
+            # Requests queued at once, e.g. by acking a whole batch of messages.
+            if isinstance(item, list):
+                for request in item:
+                    batched_commands[request.__class__].append(request)
+            else:
+                batched_commands[item.__class__].append(item)
 
         _LOGGER.debug("Handling %d batched requests", len(items))
 
@@ -185,6 +190,26 @@ class Dispatcher(object):
             )
             self._manager.send(request)
 
+    def extend_deadlines(self, ack_ids, seconds):
+        """Modify the ack deadline of many messages to the same value.
+
+        This is equivalent to :meth:`modify_ack_deadline`, but avoids creating
+        a request item for each of the ack IDs.
+
+        Args:
+            ack_ids (Sequence[str]): The ack IDs of the messages to modify.
+            seconds (int): The new ack deadline of the messages, in seconds.
+        """
+        # We must potentially split the request into multiple smaller requests
+        # to avoid the server-side max request size limit.
+        for start in range(0, len(ack_ids), _ACK_IDS_BATCH_SIZE):
+            chunk = ack_ids[start : start + _ACK_IDS_BATCH_SIZE]
+            request = types.StreamingPullRequest(
+                modify_deadline_ack_ids=chunk,
+                modify_deadline_seconds=itertools.repeat(seconds, len(chunk)),
+            )
+            self._manager.send(request)
+
     def nack(self, items):
         """Explicitly deny receipt of messages.
 
@@ -15,22 +15,42 @@
 from __future__ import absolute_import
 
 import collections
-import copy
 import logging
 import random
 import threading
 import time
 
-import six
-
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
 
 _LOGGER = logging.getLogger(__name__)
 _LEASE_WORKER_NAME = "Thread-LeaseMaintainer"
 
+_LEASE_BUCKET_SECONDS = 1.0
+"""The width of the lease expiration buckets, in seconds.
+
+Leases expiring within the same bucket are always extended together, with a
+single batched modify ack deadline request.
+"""
+
+_MIN_LEASE_SECONDS = 10
+"""The shortest ack deadline ever requested for a message, in seconds.
+
+The leases of newly added messages are conservatively assumed to expire after
+this amount of time, since they were only just modacked by the caller.
+"""
 
-_LeasedMessage = collections.namedtuple("_LeasedMessage", ["added_time", "size"])
+_MAX_SNOOZE_SECONDS = _MIN_LEASE_SECONDS / 2.0
+"""The longest time between two lease maintenance runs, in seconds.
+
+This ensures that the leases of messages added while the maintainer sleeps
+are extended in time.
+"""
+
+
+_LeasedMessage = collections.namedtuple(
+    "_LeasedMessage", ["added_time", "size", "bucket"]
+)
 
 
 class Leaser(object):
@@ -42,12 +62,19 @@ class Leaser(object):
         self._operational_lock = threading.Lock()
 
         # A lock ensuring that add/remove operations are atomic and cannot be
-        # intertwined. Protects the _leased_messages and _bytes attributes.
+        # intertwined. Protects the _leased_messages, _lease_buckets and
+        # _bytes attributes.
         self._add_remove_lock = threading.Lock()
 
-        self._leased_messages = {}
-        """dict[str, float]: A mapping of ack IDs to the local time when the
-            ack ID was initially leased in seconds since the epoch."""
+        self._leased_messages = collections.OrderedDict()
+        """OrderedDict[str, _LeasedMessage]: A mapping of ack IDs to the
+            local time when the ack ID was initially leased in seconds since
+            the epoch, the message size, and the lease bucket. Ordered by the
+            time the messages were added."""
+        self._lease_buckets = {}
+        """dict[int, set[str]]: A mapping of lease buckets to the ack IDs of
+            the messages whose leases expire within that bucket. A lease
+            expiring at time ``t`` is in bucket ``int(t // _LEASE_BUCKET_SECONDS)``."""
         self._bytes = 0
         """int: The total number of bytes consumed by leased messages."""
 
@@ -70,14 +97,18 @@ class Leaser(object):
 
     def add(self, items):
         """Add messages to be managed by the leaser."""
+        now = time.time()
+        bucket = _bucket_for(now + _MIN_LEASE_SECONDS)
+
         with self._add_remove_lock:
             for item in items:
                 # Add the ack ID to the set of managed ack IDs, and increment
                 # the size counter.
                 if item.ack_id not in self._leased_messages:
                     self._leased_messages[item.ack_id] = _LeasedMessage(
-                        added_time=time.time(), size=item.byte_size
+                        added_time=now, size=item.byte_size, bucket=bucket
                     )
+                    self._lease_buckets.setdefault(bucket, set()).add(item.ack_id)
                     self._bytes += item.byte_size
                 else:
                     _LOGGER.debug("Message %s is already lease managed", item.ack_id)
@@ -88,8 +119,10 @@ class Leaser(object):
             # Remove the ack ID from lease management, and decrement the
             # byte counter.
             for item in items:
-                if self._leased_messages.pop(item.ack_id, None) is not None:
+                leased_message = self._leased_messages.pop(item.ack_id, None)
+                if leased_message is not None:
                     self._bytes -= item.byte_size
+                    self._discard_from_bucket(item.ack_id, leased_message.bucket)
                 else:
                     _LOGGER.debug("Item %s was not managed.", item.ack_id)
 
@@ -97,12 +130,89 @@ class Leaser(object):
                 _LOGGER.debug("Bytes was unexpectedly negative: %d", self._bytes)
                 self._bytes = 0
 
+    def _discard_from_bucket(self, ack_id, bucket):
+        """Remove an ack ID from its lease bucket, dropping empty buckets.
+
+        .. note::
+            The caller must hold the ``_add_remove_lock``.
+        """
+        ack_ids = self._lease_buckets.get(bucket)
+        if ack_ids is not None:
+            ack_ids.discard(ack_id)
+            if not ack_ids:
+                del self._lease_buckets[bucket]
+
+    def _expired_items(self, cutoff):
+        """Return the messages leased before the given time.
+
+        Args:
+            cutoff (float): The time, in seconds since the epoch.
+
+        Returns:
+            List[~.pubsub_v1.subscriber._protocol.requests.DropRequest]: The
+            messages to drop.
+        """
+        to_drop = []
+        with self._add_remove_lock:
+            # The messages are ordered by the time they were added, only the
+            # oldest ones need to be looked at.
+            for ack_id, item in self._leased_messages.items():
+                if item.added_time >= cutoff:
+                    break
+                to_drop.append(requests.DropRequest(ack_id, item.size))
+        return to_drop
+
+    def _renew_due_leases(self, now, renewal_window, deadline):
+        """Move the leases expiring soon to the bucket of their new deadline.
+
+        Args:
+            now (float): The current time, in seconds since the epoch.
+            renewal_window (float): The leases expiring within this many
+                seconds from now are renewed.
+            deadline (int): The new ack deadline of the renewed leases.
+
+        Returns:
+            Tuple[List[str], Optional[float]]: The ack IDs of the renewed
+            leases, and the time at which the earliest of the remaining
+            leases becomes due for renewal (:data:`None` if there are none).
+        """
+        due_bucket = _bucket_for(now + renewal_window)
+        new_bucket = _bucket_for(now + deadline)
+
+        ack_ids = []
+        with self._add_remove_lock:
+            due_buckets = [
+                bucket for bucket in self._lease_buckets if bucket <= due_bucket
+            ]
+            for bucket in due_buckets:
+                ack_ids.extend(self._lease_buckets.pop(bucket))
+
+            if ack_ids:
+                renewed = self._lease_buckets.setdefault(new_bucket, set())
+                renewed.update(ack_ids)
+                for ack_id in ack_ids:
+                    self._leased_messages[ack_id] = self._leased_messages[
+                        ack_id
+                    ]._replace(bucket=new_bucket)
+
+            if self._lease_buckets:
+                next_due = (
+                    min(self._lease_buckets) * _LEASE_BUCKET_SECONDS - renewal_window
+                )
+            else:
+                next_due = None
+
+        return ack_ids, next_due
+
     def maintain_leases(self):
         """Maintain all of the leases being managed.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        repeats.
+        The leases are grouped in buckets by their expiration time. This
+        method modifies the ack deadline of the ack IDs whose leases are
+        about to expire, sleeps until the next bucket is about to expire
+        (with jitter), and repeats. The leases expiring in the same bucket
+        are thus extended with a single batched request, and the leases far
+        from expiring are not touched.
         """
         while self._manager.is_active and not self._stop_event.is_set():
             # Determine the appropriate duration for the lease. This is
@@ -111,37 +221,26 @@ class Leaser(object):
             p99 = self._manager.ack_histogram.percentile(99)
             _LOGGER.debug("The current p99 value is %d seconds.", p99)
 
-            # Make a copy of the leased messages. This is needed because it's
-            # possible for another thread to modify the dictionary while
-            # we're iterating over it.
-            leased_messages = copy.copy(self._leased_messages)
-
             # Drop any leases that are well beyond max lease time. This
             # ensures that in the event of a badly behaving actor, we can
             # drop messages and allow Pub/Sub to resend them.
             cutoff = time.time() - self._manager.flow_control.max_lease_duration
-            to_drop = [
-                requests.DropRequest(ack_id, item.size)
-                for ack_id, item in six.iteritems(leased_messages)
-                if item.added_time < cutoff
-            ]
+            to_drop = self._expired_items(cutoff)
 
             if to_drop:
                 _LOGGER.warning(
                     "Dropping %s items because they were leased too long.", len(to_drop)
                 )
+                # This calls self.remove(), thus the dropped items are not
+                # renewed below.
                 self._manager.dispatcher.drop(to_drop)
 
-            # Remove dropped items from our copy of the leased messages (they
-            # have already been removed from the real one by
-            # self._manager.drop(), which calls self.remove()).
-            for item in to_drop:
-                leased_messages.pop(item.ack_id)
+            # Renew the leases expiring within half of the lease duration,
+            # which leaves plenty of time for the request to reach the server.
+            now = time.time()
+            renewal_window = p99 / 2.0
+            ack_ids, next_due = self._renew_due_leases(now, renewal_window, p99)
 
-            # Create a streaming pull request.
-            # We do not actually call `modify_ack_deadline` over and over
-            # because it is more efficient to make a single request.
-            ack_ids = leased_messages.keys()
             if ack_ids:
                 _LOGGER.debug("Renewing lease for %d ack IDs.", len(ack_ids))
 
@@ -150,17 +249,17 @@ class Leaser(object):
                 #       without any sort of race condition would require a
                 #       way for ``send_request`` to fail when the consumer
                 #       is inactive.
-                self._manager.dispatcher.modify_ack_deadline(
-                    [requests.ModAckRequest(ack_id, p99) for ack_id in ack_ids]
-                )
+                self._manager.dispatcher.extend_deadlines(ack_ids, p99)
 
-            # Now wait an appropriate period of time and do this again.
+            # Now wait until the next bucket is due, and do this again.
             #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
+            # The use of jitter (http://bit.ly/2s2ekL7) helps decrease
+            # contention in cases where there are many clients. It only ever
+            # shortens the snooze, so that no lease is extended too late.
+            snooze = _MAX_SNOOZE_SECONDS
+            if next_due is not None:
+                snooze = max(min(next_due - now, snooze), _LEASE_BUCKET_SECONDS)
+            snooze *= random.uniform(0.9, 1.0)
             _LOGGER.debug("Snoozing lease management for %f seconds.", snooze)
             self._stop_event.wait(timeout=snooze)
 
@@ -191,3 +290,15 @@ class Leaser(object):
                 self._thread.join()
 
             self._thread = None
+
+
+def _bucket_for(expiration_time):
+    """Return the lease bucket of a lease expiring at the given time.
+
+    Args:
+        expiration_time (float): The time, in seconds since the epoch.
+
+    Returns:
+        int: The lease bucket.
+    """
+    return int(expiration_time // _LEASE_BUCKET_SECONDS)
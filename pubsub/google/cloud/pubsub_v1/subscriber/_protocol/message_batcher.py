@@ -0,0 +1,158 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+
+from google.cloud.pubsub_v1.subscriber import message
+
+
+_LOGGER = logging.getLogger(__name__)
+_BATCHER_WORKER_NAME = "Thread-MessageBatcher"
+
+
+class MessageBatcher(object):
+    """Groups the messages delivered to the user into batches.
+
+    A batch is complete once it holds ``max_messages`` messages, or once
+    adding the next message would exceed ``max_bytes``. An incomplete batch
+    is delivered by a helper thread once it is ``max_latency`` seconds old.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.MessageBatchSettings): The
+            batch settings.
+        deliver (Callable[[~.pubsub_v1.subscriber.message.MessageBatch], Any]):
+            Called with each batch, without any locks held. It should not
+            block.
+    """
+
+    def __init__(self, settings, deliver):
+        self._settings = settings
+        self._deliver = deliver
+
+        self._thread = None
+        self._operational_lock = threading.Lock()
+
+        # Protects the current batch, and signals the helper thread when a
+        # batch is started or when the batcher is stopped.
+        self._batch_changed = threading.Condition()
+        self._batch = message.MessageBatch()
+        self._batch_bytes = 0
+        self._batch_started = None
+        self._stopped = False
+
+    def add(self, messages):
+        """Add messages to the current batch, delivering the complete batches.
+
+        Args:
+            messages (Sequence[~.pubsub_v1.subscriber.message.Message]): The
+                messages, in delivery order.
+        """
+        complete_batches = []
+
+        with self._batch_changed:
+            for msg in messages:
+                size = msg.size
+                if self._batch and self._batch_bytes + size > self._settings.max_bytes:
+                    complete_batches.append(self._take_batch())
+
+                if not self._batch:
+                    self._batch_started = time.time()
+                    self._batch_changed.notify()
+                self._batch.append(msg)
+                self._batch_bytes += size
+
+                if len(self._batch) >= self._settings.max_messages:
+                    complete_batches.append(self._take_batch())
+
+        for batch in complete_batches:
+            self._deliver(batch)
+
+    def _take_batch(self):
+        """Return the current batch, and start a new one.
+
+        .. note::
+            The caller must hold the ``_batch_changed`` condition.
+        """
+        batch = self._batch
+        self._batch = message.MessageBatch()
+        self._batch_bytes = 0
+        self._batch_started = None
+        return batch
+
+    def deliver_incomplete_batches(self):
+        """Deliver the batches once their maximum latency elapses.
+
+        .. note::
+            This blocks; it is run in the helper thread.
+        """
+        while True:
+            with self._batch_changed:
+                while not self._stopped:
+                    if not self._batch:
+                        self._batch_changed.wait()
+                        continue
+
+                    timeout = (
+                        self._batch_started + self._settings.max_latency - time.time()
+                    )
+                    if timeout <= 0:
+                        break
+                    self._batch_changed.wait(timeout)
+
+                if self._stopped:
+                    break
+
+                batch = self._take_batch()
+
+            self._deliver(batch)
+
+        _LOGGER.info("%s exiting.", _BATCHER_WORKER_NAME)
+
+    def start(self):
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError("Message batcher is already running.")
+
+            with self._batch_changed:
+                self._stopped = False
+
+            # Create and start the helper thread.
+            thread = threading.Thread(
+                name=_BATCHER_WORKER_NAME, target=self.deliver_incomplete_batches
+            )
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug("Started helper thread %s", thread.name)
+            self._thread = thread
+
+    def stop(self):
+        """Stop the helper thread.
+
+        The messages of the current batch are not delivered, their leases
+        expire and they are redelivered by the server.
+        """
+        with self._operational_lock:
+            with self._batch_changed:
+                self._stopped = True
+                self._take_batch()
+                self._batch_changed.notify()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
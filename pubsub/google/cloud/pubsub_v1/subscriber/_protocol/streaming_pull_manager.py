@@ -16,6 +16,7 @@ from __future__ import division
 
 import collections
 import functools
+import inspect
 import logging
 import threading
 
@@ -23,6 +24,12 @@ import grpc
 import six
 from six.moves import queue
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    # Python 2.7
+    asyncio = None
+
 from google.api_core import bidi
 from google.api_core import exceptions
 from google.cloud.pubsub_v1 import types
@@ -30,6 +37,7 @@ from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
+from google.cloud.pubsub_v1.subscriber._protocol import message_batcher
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 import google.cloud.pubsub_v1.subscriber.message
 import google.cloud.pubsub_v1.subscriber.scheduler
@@ -63,12 +71,26 @@ def _wrap_callback_errors(callback, on_callback_error, message):
     """Wraps a user callback so that if an exception occurs the message is
     nacked.
 
+    If the callback returns an awaitable, e.g. because it is a coroutine
+    function, the awaitable is scheduled as a task on the current event loop.
+    The message is then nacked if the task fails.
+
     Args:
         callback (Callable[None, Message]): The user callback.
         message (~Message): The Pub/Sub message.
+
+    Returns:
+        Optional[asyncio.Future]: The task running the callback, if the
+        callback returned an awaitable.
     """
     try:
-        callback(message)
+        result = callback(message)
+        if asyncio is not None and inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            task.add_done_callback(
+                functools.partial(_on_callback_task_done, on_callback_error, message)
+            )
+            return task
     except Exception as exc:
         # Note: the likelihood of this failing is extremely low. This just adds
         # a message to a queue, so if this doesn't work the world is in an
@@ -80,6 +102,28 @@ def _wrap_callback_errors(callback, on_callback_error, message):
         on_callback_error(exc)
 
 
+def _on_callback_task_done(on_callback_error, message, task):
+    """Nack the message if the task running an awaitable callback failed.
+
+    Args:
+        on_callback_error (Callable[Exception]): Called with the exception
+            raised by the callback.
+        message (~Message): The Pub/Sub message.
+        task (asyncio.Future): The finished task.
+    """
+    if task.cancelled():
+        return
+
+    exc = task.exception()
+    if exc is not None:
+        _LOGGER.error(
+            "Top-level exception occurred in callback while processing a message",
+            exc_info=exc,
+        )
+        message.nack()
+        on_callback_error(exc)
+
+
 class StreamingPullManager(object):
     """The streaming pull manager coordinates pulling messages from Pub/Sub,
     leasing them, and scheduling them to be processed.
@@ -95,6 +139,10 @@ class StreamingPullManager(object):
         scheduler (~google.cloud.pubsub_v1.scheduler.Scheduler): The scheduler
             to use to process messages. If not provided, a thread pool-based
             scheduler will be used.
+        message_batch_settings (~google.cloud.pubsub_v1.types.MessageBatchSettings):
+            If provided, the callback is called with batches of messages
+            (:class:`~.pubsub_v1.subscriber.message.MessageBatch`) built
+            according to these settings, instead of individual messages.
     """
 
     _UNARY_REQUESTS = True
@@ -102,11 +150,17 @@ class StreamingPullManager(object):
     RPC instead of over the streaming RPC."""
 
     def __init__(
-        self, client, subscription, flow_control=types.FlowControl(), scheduler=None
+        self,
+        client,
+        subscription,
+        flow_control=types.FlowControl(),
+        scheduler=None,
+        message_batch_settings=None,
     ):
         self._client = client
         self._subscription = subscription
         self._flow_control = flow_control
+        self._message_batch_settings = message_batch_settings
         self._ack_histogram = histogram.Histogram()
         self._last_histogram_size = 0
         self._ack_deadline = 10
@@ -144,6 +198,7 @@ class StreamingPullManager(object):
         self._leaser = None
         self._consumer = None
         self._heartbeater = None
+        self._batcher = None
 
     @property
     def is_active(self):
@@ -223,12 +278,26 @@ class StreamingPullManager(object):
         # However, since these messages must still be lease-managed to avoid
         # unnecessary ACK deadline expirations, their count and total size must
         # be subtracted from the leaser's values.
+        return self._load_for(
+            self._leaser.message_count - self._messages_on_hold.qsize(),
+            self._leaser.bytes - self._on_hold_bytes,
+        )
+
+    def _load_for(self, message_count, total_bytes):
+        """Compute the load for the given count and size of delivered messages.
+
+        Args:
+            message_count (int): The number of messages delivered to the user
+                callbacks and not yet acked or nacked.
+            total_bytes (int): The total size of these messages.
+
+        Returns:
+            float: The load value.
+        """
         return max(
             [
-                (self._leaser.message_count - self._messages_on_hold.qsize())
-                / self._flow_control.max_messages,
-                (self._leaser.bytes - self._on_hold_bytes)
-                / self._flow_control.max_bytes,
+                message_count / self._flow_control.max_messages,
+                total_bytes / self._flow_control.max_bytes,
             ]
         )
 
@@ -313,8 +382,34 @@ class StreamingPullManager(object):
                 self._messages_on_hold.qsize(),
                 self._on_hold_bytes,
             )
+            self._schedule_callbacks([msg])
+
+    def _schedule_callbacks(self, messages):
+        """Schedule the user callback for the messages delivered to the user.
+
+        In batch mode the messages are added to the current batch instead, and
+        the callback is scheduled for each complete batch.
+
+        Args:
+            messages (Sequence[~.pubsub_v1.subscriber.message.Message]): The
+                messages, in delivery order.
+        """
+        if self._batcher is not None:
+            self._batcher.add(messages)
+            return
+
+        for msg in messages:
             self._scheduler.schedule(self._callback, msg)
 
+    def _schedule_batch_callback(self, batch):
+        """Schedule the user callback for a complete batch of messages.
+
+        Args:
+            batch (~.pubsub_v1.subscriber.message.MessageBatch): The batch.
+        """
+        _LOGGER.debug("Scheduling callback for a batch of %s messages.", len(batch))
+        self._scheduler.schedule(self._callback, batch)
+
     def _send_unary_request(self, request):
         """Send a request using a separate unary request instead of over the
         stream.
@@ -389,7 +484,7 @@ class StreamingPullManager(object):
         Args:
             callback (Callable[None, google.cloud.pubsub_v1.message.Message]):
                 A callback that will be called for each message received on the
-                stream.
+                stream, or for each batch of messages in batch mode.
             on_callback_error (Callable[Exception]):
                 A callable that will be called if an exception is raised in
                 the provided `callback`.
@@ -430,6 +525,12 @@ class StreamingPullManager(object):
         self._consumer = bidi.BackgroundConsumer(self._rpc, self._on_response)
         self._leaser = leaser.Leaser(self)
         self._heartbeater = heartbeater.Heartbeater(self)
+        if self._message_batch_settings is not None:
+            self._batcher = message_batcher.MessageBatcher(
+                self._message_batch_settings, self._schedule_batch_callback
+            )
+            # Start the thread delivering incomplete batches.
+            self._batcher.start()
 
         # Start the thread to pass the requests.
         self._dispatcher.start()
@@ -464,6 +565,11 @@ class StreamingPullManager(object):
             self._consumer = None
 
             # Shutdown all helper threads
+            if self._batcher is not None:
+                _LOGGER.debug("Stopping message batcher.")
+                self._batcher.stop()
+                self._batcher = None
+
             _LOGGER.debug("Stopping scheduler.")
             self._scheduler.shutdown()
             self._scheduler = None
@@ -559,31 +665,50 @@ class StreamingPullManager(object):
         # Immediately (i.e. without waiting for the auto lease management)
         # modack the messages we received, as this tells the server that we've
         # received them.
+        ack_deadline = self._ack_histogram.percentile(99)
         items = [
-            requests.ModAckRequest(message.ack_id, self._ack_histogram.percentile(99))
+            requests.ModAckRequest(message.ack_id, ack_deadline)
             for message in response.received_messages
         ]
         self._dispatcher.modify_ack_deadline(items)
 
+        messages = [
+            google.cloud.pubsub_v1.subscriber.message.Message(
+                received_message.message, received_message.ack_id, self._scheduler.queue
+            )
+            for received_message in response.received_messages
+        ]
+        lease_requests = [
+            requests.LeaseRequest(ack_id=message.ack_id, byte_size=message.size)
+            for message in messages
+        ]
+
         invoke_callbacks_for = []
 
-        for received_message in response.received_messages:
-            message = google.cloud.pubsub_v1.subscriber.message.Message(
-                received_message.message, received_message.ack_id, self._scheduler.queue
+        # Making decisions based on the load, and modifying the data that
+        # affects the load -> needs a lock, as that state can be modified
+        # by different threads. The whole response is admitted at once: the
+        # load is tracked locally as the messages are delivered, exactly as if
+        # they were added to the leaser one by one, and all of them are then
+        # added to the lease management with a single update.
+        with self._pause_resume_lock:
+            delivered_count = (
+                self._leaser.message_count - self._messages_on_hold.qsize()
             )
-            # Making a decision based on the load, and modifying the data that
-            # affects the load -> needs a lock, as that state can be modified
-            # by different threads.
-            with self._pause_resume_lock:
-                if self.load < _MAX_LOAD:
+            delivered_bytes = self._leaser.bytes - self._on_hold_bytes
+
+            for message in messages:
+                if self._load_for(delivered_count, delivered_bytes) < _MAX_LOAD:
                     invoke_callbacks_for.append(message)
+                    delivered_count += 1
+                    delivered_bytes += message.size
                 else:
                     self._messages_on_hold.put(message)
                     self._on_hold_bytes += message.size
 
-            req = requests.LeaseRequest(ack_id=message.ack_id, byte_size=message.size)
-            self.leaser.add([req])
-            self.maybe_pause_consumer()
+            self._leaser.add(lease_requests)
+
+        self.maybe_pause_consumer()
 
         _LOGGER.debug(
             "Scheduling callbacks for %s new messages, new total on hold %s (bytes %s).",
@@ -591,8 +716,7 @@ class StreamingPullManager(object):
             self._messages_on_hold.qsize(),
             self._on_hold_bytes,
         )
-        for msg in invoke_callbacks_for:
-            self._scheduler.schedule(self._callback, msg)
+        self._schedule_callbacks(invoke_callbacks_for)
 
     def _should_recover(self, exception):
         """Determine if an error on the RPC stream should be recovered.
@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 
+import inspect
 import os
 import pkg_resources
 
@@ -28,6 +29,7 @@ from google.cloud.pubsub_v1.gapic import subscriber_client
 from google.cloud.pubsub_v1.gapic.transports import subscriber_grpc_transport
 from google.cloud.pubsub_v1.subscriber import futures
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+import google.cloud.pubsub_v1.subscriber.scheduler
 
 
 __version__ = pkg_resources.get_distribution("google-cloud-pubsub").version
@@ -39,6 +41,33 @@ _BLACKLISTED_METHODS = (
 )
 
 
+def _is_coroutine_function(callback):
+    """Tell whether calling ``callback`` returns a coroutine."""
+    iscoroutinefunction = getattr(inspect, "iscoroutinefunction", None)
+    if iscoroutinefunction is None:  # pragma: NO COVER
+        # Python 2.7
+        return False
+    return iscoroutinefunction(callback) or iscoroutinefunction(
+        getattr(callback, "__call__", None)
+    )
+
+
+def _verify_callback_scheduler(callback, scheduler):
+    """Check that the scheduler can run the callback.
+
+    Raises:
+        TypeError: If ``callback`` is a coroutine function, but ``scheduler``
+            does not run the callbacks in an event loop.
+    """
+    if _is_coroutine_function(callback) and not isinstance(
+        scheduler, google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler
+    ):
+        raise TypeError(
+            "The callback is a coroutine function, which requires an "
+            "AsyncioScheduler: use subscribe_async() instead."
+        )
+
+
 @_gapic.add_methods(subscriber_client.SubscriberClient, blacklist=_BLACKLISTED_METHODS)
 class Client(object):
     """A subscriber client for Google Cloud Pub/Sub.
@@ -216,7 +245,13 @@ class Client(object):
         Returns:
             A :class:`~google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture`
             instance that can be used to manage the background stream.
+
+        Raises:
+            TypeError: If ``callback`` is a coroutine function, and
+                ``scheduler`` is not an
+                :class:`~google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler`.
         """
+        _verify_callback_scheduler(callback, scheduler)
         flow_control = types.FlowControl(*flow_control)
 
         manager = streaming_pull_manager.StreamingPullManager(
@@ -228,3 +263,167 @@ class Client(object):
         manager.open(callback=callback, on_callback_error=future.set_exception)
 
         return future
+
+    def subscribe_batches(
+        self, subscription, callback, flow_control=(), batch_settings=(), scheduler=None
+    ):
+        """Asynchronously start receiving batches of messages on a subscription.
+
+        This is like :meth:`subscribe`, but the ``callback`` is called with a
+        :class:`~google.cloud.pubsub_v1.subscriber.message.MessageBatch`, a
+        list of messages, instead of individual messages. This is useful to
+        process the messages in bulk, e.g. to write them to a database.
+
+        A batch is delivered once it holds ``batch_settings.max_messages``
+        messages, once it would exceed ``batch_settings.max_bytes`` with the
+        next message, or once it is ``batch_settings.max_latency`` seconds
+        old. Note that the messages of the batches count towards the
+        ``flow_control`` limits until they are acked or nacked, so batches
+        can never be larger than ``flow_control.max_messages``.
+
+        The whole batch can be acked or nacked at once, which is cheaper than
+        doing so for each message. If an exception occurs in the callback, the
+        exception is logged and the whole batch is ``nack()`` ed.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud import pubsub_v1
+
+            subscriber_client = pubsub_v1.SubscriberClient()
+
+            # existing subscription
+            subscription = subscriber_client.subscription_path(
+                'my-project-id', 'my-subscription')
+
+            def callback(batch):
+                insert_rows([message.data for message in batch])
+                batch.ack()
+
+            future = subscriber_client.subscribe_batches(
+                subscription, callback,
+                batch_settings=pubsub_v1.types.MessageBatchSettings(
+                    max_messages=500, max_latency=1.0))
+
+            try:
+                future.result()
+            except KeyboardInterrupt:
+                future.cancel()
+
+        Args:
+            subscription (str): The name of the subscription. The
+                subscription should have already been created (for example,
+                by using :meth:`create_subscription`).
+            callback (Callable[~google.cloud.pubsub_v1.subscriber.message.MessageBatch]):
+                The callback function. This function receives a batch of
+                messages as its only argument and will be called from a
+                different thread/process depending on the scheduling strategy.
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow control
+                settings. Use this to prevent situations where you are
+                inundated with too many messages at once.
+            batch_settings (~google.cloud.pubsub_v1.types.MessageBatchSettings):
+                The settings bounding the size and the latency of the batches.
+            scheduler (~google.cloud.pubsub_v1.subscriber.scheduler.Scheduler): An optional
+                *scheduler* to use when executing the callback. This controls
+                how callbacks are executed concurrently.
+
+        Returns:
+            A :class:`~google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture`
+            instance that can be used to manage the background stream.
+
+        Raises:
+            TypeError: If ``callback`` is a coroutine function, and
+                ``scheduler`` is not an
+                :class:`~google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler`.
+        """
+        _verify_callback_scheduler(callback, scheduler)
+        flow_control = types.FlowControl(*flow_control)
+        batch_settings = types.MessageBatchSettings(*batch_settings)
+
+        manager = streaming_pull_manager.StreamingPullManager(
+            self,
+            subscription,
+            flow_control=flow_control,
+            scheduler=scheduler,
+            message_batch_settings=batch_settings,
+        )
+
+        future = futures.StreamingPullFuture(manager)
+
+        manager.open(callback=callback, on_callback_error=future.set_exception)
+
+        return future
+
+    def subscribe_async(self, subscription, callback, flow_control=(), loop=None):
+        """Start receiving messages on a given subscription in an event loop.
+
+        This is like :meth:`subscribe`, but the messages are processed in an
+        asyncio event loop by an
+        :class:`~google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler`.
+        The ``callback`` is typically a coroutine function, and is awaited in a
+        task for each message, so that thousands of messages may be processed
+        concurrently in a single thread. The number of messages being
+        processed is bounded by the ``flow_control`` settings.
+
+        Acks and nacks are sent to the backend in batches from a background
+        thread, as with :meth:`subscribe`. If the callback raises an
+        exception, the message is ``nack()`` ed.
+
+        Requires Python 3.5 or newer.
+
+        Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from google.cloud import pubsub_v1
+
+            subscriber_client = pubsub_v1.SubscriberClient()
+
+            # existing subscription
+            subscription = subscriber_client.subscription_path(
+                'my-project-id', 'my-subscription')
+
+            async def callback(message):
+                await process(message.data)
+                message.ack()
+
+            async def main():
+                future = subscriber_client.subscribe_async(
+                    subscription, callback,
+                    flow_control=pubsub_v1.types.FlowControl(max_messages=5000))
+                try:
+                    await asyncio.get_event_loop().run_in_executor(
+                        None, future.result)
+                except asyncio.CancelledError:
+                    future.cancel()
+
+            asyncio.get_event_loop().run_until_complete(main())
+
+        Args:
+            subscription (str): The name of the subscription. The
+                subscription should have already been created (for example,
+                by using :meth:`create_subscription`).
+            callback (Callable[~google.cloud.pubsub_v1.subscriber.message.Message]):
+                The callback function. This function receives the message as
+                its only argument, is called in the event loop thread, and
+                may return an awaitable.
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow control
+                settings. Use this to prevent situations where you are
+                inundated with too many messages at once.
+            loop (asyncio.AbstractEventLoop): An optional event loop to process
+                the messages in. If not specified, the current event loop is
+                used.
+
+        Returns:
+            A :class:`~google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture`
+            instance that can be used to manage the background stream.
+        """
+        scheduler = google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler(
+            loop=loop
+        )
+        return self.subscribe(
+            subscription, callback, flow_control=flow_control, scheduler=scheduler
+        )
@@ -176,11 +176,17 @@ class Message(object):
             ensure that your processing code is idempotent, as you may
             receive any given message more than once.
         """
+        self._request_queue.put(self._ack_request())
+
+    def _ack_request(self):
+        """Create the request acknowledging this message.
+
+        Returns:
+            ~.pubsub_v1.subscriber._protocol.requests.AckRequest: The request.
+        """
         time_to_ack = math.ceil(time.time() - self._received_timestamp)
-        self._request_queue.put(
-            requests.AckRequest(
-                ack_id=self._ack_id, byte_size=self.size, time_to_ack=time_to_ack
-            )
+        return requests.AckRequest(
+            ack_id=self._ack_id, byte_size=self.size, time_to_ack=time_to_ack
         )
 
     def drop(self):
@@ -224,6 +230,47 @@ class Message(object):
 
         This will cause the message to be re-delivered to the subscription.
         """
-        self._request_queue.put(
-            requests.NackRequest(ack_id=self._ack_id, byte_size=self.size)
-        )
+        self._request_queue.put(self._nack_request())
+
+    def _nack_request(self):
+        """Create the request declining to acknowledge this message.
+
+        Returns:
+            ~.pubsub_v1.subscriber._protocol.requests.NackRequest: The request.
+        """
+        return requests.NackRequest(ack_id=self._ack_id, byte_size=self.size)
+
+
+class MessageBatch(list):
+    """A list of messages delivered together to a subscriber batch callback.
+
+    All the messages of a batch can be acknowledged (or not) at once with
+    :meth:`ack` and :meth:`nack`, which is cheaper than doing so for each
+    message. Individual messages can still be acked or nacked on their own.
+
+    The messages of a batch must all be received on the same subscription.
+    """
+
+    @property
+    def size(self):
+        """int: The total size of the messages in the batch, in bytes."""
+        return sum(message.size for message in self)
+
+    def ack(self):
+        """Acknowledge all the messages of the batch.
+
+        See :meth:`Message.ack`.
+        """
+        self._put_requests([message._ack_request() for message in self])
+
+    def nack(self):
+        """Decline to acknowledge all the messages of the batch.
+
+        See :meth:`Message.nack`.
+        """
+        self._put_requests([message._nack_request() for message in self])
+
+    def _put_requests(self, items):
+        # The requests are queued as a single item, the dispatcher unpacks it.
+        if items:
+            self[0]._request_queue.put(items)
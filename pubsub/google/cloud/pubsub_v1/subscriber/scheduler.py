@@ -20,11 +20,19 @@ each message.
 
 import abc
 import concurrent.futures
+import functools
+import inspect
 import sys
 
 import six
 from six.moves import queue
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    # Python 2.7
+    asyncio = None
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Scheduler(object):
@@ -121,3 +129,102 @@ class ThreadScheduler(Scheduler):
         except queue.Empty:
             pass
         self._executor.shutdown()
+
+
+class AsyncioScheduler(Scheduler):
+    """An asyncio event loop-based scheduler.
+
+    The callbacks are called in the thread running the event loop. If a
+    callback returns an awaitable, e.g. because it is a coroutine function,
+    the awaitable is run as a task on the event loop. This allows processing
+    a large number of messages with I/O-bound callbacks concurrently, without
+    a thread per message. The number of messages processed at the same time is
+    still bounded by the subscriber's flow control settings.
+
+    Requires Python 3.5 or newer.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): An optional event loop to run the
+            callbacks in. If not specified, the current event loop is used.
+            The loop must be running for the callbacks to be called.
+    """
+
+    def __init__(self, loop=None):
+        if asyncio is None:
+            raise RuntimeError("The asyncio scheduler requires Python 3.5+.")
+
+        self._queue = queue.Queue()
+        if loop is None:
+            self._loop = asyncio.get_event_loop()
+        else:
+            self._loop = loop
+
+        # The tasks running the awaitable callbacks. Only accessed in the event
+        # loop thread.
+        self._tasks = set()
+        self._is_shutdown = False
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    @property
+    def loop(self):
+        """asyncio.AbstractEventLoop: The event loop running the callbacks."""
+        return self._loop
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called in the event loop.
+
+        This method is thread-safe, and does not block.
+
+        Args:
+            callback (Callable): The function to call. It may return an
+                awaitable, which is then awaited in a task.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        self._loop.call_soon_threadsafe(
+            functools.partial(self._run, callback, *args, **kwargs)
+        )
+
+    def _run(self, callback, *args, **kwargs):
+        """Call the callback and keep track of the task awaiting its result.
+
+        .. note::
+            This is run in the event loop thread.
+        """
+        if self._is_shutdown:
+            return
+
+        result = callback(*args, **kwargs)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result, loop=self._loop)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _cancel_tasks(self):
+        """Cancel the tasks of the callbacks still running.
+
+        .. note::
+            This is run in the event loop thread.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+
+        The callbacks not yet called are dropped, and the tasks of the
+        awaitable callbacks still running are cancelled. This method is
+        thread-safe, and does not block.
+        """
+        self._is_shutdown = True
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
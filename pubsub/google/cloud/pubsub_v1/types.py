@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 import collections
+import enum
 import sys
 
 from google.api import http_pb2
@@ -62,6 +63,68 @@ if sys.version_info >= (3, 5):
     )
 
 
+class LimitExceededBehavior(str, enum.Enum):
+    """The possible actions when exceeding the publish flow control limits."""
+
+    IGNORE = "ignore"
+    BLOCK = "block"
+    ERROR = "error"
+
+
+# Define the type class and default values for publisher flow control.
+#
+# This class is used when creating a publisher client, and these settings
+# can be altered to bound the memory used by messages waiting to be published.
+PublishFlowControl = collections.namedtuple(
+    "PublishFlowControl", ["message_limit", "byte_limit", "limit_exceeded_behavior"]
+)
+PublishFlowControl.__new__.__defaults__ = (
+    1000,  # message_limit: 1000
+    10 * 1000 * 1000,  # byte_limit: 10 MB
+    LimitExceededBehavior.IGNORE,  # limit_exceeded_behavior: IGNORE
+)
+
+if sys.version_info >= (3, 5):
+    PublishFlowControl.__doc__ = (
+        "The client flow control settings for message publishing."
+    )
+    PublishFlowControl.message_limit.__doc__ = (
+        "The maximum number of messages awaiting to be published."
+    )
+    PublishFlowControl.byte_limit.__doc__ = (
+        "The maximum total size of messages awaiting to be published."
+    )
+    PublishFlowControl.limit_exceeded_behavior.__doc__ = (
+        "The action to take when publish flow control limits are exceeded."
+    )
+
+
+# Define the type class and default values for publisher options.
+#
+# This class is used when creating a publisher client to pass in options
+# to enable/disable features.
+PublisherOptions = collections.namedtuple(
+    "PublisherOptions", ["flow_control", "enable_message_ordering"]
+)
+PublisherOptions.__new__.__defaults__ = (
+    PublishFlowControl(),  # flow_control: default flow control settings
+    False,  # enable_message_ordering: False
+)
+
+if sys.version_info >= (3, 5):
+    PublisherOptions.__doc__ = "The options for the publisher client."
+    PublisherOptions.flow_control.__doc__ = (
+        "Flow control settings for message publishing by the client. By default "
+        "the publisher client does not do any throttling."
+    )
+    PublisherOptions.enable_message_ordering.__doc__ = (
+        "Whether to order messages in a batch by a supplied ordering key. "
+        "EXPERIMENTAL: Message ordering is an alpha feature that requires "
+        "special permissions to use. Please contact the Cloud Pub/Sub team for "
+        "more information."
+    )
+
+
 # Define the type class and default values for flow control settings.
 #
 # This class is used when creating a publisher or subscriber client, and
@@ -95,6 +158,38 @@ if sys.version_info >= (3, 5):
     )
 
 
+# Define the type class and default values for subscriber message batches.
+#
+# This class is used when subscribing with a callback receiving batches of
+# messages instead of individual messages.
+MessageBatchSettings = collections.namedtuple(
+    "MessageBatchSettings", ["max_messages", "max_bytes", "max_latency"]
+)
+MessageBatchSettings.__new__.__defaults__ = (
+    100,  # max_messages: 100
+    1 * 1000 * 1000,  # max_bytes: 1 MB
+    0.1,  # max_latency: 100 ms
+)
+
+if sys.version_info >= (3, 5):
+    MessageBatchSettings.__doc__ = (
+        "The settings for batching received messages before passing them to "
+        "a subscriber batch callback."
+    )
+    MessageBatchSettings.max_messages.__doc__ = (
+        "The maximum number of messages in a batch. Batches are only this "
+        "large if the flow control settings allow for as many messages."
+    )
+    MessageBatchSettings.max_bytes.__doc__ = (
+        "The maximum total size of the messages in a batch. A single message "
+        "larger than this is delivered in a batch of its own."
+    )
+    MessageBatchSettings.max_latency.__doc__ = (
+        "The maximum number of seconds to wait for more messages before "
+        "delivering an incomplete batch."
+    )
+
+
 _shared_modules = [
     http_pb2,
     iam_policy_pb2,
@@ -110,7 +205,14 @@ _shared_modules = [
 _local_modules = [pubsub_pb2]
 
 
-names = ["BatchSettings", "FlowControl"]
+names = [
+    "BatchSettings",
+    "FlowControl",
+    "LimitExceededBehavior",
+    "MessageBatchSettings",
+    "PublishFlowControl",
+    "PublisherOptions",
+]
 
 
 for module in _shared_modules:
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import random
 import threading
 import time
 
@@ -24,6 +25,7 @@ from google.auth import credentials
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchCancellationReason
 from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
 from google.cloud.pubsub_v1.publisher._batch import thread
 from google.cloud.pubsub_v1.publisher._batch.thread import Batch
@@ -55,25 +57,30 @@ def create_batch(autocommit=False, topic="topic_name", **batch_settings):
 
 
 def test_init():
-    """Establish that a monitor thread is usually created on init."""
+    """Establish that a commit deadline is usually scheduled on init."""
     client = create_client()
 
-    # Do not actually create a thread, but do verify that one was created;
-    # it should be running the batch's "monitor" method (which commits the
-    # batch once time elapses).
-    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+    # Do not actually schedule the deadline, but do verify that one was
+    # scheduled; it should call the batch's "commit" method once the max
+    # latency elapses.
+    with mock.patch.object(
+        client.commit_scheduler, "schedule_deadline", autospec=True
+    ) as schedule_deadline:
         batch = Batch(client, "topic_name", types.BatchSettings())
-        Thread.assert_called_once_with(
-            name="Thread-MonitorBatchPublisher", target=batch.monitor
-        )
+        schedule_deadline.assert_called_once_with(0.01, batch.commit)
 
     # New batches start able to accept messages by default.
     assert batch.status == BatchStatus.ACCEPTING_MESSAGES
 
 
 def test_init_infinite_latency():
-    batch = create_batch(max_latency=float("inf"))
-    assert batch._thread is None
+    client = create_client()
+    with mock.patch.object(
+        client.commit_scheduler, "schedule_deadline", autospec=True
+    ) as schedule_deadline:
+        Batch(client, "topic_name", types.BatchSettings(max_latency=float("inf")))
+
+    schedule_deadline.assert_not_called()
 
 
 @mock.patch.object(threading, "Lock")
@@ -92,14 +99,13 @@ def test_client():
 
 def test_commit():
     batch = create_batch()
-    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+    with mock.patch.object(
+        batch.client.commit_scheduler, "schedule_commit", autospec=True
+    ) as schedule_commit:
         batch.commit()
 
-        # A thread should have been created to do the actual commit.
-        Thread.assert_called_once_with(
-            name="Thread-CommitBatchPublisher", target=batch._commit
-        )
-        Thread.return_value.start.assert_called_once_with()
+    # The commit scheduler should have been asked to do the actual commit.
+    schedule_commit.assert_called_once_with(batch._commit)
 
     # The batch's status needs to be something other than "accepting messages",
     # since the commit started.
@@ -110,11 +116,13 @@ def test_commit():
 def test_commit_no_op():
     batch = create_batch()
     batch._status = BatchStatus.IN_PROGRESS
-    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+    with mock.patch.object(
+        batch.client.commit_scheduler, "schedule_commit", autospec=True
+    ) as schedule_commit:
         batch.commit()
 
-    # Make sure a thread was not created.
-    Thread.assert_not_called()
+    # Make sure a commit was not scheduled.
+    schedule_commit.assert_not_called()
 
     # Check that batch status is unchanged.
     assert batch.status == BatchStatus.IN_PROGRESS
@@ -273,34 +281,6 @@ def test_block__commmit_retry_error():
         assert future.exception() == error
 
 
-def test_monitor():
-    batch = create_batch(max_latency=5.0)
-    with mock.patch.object(time, "sleep") as sleep:
-        with mock.patch.object(type(batch), "_commit") as _commit:
-            batch.monitor()
-
-    # The monitor should have waited the given latency.
-    sleep.assert_called_once_with(5.0)
-
-    # Since `monitor` runs in its own thread, it should call
-    # the blocking commit implementation.
-    _commit.assert_called_once_with()
-
-
-def test_monitor_already_committed():
-    batch = create_batch(max_latency=5.0)
-    status = "something else"
-    batch._status = status
-    with mock.patch.object(time, "sleep") as sleep:
-        batch.monitor()
-
-    # The monitor should have waited the given latency.
-    sleep.assert_called_once_with(5.0)
-
-    # The status should not have changed.
-    assert batch._status == status
-
-
 def test_publish_updating_batch_size():
     batch = create_batch(topic="topic_foo")
     messages = (
@@ -419,3 +399,114 @@ def test_publish_dict():
     )
     assert batch.messages == [expected_message]
     assert batch._futures == [future]
+
+
+def test_publish_full_without_commit_when_full():
+    client = create_client()
+    batch = Batch(
+        client,
+        "topic_name",
+        types.BatchSettings(max_messages=2),
+        autocommit=False,
+        commit_when_full=False,
+    )
+
+    with mock.patch.object(batch, "commit") as commit:
+        assert batch.publish({"data": b"foo"}) is not None
+        assert batch.publish({"data": b"bar"}) is None
+
+    commit.assert_not_called()
+
+
+def test_batch_done_callback_called_on_success():
+    batch_done_callback = mock.Mock(spec=())
+    batch = Batch(
+        create_client(),
+        "topic_name",
+        types.BatchSettings(),
+        autocommit=False,
+        batch_done_callback=batch_done_callback,
+    )
+    batch.publish({"data": b"foo"})
+
+    publish_response = types.PublishResponse(message_ids=["a"])
+    with mock.patch.object(
+        type(batch.client.api), "publish", return_value=publish_response
+    ):
+        batch._commit()
+
+    batch_done_callback.assert_called_once_with(True)
+
+
+def test_batch_done_callback_called_on_error():
+    batch_done_callback = mock.Mock(spec=())
+    batch = Batch(
+        create_client(),
+        "topic_name",
+        types.BatchSettings(),
+        autocommit=False,
+        batch_done_callback=batch_done_callback,
+    )
+    batch.publish({"data": b"foo"})
+
+    error = google.api_core.exceptions.InternalServerError("uh oh")
+    with mock.patch.object(type(batch.client.api), "publish", side_effect=error):
+        batch._commit()
+
+    batch_done_callback.assert_called_once_with(False)
+
+
+def test_cancel():
+    batch = create_batch()
+    futures = (batch.publish({"data": b"foo"}), batch.publish({"data": b"bar"}))
+
+    batch.cancel(BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED)
+
+    assert batch.status == BatchStatus.ERROR
+    for future in futures:
+        exc = future.exception()
+        assert isinstance(exc, RuntimeError)
+        assert str(exc) == BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED
+
+
+def test_cancel_already_committed():
+    batch = create_batch()
+    batch._status = BatchStatus.IN_PROGRESS
+
+    with pytest.raises(RuntimeError):
+        batch.cancel(BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED)
+
+
+def _random_text(rng, max_length):
+    # Mix ASCII with multi-byte code points to exercise the UTF-8 lengths.
+    alphabet = u"abcXYZ019 éß中文\U0001f600"
+    return u"".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+
+
+def test_publish_request_size_increase_matches_wire_format():
+    rng = random.Random(1234)
+    # Lengths around the varint boundaries at 2**7 and 2**14 bytes.
+    data_lengths = (0, 1, 126, 127, 128, 129, 16383, 16384, 16385, 200000)
+
+    for _ in range(300):
+        attributes = {
+            _random_text(rng, 20): _random_text(rng, rng.choice((5, 50, 150)))
+            for _ in range(rng.randint(0, 6))
+        }
+        message = types.PubsubMessage(
+            data=b"x" * rng.choice(data_lengths),
+            attributes=attributes,
+            ordering_key=_random_text(rng, rng.choice((0, 10, 200))),
+        )
+
+        expected = types.PublishRequest(messages=[message]).ByteSize()
+        assert thread._publish_request_size_increase(message) == expected
+
+
+def test_publish_request_size_increase_server_assigned_fields():
+    message = types.PubsubMessage(
+        data=b"foo", message_id="1234", publish_time={"seconds": 1335020400}
+    )
+
+    expected = types.PublishRequest(messages=[message]).ByteSize()
+    assert thread._publish_request_size_increase(message) == expected
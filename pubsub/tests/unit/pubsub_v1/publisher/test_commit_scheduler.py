@@ -0,0 +1,196 @@
+# Copyright 2019, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+
+import mock
+
+from google.cloud.pubsub_v1.publisher import scheduler
+
+
+def test_subclasses_base_abc():
+    assert issubclass(scheduler.ThreadPoolCommitScheduler, scheduler.CommitScheduler)
+
+
+def test_constructor_defaults():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+
+    assert isinstance(scheduler_._executor, concurrent.futures.ThreadPoolExecutor)
+    assert scheduler_._executor._max_workers == 10
+    assert scheduler_._timer_thread is None
+
+
+def test_constructor_options():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler(executor=mock.sentinel.executor)
+
+    assert scheduler_._executor == mock.sentinel.executor
+
+
+def test_constructor_max_concurrent_commits():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler(max_concurrent_commits=3)
+
+    assert scheduler_._executor._max_workers == 3
+
+
+def test_schedule_commit_bounded_concurrency():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler(max_concurrent_commits=2)
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def commit():
+        started.release()
+        release.wait()
+
+    for _ in range(5):
+        scheduler_.schedule_commit(commit)
+
+    assert started.acquire(timeout=1.0)
+    assert started.acquire(timeout=1.0)
+
+    stats = scheduler_.stats
+    assert stats.in_flight == 2
+    assert stats.queue_depth == 3
+
+    release.set()
+    scheduler_.shutdown()
+    scheduler_._executor.shutdown(wait=True)
+
+    stats = scheduler_.stats
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+    assert stats.committed == 5
+    assert stats.max_commit_latency >= stats.mean_commit_latency > 0
+
+
+def test_schedule_commit_error_is_logged():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+    commit = mock.Mock(side_effect=ValueError("nope"))
+
+    with mock.patch.object(scheduler, "_LOGGER") as _LOGGER:
+        scheduler_.schedule_commit(commit)
+        scheduler_.shutdown()
+        scheduler_._executor.shutdown(wait=True)
+
+    commit.assert_called_once_with()
+    _LOGGER.exception.assert_called_once()
+    assert scheduler_.stats.committed == 1
+
+
+def test_schedule_commit_executor_shut_down_commits_in_place():
+    executor = mock.create_autospec(concurrent.futures.Executor, instance=True)
+    executor.submit.side_effect = RuntimeError("cannot schedule new futures")
+    scheduler_ = scheduler.ThreadPoolCommitScheduler(executor=executor)
+    commit = mock.Mock(spec=())
+
+    scheduler_.schedule_commit(commit)
+
+    commit.assert_called_once_with()
+    assert scheduler_.stats.queue_depth == 0
+    assert scheduler_.stats.committed == 1
+
+
+def test_shutdown_leaves_executor_passed_in_running():
+    executor = mock.create_autospec(concurrent.futures.Executor, instance=True)
+    scheduler_ = scheduler.ThreadPoolCommitScheduler(executor=executor)
+
+    scheduler_.shutdown()
+
+    executor.shutdown.assert_not_called()
+
+
+def test_shutdown_shuts_down_own_executor():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+
+    with mock.patch.object(scheduler_._executor, "shutdown") as shutdown:
+        scheduler_.shutdown()
+
+    shutdown.assert_called_once_with(wait=False)
+
+
+def test_schedule_deadline_single_timer_thread():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+    called = []
+    done = threading.Event()
+
+    def make_callback(name):
+        def callback():
+            called.append(name)
+            if len(called) == 3:
+                done.set()
+
+        return callback
+
+    scheduler_.schedule_deadline(0.2, make_callback("third"))
+    timer_thread = scheduler_._timer_thread
+    scheduler_.schedule_deadline(0.0, make_callback("first"))
+    scheduler_.schedule_deadline(0.1, make_callback("second"))
+
+    assert done.wait(timeout=1.0)
+    assert called == ["first", "second", "third"]
+    assert scheduler_._timer_thread is timer_thread
+
+    scheduler_.shutdown()
+    timer_thread.join(timeout=1.0)
+    assert not timer_thread.is_alive()
+
+
+def test_schedule_deadline_timer_thread_exits_when_idle():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+    first_done = threading.Event()
+    second_done = threading.Event()
+
+    scheduler_.schedule_deadline(0.0, first_done.set)
+    first_thread = scheduler_._timer_thread
+    # Not a daemon, so that pending deadlines delay the interpreter exit.
+    assert not first_thread.daemon
+
+    assert first_done.wait(timeout=1.0)
+    first_thread.join(timeout=1.0)
+    assert not first_thread.is_alive()
+
+    # A new deadline starts a new timer thread.
+    scheduler_.schedule_deadline(0.0, second_done.set)
+    assert scheduler_._timer_thread is not first_thread
+    assert second_done.wait(timeout=1.0)
+    scheduler_.shutdown()
+
+
+def test_schedule_deadline_error_is_logged():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+    done = threading.Event()
+
+    with mock.patch.object(scheduler, "_LOGGER") as _LOGGER:
+        scheduler_.schedule_deadline(0.0, mock.Mock(side_effect=ValueError("nope")))
+        scheduler_.schedule_deadline(0.0, done.set)
+        assert done.wait(timeout=1.0)
+
+    _LOGGER.exception.assert_called_once()
+    scheduler_.shutdown()
+
+
+def test_shutdown_drops_pending_deadlines():
+    scheduler_ = scheduler.ThreadPoolCommitScheduler()
+    callback = mock.Mock(spec=())
+
+    scheduler_.schedule_deadline(60.0, callback)
+    scheduler_.shutdown()
+    scheduler_._timer_thread.join(timeout=1.0)
+
+    assert not scheduler_._timer_thread.is_alive()
+    callback.assert_not_called()
+
+    # Deadlines scheduled after the shutdown are ignored.
+    scheduler_.schedule_deadline(0.0, callback)
+    assert scheduler_._deadlines == []
@@ -0,0 +1,259 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.flow_controller import FlowController
+
+
+def _run_in_daemon(flow_controller, action, messages, all_done_event):
+    def run_me():
+        for msg in messages:
+            if action == "add":
+                flow_controller.add(msg)
+            else:
+                flow_controller.release(msg)
+        all_done_event.set()
+
+    thread = threading.Thread(target=run_me)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def test_no_overflow_no_error():
+    settings = types.PublishFlowControl(
+        message_limit=100,
+        byte_limit=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    # there should be no errors
+    for data in (b"foo", b"bar", b"baz"):
+        msg = types.PubsubMessage(data=data)
+        flow_controller.add(msg)
+
+    assert flow_controller.message_count == 3
+
+
+def test_overflow_no_error_on_ignore():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=2,
+        limit_exceeded_behavior=types.LimitExceededBehavior.IGNORE,
+    )
+    flow_controller = FlowController(settings)
+
+    # there should be no overflow errors
+    flow_controller.add(types.PubsubMessage(data=b"foo"))
+    flow_controller.add(types.PubsubMessage(data=b"bar"))
+
+    assert flow_controller.message_count == 0
+
+
+def test_message_count_overflow_error():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    flow_controller.add(types.PubsubMessage(data=b"foo"))
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        flow_controller.add(types.PubsubMessage(data=b"bar"))
+
+    assert "messages" in str(error.value)
+    assert flow_controller.message_count == 1
+
+
+def test_byte_size_overflow_error():
+    settings = types.PublishFlowControl(
+        message_limit=10000,
+        byte_limit=199,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    # Since the message data itself occupies 100 bytes, it means that both
+    # messages combined will exceed the imposed byte limit of 199, but a single
+    # message will not (the message size overhead is way lower than data size).
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+
+    flow_controller.add(msg1)
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        flow_controller.add(msg2)
+
+    assert "bytes" in str(error.value)
+    assert flow_controller.total_bytes == msg1.ByteSize()
+
+
+def test_single_message_larger_than_byte_limit_admitted_when_empty():
+    settings = types.PublishFlowControl(
+        message_limit=10,
+        byte_limit=10,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    msg = types.PubsubMessage(data=b"x" * 100)
+    flow_controller.add(msg)
+
+    assert flow_controller.total_bytes == msg.ByteSize()
+
+
+def test_no_error_on_moderate_message_flow():
+    settings = types.PublishFlowControl(
+        message_limit=2,
+        byte_limit=250,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+    msg3 = types.PubsubMessage(data=b"z" * 100)
+
+    # The flow control settings will accept two in-flight messages, but not three.
+    # If releasing messages works correctly, the sequence below will not raise errors.
+    flow_controller.add(msg1)
+    flow_controller.add(msg2)
+    flow_controller.release(msg1)
+    flow_controller.add(msg3)
+    flow_controller.release(msg2)
+    flow_controller.release(msg3)
+
+    assert flow_controller.message_count == 0
+    assert flow_controller.total_bytes == 0
+
+
+def test_rejected_messages_do_not_increase_total_load():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=150,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+
+    flow_controller.add(msg1)
+
+    for _ in range(5):
+        with pytest.raises(exceptions.FlowControlLimitError):
+            flow_controller.add(types.PubsubMessage(data=b"z" * 100))
+
+    # After releasing a message we should again be able to add another one,
+    # despite previously trying to add a lot of other messages.
+    flow_controller.release(msg1)
+    flow_controller.add(msg2)
+
+
+def test_incorrectly_releasing_too_many_messages():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=150,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+    msg3 = types.PubsubMessage(data=b"z" * 100)
+
+    # Releasing a message that would make the load negative should result in
+    # a warning, and the counters should be clamped at zero.
+    flow_controller.release(msg1)
+
+    assert flow_controller.message_count == 0
+    assert flow_controller.total_bytes == 0
+
+    # Adding a message should still be possible, and so should be releasing it.
+    flow_controller.add(msg2)
+    with pytest.raises(exceptions.FlowControlLimitError):
+        flow_controller.add(msg3)
+
+    flow_controller.release(msg2)
+    flow_controller.add(msg3)
+
+
+def test_blocking_on_overflow_until_free_capacity():
+    settings = types.PublishFlowControl(
+        message_limit=1,
+        byte_limit=150,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+
+    flow_controller.add(msg1)
+
+    # Adding another message must block until the first one is released.
+    adding_done = threading.Event()
+    _run_in_daemon(flow_controller, "add", [msg2], adding_done)
+    assert not adding_done.wait(timeout=0.1)
+
+    releasing_done = threading.Event()
+    _run_in_daemon(flow_controller, "release", [msg1], releasing_done)
+    assert releasing_done.wait(timeout=1.0)
+    assert adding_done.wait(timeout=1.0)
+
+    assert flow_controller.message_count == 1
+    assert flow_controller.total_bytes == msg2.ByteSize()
+
+
+def test_blocked_messages_are_admitted_in_order():
+    settings = types.PublishFlowControl(
+        message_limit=10,
+        byte_limit=150,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    big_msg = types.PubsubMessage(data=b"y" * 140)
+    small_msg = types.PubsubMessage(data=b"z" * 10)
+
+    flow_controller.add(msg1)
+
+    big_done = threading.Event()
+    _run_in_daemon(flow_controller, "add", [big_msg], big_done)
+    time.sleep(0.1)
+
+    # The small message would fit, but it must not jump the queue.
+    small_done = threading.Event()
+    _run_in_daemon(flow_controller, "add", [small_msg], small_done)
+    assert not small_done.wait(timeout=0.1)
+    assert not big_done.is_set()
+
+    flow_controller.release(msg1)
+    assert big_done.wait(timeout=1.0)
+
+    flow_controller.release(big_msg)
+    assert small_done.wait(timeout=1.0)
+
+    assert flow_controller.message_count == 1
+    assert flow_controller.total_bytes == small_msg.ByteSize()
@@ -0,0 +1,224 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import pytest
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import scheduler
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._sequencer import OrderedSequencer
+
+
+_ORDERING_KEY = "ordering_key_1"
+
+
+def create_message():
+    return types.PubsubMessage(data=b"foo", ordering_key=_ORDERING_KEY)
+
+
+def create_client(**batch_settings):
+    creds = mock.Mock(spec=credentials.Credentials)
+    commit_scheduler = mock.create_autospec(scheduler.CommitScheduler, instance=True)
+    return publisher.Client(
+        batch_settings=types.BatchSettings(**batch_settings),
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        commit_scheduler=commit_scheduler,
+        credentials=creds,
+    )
+
+
+def create_sequencer(client=None, idle_callback=None, **batch_settings):
+    if client is None:
+        client = create_client(**batch_settings)
+    return OrderedSequencer(
+        client, "topic_name", _ORDERING_KEY, idle_callback=idle_callback
+    )
+
+
+def run_scheduled_commits(client):
+    """Run the commits scheduled so far, in order, and forget about them."""
+    schedule_commit = client.commit_scheduler.schedule_commit
+    commits = [call[0][0] for call in schedule_commit.call_args_list]
+    schedule_commit.reset_mock()
+    for commit in commits:
+        commit()
+
+
+def test_publish_creates_batch_without_autocommit():
+    client = create_client()
+    sequencer = create_sequencer(client=client)
+
+    future = sequencer.publish(create_message())
+
+    assert future is not None
+    assert len(sequencer._ordered_batches) == 1
+    batch = sequencer._ordered_batches[0]
+    assert batch.status == base.BatchStatus.ACCEPTING_MESSAGES
+    assert batch._commit_when_full is False
+    client.commit_scheduler.schedule_commit.assert_not_called()
+
+    # The sequencer, not the batch, schedules the latency deadline.
+    client.commit_scheduler.schedule_deadline.assert_called_once_with(0.01, mock.ANY)
+
+
+def test_publish_full_batch_commits_only_the_first_batch():
+    client = create_client(max_messages=3)
+    sequencer = create_sequencer(client=client)
+
+    for _ in range(5):
+        sequencer.publish(create_message())
+
+    assert [len(batch) for batch in sequencer._ordered_batches] == [2, 2, 1]
+    statuses = [batch.status for batch in sequencer._ordered_batches]
+    assert statuses[0] == base.BatchStatus.STARTING
+    assert statuses[1:] == [base.BatchStatus.ACCEPTING_MESSAGES] * 2
+    client.commit_scheduler.schedule_commit.assert_called_once()
+
+
+def test_batch_deadline_commits_first_batch_only():
+    client = create_client(max_messages=2)
+    sequencer = create_sequencer(client=client)
+
+    sequencer.publish(create_message())
+    sequencer.publish(create_message())
+    first, second = sequencer._ordered_batches
+
+    deadline_callbacks = [
+        call[0][1] for call in client.commit_scheduler.schedule_deadline.call_args_list
+    ]
+    assert len(deadline_callbacks) == 2
+
+    deadline_callbacks[1]()
+    assert second.status == base.BatchStatus.ACCEPTING_MESSAGES
+
+    deadline_callbacks[0]()
+    assert first.status == base.BatchStatus.STARTING
+
+
+def test_batches_committed_in_order():
+    client = create_client(max_messages=3)
+    sequencer = create_sequencer(client=client)
+    futures = [sequencer.publish(create_message()) for _ in range(3)]
+
+    api_publish = mock.patch.object(
+        type(client.api),
+        "publish",
+        side_effect=lambda topic, messages: types.PublishResponse(
+            message_ids=["id"] * len(messages)
+        ),
+    )
+    with api_publish as publish:
+        # The first batch is committed, its completion commits the next one.
+        run_scheduled_commits(client)
+        assert publish.call_count == 1
+        assert len(sequencer._ordered_batches) == 1
+
+        run_scheduled_commits(client)
+        assert publish.call_count == 2
+
+    assert [future.result(timeout=1.0) for future in futures] == ["id"] * 3
+
+
+def test_failed_batch_pauses_and_cancels_queued_batches():
+    client = create_client(max_messages=3)
+    idle_callback = mock.Mock(spec=())
+    sequencer = create_sequencer(client=client, idle_callback=idle_callback)
+    futures = [sequencer.publish(create_message()) for _ in range(3)]
+
+    error = exceptions.PublishError("nope")
+    with mock.patch.object(type(client.api), "publish", side_effect=error):
+        run_scheduled_commits(client)
+
+    assert futures[0].exception(timeout=1.0) is error
+    assert futures[1].exception(timeout=1.0) is error
+    assert isinstance(futures[2].exception(timeout=1.0), RuntimeError)
+    assert str(futures[2].exception(timeout=1.0)) == (
+        base.BatchCancellationReason.PRIOR_ORDERED_MESSAGE_FAILED
+    )
+
+    assert not sequencer._ordered_batches
+    assert not sequencer.is_finished()
+    idle_callback.assert_called_once_with(sequencer)
+
+    with pytest.raises(exceptions.PublishToPausedOrderingKeyException) as exc_info:
+        sequencer.publish(create_message())
+    assert exc_info.value.ordering_key == _ORDERING_KEY
+
+    sequencer.unpause()
+    assert sequencer.is_finished()
+    assert sequencer.publish(create_message()) is not None
+
+
+def test_failed_batch_cancelled_future_callback_resumes_publish():
+    client = create_client(max_messages=1)
+    futures = [
+        client.publish("topic_name", b"foo", ordering_key=_ORDERING_KEY)
+        for _ in range(2)
+    ]
+    resumed = []
+
+    def resume(future):
+        client.resume_publish("topic_name", _ORDERING_KEY)
+        resumed.append(client.publish("topic_name", b"foo", ordering_key=_ORDERING_KEY))
+
+    futures[1].add_done_callback(resume)
+
+    error = exceptions.PublishError("nope")
+    with mock.patch.object(type(client.api), "publish", side_effect=error):
+        run_scheduled_commits(client)
+
+    assert futures[0].exception(timeout=1.0) is error
+    assert isinstance(futures[1].exception(timeout=1.0), RuntimeError)
+    assert len(resumed) == 1
+    assert not resumed[0].done()
+
+
+def test_unpause_not_paused():
+    sequencer = create_sequencer()
+
+    with pytest.raises(RuntimeError):
+        sequencer.unpause()
+
+
+def test_stop_commits_first_batch_and_rejects_messages():
+    client = create_client(max_messages=2)
+    sequencer = create_sequencer(client=client)
+    sequencer.publish(create_message())
+
+    sequencer.stop()
+
+    assert sequencer._ordered_batches[0].status == base.BatchStatus.STARTING
+    with pytest.raises(RuntimeError):
+        sequencer.publish(create_message())
+    with pytest.raises(RuntimeError):
+        sequencer.stop()
+
+
+def test_idle_callback_on_last_batch_done():
+    client = create_client()
+    idle_callback = mock.Mock(spec=())
+    sequencer = create_sequencer(client=client, idle_callback=idle_callback)
+    sequencer.publish(create_message())
+    sequencer.stop()
+
+    response = types.PublishResponse(message_ids=["a"])
+    with mock.patch.object(type(client.api), "publish", return_value=response):
+        run_scheduled_commits(client)
+
+    assert sequencer.is_finished()
+    idle_callback.assert_called_once_with(sequencer)
@@ -21,6 +21,8 @@ import pytest
 
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import scheduler
 from google.cloud.pubsub_v1 import types
 
 
@@ -265,3 +267,211 @@ def test_gapic_class_method_on_instance():
     client = publisher.Client(credentials=creds)
     answer = client.topic_path("foo", "bar")
     assert answer == "projects/foo/topics/bar"
+
+
+def test_init_w_publisher_options():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=10, limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK
+    )
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(flow_control=flow_control),
+        credentials=creds,
+    )
+
+    assert client.publisher_options.flow_control == flow_control
+    assert client._flow_controller._settings == flow_control
+
+
+def test_publish_flow_control_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=1, limit_exceeded_behavior=types.LimitExceededBehavior.ERROR
+    )
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(flow_control=flow_control),
+        credentials=creds,
+    )
+    topic = "topic/path"
+    client._batch(topic, autocommit=False)
+
+    future = client.publish(topic, b"foo")
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish(topic, b"bar")
+
+    # Completing the first message frees up the capacity.
+    future.set_result("1")
+    client.publish(topic, b"baz")
+
+
+def test_publish_flow_control_released_on_batch_error():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        message_limit=1, limit_exceeded_behavior=types.LimitExceededBehavior.ERROR
+    )
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(flow_control=flow_control),
+        credentials=creds,
+    )
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = exceptions.MessageTooLargeError()
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    with pytest.raises(exceptions.MessageTooLargeError):
+        client.publish(topic, b"foo")
+
+    assert client._flow_controller.message_count == 0
+
+
+def test_init_default_commit_scheduler():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    assert isinstance(client.commit_scheduler, scheduler.ThreadPoolCommitScheduler)
+
+
+def test_stop_shuts_down_own_commit_scheduler():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    with mock.patch.object(client.commit_scheduler, "shutdown") as shutdown:
+        client.stop()
+
+    shutdown.assert_called_once_with()
+
+
+def test_stop_keeps_custom_commit_scheduler():
+    creds = mock.Mock(spec=credentials.Credentials)
+    commit_scheduler = mock.create_autospec(scheduler.CommitScheduler, instance=True)
+    client = publisher.Client(credentials=creds, commit_scheduler=commit_scheduler)
+
+    assert client.commit_scheduler is commit_scheduler
+
+    client.stop()
+
+    commit_scheduler.shutdown.assert_not_called()
+
+
+def test_publish_with_ordering_key_requires_message_ordering():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    with pytest.raises(ValueError):
+        client.publish("topic/path", b"foo", ordering_key="key1")
+
+
+def test_publish_with_ordering_key_uses_sequencer_per_key():
+    creds = mock.Mock(spec=credentials.Credentials)
+    commit_scheduler = mock.create_autospec(scheduler.CommitScheduler, instance=True)
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        commit_scheduler=commit_scheduler,
+        credentials=creds,
+    )
+    topic = "topic/path"
+
+    future1 = client.publish(topic, b"foo", ordering_key="key1")
+    future2 = client.publish(topic, b"bar", ordering_key="key2")
+    future3 = client.publish(topic, b"baz", ordering_key="key1")
+
+    assert future1 is not None and future2 is not None and future3 is not None
+    assert sorted(client._sequencers) == [(topic, "key1"), (topic, "key2")]
+    assert client._batches == {}
+
+    sequencer = client._sequencers[(topic, "key1")]
+    messages = [
+        message for batch in sequencer._ordered_batches for message in batch.messages
+    ]
+    assert messages == [
+        types.PubsubMessage(data=b"foo", ordering_key="key1"),
+        types.PubsubMessage(data=b"baz", ordering_key="key1"),
+    ]
+
+
+def test_resume_publish():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        credentials=creds,
+    )
+    topic = "topic/path"
+    sequencer = mock.Mock(spec=["unpause"])
+    client._sequencers[(topic, "key1")] = sequencer
+
+    client.resume_publish(topic, "key1")
+    sequencer.unpause.assert_called_once_with()
+
+    # Unknown keys are ignored.
+    client.resume_publish(topic, "key2")
+
+
+def test_resume_publish_not_paused():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        credentials=creds,
+    )
+    topic = "topic/path"
+    sequencer = mock.Mock(spec=["unpause"])
+    sequencer.unpause.side_effect = RuntimeError("Ordering key is not paused.")
+    client._sequencers[(topic, "key1")] = sequencer
+
+    with pytest.raises(RuntimeError):
+        client.resume_publish(topic, "key1")
+
+
+def test_resume_publish_no_message_ordering():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    with pytest.raises(ValueError):
+        client.resume_publish("topic/path", "key1")
+
+
+def test_resume_publish_stopped():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        credentials=creds,
+    )
+    client.stop()
+
+    with pytest.raises(RuntimeError):
+        client.resume_publish("topic/path", "key1")
+
+
+def test_stop_stops_sequencers():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        credentials=creds,
+    )
+    sequencer = mock.Mock(spec=["stop"])
+    client._sequencers[("topic/path", "key1")] = sequencer
+
+    client.stop()
+
+    sequencer.stop.assert_called_once_with()
+
+
+def test_idle_sequencer_is_discarded():
+    creds = mock.Mock(spec=credentials.Credentials)
+    commit_scheduler = mock.create_autospec(scheduler.CommitScheduler, instance=True)
+    client = publisher.Client(
+        publisher_options=types.PublisherOptions(enable_message_ordering=True),
+        commit_scheduler=commit_scheduler,
+        credentials=creds,
+    )
+    topic = "topic/path"
+    client.publish(topic, b"foo", ordering_key="key1")
+    sequencer = client._sequencers[(topic, "key1")]
+
+    with mock.patch.object(sequencer, "is_finished", return_value=False):
+        client._on_sequencer_idle(sequencer)
+    assert client._sequencers == {(topic, "key1"): sequencer}
+
+    with mock.patch.object(sequencer, "is_finished", return_value=True):
+        client._on_sequencer_idle(sequencer)
+    assert client._sequencers == {}
@@ -50,6 +50,26 @@ def test_dispatch_callback(item, method_name):
     method.assert_called_once_with([item])
 
 
+def test_dispatch_callback_unpacks_bulk_requests():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    ack_1 = requests.AckRequest(ack_id="ack_1", byte_size=0, time_to_ack=20)
+    ack_2 = requests.AckRequest(ack_id="ack_2", byte_size=0, time_to_ack=20)
+    ack_3 = requests.AckRequest(ack_id="ack_3", byte_size=0, time_to_ack=20)
+    nack = requests.NackRequest(ack_id="nack", byte_size=0)
+
+    with mock.patch.object(dispatcher_, "ack") as ack, mock.patch.object(
+        dispatcher_, "nack"
+    ) as nack_method:
+        dispatcher_.dispatch_callback([ack_1, [ack_2, ack_3], [nack]])
+
+    ack.assert_called_once_with([ack_1, ack_2, ack_3])
+    nack_method.assert_called_once_with([nack])
+
+
 def test_dispatch_callback_inactive():
     manager = mock.create_autospec(
         streaming_pull_manager.StreamingPullManager, instance=True
@@ -116,7 +136,7 @@ def test_ack_splitting_large_payload():
     sent_ack_ids = collections.Counter()
 
     for call in calls:
-        message = call.args[0]
+        message = call[0][0]
         assert message.ByteSize() <= 524288  # server-side limit (2**19)
         sent_ack_ids.update(message.ack_ids)
 
@@ -202,7 +222,7 @@ def test_modify_ack_deadline_splitting_large_payload():
     sent_ack_ids = collections.Counter()
 
     for call in calls:
-        message = call.args[0]
+        message = call[0][0]
         assert message.ByteSize() <= 524288  # server-side limit (2**19)
         sent_ack_ids.update(message.modify_deadline_ack_ids)
 
@@ -259,3 +279,41 @@ def test_stop_no_join():
     dispatcher_ = dispatcher.Dispatcher(mock.sentinel.manager, mock.sentinel.queue)
 
     dispatcher_.stop()
+
+
+def test_extend_deadlines():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    dispatcher_.extend_deadlines(["ack_id_1", "ack_id_2"], 60)
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(
+            modify_deadline_ack_ids=["ack_id_1", "ack_id_2"],
+            modify_deadline_seconds=[60, 60],
+        )
+    )
+
+
+def test_extend_deadlines_splitting_large_payload():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    dispatcher_ = dispatcher.Dispatcher(manager, mock.sentinel.queue)
+
+    ack_ids = [str(i).zfill(176) for i in range(5001)]
+    dispatcher_.extend_deadlines(ack_ids, 60)
+
+    calls = manager.send.call_args_list
+    assert len(calls) == 3
+
+    sent_ack_ids = []
+    for call in calls:
+        message = call[0][0]
+        assert len(message.modify_deadline_ack_ids) <= dispatcher._ACK_IDS_BATCH_SIZE
+        assert set(message.modify_deadline_seconds) == {60}
+        sent_ack_ids.extend(message.modify_deadline_ack_ids)
+
+    assert sent_ack_ids == ack_ids
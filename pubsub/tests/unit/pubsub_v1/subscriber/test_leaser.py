@@ -118,20 +118,69 @@ def make_sleep_mark_manager_as_inactive(leaser):
         assert 0 < timeout < 10
         leaser._manager.is_active = False
 
-    leaser._stop_event.wait = trigger_inactive
+    leaser._stop_event.wait = mock.Mock(side_effect=trigger_inactive)
 
 
-def test_maintain_leases_ack_ids():
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_ack_ids(time):
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
     make_sleep_mark_manager_as_inactive(leaser_)
+
+    time.return_value = 1000
     leaser_.add([requests.LeaseRequest(ack_id="my ack id", byte_size=50)])
 
+    # New leases are assumed to expire after 10 seconds, and are renewed
+    # once they expire within half of the p99 value (10 seconds as well).
+    time.return_value = 1005
     leaser_.maintain_leases()
 
-    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
-        [requests.ModAckRequest(ack_id="my ack id", seconds=10)]
-    )
+    manager.dispatcher.extend_deadlines.assert_called_once_with(["my ack id"], 10)
+    assert leaser_._lease_buckets == {1015: set(["my ack id"])}
+    assert leaser_._leased_messages["my ack id"].bucket == 1015
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_not_due_yet(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+
+    time.return_value = 1000
+    leaser_.add([requests.LeaseRequest(ack_id="my ack id", byte_size=50)])
+
+    time.return_value = 1002
+    leaser_.maintain_leases()
+
+    manager.dispatcher.extend_deadlines.assert_not_called()
+
+    # The maintainer should wake up when the lease becomes due.
+    timeout = leaser_._stop_event.wait.call_args[1]["timeout"]
+    assert 2.7 <= timeout <= 3.0
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_coalesces_due_buckets(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+
+    time.return_value = 1000
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    time.return_value = 1003.5
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+    time.return_value = 1008
+    leaser_.add([requests.LeaseRequest(ack_id="ack3", byte_size=50)])
+
+    # The first two leases expire within the renewal window, and are renewed
+    # with a single request. The third one is not due yet.
+    time.return_value = 1008
+    leaser_.maintain_leases()
+
+    manager.dispatcher.extend_deadlines.assert_called_once_with(mock.ANY, 10)
+    (ack_ids, _), _ = manager.dispatcher.extend_deadlines.call_args
+    assert sorted(ack_ids) == ["ack1", "ack2"]
+    assert leaser_._lease_buckets == {1018: set(["ack1", "ack2", "ack3"])}
 
 
 def test_maintain_leases_no_ack_ids():
@@ -141,7 +190,7 @@ def test_maintain_leases_no_ack_ids():
 
     leaser_.maintain_leases()
 
-    manager.dispatcher.modify_ack_deadline.assert_not_called()
+    manager.dispatcher.extend_deadlines.assert_not_called()
 
 
 @mock.patch("time.time", autospec=True)
@@ -149,6 +198,7 @@ def test_maintain_leases_outdated_items(time):
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
     make_sleep_mark_manager_as_inactive(leaser_)
+    manager.dispatcher.drop.side_effect = leaser_.remove
 
     # Add these items at the beginning of the timeline
     time.return_value = 0
@@ -159,19 +209,35 @@ def test_maintain_leases_outdated_items(time):
     leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
 
     # Now make sure time reports that we are at the end of our timeline.
-    time.return_value = manager.flow_control.max_lease_duration + 1
+    time.return_value = manager.flow_control.max_lease_duration + 6
 
     leaser_.maintain_leases()
 
     # Only ack2 should be renewed. ack1 should've been dropped
-    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
-        [requests.ModAckRequest(ack_id="ack2", seconds=10)]
-    )
+    manager.dispatcher.extend_deadlines.assert_called_once_with(["ack2"], 10)
     manager.dispatcher.drop.assert_called_once_with(
         [requests.DropRequest(ack_id="ack1", byte_size=50)]
     )
 
 
+def test_remove_clears_lease_bucket():
+    leaser_ = leaser.Leaser(mock.sentinel.manager)
+
+    leaser_.add(
+        [
+            requests.LeaseRequest(ack_id="ack1", byte_size=50),
+            requests.LeaseRequest(ack_id="ack2", byte_size=50),
+        ]
+    )
+    assert len(leaser_._lease_buckets) == 1
+
+    leaser_.remove([requests.DropRequest(ack_id="ack1", byte_size=50)])
+    assert list(leaser_._lease_buckets.values()) == [set(["ack2"])]
+
+    leaser_.remove([requests.DropRequest(ack_id="ack2", byte_size=50)])
+    assert leaser_._lease_buckets == {}
+
+
 @mock.patch("threading.Thread", autospec=True)
 def test_start(thread):
     manager = mock.create_autospec(
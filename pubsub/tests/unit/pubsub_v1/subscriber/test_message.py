@@ -158,3 +158,59 @@ def test_repr():
         )
     )
     assert repr(msg) == expected_repr
+
+
+def test_message_batch_is_a_list():
+    msgs = [create_message(b"foo", ack_id="ack_1"), create_message(b"bar")]
+    batch = message.MessageBatch(msgs)
+
+    assert batch == msgs
+    assert batch.size == 60
+
+
+def test_message_batch_ack():
+    request_queue = queue.Queue()
+    msgs = [create_message(b"foo", ack_id="ack_{}".format(i)) for i in range(3)]
+    for msg in msgs:
+        msg._request_queue = request_queue
+    batch = message.MessageBatch(msgs)
+
+    with mock.patch.object(request_queue, "put") as put:
+        batch.ack()
+
+    # All the requests are queued at once.
+    put.assert_called_once_with(
+        [
+            requests.AckRequest(
+                ack_id="ack_{}".format(i), byte_size=30, time_to_ack=mock.ANY
+            )
+            for i in range(3)
+        ]
+    )
+
+
+def test_message_batch_nack():
+    request_queue = queue.Queue()
+    msgs = [create_message(b"foo", ack_id="ack_{}".format(i)) for i in range(2)]
+    for msg in msgs:
+        msg._request_queue = request_queue
+    batch = message.MessageBatch(msgs)
+
+    with mock.patch.object(request_queue, "put") as put:
+        batch.nack()
+
+    put.assert_called_once_with(
+        [
+            requests.NackRequest(ack_id="ack_0", byte_size=30),
+            requests.NackRequest(ack_id="ack_1", byte_size=30),
+        ]
+    )
+
+
+def test_message_batch_empty():
+    batch = message.MessageBatch()
+
+    batch.ack()
+    batch.nack()
+
+    assert batch.size == 0
@@ -0,0 +1,138 @@
+# Copyright 2019, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import mock
+import pytest
+from six.moves import queue
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import message
+from google.cloud.pubsub_v1.subscriber._protocol import message_batcher
+
+
+def create_messages(count, data=b"x"):
+    return [
+        message.Message(
+            types.PubsubMessage(data=data, message_id=str(i)),
+            "ack_{}".format(i),
+            queue.Queue(),
+        )
+        for i in range(count)
+    ]
+
+
+def message_ids(batch):
+    return [msg.message_id for msg in batch]
+
+
+def test_add_delivers_full_batches():
+    deliver = mock.Mock(spec=())
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(max_messages=2), deliver
+    )
+
+    batcher.add(create_messages(5))
+
+    batches = [call[0][0] for call in deliver.call_args_list]
+    assert [message_ids(batch) for batch in batches] == [["0", "1"], ["2", "3"]]
+    assert all(isinstance(batch, message.MessageBatch) for batch in batches)
+    assert message_ids(batcher._batch) == ["4"]
+
+
+def test_add_delivers_batches_before_exceeding_max_bytes():
+    deliver = mock.Mock(spec=())
+    messages = create_messages(5, data=b"x" * 100)
+    size = messages[0].size
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(max_bytes=size * 2 + 1), deliver
+    )
+
+    batcher.add(messages)
+
+    batches = [call[0][0] for call in deliver.call_args_list]
+    assert [message_ids(batch) for batch in batches] == [["0", "1"], ["2", "3"]]
+    assert batcher._batch_bytes == size
+
+
+def test_add_oversized_message():
+    deliver = mock.Mock(spec=())
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(max_bytes=1), deliver
+    )
+
+    batcher.add(create_messages(2))
+
+    # Each message is in a batch of its own.
+    deliver.assert_called_once()
+    assert message_ids(deliver.call_args[0][0]) == ["0"]
+    assert message_ids(batcher._batch) == ["1"]
+
+
+def test_incomplete_batch_delivered_after_max_latency():
+    delivered = []
+    done = threading.Event()
+
+    def deliver(batch):
+        delivered.append(batch)
+        done.set()
+
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(max_messages=10, max_latency=0.01), deliver
+    )
+    batcher.start()
+    try:
+        batcher.add(create_messages(3))
+        assert done.wait(timeout=1.0)
+    finally:
+        batcher.stop()
+
+    assert [message_ids(batch) for batch in delivered] == [["0", "1", "2"]]
+    assert not batcher._batch
+
+
+def test_start_already_started():
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(), mock.Mock(spec=())
+    )
+    batcher._thread = mock.sentinel.thread
+
+    with pytest.raises(ValueError):
+        batcher.start()
+
+
+def test_stop_drops_incomplete_batch():
+    deliver = mock.Mock(spec=())
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(max_latency=60), deliver
+    )
+    batcher.start()
+    batcher.add(create_messages(3))
+
+    batcher.stop()
+
+    assert batcher._thread is None
+    assert not batcher._batch
+    deliver.assert_not_called()
+
+
+def test_stop_no_thread():
+    batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(), mock.Mock(spec=())
+    )
+
+    batcher.stop()
+
+    assert batcher._thread is None
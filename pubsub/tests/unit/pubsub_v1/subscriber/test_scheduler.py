@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import concurrent.futures
+import sys
 import threading
 
 import mock
+import pytest
 from six.moves import queue
 
 from google.cloud.pubsub_v1.subscriber import scheduler
@@ -54,3 +56,104 @@ def test_schedule():
     scheduler_.shutdown()
 
     assert called_with == [(("arg1",), {"kwarg1": "meep"})]
+
+
+requires_asyncio = pytest.mark.skipif(
+    sys.version_info < (3, 5), reason="requires asyncio"
+)
+
+
+@pytest.fixture
+def event_loop():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@requires_asyncio
+def test_asyncio_subclasses_base_abc():
+    assert issubclass(scheduler.AsyncioScheduler, scheduler.Scheduler)
+
+
+@requires_asyncio
+def test_asyncio_constructor(event_loop):
+    scheduler_ = scheduler.AsyncioScheduler(loop=event_loop)
+
+    assert isinstance(scheduler_.queue, queue.Queue)
+    assert scheduler_.loop is event_loop
+
+
+@requires_asyncio
+def test_asyncio_schedule_from_another_thread(event_loop):
+    import asyncio
+
+    called_with = []
+    called = event_loop.create_future()
+
+    def callback(*args, **kwargs):
+        called_with.append((args, kwargs, threading.current_thread()))
+        called.set_result(None)
+
+    scheduler_ = scheduler.AsyncioScheduler(loop=event_loop)
+    thread = threading.Thread(
+        target=scheduler_.schedule, args=(callback, "arg1"), kwargs={"kwarg1": "meep"}
+    )
+    thread.start()
+    thread.join()
+
+    event_loop.run_until_complete(asyncio.wait_for(called, timeout=1.0))
+
+    assert called_with == [(("arg1",), {"kwarg1": "meep"}, threading.current_thread())]
+
+
+@requires_asyncio
+def test_asyncio_schedule_awaits_callback_results_concurrently(event_loop):
+    import asyncio
+
+    scheduler_ = scheduler.AsyncioScheduler(loop=event_loop)
+    results = [event_loop.create_future() for _ in range(3)]
+    for result in results:
+        scheduler_.schedule(lambda result=result: asyncio.wait_for(result, None))
+
+    event_loop.run_until_complete(asyncio.sleep(0))
+    assert len(scheduler_._tasks) == 3
+
+    for result in results:
+        result.set_result(None)
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    assert not scheduler_._tasks
+
+
+@requires_asyncio
+def test_asyncio_shutdown_cancels_running_tasks(event_loop):
+    import asyncio
+
+    scheduler_ = scheduler.AsyncioScheduler(loop=event_loop)
+    pending = event_loop.create_future()
+    scheduler_.schedule(lambda: pending)
+
+    event_loop.run_until_complete(asyncio.sleep(0))
+    assert scheduler_._tasks == {pending}
+
+    dropped = mock.Mock(spec=())
+    scheduler_.schedule(dropped)
+    scheduler_.shutdown()
+    event_loop.run_until_complete(asyncio.sleep(0))
+
+    assert pending.cancelled()
+    assert not scheduler_._tasks
+    dropped.assert_not_called()
+
+
+@requires_asyncio
+def test_asyncio_shutdown_closed_loop():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    scheduler_ = scheduler.AsyncioScheduler(loop=loop)
+    loop.close()
+
+    scheduler_.shutdown()
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
+import sys
 import threading
 import time
 import types as stdlib_types
@@ -31,6 +33,7 @@ from google.cloud.pubsub_v1.subscriber import scheduler
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
+from google.cloud.pubsub_v1.subscriber._protocol import message_batcher
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
 import grpc
@@ -77,6 +80,98 @@ def test__wrap_callback_errors_error():
     on_callback_error.assert_called_once_with(callback_error)
 
 
+def call_in_event_loop(loop, func):
+    """Call ``func`` in the running ``loop``, and wait for the task it returns."""
+    import asyncio
+
+    result = loop.create_future()
+    loop.call_soon(lambda: result.set_result(func()))
+    task = loop.run_until_complete(result)
+    if task is not None:
+        loop.run_until_complete(asyncio.wait([task]))
+    return task
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__wrap_callback_errors_awaitable_no_error():
+    import asyncio
+
+    msg = mock.create_autospec(message.Message, instance=True)
+    on_callback_error = mock.Mock()
+    callback = mock.Mock(side_effect=lambda msg: asyncio.sleep(0))
+
+    loop = asyncio.new_event_loop()
+    try:
+        task = call_in_event_loop(
+            loop,
+            lambda: streaming_pull_manager._wrap_callback_errors(
+                callback, on_callback_error, msg
+            ),
+        )
+    finally:
+        loop.close()
+
+    callback.assert_called_once_with(msg)
+    assert task.done()
+    msg.nack.assert_not_called()
+    on_callback_error.assert_not_called()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__wrap_callback_errors_awaitable_error():
+    import asyncio
+
+    callback_error = ValueError("meep")
+    msg = mock.create_autospec(message.Message, instance=True)
+    on_callback_error = mock.Mock()
+
+    def callback(msg):
+        future = asyncio.get_event_loop().create_future()
+        future.set_exception(callback_error)
+        return future
+
+    loop = asyncio.new_event_loop()
+    try:
+        call_in_event_loop(
+            loop,
+            lambda: streaming_pull_manager._wrap_callback_errors(
+                callback, on_callback_error, msg
+            ),
+        )
+    finally:
+        loop.close()
+
+    msg.nack.assert_called_once()
+    on_callback_error.assert_called_once_with(callback_error)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__wrap_callback_errors_awaitable_cancelled():
+    import asyncio
+
+    msg = mock.create_autospec(message.Message, instance=True)
+    on_callback_error = mock.Mock()
+
+    def callback(msg):
+        future = asyncio.get_event_loop().create_future()
+        future.cancel()
+        return future
+
+    loop = asyncio.new_event_loop()
+    try:
+        call_in_event_loop(
+            loop,
+            lambda: streaming_pull_manager._wrap_callback_errors(
+                callback, on_callback_error, msg
+            ),
+        )
+    finally:
+        loop.close()
+
+    msg.nack.assert_not_called()
+    on_callback_error.assert_not_called()
+
+
 def test_constructor_and_default_state():
     manager = streaming_pull_manager.StreamingPullManager(
         mock.sentinel.client, mock.sentinel.subscription
@@ -470,6 +565,30 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     assert manager.is_active is True
 
 
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.message_batcher.MessageBatcher",
+    autospec=True,
+)
+def test_open_batch_mode(batcher, heartbeater, dispatcher, leaser, *unused_mocks):
+    settings = types.MessageBatchSettings(max_messages=500)
+    manager = make_manager(message_batch_settings=settings)
+
+    manager.open(mock.sentinel.callback, mock.sentinel.on_callback_error)
+
+    batcher.assert_called_once_with(settings, manager._schedule_batch_callback)
+    batcher.return_value.start.assert_called_once()
+    assert manager._batcher == batcher.return_value
+
+
 def test_open_already_active():
     manager = make_manager()
     manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
@@ -521,6 +640,18 @@ def test_close():
     assert manager.is_active is False
 
 
+def test_close_batch_mode():
+    manager, _, _, _, _, scheduler = make_running_manager()
+    batcher = mock.create_autospec(message_batcher.MessageBatcher, instance=True)
+    manager._batcher = batcher
+
+    manager.close()
+
+    batcher.stop.assert_called_once()
+    scheduler.shutdown.assert_called_once()
+    assert manager._batcher is None
+
+
 def test_close_inactive_consumer():
     manager, consumer, dispatcher, leaser, heartbeater, scheduler = (
         make_running_manager()
@@ -721,6 +852,70 @@ def test__on_response_with_leaser_overload():
             assert msg.message_id in ("2", "3")
 
 
+def test__on_response_single_leaser_update_and_load_check():
+    manager, consumer, dispatcher, leaser, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    consumer.is_paused = False
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="ack_{}".format(i),
+                message=types.PubsubMessage(data=b"x", message_id=str(i)),
+            )
+            for i in range(5)
+        ]
+    )
+
+    # Three more messages hit the default FlowControl.max_messages limit.
+    fake_leaser_add(leaser, init_msg_count=997, assumed_msg_size=10)
+    leaser.add = mock.Mock(wraps=leaser.add)
+
+    with mock.patch.object(
+        manager, "maybe_pause_consumer", wraps=manager.maybe_pause_consumer
+    ) as maybe_pause:
+        manager._on_response(response)
+
+    leaser.add.assert_called_once()
+    lease_requests = leaser.add.call_args[0][0]
+    assert [req.ack_id for req in lease_requests] == [
+        "ack_{}".format(i) for i in range(5)
+    ]
+    maybe_pause.assert_called_once_with()
+    consumer.pause.assert_called_once()
+
+    delivered = [call[1][1].message_id for call in scheduler.schedule.mock_calls]
+    assert delivered == ["0", "1", "2"]
+    held = [manager._messages_on_hold.get_nowait() for _ in range(2)]
+    assert [msg.message_id for msg in held] == ["3", "4"]
+    assert manager._on_hold_bytes == sum(msg.size for msg in held)
+
+
+def test__on_response_holds_messages_over_byte_limit():
+    manager, _, _, leaser, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    manager._flow_control = types.FlowControl(max_bytes=1000)
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="ack_{}".format(i),
+                message=types.PubsubMessage(data=b"x" * 400, message_id=str(i)),
+            )
+            for i in range(4)
+        ]
+    )
+    fake_leaser_add(leaser, init_msg_count=0, assumed_msg_size=0)
+
+    manager._on_response(response)
+
+    # The third message still fits in, as the load is checked before admitting
+    # each message, the fourth one has to wait.
+    assert len(scheduler.schedule.mock_calls) == 3
+    assert manager._messages_on_hold.qsize() == 1
+    assert manager._messages_on_hold.get_nowait().message_id == "3"
+
+
 def test__on_response_none_data(caplog):
     caplog.set_level(logging.DEBUG)
 
@@ -736,6 +931,109 @@ def test__on_response_none_data(caplog):
     assert "callback invoked with None" in caplog.text
 
 
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__on_response_asyncio_scheduler():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    manager = streaming_pull_manager.StreamingPullManager(
+        mock.create_autospec(client.Client, instance=True),
+        "subscription-name",
+        scheduler=scheduler.AsyncioScheduler(loop=loop),
+    )
+    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._dispatcher = mock.create_autospec(dispatcher.Dispatcher, instance=True)
+    manager._leaser = mock.create_autospec(leaser.Leaser, instance=True)
+    fake_leaser_add(manager._leaser, init_msg_count=0, assumed_msg_size=10)
+
+    processed = []
+
+    def callback(msg):
+        processed.append(msg.message_id)
+        msg.ack()
+        return asyncio.sleep(0)
+
+    manager._callback = functools.partial(
+        streaming_pull_manager._wrap_callback_errors, callback, mock.Mock()
+    )
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="ack_{}".format(i),
+                message=types.PubsubMessage(data=b"x", message_id=str(i)),
+            )
+            for i in range(3)
+        ]
+    )
+    # The response is processed in the consumer thread.
+    thread = threading.Thread(target=manager._on_response, args=(response,))
+    thread.start()
+    thread.join()
+
+    try:
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert not manager._scheduler._tasks
+    finally:
+        loop.close()
+
+    assert processed == ["0", "1", "2"]
+    # The acks are handed over to the dispatcher through the scheduler queue.
+    acks = [manager._scheduler.queue.get_nowait() for _ in range(3)]
+    assert [ack.ack_id for ack in acks] == ["ack_0", "ack_1", "ack_2"]
+    assert all(isinstance(ack, requests.AckRequest) for ack in acks)
+
+
+def test__on_response_batch_mode():
+    manager, _, _, leaser, _, scheduler = make_running_manager()
+    manager._callback = mock.sentinel.callback
+    manager._batcher = message_batcher.MessageBatcher(
+        types.MessageBatchSettings(max_messages=2), manager._schedule_batch_callback
+    )
+
+    response = types.StreamingPullResponse(
+        received_messages=[
+            types.ReceivedMessage(
+                ack_id="ack_{}".format(i),
+                message=types.PubsubMessage(data=b"x", message_id=str(i)),
+            )
+            for i in range(5)
+        ]
+    )
+    fake_leaser_add(leaser, init_msg_count=0, assumed_msg_size=10)
+
+    manager._on_response(response)
+
+    # The callback is scheduled for the complete batches only.
+    schedule_calls = scheduler.schedule.mock_calls
+    assert len(schedule_calls) == 2
+    for call, expected_ids in zip(schedule_calls, (["0", "1"], ["2", "3"])):
+        assert call[1][0] == mock.sentinel.callback
+        batch = call[1][1]
+        assert isinstance(batch, message.MessageBatch)
+        assert [msg.message_id for msg in batch] == expected_ids
+
+    assert [msg.message_id for msg in manager._batcher._batch] == ["4"]
+
+
+def test__maybe_release_messages_batch_mode():
+    manager = make_manager()
+    manager._leaser = mock.create_autospec(leaser.Leaser, instance=True)
+    fake_leaser_add(manager._leaser, init_msg_count=0, assumed_msg_size=10)
+    manager._batcher = mock.create_autospec(
+        message_batcher.MessageBatcher, instance=True
+    )
+
+    msg = mock.create_autospec(message.Message, instance=True, size=10)
+    manager._messages_on_hold.put(msg)
+    manager._on_hold_bytes = 10
+
+    manager._maybe_release_messages()
+
+    manager._batcher.add.assert_called_once_with([msg])
+    manager._scheduler.schedule.assert_not_called()
+
+
 def test_retryable_stream_errors():
     # Make sure the config matches our hard-coded tuple of exceptions.
     interfaces = subscriber_client_config.config["interfaces"]
@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 from google.auth import credentials
 import mock
+import pytest
 
 from google.cloud.pubsub_v1 import subscriber
 from google.cloud.pubsub_v1.gapic import subscriber_client
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber import scheduler
 
 
 def test_init():
@@ -106,3 +110,140 @@ def test_subscribe_options(manager_open):
         callback=mock.sentinel.callback,
         on_callback_error=future.set_exception,
     )
+
+
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_batches(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    flow_control = types.FlowControl(max_messages=1000)
+    batch_settings = types.MessageBatchSettings(max_messages=500)
+
+    future = client.subscribe_batches(
+        "sub_name_a",
+        callback=mock.sentinel.callback,
+        flow_control=flow_control,
+        batch_settings=batch_settings,
+        scheduler=mock.sentinel.scheduler,
+    )
+    assert isinstance(future, futures.StreamingPullFuture)
+
+    assert future._manager._subscription == "sub_name_a"
+    assert future._manager.flow_control == flow_control
+    assert future._manager._message_batch_settings == batch_settings
+    assert future._manager._scheduler == mock.sentinel.scheduler
+    manager_open.assert_called_once_with(
+        mock.ANY,
+        callback=mock.sentinel.callback,
+        on_callback_error=future.set_exception,
+    )
+
+
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_batches_default_settings(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+
+    future = client.subscribe_batches("sub_name_a", callback=mock.sentinel.callback)
+
+    assert future._manager._message_batch_settings == types.MessageBatchSettings()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_async(manager_open):
+    import asyncio
+
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    flow_control = types.FlowControl(max_messages=5000)
+    loop = asyncio.new_event_loop()
+
+    try:
+        future = client.subscribe_async(
+            "sub_name_a",
+            callback=mock.sentinel.callback,
+            flow_control=flow_control,
+            loop=loop,
+        )
+    finally:
+        loop.close()
+
+    assert isinstance(future, futures.StreamingPullFuture)
+    assert future._manager._subscription == "sub_name_a"
+    assert future._manager.flow_control == flow_control
+    assert isinstance(future._manager._scheduler, scheduler.AsyncioScheduler)
+    assert future._manager._scheduler.loop is loop
+    manager_open.assert_called_once_with(
+        mock.ANY,
+        callback=mock.sentinel.callback,
+        on_callback_error=future.set_exception,
+    )
+
+
+def _make_coroutine_function():
+    # ``async def`` is a syntax error on Python 2.
+    namespace = {}
+    exec("async def callback(message):\n    message.ack()\n", namespace)
+    return namespace["callback"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_coroutine_function_requires_asyncio_scheduler(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    callback = _make_coroutine_function()
+
+    with pytest.raises(TypeError):
+        client.subscribe("sub_name_a", callback=callback)
+
+    with pytest.raises(TypeError):
+        client.subscribe(
+            "sub_name_a", callback=callback, scheduler=scheduler.ThreadScheduler()
+        )
+
+    with pytest.raises(TypeError):
+        client.subscribe_batches("sub_name_a", callback=callback)
+
+    manager_open.assert_not_called()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_async_coroutine_function(manager_open):
+    import asyncio
+
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    callback = _make_coroutine_function()
+    loop = asyncio.new_event_loop()
+
+    try:
+        future = client.subscribe_async("sub_name_a", callback=callback, loop=loop)
+    finally:
+        loop.close()
+
+    manager_open.assert_called_once_with(
+        mock.ANY, callback=callback, on_callback_error=future.set_exception
+    )
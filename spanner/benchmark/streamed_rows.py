@@ -0,0 +1,105 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the decoding of streamed result sets.
+
+Decodes fake partial result sets into rows, once per cell with
+``_parse_value_pb`` and ``list.pop(0)`` as before the decoder was compiled,
+and with :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`.
+No API is called.
+
+Usage: python streamed_rows.py [rows_per_result_set] [number_of_result_sets]
+"""
+
+import sys
+import time
+
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1._helpers import _parse_value_pb
+from google.cloud.spanner_v1.proto.result_set_pb2 import PartialResultSet
+from google.cloud.spanner_v1.proto.result_set_pb2 import ResultSetMetadata
+from google.cloud.spanner_v1.proto.type_pb2 import StructType
+from google.cloud.spanner_v1.proto.type_pb2 import Type
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+
+FIELDS = [
+    StructType.Field(name="name", type=Type(code="STRING")),
+    StructType.Field(name="age", type=Type(code="INT64")),
+    StructType.Field(name="score", type=Type(code="FLOAT64")),
+    StructType.Field(name="alive", type=Type(code="BOOL")),
+    StructType.Field(
+        name="tags", type=Type(code="ARRAY", array_element_type=Type(code="STRING"))
+    ),
+]
+
+
+def fake_result_sets(rows_per_result_set, number_of_result_sets):
+    metadata = ResultSetMetadata()
+    metadata.row_type.fields.extend(FIELDS)
+    values = []
+    for i in range(rows_per_result_set):
+        row = [u"name-{}".format(i), i, None if i % 3 else i / 2.0, i % 2 == 0]
+        values.extend(_make_value_pb(value) for value in row + [[u"a", u"b"]])
+
+    result_sets = []
+    for index in range(number_of_result_sets):
+        result_set = PartialResultSet(values=values)
+        if index == 0:
+            result_set.metadata.CopyFrom(metadata)
+        result_sets.append(result_set)
+    return result_sets
+
+
+def per_cell(result_sets):
+    """Rows decoding before the decoder was compiled."""
+    result = []
+    current_row = []
+    for result_set in result_sets:
+        rows = []
+        for value in result_set.values:
+            current_row.append(_parse_value_pb(value, FIELDS[len(current_row)].type))
+            if len(current_row) == len(FIELDS):
+                rows.append(current_row)
+                current_row = []
+        while rows:
+            result.append(rows.pop(0))
+    return result
+
+
+def compiled(result_sets):
+    return list(StreamedResultSet(iter(result_sets)))
+
+
+def run(decode, result_sets):
+    start = time.time()
+    result = decode(result_sets)
+    return time.time() - start, result
+
+
+rows_per_result_set = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+number_of_result_sets = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+result_sets = fake_result_sets(rows_per_result_set, number_of_result_sets)
+total = rows_per_result_set * number_of_result_sets
+
+before_time, before_result = run(per_cell, result_sets)
+after_time, after_result = run(compiled, result_sets)
+assert before_result == after_result
+
+print(
+    "{0} rows: per cell {1:,.0f} rows/s, compiled {2:,.0f} rows/s, "
+    "speedup {3:.1f}x".format(
+        total, total / before_time, total / after_time, before_time / after_time
+    )
+)
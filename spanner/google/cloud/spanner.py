@@ -23,6 +23,7 @@ from google.cloud.spanner_v1 import Client
 from google.cloud.spanner_v1 import COMMIT_TIMESTAMP
 from google.cloud.spanner_v1 import enums
 from google.cloud.spanner_v1 import FixedSizePool
+from google.cloud.spanner_v1 import KeepAlivePool
 from google.cloud.spanner_v1 import KeyRange
 from google.cloud.spanner_v1 import KeySet
 from google.cloud.spanner_v1 import param_types
@@ -39,6 +40,7 @@ __all__ = (
     "COMMIT_TIMESTAMP",
     "enums",
     "FixedSizePool",
+    "KeepAlivePool",
     "KeyRange",
     "KeySet",
     "param_types",
@@ -27,6 +27,7 @@ from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import AbstractSessionPool
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import FixedSizePool
+from google.cloud.spanner_v1.pool import KeepAlivePool
 from google.cloud.spanner_v1.pool import PingingPool
 from google.cloud.spanner_v1.pool import TransactionPingingPool
 
@@ -53,6 +54,7 @@ __all__ = (
     "AbstractSessionPool",
     "BurstyPool",
     "FixedSizePool",
+    "KeepAlivePool",
     "PingingPool",
     "TransactionPingingPool",
     # google.cloud.spanner_v1.gapic
@@ -16,6 +16,7 @@
 
 import datetime
 import math
+import operator
 
 import six
 
@@ -191,6 +192,79 @@ def _parse_list_value_pbs(rows, row_type):
     return result
 
 
+def _parse_float64_pb(value_pb):
+    """Helper for '_make_value_pb_parser':  NaN / infinities are strings."""
+    if value_pb.HasField("string_value"):
+        return float(value_pb.string_value)
+    return value_pb.number_value
+
+
+def _parse_timestamp_pb(value_pb):
+    """Helper for '_make_value_pb_parser'."""
+    DatetimeWithNanoseconds = datetime_helpers.DatetimeWithNanoseconds
+    return DatetimeWithNanoseconds.from_rfc3339(value_pb.string_value)
+
+
+_VALUE_PB_CONVERTERS = {
+    type_pb2.STRING: operator.attrgetter("string_value"),
+    type_pb2.BYTES: lambda value_pb: value_pb.string_value.encode("utf8"),
+    type_pb2.BOOL: operator.attrgetter("bool_value"),
+    type_pb2.INT64: lambda value_pb: int(value_pb.string_value),
+    type_pb2.FLOAT64: _parse_float64_pb,
+    type_pb2.DATE: lambda value_pb: _date_from_iso8601_date(value_pb.string_value),
+    type_pb2.TIMESTAMP: _parse_timestamp_pb,
+}
+
+
+def _make_value_pb_parser(field_type):
+    """Compile the conversion of Value protobufs of a type to cell data.
+
+    The returned function is equivalent to :func:`_parse_value_pb` for
+    ``field_type``, but the dispatch on the type, and on the types of the
+    array elements / struct fields, is done once instead of for each value.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.proto.type_pb2.Type`
+    :param field_type: type code for the values
+
+    :rtype: callable
+    :returns: function converting a
+              :class:`~google.protobuf.struct_pb2.Value` to cell data.
+              It raises :exc:`ValueError` for a non-null value of an unknown
+              type.
+    """
+    code = field_type.code
+    if code == type_pb2.ARRAY:
+        parse_item = _make_value_pb_parser(field_type.array_element_type)
+
+        def convert(value_pb):
+            return [parse_item(item_pb) for item_pb in value_pb.list_value.values]
+
+    elif code == type_pb2.STRUCT:
+        parse_items = [
+            _make_value_pb_parser(field.type) for field in field_type.struct_type.fields
+        ]
+
+        def convert(value_pb):
+            return [
+                parse_item(item_pb)
+                for parse_item, item_pb in zip(parse_items, value_pb.list_value.values)
+            ]
+
+    else:
+        convert = _VALUE_PB_CONVERTERS.get(code)
+        if convert is None:
+
+            def convert(value_pb):
+                raise ValueError("Unknown type: %s" % (field_type,))
+
+    def parse(value_pb):
+        if value_pb.WhichOneof("kind") == "null_value":
+            return None
+        return convert(value_pb)
+
+    return parse
+
+
 class _SessionWrapper(object):
     """Base class for objects wrapping a session.
 
@@ -14,15 +14,20 @@
 
 """User friendly container for Cloud Spanner Database."""
 
+import concurrent.futures
 import copy
 import functools
+import multiprocessing
+import pickle
 import re
+import sys
 import threading
 
 import google.auth.credentials
 from google.protobuf.struct_pb2 import Struct
 from google.cloud.exceptions import NotFound
 import six
+from six.moves import queue
 
 # pylint: disable=ungrouped-imports
 from google.cloud.spanner_v1._helpers import _make_value_pb
@@ -32,6 +37,7 @@ from google.cloud.spanner_v1.gapic.spanner_client import SpannerClient
 from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import SessionCheckout
+from google.cloud.spanner_v1.pool import _session_not_found
 from google.cloud.spanner_v1.session import Session
 from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
 from google.cloud.spanner_v1.snapshot import Snapshot
@@ -46,6 +52,11 @@ from google.cloud.spanner_v1.proto.transaction_pb2 import (
 
 SPANNER_DATA_SCOPE = "https://www.googleapis.com/auth/spanner.data"
 
+_PARTITIONED_EXECUTORS = ("thread", "process")
+_PARTITIONED_ROWS_PER_BATCH = 1000  # rows sent at once by the workers
+_PARTITIONED_MAX_QUEUE_SIZE_DEFAULT = 16  # batches of rows buffered
+_PARTITIONED_PUT_TIMEOUT = 0.1  # seconds between checks that the run stopped
+
 
 _DATABASE_NAME_RE = re.compile(
     r"^projects/(?P<project>[^/]+)/"
@@ -471,11 +482,18 @@ class BatchCheckout(object):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End ``with`` block."""
+        session_not_found = _session_not_found(exc_val)
         try:
             if exc_type is None:
                 self._batch.commit()
+        except NotFound as exc:
+            session_not_found = _session_not_found(exc)
+            raise
         finally:
-            self._database._pool.put(self._session)
+            if session_not_found:
+                self._database._pool.replace(self._session)
+            else:
+                self._database._pool.put(self._session)
 
 
 class SnapshotCheckout(object):
@@ -508,7 +526,10 @@ class SnapshotCheckout(object):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End ``with`` block."""
-        self._database._pool.put(self._session)
+        if _session_not_found(exc_val):
+            self._database._pool.replace(self._session)
+        else:
+            self._database._pool.put(self._session)
 
 
 class BatchSnapshot(object):
@@ -778,6 +799,278 @@ class BatchSnapshot(object):
             return self.process_read_batch(batch)
         raise ValueError("Invalid batch")
 
+    def run_partitioned_read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        partition_size_bytes=None,
+        max_partitions=None,
+        max_workers=None,
+        executor="thread",
+        max_queue_size=_PARTITIONED_MAX_QUEUE_SIZE_DEFAULT,
+        callback=None,
+    ):
+        """Run a partitioned read, processing the partitions concurrently.
+
+        Generates the batches with :meth:`generate_read_batches`, and
+        processes them with :meth:`process_read_batch` from a pool of
+        workers.  See :meth:`run_partitioned_query` for the arguments
+        controlling the workers and the returned rows.
+
+        :type table: str
+        :param table: name of the table from which to fetch data
+
+        :type columns: list of str
+        :param columns: names of columns to be retrieved
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.KeySet`
+        :param keyset: keys / ranges identifying rows to be retrieved
+
+        :type index: str
+        :param index: (Optional) name of index to use, rather than the
+                      table's primary key
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of concurrent workers.
+
+        :type executor: str
+        :param executor: (Optional) ``"thread"`` or ``"process"``.
+
+        :type max_queue_size: int
+        :param max_queue_size:
+            (Optional) maximum number of batches of rows buffered.
+
+        :type callback: callable
+        :param callback: (Optional) called with each row.
+
+        :rtype: iterable of list, or None
+        :returns: the rows of all the partitions, or None if ``callback``
+                  is passed.
+        :raises ValueError: if ``executor`` is not supported.
+        """
+        batches = self.generate_read_batches(
+            table,
+            columns,
+            keyset,
+            index=index,
+            partition_size_bytes=partition_size_bytes,
+            max_partitions=max_partitions,
+        )
+        return self._run_partitioned(
+            batches, max_workers, executor, max_queue_size, callback
+        )
+
+    def run_partitioned_query(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        partition_size_bytes=None,
+        max_partitions=None,
+        max_workers=None,
+        executor="thread",
+        max_queue_size=_PARTITIONED_MAX_QUEUE_SIZE_DEFAULT,
+        callback=None,
+    ):
+        """Run a partitioned query, processing the partitions concurrently.
+
+        Generates the batches with :meth:`generate_query_batches`, and
+        processes them with :meth:`process_query_batch` from a pool of
+        workers.  The rows of all the partitions are returned as they are
+        received, in no particular order.  At most ``max_queue_size``
+        batches of rows are buffered:  the workers wait while the rows are
+        not consumed.
+
+        With ``executor="process"``, the worker processes are started with
+        the ``spawn`` method, so the calling script must be importable (see
+        :mod:`multiprocessing`), and Python 3.7 or later is required.  Each
+        worker process creates its own
+        :class:`~google.cloud.spanner_v1.client.Client`, with the project,
+        credentials, client info and client options of the database's
+        client, and joins the snapshot through :meth:`to_dict` /
+        :meth:`from_dict`.  The credentials must be picklable.  The rows are
+        pickled back to the calling process.
+
+        :type sql: str
+        :param sql: SQL query statement
+
+        :type params: dict, {str -> column value}
+        :param params: values for parameter replacement.  Keys must match
+                       the names used in ``sql``.
+
+        :type param_types: dict[str -> Union[dict, .types.Type]]
+        :param param_types:
+            (Optional) maps explicit types for one or more param values;
+            required if parameters are passed.
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.  The service
+            uses this as a hint, the actual partition size may differ.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated. The
+            service uses this as a hint, the actual number of partitions may
+            differ.
+
+        :type max_workers: int
+        :param max_workers:
+            (Optional) maximum number of partitions processed concurrently.
+            Defaults to the default of the executor.
+
+        :type executor: str
+        :param executor:
+            (Optional) ``"thread"`` (the default) to process the partitions
+            from threads, or ``"process"`` to process them from processes,
+            to decode the rows on several cores.
+
+        :type max_queue_size: int
+        :param max_queue_size:
+            (Optional) maximum number of batches of rows buffered between
+            the workers and the consumer of the rows.
+
+        :type callback: callable
+        :param callback:
+            (Optional) called with each row, from the calling thread, instead
+            of returning the rows.
+
+        :rtype: iterable of list, or None
+        :returns: the rows of all the partitions, or None if ``callback``
+                  is passed.
+        :raises ValueError: if ``executor`` is not supported, or if
+                            ``executor="process"`` cannot pass the client
+                            to the worker processes.
+        """
+        batches = self.generate_query_batches(
+            sql,
+            params=params,
+            param_types=param_types,
+            partition_size_bytes=partition_size_bytes,
+            max_partitions=max_partitions,
+        )
+        return self._run_partitioned(
+            batches, max_workers, executor, max_queue_size, callback
+        )
+
+    def _run_partitioned(
+        self, batches, max_workers, executor, max_queue_size, callback
+    ):
+        """Helper for :meth:`run_partitioned_read` / :meth:`run_partitioned_query`."""
+        if executor not in _PARTITIONED_EXECUTORS:
+            raise ValueError(
+                "executor must be one of {}, got {!r}".format(
+                    _PARTITIONED_EXECUTORS, executor
+                )
+            )
+
+        process_source = None
+        if executor == "process":
+            process_source = self._get_process_source()
+
+        rows = self._iter_partitioned(
+            list(batches), max_workers, process_source, max_queue_size
+        )
+        if callback is None:
+            return rows
+
+        for row in rows:
+            callback(row)
+
+    def _get_process_source(self):
+        """Describe the snapshot for :func:`_get_process_batch_snapshot`.
+
+        :rtype: tuple
+        :returns: the arguments of the clients of the worker processes, the
+                  instance ID and database ID of the database, and the
+                  mapping from :meth:`to_dict`.
+        :raises ValueError: if worker processes cannot be spawned, or if the
+                            client cannot be passed to them.
+        """
+        if sys.version_info < (3, 7):
+            raise ValueError('executor="process" requires Python 3.7 or later')
+
+        database = self._database
+        client = database._instance._client
+        client_kwargs = {
+            "project": client.project,
+            "credentials": client.credentials,
+            "client_info": client._client_info,
+            "client_options": client._client_options,
+        }
+        source = (
+            client_kwargs,
+            database._instance.instance_id,
+            database.database_id,
+            self.to_dict(),
+        )
+        try:
+            pickle.dumps(source)
+        except Exception as exc:  # pylint: disable=broad-except
+            raise ValueError(
+                'executor="process" cannot pass the client to the worker '
+                "processes: {}".format(exc)
+            )
+        return source
+
+    def _iter_partitioned(self, batches, max_workers, process_source, max_queue_size):
+        """Process the batches from a pool of workers, and yield their rows.
+
+        The workers are processes if ``process_source`` is passed, threads
+        otherwise.
+        """
+        manager = None
+        if process_source is not None:
+            # Forking after the gRPC channel of the calling process was used
+            # is not supported by gRPC.
+            context = multiprocessing.get_context("spawn")
+            manager = context.Manager()
+            results = manager.Queue(max_queue_size)
+            stopped = manager.Event()
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=context
+            )
+            source = process_source
+        else:
+            results = queue.Queue(max_queue_size)
+            stopped = threading.Event()
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            source = self
+
+        futures = []
+        try:
+            futures = [
+                pool.submit(_process_partition, source, batch, results, stopped)
+                for batch in batches
+            ]
+            remaining = len(futures)
+            while remaining:
+                item = results.get()
+                if item is None:  # a partition is done
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    for row in item:
+                        yield row
+        finally:
+            stopped.set()
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=True)
+            if manager is not None:
+                manager.shutdown()
+
     def close(self):
         """Clean up underlying session.
 
@@ -792,6 +1085,90 @@ class BatchSnapshot(object):
             self._session.delete()
 
 
+# The batch snapshots joined by a worker process, by session.
+_PROCESS_BATCH_SNAPSHOTS = {}
+
+
+def _get_process_batch_snapshot(source):
+    """Join a batch snapshot from a worker process, once per session.
+
+    :type source: tuple
+    :param source: the keyword arguments of the client, the instance ID and
+                   database ID of the database, and the mapping from
+                   :meth:`BatchSnapshot.to_dict`.
+
+    :rtype: :class:`BatchSnapshot`
+    """
+    from google.cloud.spanner_v1.client import Client
+
+    client_kwargs, instance_id, database_id, mapping = source
+    key = (client_kwargs["project"], instance_id, database_id, mapping["session_id"])
+    batch_snapshot = _PROCESS_BATCH_SNAPSHOTS.get(key)
+    if batch_snapshot is None:
+        client = Client(**client_kwargs)
+        database = client.instance(instance_id).database(database_id)
+        batch_snapshot = BatchSnapshot.from_dict(database, mapping)
+        _PROCESS_BATCH_SNAPSHOTS[key] = batch_snapshot
+    return batch_snapshot
+
+
+def _put_partitioned(results, stopped, item):
+    """Put an item in the results, unless the run stops while it is full.
+
+    :rtype: bool
+    :returns: whether the item was put.
+    """
+    while not stopped.is_set():
+        try:
+            results.put(item, timeout=_PARTITIONED_PUT_TIMEOUT)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _process_partition(source, batch, results, stopped):
+    """Put the rows of a partition in the results, by batches.
+
+    Run from the workers of :meth:`BatchSnapshot.run_partitioned_query`.
+    The rows are followed by ``None`` once the partition is done, or by the
+    error which stopped its processing.
+
+    :type source: :class:`BatchSnapshot` or tuple
+    :param source: the batch snapshot, or the arguments of
+                   :func:`_get_process_batch_snapshot` in a worker process.
+
+    :type batch: mapping
+    :param batch: the batch to process.
+
+    :type results: :class:`~six.moves.queue.Queue`
+    :param results: the queue receiving the rows.
+
+    :type stopped: :class:`threading.Event`
+    :param stopped: set once the rows are not consumed anymore.
+    """
+    try:
+        if isinstance(source, BatchSnapshot):
+            batch_snapshot = source
+        else:
+            batch_snapshot = _get_process_batch_snapshot(source)
+
+        rows = []
+        for row in batch_snapshot.process(batch):
+            rows.append(row)
+            if len(rows) >= _PARTITIONED_ROWS_PER_BATCH:
+                if not _put_partitioned(results, stopped, rows):
+                    return
+                rows = []
+
+        if rows and not _put_partitioned(results, stopped, rows):
+            return
+    except Exception as exc:  # pylint: disable=broad-except
+        _put_partitioned(results, stopped, exc)
+    else:
+        _put_partitioned(results, stopped, None)
+
+
 def _check_ddl_statements(value):
     """Validate DDL Statements used to define database schema.
 
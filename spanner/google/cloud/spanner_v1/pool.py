@@ -14,7 +14,11 @@
 
 """Pools managing shared Session objects."""
 
+import collections
 import datetime
+import logging
+import threading
+import time
 
 from six.moves import queue
 
@@ -22,9 +26,24 @@ from google.cloud.exceptions import NotFound
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 
 
+_LOGGER = logging.getLogger(__name__)
+_KEEP_ALIVE_WORKER_NAME = "Thread-KeepAlivePool"
+
 _NOW = datetime.datetime.utcnow  # unit tests may replace
 
 
+def _session_not_found(exc):
+    """Whether an error reports that a session was deleted by the backend.
+
+    :type exc: Exception or None
+    :param exc: the error raised while using a session.
+
+    :rtype: bool
+    :returns: True if the error is a ``NOT_FOUND`` error for the session.
+    """
+    return isinstance(exc, NotFound) and "Session not found" in exc.message
+
+
 class AbstractSessionPool(object):
     """Specifies required API for concrete session pool implementations.
 
@@ -99,6 +118,19 @@ class AbstractSessionPool(object):
         """
         raise NotImplementedError()
 
+    def replace(self, session):
+        """Return a session found to be deleted to the pool.
+
+        Called instead of :meth:`put` when using the session failed with a
+        ``NOT_FOUND`` error for the session.  The default implementation
+        returns it with :meth:`put`, for pools which validate the sessions
+        when they are checked out.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the deleted session.
+        """
+        self.put(session)
+
     def _new_session(self):
         """Helper for concrete methods creating session instances.
 
@@ -517,6 +549,224 @@ class TransactionPingingPool(PingingPool):
             super(TransactionPingingPool, self).put(session)
 
 
+class KeepAlivePool(AbstractSessionPool):
+    """Concrete session pool implementation:
+
+    - Pre-allocates / creates a fixed number of sessions.
+
+    - Tracks when each session was last used.  Only the sessions idle for
+      longer than ``validate_after`` are "pinged" via :meth:`session.exists`
+      when they are checked out: the others are returned without an API
+      request.
+
+    - Keeps the idle sessions fresh from a background thread, which pings
+      the sessions idle for longer than ``keep_alive_interval``, and replaces
+      expired sessions.
+
+    - Replaces the sessions which fail with a ``NOT_FOUND`` error while
+      checked out, when they are returned to the pool.
+
+    - Blocks, with a timeout, when :meth:`get` is called on an empty pool.
+      Raises after timing out.
+
+    - Raises when :meth:`put` is called on a full pool.  That error is
+      never expected in normal practice, as users should be calling
+      :meth:`get` followed by :meth:`put` whenever in need of a session.
+
+    :type size: int
+    :param size: fixed pool size
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for
+                            a returned session.
+
+    :type validate_after: int
+    :param validate_after: idle time, in seconds, after which a session is
+                           pinged when it is checked out.
+
+    :type keep_alive_interval: int or None
+    :param keep_alive_interval: idle time, in seconds, after which a session
+                                is pinged by the background thread, which
+                                checks the sessions at this interval.  If
+                                ``None``, no background thread is started.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+    """
+
+    DEFAULT_SIZE = 10
+    DEFAULT_TIMEOUT = 10
+    DEFAULT_VALIDATE_AFTER = 3000
+    DEFAULT_KEEP_ALIVE_INTERVAL = 600
+
+    def __init__(
+        self,
+        size=DEFAULT_SIZE,
+        default_timeout=DEFAULT_TIMEOUT,
+        validate_after=DEFAULT_VALIDATE_AFTER,
+        keep_alive_interval=DEFAULT_KEEP_ALIVE_INTERVAL,
+        labels=None,
+    ):
+        super(KeepAlivePool, self).__init__(labels=labels)
+        self.size = size
+        self.default_timeout = default_timeout
+        self._validate_after = datetime.timedelta(seconds=validate_after)
+        self._keep_alive_interval = keep_alive_interval
+
+        # (last_used, session) pairs, the most recently used last.  Sessions
+        # are checked out from the end, and pinged from the start.
+        self._sessions = collections.deque()
+        self._sessions_changed = threading.Condition()
+        self._stopped = threading.Event()
+        self._keep_alive_thread = None
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        Starts the background thread keeping the sessions fresh.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database used by the pool:  used to create sessions
+                         when needed.
+        """
+        self._database = database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        created_session_count = 0
+
+        while created_session_count < self.size:
+            resp = api.batch_create_sessions(
+                database.name,
+                self.size - created_session_count,
+                timeout=self.default_timeout,
+                metadata=metadata,
+            )
+            for session_pb in resp.session:
+                session = self._new_session()
+                session._session_id = session_pb.name.split("/")[-1]
+                self.put(session)
+            created_session_count += len(resp.session)
+
+        if self._keep_alive_interval is not None and self._keep_alive_thread is None:
+            self._stopped.clear()
+            thread = threading.Thread(
+                name=_KEEP_ALIVE_WORKER_NAME, target=self._keep_alive
+            )
+            thread.daemon = True
+            thread.start()
+            self._keep_alive_thread = thread
+
+    def get(self, timeout=None):  # pylint: disable=arguments-differ
+        """Check a session out from the pool.
+
+        :type timeout: int
+        :param timeout: seconds to block waiting for an available session
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: an existing session from the pool, or a newly-created
+                  session.
+        :raises: :exc:`six.moves.queue.Empty` if the queue is empty.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        deadline = time.time() + timeout
+        with self._sessions_changed:
+            while not self._sessions:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise queue.Empty()
+                self._sessions_changed.wait(remaining)
+            last_used, session = self._sessions.pop()
+
+        if _NOW() - last_used > self._validate_after:
+            if not session.exists():
+                session = self._new_session()
+                session.create()
+
+        return session
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        Never blocks:  if the pool is full, raises.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+
+        :raises: :exc:`six.moves.queue.Full` if the queue is full.
+        """
+        with self._sessions_changed:
+            if len(self._sessions) >= self.size:
+                raise queue.Full()
+            self._sessions.append((_NOW(), session))
+            self._sessions_changed.notify()
+
+    def replace(self, session):
+        """Return a session found to be deleted to the pool.
+
+        A new session is created, and returned to the pool instead.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the deleted session.
+        """
+        session = self._new_session()
+        session.create()
+        self.put(session)
+
+    def clear(self):
+        """Stop the background thread, and delete all sessions in the pool."""
+        self._stopped.set()
+        if self._keep_alive_thread is not None:
+            self._keep_alive_thread.join()
+            self._keep_alive_thread = None
+
+        while True:
+            with self._sessions_changed:
+                if not self._sessions:
+                    break
+                _, session = self._sessions.popleft()
+            session.delete()
+
+    def ping(self):
+        """Refresh the sessions idle for longer than ``keep_alive_interval``.
+
+        Called from the background thread.  Without a background thread,
+        this may be called by the application, and refreshes the sessions
+        idle for longer than ``validate_after``.
+        """
+        if self._keep_alive_interval is None:
+            keep_alive_delta = self._validate_after
+        else:
+            keep_alive_delta = datetime.timedelta(seconds=self._keep_alive_interval)
+        while True:
+            with self._sessions_changed:
+                if not self._sessions:  # all sessions in use
+                    break
+                last_used, session = self._sessions[0]
+                if _NOW() - last_used < keep_alive_delta:  # oldest is fresh
+                    break
+                self._sessions.popleft()
+
+            try:
+                if not session.exists():  # stale
+                    session = self._new_session()
+                    session.create()
+            finally:
+                # Re-add to the pool as just used.
+                self.put(session)
+
+    def _keep_alive(self):
+        """Ping the idle sessions until the pool is cleared."""
+        while not self._stopped.wait(self._keep_alive_interval):
+            try:
+                self.ping()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while keeping the sessions alive.")
+        _LOGGER.debug("%s exiting.", _KEEP_ALIVE_WORKER_NAME)
+
+
 class SessionCheckout(object):
     """Context manager: hold session checked out from a pool.
 
@@ -537,5 +787,8 @@ class SessionCheckout(object):
         self._session = self._pool.get(**self._kwargs)
         return self._session
 
-    def __exit__(self, *ignored):
-        self._pool.put(self._session)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if _session_not_found(exc_val):
+            self._pool.replace(self._session)
+        else:
+            self._pool.put(self._session)
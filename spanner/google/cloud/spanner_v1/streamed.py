@@ -20,11 +20,21 @@ from google.cloud import exceptions
 from google.cloud.spanner_v1.proto import type_pb2
 import six
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 # pylint: disable=ungrouped-imports
-from google.cloud.spanner_v1._helpers import _parse_value_pb
+from google.cloud.spanner_v1._helpers import _make_value_pb_parser
 
 # pylint: enable=ungrouped-imports
 
+_NO_PANDAS_ERROR = (
+    "The pandas library is not installed, please install "
+    "pandas to use the to_dataframe() function."
+)
+
 
 class StreamedResultSet(object):
     """Process a sequence of partial result sets into a single set of row data.
@@ -44,6 +54,7 @@ class StreamedResultSet(object):
         self._rows = []  # Fully-processed rows
         self._counter = 0  # Counter for processed responses
         self._metadata = None  # Until set from first PRS
+        self._parsers = None  # Compiled from the metadata on first use
         self._stats = None  # Until set from last PRS
         self._current_row = []  # Accumulated values for incomplete row
         self._pending_chunk = None  # Incomplete value
@@ -93,20 +104,57 @@ class StreamedResultSet(object):
         self._pending_chunk = None
         return merged
 
+    def _get_parsers(self):
+        """Compile the parsers of the values of each column.
+
+        :rtype: list of callable
+        :returns: the parsers, from :func:`_make_value_pb_parser`.
+        """
+        if self._parsers is None:
+            self._parsers = [_make_value_pb_parser(field.type) for field in self.fields]
+        return self._parsers
+
     def _merge_values(self, values):
         """Merge values into rows.
 
         :type values: list of :class:`~google.protobuf.struct_pb2.Value`
         :param values: non-chunked values from partial result set.
         """
-        width = len(self.fields)
-        for value in values:
-            index = len(self._current_row)
-            field = self.fields[index]
-            self._current_row.append(_parse_value_pb(value, field.type))
-            if len(self._current_row) == width:
-                self._rows.append(self._current_row)
-                self._current_row = []
+        if not values:  # e.g. DML statements
+            return
+
+        parsers = self._get_parsers()
+        width = len(parsers)
+        rows = self._rows
+        current_row = self._current_row
+        start = 0
+
+        # Complete the row started by a previous partial result set.
+        if current_row:
+            start = min(width - len(current_row), len(values))
+            current_row.extend(
+                parse(value)
+                for parse, value in zip(parsers[len(current_row) :], values[:start])
+            )
+            if len(current_row) < width:
+                return
+            rows.append(current_row)
+
+        # Decode the complete rows in one pass.
+        end = start + (len(values) - start) // width * width
+        for row_start in six.moves.range(start, end, width):
+            rows.append(
+                [
+                    parse(value)
+                    for parse, value in zip(
+                        parsers, values[row_start : row_start + width]
+                    )
+                ]
+            )
+
+        self._current_row = [
+            parse(value) for parse, value in zip(parsers, values[end:])
+        ]
 
     def _consume_next(self):
         """Consume the next partial result set from the stream.
@@ -136,16 +184,76 @@ class StreamedResultSet(object):
         self._merge_values(values)
 
     def __iter__(self):
-        iter_rows, self._rows[:] = self._rows[:], ()
         while True:
-            if not iter_rows:
-                try:
-                    self._consume_next()
-                except StopIteration:
-                    return
-                iter_rows, self._rows[:] = self._rows[:], ()
-            while iter_rows:
-                yield iter_rows.pop(0)
+            iter_rows, self._rows = self._rows, []
+            for row in iter_rows:
+                yield row
+            try:
+                self._consume_next()
+            except StopIteration:
+                return
+
+    def iter_column_batches(self):
+        """Iterate over the rows, by batches of columns.
+
+        Each batch holds the rows completed by one or more partial result
+        sets, as one list of values per field.
+
+        :rtype: iterable of list of list
+        :returns: batches of columns, in the order of :attr:`fields`
+        """
+        while True:
+            iter_rows, self._rows = self._rows, []
+            if iter_rows:
+                yield [list(column) for column in zip(*iter_rows)]
+            try:
+                self._consume_next()
+            except StopIteration:
+                return
+
+    def _column_names(self):
+        if self._metadata is None:
+            return []
+        return [field.name for field in self.fields]
+
+    def to_dataframe_iterable(self):
+        """Iterate over the rows, by pandas DataFrames.
+
+        Each DataFrame holds the rows of a batch from
+        :meth:`iter_column_batches`.
+
+        :rtype: iterable of :class:`pandas.DataFrame`
+        :returns: DataFrames with a column per field
+        :raises: :exc:`ValueError`: If the pandas library is not installed.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        for columns in self.iter_column_batches():
+            yield _columns_to_dataframe(self._column_names(), columns)
+
+    def to_dataframe(self):
+        """Read all the rows into a pandas DataFrame.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: a DataFrame with a column per field
+        :raises: :exc:`ValueError`: If the pandas library is not installed.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        all_columns = None
+        for columns in self.iter_column_batches():
+            if all_columns is None:
+                all_columns = columns
+            else:
+                for all_values, values in zip(all_columns, columns):
+                    all_values.extend(values)
+
+        names = self._column_names()
+        if all_columns is None:
+            all_columns = [[] for _ in names]
+        return _columns_to_dataframe(names, all_columns)
 
     def one(self):
         """Return exactly one result, or raise an exception.
@@ -192,6 +300,15 @@ class StreamedResultSet(object):
             return answer
 
 
+def _columns_to_dataframe(names, columns):
+    """Helper for 'to_dataframe':  column names may be repeated or empty."""
+    dataframe = pandas.DataFrame(
+        dict(enumerate(columns)), columns=six.moves.range(len(columns))
+    )
+    dataframe.columns = names
+    return dataframe
+
+
 class Unmergeable(ValueError):
     """Unable to merge two values.
 
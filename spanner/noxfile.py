@@ -69,7 +69,7 @@ def default(session):
     session.install("mock", "pytest", "pytest-cov")
     for local_dep in LOCAL_DEPS:
         session.install("-e", local_dep)
-    session.install("-e", ".")
+    session.install("-e", ".[pandas]")
 
     # Run py.test against the unit tests.
     session.run(
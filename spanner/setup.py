@@ -33,7 +33,7 @@ dependencies = [
     "google-cloud-core >= 1.0.3, < 2.0dev",
     "grpc-google-iam-v1 >= 0.12.3, < 0.13dev",
 ]
-extras = {}
+extras = {"pandas": ["pandas >= 0.17.1"]}
 
 
 # Setup boilerplate below this line.
@@ -388,6 +388,47 @@ class Test_parse_value_pb(unittest.TestCase):
             self._callFUT(value_pb, field_type)
 
 
+class Test_make_value_pb_parser(Test_parse_value_pb):
+    """The compiled parsers convert values as ``_parse_value_pb`` does."""
+
+    def _callFUT(self, value_pb, field_type):
+        from google.cloud.spanner_v1._helpers import _make_value_pb_parser
+
+        return _make_value_pb_parser(field_type)(value_pb)
+
+    def test_w_unknown_type_null(self):
+        from google.protobuf.struct_pb2 import Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type
+        from google.cloud.spanner_v1.proto.type_pb2 import TYPE_CODE_UNSPECIFIED
+
+        field_type = Type(code=TYPE_CODE_UNSPECIFIED)
+        value_pb = Value(null_value=NULL_VALUE)
+
+        self.assertIsNone(self._callFUT(value_pb, field_type))
+
+    def test_w_float_nan_and_array_of_nulls(self):
+        import math
+        from google.protobuf.struct_pb2 import ListValue, Value, NULL_VALUE
+        from google.cloud.spanner_v1.proto.type_pb2 import Type, ARRAY, FLOAT64
+
+        field_type = Type(code=ARRAY, array_element_type=Type(code=FLOAT64))
+        value_pb = Value(
+            list_value=ListValue(
+                values=[
+                    Value(string_value="NaN"),
+                    Value(null_value=NULL_VALUE),
+                    Value(number_value=1.5),
+                ]
+            )
+        )
+
+        nan, null, number = self._callFUT(value_pb, field_type)
+
+        self.assertTrue(math.isnan(nan))
+        self.assertIsNone(null)
+        self.assertEqual(number, 1.5)
+
+
 class Test_parse_list_value_pbs(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_list_value_pbs
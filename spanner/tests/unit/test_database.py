@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import sys
 import unittest
 
 import mock
@@ -994,6 +995,24 @@ class TestBatchCheckout(_BaseTest):
         self.assertIs(pool._session, session)
         self.assertIsNone(batch.committed)
 
+    def test_context_mgr_commit_session_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        database = _Database(self.DATABASE_NAME)
+        api = database.spanner_api = self._make_spanner_client()
+        api.commit.side_effect = NotFound("Session not found: " + self.SESSION_NAME)
+        pool = database._pool = _Pool()
+        session = _Session(database)
+        pool.put(session)
+        checkout = self._make_one(database)
+
+        with self.assertRaises(NotFound):
+            with checkout:
+                pass
+
+        self.assertIsNone(pool._session)
+        self.assertEqual(pool._replaced, [session])
+
 
 class TestSnapshotCheckout(_BaseTest):
     def _get_target_class(self):
@@ -1067,6 +1086,22 @@ class TestSnapshotCheckout(_BaseTest):
 
         self.assertIs(pool._session, session)
 
+    def test_context_mgr_session_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        database = _Database(self.DATABASE_NAME)
+        pool = database._pool = _Pool()
+        session = _Session(database)
+        pool.put(session)
+        checkout = self._make_one(database)
+
+        with self.assertRaises(NotFound):
+            with checkout:
+                raise NotFound("Session not found: " + self.SESSION_NAME)
+
+        self.assertIsNone(pool._session)
+        self.assertEqual(pool._replaced, [session])
+
 
 class TestBatchSnapshot(_BaseTest):
     TABLE = "table_name"
@@ -1438,6 +1473,238 @@ class TestBatchSnapshot(_BaseTest):
             sql=sql, params=params, param_types=param_types, partition=token
         )
 
+    def _make_partitioned_snapshot(self, rows_by_token, error_token=None):
+        snapshot = self._make_snapshot()
+        snapshot.partition_query.return_value = list(rows_by_token)
+        snapshot.partition_read.return_value = list(rows_by_token)
+
+        def process(partition=None, **kwargs):
+            if partition == error_token:
+                raise RuntimeError("testing")
+            return iter(rows_by_token[partition])
+
+        snapshot.execute_sql.side_effect = process
+        snapshot.read.side_effect = process
+        return snapshot
+
+    def _make_rows_by_token(self):
+        return {
+            token: [[token, index] for index in range(count)]
+            for token, count in zip(self.TOKENS + [b"TOKEN3"], (0, 1, 2500))
+        }
+
+    def test_run_partitioned_query_w_invalid_executor(self):
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_snapshot()
+
+        with self.assertRaises(ValueError):
+            batch_txn.run_partitioned_query("SELECT 1", executor="fiber")
+
+        snapshot.partition_query.assert_not_called()
+
+    def test_run_partitioned_query(self):
+        sql = "SELECT first_name, age FROM citizens"
+        rows_by_token = self._make_rows_by_token()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_partitioned_snapshot(rows_by_token)
+
+        found = list(
+            batch_txn.run_partitioned_query(sql, max_partitions=3, max_workers=2)
+        )
+
+        expected = [row for rows in rows_by_token.values() for row in rows]
+        self.assertEqual(sorted(found), sorted(expected))
+        snapshot.partition_query.assert_called_once_with(
+            sql=sql,
+            params=None,
+            param_types=None,
+            partition_size_bytes=None,
+            max_partitions=3,
+        )
+        self.assertEqual(
+            sorted(call[2]["partition"] for call in snapshot.execute_sql.mock_calls),
+            sorted(rows_by_token),
+        )
+
+    def test_run_partitioned_query_w_callback(self):
+        rows_by_token = self._make_rows_by_token()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batch_txn._snapshot = self._make_partitioned_snapshot(rows_by_token)
+        found = []
+
+        result = batch_txn.run_partitioned_query("SELECT 1", callback=found.append)
+
+        self.assertIsNone(result)
+        self.assertEqual(len(found), 2501)
+
+    def test_run_partitioned_query_w_error(self):
+        rows_by_token = self._make_rows_by_token()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batch_txn._snapshot = self._make_partitioned_snapshot(
+            rows_by_token, error_token=self.TOKENS[1]
+        )
+
+        with self.assertRaises(RuntimeError):
+            list(batch_txn.run_partitioned_query("SELECT 1", max_workers=1))
+
+    def test_run_partitioned_query_stops_workers_on_early_exit(self):
+        rows_by_token = self._make_rows_by_token()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        batch_txn._snapshot = self._make_partitioned_snapshot(rows_by_token)
+
+        rows = batch_txn.run_partitioned_query("SELECT 1", max_queue_size=1)
+        next(rows)
+        rows.close()  # Does not wait for the blocked workers forever.
+
+    def test_run_partitioned_read(self):
+        keyset = self._make_keyset()
+        rows_by_token = self._make_rows_by_token()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        snapshot = batch_txn._snapshot = self._make_partitioned_snapshot(rows_by_token)
+
+        found = list(
+            batch_txn.run_partitioned_read(
+                self.TABLE, self.COLUMNS, keyset, index=self.INDEX, max_workers=3
+            )
+        )
+
+        self.assertEqual(len(found), 2501)
+        snapshot.partition_read.assert_called_once_with(
+            table=self.TABLE,
+            columns=self.COLUMNS,
+            keyset=keyset,
+            index=self.INDEX,
+            partition_size_bytes=None,
+            max_partitions=None,
+        )
+        self.assertEqual(snapshot.read.call_count, 3)
+
+    def _make_process_batch_txn(self, rows_by_token, credentials=None):
+        from google.auth.credentials import AnonymousCredentials
+
+        if credentials is None:
+            credentials = AnonymousCredentials()
+        database = self._make_database()
+        database._instance = mock.Mock(instance_id=self.INSTANCE_ID, spec=[])
+        database._instance._client = mock.Mock(
+            project=self.PROJECT_ID,
+            credentials=credentials,
+            _client_info=None,
+            _client_options={"api_endpoint": "spanner.example.com"},
+            spec=[],
+        )
+        database.database_id = self.DATABASE_ID
+        batch_txn = self._make_one(database)
+        batch_txn._session = self._make_session(_session_id=self.SESSION_ID)
+        snapshot = batch_txn._snapshot = self._make_partitioned_snapshot(rows_by_token)
+        snapshot._transaction_id = self.TRANSACTION_ID
+        return batch_txn
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Requires Python 3.7+")
+    def test_run_partitioned_query_w_process_executor(self):
+        import concurrent.futures
+        import threading
+        from six.moves import queue
+
+        rows_by_token = self._make_rows_by_token()
+        batch_txn = self._make_process_batch_txn(rows_by_token)
+        manager = mock.Mock(Queue=queue.Queue, Event=threading.Event, spec=[])
+        manager.shutdown = mock.Mock()
+        context = mock.Mock(spec=["Manager"])
+        context.Manager.return_value = manager
+        sources = []
+
+        def get_process_batch_snapshot(source):
+            sources.append(source)
+            return batch_txn
+
+        def process_pool_executor(max_workers, mp_context):
+            self.assertIs(mp_context, context)
+            return concurrent.futures.ThreadPoolExecutor(max_workers)
+
+        context_patch = mock.patch("multiprocessing.get_context", return_value=context)
+        executor_patch = mock.patch(
+            "concurrent.futures.ProcessPoolExecutor", new=process_pool_executor
+        )
+        join_patch = mock.patch(
+            "google.cloud.spanner_v1.database._get_process_batch_snapshot",
+            side_effect=get_process_batch_snapshot,
+        )
+        with context_patch as get_context, executor_patch, join_patch:
+            found = list(
+                batch_txn.run_partitioned_query("SELECT 1", executor="process")
+            )
+
+        self.assertEqual(len(found), 2501)
+        get_context.assert_called_once_with("spawn")
+        manager.shutdown.assert_called_once_with()
+        client = batch_txn._database._instance._client
+        expected_source = (
+            {
+                "project": self.PROJECT_ID,
+                "credentials": client.credentials,
+                "client_info": None,
+                "client_options": {"api_endpoint": "spanner.example.com"},
+            },
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            {"session_id": self.SESSION_ID, "transaction_id": self.TRANSACTION_ID},
+        )
+        self.assertEqual(sources, [expected_source] * 3)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Requires Python 3.7+")
+    def test_run_partitioned_query_w_process_executor_unpicklable_client(self):
+        batch_txn = self._make_process_batch_txn(
+            self._make_rows_by_token(), credentials=lambda: None
+        )
+
+        with self.assertRaises(ValueError):
+            batch_txn.run_partitioned_query("SELECT 1", executor="process")
+
+        batch_txn._snapshot.partition_query.assert_not_called()
+
+    @unittest.skipIf(sys.version_info >= (3, 7), "Requires Python < 3.7")
+    def test_run_partitioned_query_w_process_executor_unsupported(self):
+        batch_txn = self._make_process_batch_txn(self._make_rows_by_token())
+
+        with self.assertRaises(ValueError):
+            batch_txn.run_partitioned_query("SELECT 1", executor="process")
+
+    def test__get_process_batch_snapshot(self):
+        from google.cloud.spanner_v1 import database as MUT
+
+        client_kwargs = {
+            "project": self.PROJECT_ID,
+            "credentials": mock.sentinel.credentials,
+            "client_info": mock.sentinel.client_info,
+            "client_options": mock.sentinel.client_options,
+        }
+        source = (
+            client_kwargs,
+            self.INSTANCE_ID,
+            self.DATABASE_ID,
+            {"session_id": self.SESSION_ID, "transaction_id": self.TRANSACTION_ID},
+        )
+        client_patch = mock.patch("google.cloud.spanner_v1.client.Client")
+        cache_patch = mock.patch.dict(MUT._PROCESS_BATCH_SNAPSHOTS, clear=True)
+        with client_patch as client_class, cache_patch:
+            first = MUT._get_process_batch_snapshot(source)
+            second = MUT._get_process_batch_snapshot(source)
+
+        self.assertIs(first, second)
+        client_class.assert_called_once_with(**client_kwargs)
+        instance = client_class.return_value.instance
+        instance.assert_called_once_with(self.INSTANCE_ID)
+        instance.return_value.database.assert_called_once_with(self.DATABASE_ID)
+        self.assertEqual(first._session._session_id, self.SESSION_ID)
+        self.assertEqual(first._snapshot._transaction_id, self.TRANSACTION_ID)
+
     def test_close_wo_session(self):
         database = self._make_database()
         batch_txn = self._make_one(database)
@@ -1549,6 +1816,9 @@ class _Pool(object):
     def put(self, session):
         self._session = session
 
+    def replace(self, session):
+        self._replaced = getattr(self, "_replaced", []) + [session]
+
 
 class _Session(object):
 
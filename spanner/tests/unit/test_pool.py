@@ -776,6 +776,246 @@ class TestTransactionPingingPool(unittest.TestCase):
         self.assertTrue(pending.empty())
 
 
+class TestKeepAlivePool(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import KeepAlivePool
+
+        return KeepAlivePool
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_bound(self, session_count, size=None, created=None, **kwargs):
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        kwargs.setdefault("keep_alive_interval", None)
+        pool = self._make_one(size=size or session_count, **kwargs)
+        database = _Database("name")
+        sessions = [_Session(database) for _ in range(session_count)]
+        database._sessions.extend(sessions)
+
+        if created is None:
+            pool.bind(database)
+        else:
+            with _Monkey(MUT, _NOW=lambda: created):
+                pool.bind(database)
+        return pool, sessions
+
+    def test_ctor_defaults(self):
+        pool = self._make_one()
+        self.assertIsNone(pool._database)
+        self.assertEqual(pool.size, 10)
+        self.assertEqual(pool.default_timeout, 10)
+        self.assertEqual(pool._validate_after.seconds, 3000)
+        self.assertEqual(pool._keep_alive_interval, 600)
+        self.assertEqual(len(pool._sessions), 0)
+        self.assertEqual(pool.labels, {})
+
+    def test_ctor_explicit(self):
+        labels = {"foo": "bar"}
+        pool = self._make_one(
+            size=4,
+            default_timeout=30,
+            validate_after=1800,
+            keep_alive_interval=None,
+            labels=labels,
+        )
+        self.assertIsNone(pool._database)
+        self.assertEqual(pool.size, 4)
+        self.assertEqual(pool.default_timeout, 30)
+        self.assertEqual(pool._validate_after.seconds, 1800)
+        self.assertIsNone(pool._keep_alive_interval)
+        self.assertEqual(len(pool._sessions), 0)
+        self.assertEqual(pool.labels, labels)
+
+    def test_bind(self):
+        pool, sessions = self._make_bound(10)
+
+        self.assertEqual(len(pool._sessions), 10)
+        self.assertIsNone(pool._keep_alive_thread)
+        api = pool._database.spanner_api
+        self.assertEqual(api.batch_create_sessions.call_count, 5)
+        for session in sessions:
+            session.create.assert_not_called()
+
+    def test_bind_starts_keep_alive_thread(self):
+        import threading
+
+        pinged = threading.Event()
+        pool, _ = self._make_bound(2, keep_alive_interval=0.01)
+        self.assertTrue(pool._keep_alive_thread.daemon)
+
+        with mock.patch.object(pool, "ping", side_effect=pinged.set):
+            self.assertTrue(pinged.wait(5))
+            pool.clear()
+
+        self.assertIsNone(pool._keep_alive_thread)
+
+    def test_keep_alive_thread_survives_errors(self):
+        import threading
+
+        pinged = threading.Event()
+        errors = [RuntimeError("testing"), None]
+
+        def ping():
+            error = errors.pop(0)
+            if error is not None:
+                raise error
+            pinged.set()
+
+        pool, _ = self._make_bound(2, keep_alive_interval=0.01)
+
+        with mock.patch.object(pool, "ping", side_effect=ping):
+            self.assertTrue(pinged.wait(5))
+            pool.clear()
+
+    def test_get_recently_used_wo_ping(self):
+        pool, sessions = self._make_bound(4)
+
+        session = pool.get()
+
+        self.assertIs(session, sessions[3])
+        self.assertFalse(session._exists_checked)
+        self.assertEqual(len(pool._sessions), 3)
+
+    def test_get_most_recently_used_first(self):
+        pool, sessions = self._make_bound(4)
+
+        first = pool.get()
+        second = pool.get()
+        pool.put(first)
+
+        self.assertIs(pool.get(), first)
+        self.assertIsNot(second, first)
+
+    def test_get_idle_w_ping(self):
+        import datetime
+
+        created = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+        pool, sessions = self._make_bound(4, created=created)
+
+        session = pool.get()
+
+        self.assertIs(session, sessions[3])
+        self.assertTrue(session._exists_checked)
+
+    def test_get_idle_w_ping_expired(self):
+        import datetime
+
+        created = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+        pool, sessions = self._make_bound(5, size=4, created=created)
+        sessions[3]._exists = False
+
+        session = pool.get()
+
+        self.assertIs(session, sessions[4])
+        session.create.assert_called_once_with()
+        self.assertTrue(sessions[3]._exists_checked)
+
+    def test_get_empty_timeout(self):
+        from six.moves.queue import Empty
+
+        pool = self._make_one(size=1, keep_alive_interval=None)
+
+        with self.assertRaises(Empty):
+            pool.get(timeout=0.01)
+
+    def test_get_waits_for_put(self):
+        import threading
+
+        pool, sessions = self._make_bound(1)
+        session = pool.get()
+        timer = threading.Timer(0.01, pool.put, (session,))
+        timer.start()
+
+        self.assertIs(pool.get(timeout=5), session)
+        timer.join()
+
+    def test_put_full(self):
+        from six.moves.queue import Full
+
+        pool, _ = self._make_bound(4)
+
+        with self.assertRaises(Full):
+            pool.put(_Session(pool._database))
+
+        self.assertEqual(len(pool._sessions), 4)
+
+    def test_put_tracks_last_use(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool, _ = self._make_bound(1)
+        session = pool.get()
+        now = datetime.datetime.utcnow()
+
+        with _Monkey(MUT, _NOW=lambda: now):
+            pool.put(session)
+
+        self.assertEqual(list(pool._sessions), [(now, session)])
+
+    def test_replace(self):
+        pool, sessions = self._make_bound(2, size=1)
+        session = pool.get()
+
+        pool.replace(session)
+
+        self.assertIs(pool.get(), sessions[1])
+        sessions[1].create.assert_called_once_with()
+
+    def test_clear(self):
+        pool, sessions = self._make_bound(10)
+
+        pool.clear()
+
+        self.assertEqual(len(pool._sessions), 0)
+        for session in sessions:
+            self.assertTrue(session._deleted)
+
+    def test_ping_empty(self):
+        pool = self._make_one(size=1, keep_alive_interval=None)
+        pool.ping()  # Does not raise 'Empty'
+
+    def test_ping_oldest_fresh(self):
+        pool, sessions = self._make_bound(1)
+        pool._keep_alive_interval = 600
+
+        pool.ping()
+
+        self.assertFalse(sessions[0]._exists_checked)
+
+    def test_ping_oldest_stale_but_exists(self):
+        import datetime
+
+        created = datetime.datetime.utcnow() - datetime.timedelta(seconds=700)
+        pool, sessions = self._make_bound(2, created=created)
+        pool._keep_alive_interval = 600
+
+        pool.ping()
+
+        self.assertTrue(sessions[0]._exists_checked)
+        self.assertTrue(sessions[1]._exists_checked)
+        self.assertEqual(len(pool._sessions), 2)
+        last_used, _ = pool._sessions[0]
+        self.assertGreater(last_used, created)
+
+    def test_ping_oldest_stale_and_not_exists(self):
+        import datetime
+
+        created = datetime.datetime.utcnow() - datetime.timedelta(seconds=700)
+        pool, sessions = self._make_bound(2, size=1, created=created)
+        pool._keep_alive_interval = 600
+        sessions[0]._exists = False
+
+        pool.ping()
+
+        self.assertTrue(sessions[0]._exists_checked)
+        sessions[1].create.assert_called_once_with()
+        self.assertIs(pool.get(), sessions[1])
+
+
 class TestSessionCheckout(unittest.TestCase):
     def _getTargetClass(self):
         from google.cloud.spanner_v1.pool import SessionCheckout
@@ -831,6 +1071,34 @@ class TestSessionCheckout(unittest.TestCase):
         self.assertIs(pool._items[0], session)
         self.assertEqual(pool._got, {"foo": "bar"})
 
+    def test_context_manager_w_session_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        session = object()
+        pool = _Pool(session)
+        checkout = self._make_one(pool)
+
+        with self.assertRaises(NotFound):
+            with checkout:
+                raise NotFound("Session not found: name")
+
+        self.assertEqual(len(pool._items), 0)
+        self.assertEqual(pool._replaced, [session])
+
+    def test_context_manager_w_other_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        session = object()
+        pool = _Pool(session)
+        checkout = self._make_one(pool)
+
+        with self.assertRaises(NotFound):
+            with checkout:
+                raise NotFound("Table not found: name")
+
+        self.assertEqual(pool._items, [session])
+        self.assertEqual(pool._replaced, [])
+
 
 def _make_transaction(*args, **kw):
     from google.cloud.spanner_v1.transaction import Transaction
@@ -935,3 +1203,10 @@ class _Queue(object):
 class _Pool(_Queue):
 
     _database = None
+
+    def __init__(self, *items):
+        super(_Pool, self).__init__(*items)
+        self._replaced = []
+
+    def replace(self, session):
+        self._replaced.append(session)
@@ -17,6 +17,11 @@ import unittest
 
 import mock
 
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 
 class TestStreamedResultSet(unittest.TestCase):
     def _getTargetClass(self):
@@ -821,6 +826,118 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def test_merge_values_row_across_result_sets(self):
+        iterator = _MockCancellableIterator()
+        streamed = self._make_one(iterator)
+        FIELDS = [
+            self._make_scalar_field("full_name", "STRING"),
+            self._make_scalar_field("age", "INT64"),
+            self._make_scalar_field("married", "BOOL"),
+        ]
+        streamed._metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [u"Phred Phlyntstone", 42, True, u"Bharney Rhubble", 39, True, u"Wylma"]
+        VALUES = [self._make_value(bare) for bare in BARE]
+
+        streamed._merge_values(VALUES[:1])
+        streamed._merge_values(VALUES[1:2])
+        self.assertEqual(streamed._rows, [])
+        self.assertEqual(streamed._current_row, BARE[:2])
+
+        streamed._merge_values(VALUES[2:])
+        self.assertEqual(streamed._rows, [BARE[:3], BARE[3:6]])
+        self.assertEqual(streamed._current_row, BARE[6:])
+
+    def _make_streamed_people(self):
+        FIELDS = [
+            self._make_scalar_field("full_name", "STRING"),
+            self._make_scalar_field("age", "INT64"),
+            self._make_array_field("ages", element_type_code="INT64"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        VALUES = [
+            self._make_value(u"Phred Phlyntstone"),
+            self._make_value(42),
+            self._make_list_value([1, 2]),
+            self._make_value(u"Bharney Rhubble"),
+            self._make_value(None),
+            self._make_list_value([]),
+            self._make_value(u"Wylma Phlyntstone"),
+            self._make_value(41),
+            self._make_value(None),
+        ]
+        result_set1 = self._make_partial_result_set(VALUES[:4], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[4:5])
+        result_set3 = self._make_partial_result_set(VALUES[5:])
+        iterator = _MockCancellableIterator(result_set1, result_set2, result_set3)
+        return self._make_one(iterator)
+
+    def test_iter_column_batches(self):
+        streamed = self._make_streamed_people()
+
+        batches = list(streamed.iter_column_batches())
+
+        self.assertEqual(
+            batches,
+            [
+                [[u"Phred Phlyntstone"], [42], [[1, 2]]],
+                [[u"Bharney Rhubble", u"Wylma Phlyntstone"], [None, 41], [[], None]],
+            ],
+        )
+        self.assertEqual(list(streamed), [])
+
+    def test_to_dataframe_wo_pandas(self):
+        streamed = self._make_streamed_people()
+
+        with mock.patch("google.cloud.spanner_v1.streamed.pandas", new=None):
+            with self.assertRaises(ValueError):
+                streamed.to_dataframe()
+            with self.assertRaises(ValueError):
+                next(streamed.to_dataframe_iterable())
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe(self):
+        streamed = self._make_streamed_people()
+
+        dataframe = streamed.to_dataframe()
+
+        self.assertEqual(list(dataframe.columns), ["full_name", "age", "ages"])
+        self.assertEqual(
+            list(dataframe["full_name"]),
+            [u"Phred Phlyntstone", u"Bharney Rhubble", u"Wylma Phlyntstone"],
+        )
+        self.assertEqual(list(dataframe["age"].fillna(-1)), [42, -1, 41])
+        self.assertEqual(list(dataframe["ages"]), [[1, 2], [], None])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_empty_w_repeated_column_names(self):
+        FIELDS = [
+            self._make_scalar_field("", "INT64"),
+            self._make_scalar_field("", "STRING"),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        iterator = _MockCancellableIterator(
+            self._make_partial_result_set([], metadata=metadata)
+        )
+        streamed = self._make_one(iterator)
+
+        dataframe = streamed.to_dataframe()
+
+        self.assertEqual(list(dataframe.columns), ["", ""])
+        self.assertEqual(len(dataframe.index), 0)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_iterable(self):
+        streamed = self._make_streamed_people()
+
+        dataframes = list(streamed.to_dataframe_iterable())
+
+        self.assertEqual([len(dataframe.index) for dataframe in dataframes], [1, 2])
+        for dataframe in dataframes:
+            self.assertEqual(list(dataframe.columns), ["full_name", "age", "ages"])
+        self.assertEqual(
+            list(dataframes[1]["full_name"]), [u"Bharney Rhubble", u"Wylma Phlyntstone"]
+        )
+
 
 class _MockCancellableIterator(object):
 